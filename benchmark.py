@@ -1,12 +1,5 @@
-import sys
-import threading
-import time
-from unittest.mock import MagicMock
-
-# Mock dearpygui before importing main
-sys.modules["dearpygui.dearpygui"] = MagicMock()
-sys.modules["dearpygui"] = MagicMock()
-from main import ColorTrackerAlgo  # noqa: E402
+from core.headless import HeadlessRunner
+from utils.config import Config
 
 
 def run_benchmark():
@@ -14,26 +7,14 @@ def run_benchmark():
         "Starting benchmark (10s for test run)..."
     )  # 10s for quick verification, spec says 60s. I'll do 10s for "implementation" validation.
 
-    # Create app
-    app = ColorTrackerAlgo()
-    app.config.enabled = True  # Enable tracking
-    app.running = True
-
-    # Start the loop in a separate thread
-    t = threading.Thread(target=app._algo_loop_internal, daemon=True)
-    t.start()
-
-    # Let it run
-    # We simulate a "Benchmark" by just letting it run.
-    # In a real scenario, we might want to feed it fake input or just let it capture the screen (mss works).
-
+    # Headless pipeline (no GUI); Ctrl+C ends the run early
+    config = Config()
+    config.enabled = True  # Enable tracking
+    app = HeadlessRunner(config)
     try:
-        time.sleep(10)
-    except KeyboardInterrupt:
-        pass
+        app.run(duration=10.0)
     finally:
-        app.running = False
-        t.join(timeout=2.0)
+        app.close()
 
     print("-" * 50)
     print("BENCHMARK REPORT")
@@ -60,6 +41,8 @@ def run_benchmark():
             print(f"  Avg:   {p_stats['avg_ms']:.4f} ms")
             print(f"  Min:   {p_stats['min_ms']:.4f} ms")
             print(f"  Max:   {p_stats['max_ms']:.4f} ms")
+            print(f"  p99:   {p_stats['p99_ms']:.4f} ms")
+            print(f"  p99.9: {p_stats['p99_9_ms']:.4f} ms")
         else:
             print(f"[{name}] No data recorded.")
 
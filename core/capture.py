@@ -1,9 +1,13 @@
+import time
 from abc import ABC, abstractmethod
+from typing import Any
 
 import mss
 import numpy as np
 from numpy.typing import NDArray
 
+from utils.clock import SYSTEM_CLOCK, Clock
+
 
 class CaptureBackend(ABC):
     """
@@ -24,6 +28,37 @@ class CaptureBackend(ABC):
         """
         pass
 
+    # Short backend name for reports and metrics
+    name = "capture"
+
+    # True if wait_for_frame() blocks until the source presents a new frame
+    frame_events = False
+
+    # Successful grabs, and how many of them repeated the previous frame (no new frame presented)
+    frames_captured = 0
+    duplicate_frames = 0
+
+    # Time the last returned frame was acquired from the source, on the owner's clock
+    # (the detection clock, so it compares with capture and input times).
+    # Cached frames keep their original time, so reuse shows up as frame age.
+    # 0.0 = backend captures on every grab (the grab start is the frame time).
+    frame_time = 0.0
+
+    def wait_for_frame(self, timeout: float, region: dict | None = None) -> bool:
+        """
+        Block until the next grab will return a newly presented frame.
+
+        Args:
+            timeout: Maximum wait in seconds.
+            region: Area covering every region the following grabs will request
+                (defaults to the last grabbed region).
+
+        Returns:
+            True if a new frame is ready, False on timeout.
+            Backends that capture a fresh frame on every grab (MSS) are always ready.
+        """
+        return True
+
     @abstractmethod
     def close(self) -> None:
         """
@@ -37,6 +72,8 @@ class MSSBackend(CaptureBackend):
     MSS-based capture backend (Cross-platform, reliable).
     """
 
+    name = "mss"
+
     def __init__(self):
         self._sct = mss.mss(with_cursor=False)
 
@@ -46,6 +83,7 @@ class MSSBackend(CaptureBackend):
             # mss.grab returns BGRA by default
             sct_img = self._sct.grab(region)
             img_bgra = np.frombuffer(sct_img.bgra, dtype=np.uint8).reshape((sct_img.height, sct_img.width, 4))
+            self.frames_captured += 1
             return True, img_bgra
         except Exception:
             return False, None
@@ -57,96 +95,180 @@ class MSSBackend(CaptureBackend):
             pass
 
 
-class DXGIBackend(CaptureBackend):
+def _contains(outer: tuple[int, int, int, int], box: tuple[int, int, int, int]) -> bool:
+    return outer[0] <= box[0] and outer[1] <= box[1] and box[2] <= outer[2] and box[3] <= outer[3]
+
+
+class _GrabModeBackend(CaptureBackend):
     """
-    DXGI-based capture backend using dxcam (Windows only, High Performance).
-    Uses 'Grab Mode' (Manual) with caching to bypass VSync locking.
+    Shared logic for desktop-duplication cameras polled in 'Grab Mode'.
+    `self._camera.grab(region=(l, t, r, b))` returns None when the display has not
+    presented a new frame; the last valid frame is then returned from cache.
+
+    A grab inside the area of the last acquired frame is served as a view of that frame
+    (no copy), so one frame acquired by `wait_for_frame` over the whole search area
+    feeds the local and full searches of the iteration, wherever they are.
     """
 
-    def __init__(self):
-        try:
-            import dxcam
-        except ImportError:
-            raise ImportError("dxcam not installed") from None
+    frame_events = True
 
-        # output_color="BGRA" allows direct compatibility with existing pipeline
-        self._camera = dxcam.create(output_color="BGRA", output_idx=0)
+    # Poll interval while waiting for the next presented frame (sleeps, never spins)
+    FRAME_POLL_INTERVAL = 0.0005
+
+    _camera: Any
+    last_valid_frame: Any
+
+    def __init__(self, clock: Clock | None = None) -> None:
+        """
+        Args:
+            clock: Time source for frame timestamps (defaults to the system clock)
+        """
+        # Frame stamps use the owner's clock; poll deadlines and sleeps stay on real time
+        self._perf_counter = (clock or SYSTEM_CLOCK).perf_counter
         self.last_valid_frame = None
+        # Screen area of last_valid_frame, and whether wait_for_frame() acquired it and no grab has used it yet
+        self._frame_box: tuple[int, int, int, int] | None = None
+        self._frame_pending = False
+        self._pending_frame_time = 0.0
+        # Last view cut from last_valid_frame: the same region gets the same object (detection's frame cache)
+        self._view_box: tuple[int, int, int, int] | None = None
+        self._view = None
+        self._last_region: tuple[int, int, int, int] | None = None
+        self._handed_out = None
+
+    def _hand_out(self, image):
+        # Keep the previous image alive until the next one exists: a new frame or view can then
+        # never reuse its id(), which detection uses to skip re-processing an unchanged frame
+        self._handed_out = image
+        return image
+
+    def _crop(self, frame_box: tuple[int, int, int, int], box: tuple[int, int, int, int]):
+        """View of `box` inside last_valid_frame (which covers `frame_box`)."""
+        if box == frame_box:
+            return self.last_valid_frame
+        if box != self._view_box:
+            left, top = frame_box[0], frame_box[1]
+            self._view = self.last_valid_frame[box[1] - top : box[3] - top, box[0] - left : box[2] - left]
+            self._view_box = box
+        return self._view
 
     def grab(self, region: dict) -> tuple[bool, NDArray[np.uint8] | None]:
         try:
-            # dxcam uses (left, top, right, bottom)
+            # Cameras use (left, top, right, bottom)
             left = region["left"]
             top = region["top"]
             right = left + region["width"]
             bottom = top + region["height"]
-            dxgi_region = (left, top, right, bottom)
+            box = (left, top, right, bottom)
+            self._last_region = box
 
-            # Direct grab from dxcam
-            frame = self._camera.grab(region=dxgi_region)
+            frame_box = self._frame_box
+            if self._frame_pending and frame_box is not None and _contains(frame_box, box):
+                # New frame acquired while waiting: hand it out without another camera grab
+                self._frame_pending = False
+                self.frame_time = self._pending_frame_time
+                self.frames_captured += 1
+                return True, self._hand_out(self._crop(frame_box, box))
+
+            # Direct grab from the camera
+            frame = self._camera.grab(region=box)
 
             if frame is None:
                 # No new frame available (VSync limit)
                 # Return cached frame to allow Logic Loop to spin at 1000Hz+
                 if self.last_valid_frame is not None:
-                    return True, self.last_valid_frame
+                    self._frame_pending = False
+                    self.frames_captured += 1
+                    self.duplicate_frames += 1
+                    if frame_box is not None and _contains(frame_box, box):
+                        return True, self._hand_out(self._crop(frame_box, box))
+                    return True, self._hand_out(self.last_valid_frame)
                 return False, None
 
             self.last_valid_frame = frame
-            return True, frame
+            self._frame_box = box
+            self._frame_pending = False
+            self._view_box = self._view = None
+            self.frame_time = self._perf_counter()
+            self.frames_captured += 1
+            return True, self._hand_out(frame)
 
         except Exception:
             return False, None
 
+    def wait_for_frame(self, timeout: float, region: dict | None = None) -> bool:
+        if self._frame_pending:
+            return True
+        if region is not None:
+            left = region["left"]
+            top = region["top"]
+            box = (left, top, left + region["width"], top + region["height"])
+        elif self._last_region is not None:
+            box = self._last_region
+        else:
+            return True
+
+        # The camera API has no blocking acquire: poll the whole area with short sleeps
+        # and keep the new frame for the grabs that follow (each gets a view of its region).
+        deadline = time.perf_counter() + timeout
+        try:
+            while True:
+                frame = self._camera.grab(region=box)
+                if frame is not None:
+                    self.last_valid_frame = frame
+                    self._frame_box = box
+                    self._frame_pending = True
+                    self._view_box = self._view = None
+                    self._pending_frame_time = self._perf_counter()
+                    return True
+                if time.perf_counter() >= deadline:
+                    return False
+                time.sleep(self.FRAME_POLL_INTERVAL)
+        except Exception:
+            return False
+
     def close(self) -> None:
+        self._frame_pending = False
+        self.last_valid_frame = self._view = self._handed_out = None
         try:
             del self._camera
         except Exception:
             pass
 
 
-class BetterCamBackend(CaptureBackend):
+class DXGIBackend(_GrabModeBackend):
+    """
+    DXGI-based capture backend using dxcam (Windows only, High Performance).
+    Uses 'Grab Mode' (Manual) with caching to bypass VSync locking.
+    """
+
+    name = "dxgi"
+
+    def __init__(self, clock: Clock | None = None):
+        try:
+            import dxcam
+        except ImportError:
+            raise ImportError("dxcam not installed") from None
+
+        super().__init__(clock)
+        # output_color="BGRA" allows direct compatibility with existing pipeline
+        self._camera = dxcam.create(output_color="BGRA", output_idx=0)
+
+
+class BetterCamBackend(_GrabModeBackend):
     """
     BetterCam-based capture backend (High Performance, Region Optimized).
     Supports very fast region capture (~400 FPS visual) via NVIDIA NvFBC or Desktop Duplication.
     """
 
-    def __init__(self):
+    name = "bettercam"
+
+    def __init__(self, clock: Clock | None = None):
         try:
             import bettercam
         except ImportError:
             raise ImportError("bettercam not installed") from None
 
+        super().__init__(clock)
         # Output 0, BGRA color mode
         self._camera = bettercam.create(output_idx=0, output_color="BGRA")
-        self.last_valid_frame = None
-
-    def grab(self, region: dict) -> tuple[bool, NDArray[np.uint8] | None]:
-        try:
-            # bettercam expects (left, top, right, bottom)
-            left = region["left"]
-            top = region["top"]
-            right = left + region["width"]
-            bottom = top + region["height"]
-
-            # Direct region grab
-            frame = self._camera.grab(region=(left, top, right, bottom))
-
-            if frame is None:
-                # Fallback to cache if capture fails
-                # Return cached frame to allow Logic Loop to spin at 1000Hz+
-                if self.last_valid_frame is not None:
-                    return True, self.last_valid_frame
-                return False, None
-
-            self.last_valid_frame = frame
-            return True, frame
-
-        except Exception:
-            return False, None
-
-    def close(self) -> None:
-        try:
-            del self._camera
-        except Exception:
-            pass
@@ -9,6 +9,7 @@ OPTIMIZATIONS (V3.3.0 ULTRATHINK):
 - Zero-copy buffer architecture via `np.frombuffer` for ultra-low latency.
 - Thread-local MSS instances for concurrent screen capture safety.
 - Version-based Cache Invalidation (Observer Pattern) for O(1) config checks.
+- Accepts the loop's per-frame `ConfigSnapshot` (one consistent set of settings per frame).
 - Local Variable Caching in hot loops to eliminate attribute lookup overhead.
 """
 
@@ -20,6 +21,11 @@ import numpy as np
 from numpy.typing import NDArray
 
 from core.capture import CaptureBackend, DXGIBackend, MSSBackend
+from utils.clock import SYSTEM_CLOCK, Clock
+from utils.config import ConfigSnapshot
+
+# Half-size of the local search box around the last target (px)
+LOCAL_SEARCH_MARGIN = 100
 
 
 class DetectionSystem:
@@ -36,16 +42,23 @@ class DetectionSystem:
     _last_color_tolerance: int | None
     _backend: CaptureBackend | None
 
-    def __init__(self, config: Any, perf_monitor: Any) -> None:
+    def __init__(
+        self, config: Any, perf_monitor: Any, clock: Clock | None = None, backend: CaptureBackend | None = None
+    ) -> None:
         """
         Initialize the detection system
 
         Args:
             config: Configuration object with detection settings
             perf_monitor: PerformanceMonitor instance for telemetry
+            clock: Time source for capture timestamps (defaults to the system clock)
+            backend: Capture backend to use instead of the one selected by `capture_method`
+                (e.g. the simulator's virtual camera). Owned by the caller: never closed here.
         """
         self.config = config
         self.perf_monitor = perf_monitor
+        self._clock = clock or SYSTEM_CLOCK
+        self._perf_counter = self._clock.perf_counter
 
         # Initialize thread-local storage for MSS instances
         # This prevents threading issues with screen capture
@@ -54,6 +67,9 @@ class DetectionSystem:
         # Shared backend storage (for DXGI)
         self._backend = None
         self._current_capture_method = None
+        # capture_method of the last frame's snapshot (None until the first frame: live config)
+        self._capture_method: str | None = None
+        self._injected_backend = backend
 
         # Target position tracking
         self.target_x = 0
@@ -79,11 +95,22 @@ class DetectionSystem:
 
         # Optimization: Pre-allocate capture area dictionaries to avoid per-frame allocation
         self._capture_area = {"left": 0, "top": 0, "width": 0, "height": 0}
+        # Area covering every local and full search box (frame waits acquire it once per frame)
+        self._watch_area: dict[str, int] | None = None
 
         # Cache for frame identity to skip redundant CV2 processing
         self._last_processed_frame_id = -1
         self._last_result = (False, 0, 0)
 
+        # perf_counter() timestamp of the most recent capture (start of grab).
+        # Consumed by the logic loop to measure capture-to-input latency.
+        self.last_capture_time = 0.0
+        # Acquisition time of the frame behind the latest result: earlier than last_capture_time
+        # when the backend handed back a cached frame (DXGI/BetterCam between presents)
+        self.last_frame_time = 0.0
+        # Backend used by the most recent capture (read by reporting threads, never created there)
+        self.active_backend: CaptureBackend | None = None
+
     def close(self) -> None:
         """
         Cleanup resources for the current thread.
@@ -105,12 +132,21 @@ class DetectionSystem:
                 pass
             self._backend = None
 
-    def _get_backend(self) -> CaptureBackend:
+    def _get_backend(self, method: str | None = None) -> CaptureBackend:
         """
         Get the appropriate capture backend based on configuration.
         Handles switching between backends and thread-local storage for MSS.
+
+        Args:
+            method: Capture method to use (defaults to the one of the last frame's config snapshot)
         """
-        method = getattr(self.config, "capture_method", "mss")
+        if self._injected_backend is not None:
+            return self._injected_backend
+
+        if method is None:
+            method = self._capture_method
+            if method is None:
+                method = getattr(self.config, "capture_method", "mss")
 
         # Handle method switch
         if method != self._current_capture_method:
@@ -134,7 +170,7 @@ class DetectionSystem:
         if method == "dxgi":
             if self._backend is None:
                 try:
-                    self._backend = DXGIBackend()
+                    self._backend = DXGIBackend(self._clock)
                 except Exception as e:
                     # Fallback to MSS if DXGI fails (e.g. missing dll, admin rights)
                     print(f"DXGI Backend init failed: {e}. Falling back to MSS.")
@@ -150,13 +186,56 @@ class DetectionSystem:
             self._local.backend = MSSBackend()
         return self._local.backend
 
-    def _update_color_bounds(self) -> None:
+    def get_capture_stats(self) -> dict[str, Any]:
+        """
+        Name and grab/duplicate-frame counters of the backend used by the last capture.
+        Safe from any thread: never creates a backend (MSS instances are per thread).
+        """
+        backend = self.active_backend
+        if backend is None:
+            return {"backend": "none", "frames": 0, "duplicate_frames": 0}
+        return {
+            "backend": backend.name,
+            "frames": backend.frames_captured,
+            "duplicate_frames": backend.duplicate_frames,
+        }
+
+    def supports_frame_events(self, cfg: Any = None) -> bool:
+        """
+        True if the capture backend can signal newly presented frames.
+
+        Args:
+            cfg: Config snapshot selecting the backend (defaults to the last frame's)
+        """
+        try:
+            method = getattr(cfg, "capture_method", None) if cfg is not None else None
+            return self._get_backend(method).frame_events is True
+        except Exception:
+            return False
+
+    def wait_for_frame(self, timeout: float) -> bool:
+        """
+        Block until the capture backend has a new frame (event-driven loop mode).
+        The frame covers the FOV plus the local search margin, so the searches that follow
+        read it whichever region they use.
+
+        Returns:
+            True if a new frame is ready, False on timeout or capture error.
+        """
+        try:
+            return self._get_backend().wait_for_frame(timeout, self._watch_area)
+        except Exception:
+            return False
+
+    def _update_color_bounds(self, cfg: Any = None) -> None:
         """
         Updates the cached color bounds.
         Triggered only when config version changes.
         """
-        current_color: int = self.config.target_color
-        current_tolerance: int = self.config.color_tolerance
+        if cfg is None:
+            cfg = self.config
+        current_color: int = cfg.target_color
+        current_tolerance: int = cfg.color_tolerance
 
         target_bgr = self._hex_to_bgr(current_color)
 
@@ -175,18 +254,20 @@ class DetectionSystem:
 
         # Cache update complete
 
-    def _update_fov_cache(self) -> None:
+    def _update_fov_cache(self, cfg: Any = None) -> None:
         """
         Updates cached FOV and screen dimension values.
         Triggered only when config version changes.
         """
+        if cfg is None:
+            cfg = self.config
         # Cache dimensions locally to avoid config lookups in hot path
-        self._screen_width = self.config.screen_width
-        self._screen_height = self.config.screen_height
+        self._screen_width = cfg.screen_width
+        self._screen_height = cfg.screen_height
 
         w, h = self._screen_width, self._screen_height
-        fov_x = self.config.fov_x
-        fov_y = self.config.fov_y
+        fov_x = cfg.fov_x
+        fov_y = cfg.fov_y
 
         self._center_x = w // 2
         self._center_y = h // 2
@@ -202,18 +283,36 @@ class DetectionSystem:
         self._scan_area = (scan_left, scan_top, scan_right, scan_bottom)
         # _last_fov_config removed as we use versioning now
 
-    def find_target(self) -> tuple[bool, int, int]:
+        # A local search box is centred on a target inside the FOV
+        watch_left = max(0, scan_left - LOCAL_SEARCH_MARGIN)
+        watch_top = max(0, scan_top - LOCAL_SEARCH_MARGIN)
+        self._watch_area = {
+            "left": watch_left,
+            "top": watch_top,
+            "width": min(w, scan_right + LOCAL_SEARCH_MARGIN) - watch_left,
+            "height": min(h, scan_bottom + LOCAL_SEARCH_MARGIN) - watch_top,
+        }
+
+    def find_target(self, cfg: ConfigSnapshot | None = None) -> tuple[bool, int, int]:
         """
         Search for target pixel color on screen
+
+        Args:
+            cfg: Config snapshot for this frame (reads the live config when omitted)
         """
         # ULTRATHINK: O(1) Version Check
         # Use getattr to support mocked config in tests which might not have _version
-        current_version = getattr(self.config, "_version", 0)
+        if cfg is not None:
+            current_version = cfg.version
+        else:
+            cfg = self.config
+            current_version = getattr(cfg, "_version", 0)
 
         # Initialize if first run or config changed
         if current_version != self._last_config_version or self._scan_area is None:
-            self._update_fov_cache()
-            self._update_color_bounds()
+            self._update_fov_cache(cfg)
+            self._update_color_bounds(cfg)
+            self._capture_method = getattr(cfg, "capture_method", "mss")
             self._last_config_version = current_version
 
         # First try local search if we found a target in the previous frame
@@ -244,11 +343,18 @@ class DetectionSystem:
         try:
             # Check if backend is valid/alive before usage
             backend = self._get_backend()
+            self.active_backend = backend
+            capture_time = self._perf_counter()
+            self.last_capture_time = capture_time
             success, img_bgra = backend.grab(area)
 
             if not success or img_bgra is None:
                 return False, None
 
+            # isinstance: mocked backends in tests carry no real frame_time
+            frame_time = backend.frame_time
+            self.last_frame_time = frame_time if isinstance(frame_time, float) and frame_time > 0.0 else capture_time
+
             return True, img_bgra
         except Exception:
             # Robustness: Force cleanup on error
@@ -278,7 +384,7 @@ class DetectionSystem:
         # Calculate local search area with bounds checking
         # Calculate local search area with bounds checking
         # Hardcoded optimization margin (user feedback: slider removed)
-        search_area: int = 100
+        search_area: int = LOCAL_SEARCH_MARGIN
         local_left = max(0, self.target_x - search_area)
         local_top = max(0, self.target_y - search_area)
         # Use cached screen dimensions
@@ -3,6 +3,10 @@ Fast Math Kernel (Phase 6: Bare Metal Performance)
 
 Optimized mathematical functions compiled with Numba JIT for
 extreme performance in the tracking hot loop.
+
+Batch kernels (`*_batch`) run the exact same per-sample kernels over whole
+trajectories in compiled loops, so offline analysis is bit-compatible with
+the streaming path.
 """
 
 import math
@@ -85,6 +89,7 @@ def calculate_prediction(
     prev_dy: float,
     dt: float,
     prediction_scale: float,
+    lookahead_time: float,
     smoothed_x: float,
     smoothed_y: float,
     screen_width: float,
@@ -95,6 +100,9 @@ def calculate_prediction(
     """
     Calculate predicted position with advanced physics logic.
     INCLUDES FIX for Axis-Coupling Bug (treating X/Y flips independently).
+
+    `lookahead_time` is the prediction horizon in seconds at scale 1.0
+    (0.1s in manual mode, the measured pipeline latency in auto mode).
     """
 
     # 1. Velocity Magnitude (Chebyshev distance for speed)
@@ -106,7 +114,7 @@ def calculate_prediction(
     if vel_mag < 100.0:
         vel_scale = max(0.0, vel_mag * 0.01)
 
-    base_lookahead = 0.1 * prediction_scale * vel_scale
+    base_lookahead = lookahead_time * prediction_scale * vel_scale
 
     # 3. Decoupled Direction Flip Suppression (FIXED)
     lookahead_x = base_lookahead
@@ -165,3 +173,146 @@ def calculate_prediction(
         pred_y = screen_height - 1.0
 
     return pred_x, pred_y
+
+
+@jit(nopython=True, cache=True, fastmath=False)
+def one_euro_filter_batch(
+    t,
+    x,
+    min_cutoff: float,
+    beta: float,
+    d_cutoff: float,
+    out_x,
+    out_dx,
+) -> None:
+    """
+    Run the 1 Euro Filter over many trajectories at once.
+
+    Each row is filtered independently, exactly as a fresh `OneEuroFilter`
+    seeded with the row's first sample and then fed the remaining samples.
+
+    NOTE: The loop itself is compiled without fastmath; all arithmetic happens in
+    `one_euro_filter_step`, which keeps its own flags, so results are bit-identical
+    to the streaming path.
+
+    Args:
+        t: (n_traj, n_samples) float64 timestamps
+        x: (n_traj, n_samples) float64 noisy values
+        min_cutoff: Minimum cutoff frequency
+        beta: Speed coefficient
+        d_cutoff: Derivative cutoff
+        out_x: (n_traj, n_samples) float64 output, filtered values
+        out_dx: (n_traj, n_samples) float64 output, filtered derivatives
+    """
+    n_traj, n_samples = x.shape
+    for r in range(n_traj):
+        if n_samples == 0:
+            continue
+        value_prev = x[r, 0]
+        deriv_prev = 0.0
+        t_prev = t[r, 0]
+        out_x[r, 0] = value_prev
+        out_dx[r, 0] = deriv_prev
+        for i in range(1, n_samples):
+            value_prev, deriv_prev, t_prev = one_euro_filter_step(
+                t[r, i], x[r, i], min_cutoff, beta, d_cutoff, value_prev, deriv_prev, t_prev
+            )
+            out_x[r, i] = value_prev
+            out_dx[r, i] = deriv_prev
+
+
+@jit(nopython=True, cache=True, fastmath=False)
+def motion_process_batch(
+    t,
+    x,
+    y,
+    min_cutoff: float,
+    beta: float,
+    d_cutoff: float,
+    prediction_scale: float,
+    lookahead_time: float,
+    screen_width: float,
+    screen_height: float,
+    fov_x: float,
+    fov_y: float,
+    out_x,
+    out_y,
+) -> None:
+    """
+    Replay `MotionEngine.process` (smoothing + prediction + rounding) over many
+    trajectories at once.
+
+    Mirrors the streaming engine sample for sample: the first finite sample seeds
+    the filters and is returned rounded, non-finite samples return the last
+    filtered position without touching filter state.
+
+    Args:
+        t: (n_traj, n_samples) float64 timestamps
+        x, y: (n_traj, n_samples) float64 detected target coordinates
+        out_x, out_y: (n_traj, n_samples) int64 outputs (engine aim coordinates)
+    """
+    n_traj, n_samples = x.shape
+    for r in range(n_traj):
+        initialized = False
+        vx = 0.0
+        dvx = 0.0
+        tx = 0.0
+        vy = 0.0
+        dvy = 0.0
+        ty = 0.0
+        prev_dx = 0.0
+        prev_dy = 0.0
+        prev_t = t[r, 0] if n_samples > 0 else 0.0
+
+        for i in range(n_samples):
+            now = t[r, i]
+            dt = now - prev_t
+            prev_t = now
+            sx = x[r, i]
+            sy = y[r, i]
+
+            # Guard against NaN/Inf inputs
+            if not (math.isfinite(sx) and math.isfinite(sy)):
+                if initialized:
+                    out_x[r, i] = int(vx + 0.5)
+                    out_y[r, i] = int(vy + 0.5)
+                else:
+                    out_x[r, i] = 0
+                    out_y[r, i] = 0
+                continue
+
+            if not initialized:
+                vx = sx
+                dvx = 0.0
+                tx = now
+                vy = sy
+                dvy = 0.0
+                ty = now
+                initialized = True
+                out_x[r, i] = int(sx + 0.5)
+                out_y[r, i] = int(sy + 0.5)
+                continue
+
+            vx, dvx, tx = one_euro_filter_step(now, sx, min_cutoff, beta, d_cutoff, vx, dvx, tx)
+            vy, dvy, ty = one_euro_filter_step(now, sy, min_cutoff, beta, d_cutoff, vy, dvy, ty)
+
+            px, py = calculate_prediction(
+                dvx,
+                dvy,
+                prev_dx,
+                prev_dy,
+                dt,
+                prediction_scale,
+                lookahead_time,
+                vx,
+                vy,
+                screen_width,
+                screen_height,
+                fov_x,
+                fov_y,
+            )
+            prev_dx = dvx
+            prev_dy = dvy
+
+            out_x[r, i] = int(px + 0.5)
+            out_y[r, i] = int(py + 0.5)
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+
+"""
+Frame Loop
+
+One logic-loop iteration, shared by the app loop (`main.py`) and the headless runner so
+benchmarks and soak runs measure the loop that ships:
+- config snapshot refresh and the settings that follow a new version (idle governor,
+  span tracing, input backend, input dispatcher, event/fixed pacing)
+- the event-mode wait for a new captured frame, the frame start and the motion time step
+- detect -> idle governor -> predict -> aim (or post to the input thread), with latency samples
+- frame recording, the next pacing deadline and the precision sleep to it
+
+Owners keep only what differs: the app adds GUI updates, diagnostics and logging; the
+headless runner counts results for its report.
+
+OPTIMIZATIONS:
+- Hot-path methods are bound once in `__init__`, so a frame runs no attribute chains.
+- Each frame runs on one `ConfigSnapshot` compared by identity; settings are re-read
+  only when the version changes (static configs without snapshots are read directly).
+"""
+
+import math
+from collections.abc import Callable
+from typing import Any
+
+from core.detection import DetectionSystem
+from core.idle_governor import IdleGovernor
+from core.input_dispatcher import InputDispatcher
+from core.low_level_movement import LowLevelMovementSystem
+from core.motion_engine import MotionEngine
+from utils.clock import Clock
+from utils.performance_monitor import PerformanceMonitor
+
+# Event-driven loop mode: longest wait for a new frame before the loop wakes anyway
+# (keeps stop requests and config changes responsive on a static screen)
+FRAME_WAIT_TIMEOUT = 0.05
+
+
+class FrameLoop:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Per-frame pipeline step and pacing state of the logic loop.
+
+    Called from the logic thread only. One iteration:
+
+        waited, ready = loop.wait_for_frame(scanning)
+        loop_start = loop.begin_frame(waited)
+        loop.refresh_config()
+        if ready: loop.process()
+        loop.pace(loop.end_frame(loop_start, waited))
+    """
+
+    def __init__(
+        self,
+        config: Any,
+        detection: DetectionSystem,
+        motion_engine: MotionEngine,
+        movement: LowLevelMovementSystem,
+        input_dispatcher: InputDispatcher,
+        perf_monitor: PerformanceMonitor,
+        idle_governor: IdleGovernor,
+        clock: Clock,
+        on_warning: Callable[[str], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            on_warning: Receives one-off configuration warnings (e.g. event mode unsupported)
+        """
+        self.config = config
+        self.detection = detection
+        self.movement = movement
+        self.input_dispatcher = input_dispatcher
+        self.perf_monitor = perf_monitor
+        self.idle_governor = idle_governor
+        self.clock = clock
+        self._on_warning = on_warning
+        self._frame_events_warned = False
+        # Static configs (e.g. `simulation_config`) have no snapshots: stages read them directly
+        self._get_snapshot: Callable[[], Any] | None = getattr(config, "snapshot", None)
+
+        # Hot-path bindings
+        self._perf_counter = clock.perf_counter
+        self._find_target = detection.find_target
+        self._detection_wait = detection.wait_for_frame
+        self._process_motion = motion_engine.process
+        self._aim_at = movement.aim_at
+        self._post_target = input_dispatcher.post
+
+        # Settings of the current snapshot
+        self.cfg: Any = None
+        self.async_input = False
+        self.event_driven = False
+        # Frame interval from the governor: 1 / target_fps, or the idle scan interval
+        self.target_frame_time = idle_governor.interval
+
+        # Per-frame state
+        self.last_loop_start = 0.0
+        # Deadline the pacing sleep aims the next frame start at (0 = unscheduled: first or event-driven frame)
+        self.next_frame_start = 0.0
+        self.motion_dt = self.target_frame_time
+        # Result of the current frame (set by process before aiming, so it survives an input error)
+        self.target_found = False
+        self.capture_time = 0.0
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Apply the current config and start from the active scan rate (call before the first frame)."""
+        get_snapshot = self._get_snapshot
+        self.cfg = get_snapshot() if get_snapshot is not None else None
+        self.apply_config()
+        self.reset_idle()
+        self.last_loop_start = 0.0
+        self.next_frame_start = 0.0
+
+    def refresh_config(self) -> bool:
+        """
+        Take this frame's config snapshot; a new version (e.g. the enable toggle) is applied
+        before any stage runs. Returns True if the version changed.
+        """
+        get_snapshot = self._get_snapshot
+        if get_snapshot is None:
+            return False
+        cfg = get_snapshot()
+        if cfg is self.cfg:
+            return False
+        self.cfg = cfg
+        self.apply_config()
+        return True
+
+    def apply_config(self) -> None:
+        """
+        Re-read the settings that depend on the config (governor, tracing, backends, loop mode)
+        from the current snapshot, or from the config itself when it has no snapshots.
+        """
+        source = self.cfg if self.cfg is not None else self.config
+        idle_governor = self.idle_governor
+        # Picks up target_fps and the idle settings
+        idle_governor.update_config(source)
+        self.target_frame_time = idle_governor.interval
+        self.perf_monitor.tracing = getattr(source, "trace_spans", False) is True
+        self.movement.update_backend()
+        self.async_input = self.sync_input_dispatcher(source)
+        self.event_driven = self.use_frame_events(source)
+
+    def reset_idle(self) -> None:
+        """Back to the active scan rate (e.g. when tracking is toggled)."""
+        self.idle_governor.reset()
+        self.target_frame_time = self.idle_governor.interval
+
+    def sync_input_dispatcher(self, cfg: Any) -> bool:
+        """Start/stop the input dispatcher thread to match `cfg`. Returns whether it is in use."""
+        substeps = cfg.output_substeps
+        substeps = substeps if isinstance(substeps, int) and substeps > 1 else 1
+        self.input_dispatcher.substeps = substeps
+
+        # Micro-moves are paced by the dispatcher thread, so they imply async input
+        async_input = cfg.async_input is True or substeps > 1
+        if async_input and not self.input_dispatcher.running:
+            self.input_dispatcher.start()
+        elif not async_input and self.input_dispatcher.running:
+            self.input_dispatcher.stop()
+        return async_input
+
+    def use_frame_events(self, cfg: Any) -> bool:
+        """Whether the loop should wait for new frames (event loop mode in `cfg` and a backend that signals them)."""
+        if cfg.loop_mode != "event":
+            return False
+        if self.detection.supports_frame_events(cfg):
+            return True
+        if not self._frame_events_warned:
+            self._frame_events_warned = True
+            if self._on_warning is not None:
+                self._on_warning("Capture backend has no new-frame signal; event loop mode falls back to fixed pacing")
+        return False
+
+    # ------------------------------------------------------------------
+    # Frame
+    # ------------------------------------------------------------------
+    def wait_for_frame(self, scanning: bool = True) -> tuple[bool, bool]:
+        """
+        Event-driven mode: block until capture presents a new frame (one iteration per real
+        frame, no spinning on cached frames). Idle scans are paced by the governor instead.
+
+        Args:
+            scanning: Detection will run this frame (no wait otherwise)
+
+        Returns:
+            (waited, frame_ready): whether the frame is event-paced, and whether a new frame arrived
+        """
+        if not (self.event_driven and scanning and not self.idle_governor.idle):
+            return False, True
+        perf_monitor = self.perf_monitor
+        perf_monitor.start_probe("frame_wait")
+        frame_ready = self._detection_wait(FRAME_WAIT_TIMEOUT)
+        perf_monitor.stop_probe("frame_wait")
+        return True, frame_ready
+
+    def begin_frame(self, waited: bool) -> float:
+        """Record the frame start against the pacing schedule and start the frame probe. Returns the start time."""
+        loop_start = self._perf_counter()
+        perf_monitor = self.perf_monitor
+        perf_monitor.record_frame_start(loop_start, self.next_frame_start, self.target_frame_time)
+        # Motion time step: the real frame interval when paced by frames
+        motion_dt = self.target_frame_time
+        if waited and 0.0 < loop_start - self.last_loop_start < FRAME_WAIT_TIMEOUT:
+            motion_dt = loop_start - self.last_loop_start
+        self.motion_dt = motion_dt
+        self.last_loop_start = loop_start
+        self.target_found = False
+        self.capture_time = 0.0
+        perf_monitor.start_probe("main_loop_active")
+        return loop_start
+
+    def process(self) -> bool:
+        """
+        Detect, update the idle governor, then predict and aim (or hand off to the input thread).
+
+        Returns:
+            Whether the target was found. Exceptions propagate to the owner; detection results
+            (`target_found`, `capture_time`, the governor state) are kept if aiming fails.
+        """
+        cfg = self.cfg
+        perf_counter = self._perf_counter
+        perf_monitor = self.perf_monitor
+        detection = self.detection
+
+        t0_detect = perf_counter()
+        target_found, target_x, target_y = self._find_target(cfg)
+        perf_monitor.record_detection(perf_counter() - t0_detect)
+        self.target_found = target_found
+        self.capture_time = detection.last_frame_time
+
+        # Idle governor: low scan rate after N misses, full rate on the first hit
+        self.target_frame_time = self.idle_governor.update(target_found)
+
+        if target_found:
+            # Calculate motion (smoothing + prediction)
+            predicted_x, predicted_y = self._process_motion(target_x, target_y, self.motion_dt, cfg)
+            if self.async_input:
+                # Hand off to the input thread (latest-wins, never blocks on SendInput)
+                self._post_target(predicted_x, predicted_y, detection.last_capture_time, detection.last_frame_time, cfg)
+            else:
+                self._aim_at(predicted_x, predicted_y, cfg)
+                # End-to-end latency: capture timestamp / frame acquisition -> SendInput return
+                input_time = perf_counter()
+                perf_monitor.record_pipeline_latency(
+                    input_time - detection.last_capture_time, input_time - detection.last_frame_time
+                )
+        return target_found
+
+    def end_frame(self, loop_start: float, waited: bool) -> float:
+        """
+        Stop the frame probe, record the frame and set the next pacing deadline.
+
+        Returns:
+            Time left until the deadline in seconds (<= 0: the frame overran; event-paced frames: 0)
+        """
+        frame_end = self._perf_counter()
+        perf_monitor = self.perf_monitor
+        perf_monitor.stop_probe("main_loop_active")
+        actual_frame_time = frame_end - loop_start
+        sleep_time = self.target_frame_time - actual_frame_time
+        capture_time = self.capture_time
+        perf_monitor.record_frame(
+            actual_frame_time,
+            missed=sleep_time <= 0,
+            target_found=self.target_found,
+            frame_age=frame_end - capture_time if capture_time > 0.0 else math.nan,
+        )
+        if waited:
+            # Event mode is paced by the frame wait instead
+            self.next_frame_start = 0.0
+            return 0.0
+        self.next_frame_start = loop_start + self.target_frame_time
+        return sleep_time
+
+    def pace(self, sleep_time: float) -> None:
+        """Precision sleep to the next frame deadline (delegated to the clock); records the wake-up error."""
+        if sleep_time > 0.0:
+            # SystemClock waits on a high-resolution kernel timer, then spins ~100µs;
+            # SimulatedClock jumps straight to the deadline.
+            self.perf_monitor.record_wake_error(self.clock.sleep_until(self.next_frame_start))
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+
+"""
+Headless Runner
+
+Runs the tracking pipeline (`DetectionSystem` -> `MotionEngine` -> `LowLevelMovementSystem`)
+without DearPyGui, a viewport or DPI setup, for soak tests and scripted runs on servers:
+
+    python -m core.headless --duration 60 --json report.json
+    python -m core.headless --frames 5000 --set target_fps=500 --set capture_method=dxgi
+    python -m core.headless --duration 30 --trace trace.json   # open in ui.perfetto.dev
+    python -m core.headless --duration 3600 --telemetry soak.cttl   # per-frame records, see load_telemetry
+    python -m core.headless --duration 600 --metrics-port 9464   # scrape http://127.0.0.1:9464/metrics
+    python -m core.headless --duration 60 --profile loop.folded   # flamegraph.pl / speedscope input
+    python -m core.headless --duration 600 --slow-frames snaps/   # JSON snapshot per slow frame
+
+Output goes to the "recording" input backend unless `--live-input` is given, so a run
+never moves the real cursor by accident. Settings come from config.json (or `--config`)
+plus `--set` overrides and are never written back.
+OPTIMIZATIONS:
+- Runs the app's own frame step (`core.frame_loop.FrameLoop`): event-driven frame waits,
+  idle governor, async input dispatch and precision-timer pacing all follow the config,
+  so benchmark numbers measure the loop that ships.
+- Hot-path methods are bound to locals; the runner only adds counting and reporting.
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+import threading
+import time
+from typing import Any
+
+from core.capture import CaptureBackend
+from core.detection import DetectionSystem
+from core.frame_loop import FrameLoop
+from core.idle_governor import IdleGovernor
+from core.input_backend import InputBackend
+from core.input_dispatcher import InputDispatcher
+from core.low_level_movement import LowLevelMovementSystem
+from core.motion_engine import MotionEngine
+from utils.clock import SYSTEM_CLOCK, Clock
+from utils.metrics_server import DEFAULT_METRICS_PORT, MetricsServer
+from utils.performance_monitor import PerformanceMonitor
+from utils.sampling_profiler import SamplingProfiler
+
+# Probes reported when they recorded samples
+REPORT_PROBES = ("main_loop_active", "frame_wait", "detection_capture", "detection_process", "movement_input")
+
+
+class HeadlessRunner:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    GUI-free owner of the core systems; runs the logic loop for a fixed duration or frame count.
+    """
+
+    def __init__(
+        self,
+        config: Any,
+        clock: Clock | None = None,
+        capture_backend: CaptureBackend | None = None,
+        input_backend: InputBackend | None = None,
+    ) -> None:
+        """
+        Args:
+            config: Config (or any object with the same attributes)
+            clock: Time source for the loop and all core systems
+            capture_backend: Capture backend to use instead of `capture_method`
+            input_backend: Input backend to use instead of `input_method`
+        """
+        self.config = config
+        self.clock = clock or SYSTEM_CLOCK
+        self.perf_monitor = PerformanceMonitor(clock=self.clock)
+        self.detection = DetectionSystem(config, self.perf_monitor, clock=self.clock, backend=capture_backend)
+        self.motion_engine = MotionEngine(config, self.perf_monitor, clock=self.clock)
+        self.movement = LowLevelMovementSystem(config, self.perf_monitor, clock=self.clock, backend=input_backend)
+        self.input_dispatcher = InputDispatcher(self.movement, self.perf_monitor, clock=self.clock)
+        self.idle_governor = IdleGovernor.from_config(config)
+        self.perf_monitor.governor = self.idle_governor
+        # The app's per-frame pipeline and pacing (see core/frame_loop.py)
+        self.frame_loop = FrameLoop(
+            config,
+            self.detection,
+            self.motion_engine,
+            self.movement,
+            self.input_dispatcher,
+            self.perf_monitor,
+            self.idle_governor,
+            self.clock,
+        )
+        # Stack sampler of the last run (when `sampling_profiler` is enabled)
+        self.profiler: SamplingProfiler | None = None
+
+        # Detection centres its FOV on the configured screen size
+        config.screen_width = self.movement.screen_width
+        config.screen_height = self.movement.screen_height
+
+    def run(
+        self,
+        duration: float | None = None,
+        max_frames: int | None = None,
+        telemetry_path: str | None = None,
+        slow_frames_dir: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run the loop until `duration` seconds or `max_frames` iterations (whichever comes first).
+        Ctrl+C ends the run early; the report covers what ran.
+
+        Args:
+            telemetry_path: Stream per-frame records to this file (also enabled by `telemetry_stream`,
+                which writes to logs/telemetry/)
+            slow_frames_dir: Write slow-frame snapshots to this directory (also enabled by
+                `slow_frame_forensics`, which writes to logs/slow_frames/)
+
+        Returns:
+            The performance report (see `build_report`).
+        """
+        if duration is None and max_frames is None:
+            raise ValueError("Headless run needs a duration or a frame count")
+
+        perf_counter = self.clock.perf_counter
+        perf_monitor = self.perf_monitor
+        detection = self.detection
+        frame_loop = self.frame_loop
+        wait_for_frame = frame_loop.wait_for_frame
+        begin_frame = frame_loop.begin_frame
+        refresh_config = frame_loop.refresh_config
+        process_frame = frame_loop.process
+        end_frame = frame_loop.end_frame
+        pace = frame_loop.pace
+
+        frame_loop.start()
+        if telemetry_path is not None or getattr(self.config, "telemetry_stream", False) is True:
+            perf_monitor.start_telemetry(telemetry_path)
+        sink = perf_monitor.telemetry_sink
+        metrics_server = None
+        if getattr(self.config, "metrics_endpoint", False) is True:
+            metrics_server = MetricsServer(
+                perf_monitor, detection, getattr(self.config, "metrics_port", DEFAULT_METRICS_PORT)
+            )
+            metrics_server.start()
+        profiler = None
+        if getattr(self.config, "sampling_profiler", False) is True:
+            profiler = SamplingProfiler(threading.get_ident(), getattr(self.config, "profiler_interval_ms", 5) / 1000.0)
+            self.profiler = profiler
+            profiler.start()
+        if getattr(self.config, "gc_tracking", False) is True:
+            perf_monitor.start_gc_tracking(freeze=getattr(self.config, "gc_freeze", False) is True)
+        gc_monitor = perf_monitor.gc_monitor
+        forensics = None
+        if slow_frames_dir is not None or getattr(self.config, "slow_frame_forensics", False) is True:
+            forensics = perf_monitor.start_forensics(
+                slow_frames_dir, factor=getattr(self.config, "slow_frame_factor", 3.0)
+            )
+            forensics.context_sources["capture"] = detection.get_capture_stats
+            forensics.context_sources["config_version"] = lambda: getattr(self.config, "_version", 0)
+        max_frames = max_frames if max_frames is not None else sys.maxsize
+
+        frames = 0
+        detections = 0
+        errors = 0
+        start_time = perf_counter()
+        end_time = start_time + duration if duration is not None else float("inf")
+        wall_start = time.perf_counter()
+
+        try:
+            while frames < max_frames and perf_counter() < end_time:
+                waited, frame_ready = wait_for_frame()
+                if not frame_ready:
+                    continue
+
+                loop_start = begin_frame(waited)
+                frames += 1
+                refresh_config()
+
+                try:
+                    if process_frame():
+                        detections += 1
+                except Exception as e:
+                    errors += 1
+                    if errors == 1:
+                        print(f"Headless pipeline error: {e}")
+
+                pace(end_frame(loop_start, waited))
+        except KeyboardInterrupt:
+            print("Headless run interrupted; reporting partial results.")
+        finally:
+            self.input_dispatcher.stop()
+            perf_monitor.stop_telemetry()
+            if metrics_server is not None:
+                metrics_server.stop()
+            if profiler is not None:
+                profiler.stop()
+            # Read before stopping: stopping undoes freeze mode
+            gc_stats = gc_monitor.get_stats() if gc_monitor is not None else None
+            perf_monitor.stop_gc_tracking()
+            # Stopped after GC tracking's stats are read; joins the writer, so snapshots are on disk
+            perf_monitor.stop_forensics()
+
+        report = self.build_report(
+            frames=frames,
+            detections=detections,
+            errors=errors,
+            elapsed=perf_counter() - start_time,
+            wall_time=time.perf_counter() - wall_start,
+        )
+        if sink is not None:
+            report["telemetry"] = {"path": sink.path, "frames": sink.rows_written, "dropped": sink.dropped_rows}
+        if profiler is not None:
+            report["profiler"] = profiler.get_overhead()
+        if gc_stats is not None:
+            report["gc"] = gc_stats
+        if forensics is not None:
+            report["slow_frames"] = {
+                "directory": forensics.directory,
+                "snapshots": forensics.snapshots,
+                "suppressed": forensics.suppressed,
+                "threshold_ms": forensics.get_stats()["threshold_ms"],
+            }
+        return report
+
+    def build_report(self, frames: int, detections: int, errors: int, elapsed: float, wall_time: float) -> dict:
+        """JSON-serializable run summary: loop counters, monitor stats, probes and backends."""
+        perf_monitor = self.perf_monitor
+        probes = {}
+        for name in REPORT_PROBES:
+            probe_stats = perf_monitor.get_probe_stats(name)
+            if probe_stats:
+                probes[name] = probe_stats
+
+        backend = self.movement.backend
+        input_stats = backend.get_stats() if hasattr(backend, "get_stats") else {}
+        config = self.config
+        return {
+            "frames": frames,
+            "detections": detections,
+            "detection_rate": detections / frames if frames else 0.0,
+            "errors": errors,
+            "elapsed_s": elapsed,
+            "wall_time_s": wall_time,
+            "loop_fps": frames / elapsed if elapsed > 0 else 0.0,
+            "stats": perf_monitor.get_stats(),
+            "probes": probes,
+            "input": {"method": backend.name, **input_stats},
+            "config": {
+                key: getattr(config, key, None)
+                for key in ("capture_method", "loop_mode", "target_fps", "fov_x", "fov_y", "async_input")
+            },
+        }
+
+    def close(self) -> None:
+        self.input_dispatcher.stop()
+        self.detection.close()
+        self.movement.close()
+
+
+def parse_overrides(items: list[str]) -> dict[str, str]:
+    """Parse `KEY=VALUE` items from `--set` (values are validated by `Config.validate`)."""
+    overrides = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep or not key.strip():
+            raise ValueError(f"Expected KEY=VALUE, got {item!r}")
+        overrides[key.strip()] = value.strip()
+    return overrides
+
+
+def apply_overrides(config: Any, overrides: dict[str, str]) -> None:
+    """Validate and apply overrides in memory (never saved to config.json)."""
+    for key, value in overrides.items():
+        if key not in config.DEFAULT_CONFIG:
+            raise ValueError(f"Unknown configuration key: {key}")
+        setattr(config, key, config.validate(key, value))
+
+
+def print_report(report: dict[str, Any]) -> None:
+    stats = report["stats"]
+    print("-" * 60)
+    print("HEADLESS RUN REPORT")
+    print("-" * 60)
+    print(f"Frames:          {report['frames']} in {report['elapsed_s']:.2f}s ({report['loop_fps']:.1f} FPS)")
+    print(f"Detections:      {report['detections']} ({report['detection_rate'] * 100.0:.1f}%)")
+    print(f"Errors:          {report['errors']}")
+    print(f"Avg Frame:       {stats['avg_frame_ms']:.3f} ms (worst {stats['worst_frame_ms']:.3f} ms)")
+    print(f"1% Low FPS:      {stats['one_percent_low_fps']:.1f} (session {stats['session_one_percent_low_fps']:.1f})")
+    print(f"Frame p99/p99.9: {stats['frame_p99_ms']:.3f} / {stats['frame_p99_9_ms']:.3f} ms")
+    print(f"Missed Frames:   {int(stats['missed_frames'])}")
+    print(f"Pipeline Lat.:   {stats['pipeline_latency_ms']:.3f} ms")
+    print(
+        f"Capture->Input:  p50 {stats['capture_to_input_p50_ms']:.3f} / p99 {stats['capture_to_input_p99_ms']:.3f} ms"
+    )
+    print(f"Frame Age@Input: p50 {stats['input_frame_age_p50_ms']:.3f} / p99 {stats['input_frame_age_p99_ms']:.3f} ms")
+    print(f"Wake Error:      {stats['wake_error_ms'] * 1000.0:.0f} us")
+    print(
+        f"Start Error:     p50 {stats['pacing_start_error_p50_ms']:.3f} / p99 {stats['pacing_start_error_p99_ms']:.3f} ms"
+        f" | late {int(stats['pacing_late_starts'])} | drift {stats['pacing_drift_ms']:.2f} ms"
+    )
+    print(f"Frame Interval:  p50 {stats['pacing_interval_p50_ms']:.3f} / p99 {stats['pacing_interval_p99_ms']:.3f} ms")
+    print(f"Input:           {report['input']['method']}")
+    if "telemetry" in report:
+        telemetry = report["telemetry"]
+        print(f"Telemetry:       {telemetry['frames']} frames -> {telemetry['path']} ({telemetry['dropped']} dropped)")
+    if "gc" in report:
+        gc_stats = report["gc"]
+        print(
+            f"GC Pauses:       {int(gc_stats['pauses'])} ({int(gc_stats['gen2_pauses'])} gen2), "
+            f"worst {gc_stats['pause_max_ms']:.3f} ms | slow frames hit: "
+            f"{int(gc_stats['slow_frames_with_gc'])}/{int(gc_stats['slow_frames'])}"
+        )
+        print(
+            f"Alloc/Frame:     avg {gc_stats['alloc_blocks_avg']:.1f} blocks, max {int(gc_stats['alloc_blocks_max'])}"
+        )
+    if "slow_frames" in report:
+        slow_frames = report["slow_frames"]
+        print(
+            f"Slow Frames:     {slow_frames['snapshots']} snapshots ({slow_frames['suppressed']} rate limited, "
+            f"threshold {slow_frames['threshold_ms']:.3f} ms) -> {slow_frames['directory']}"
+        )
+    if "profiler" in report:
+        profiler = report["profiler"]
+        print(
+            f"Profiler:        {int(profiler['samples'])} samples, {profiler['avg_sample_us']:.1f} us/sample, "
+            f"overhead {profiler['overhead_pct']:.2f}%"
+        )
+    for name, probe in report["probes"].items():
+        print(
+            f"[{name}] avg {probe['avg_ms']:.4f} ms | p99 {probe['p99_ms']:.4f} ms | "
+            f"p99.9 {probe['p99_9_ms']:.4f} ms | max {probe['max_ms']:.4f} ms | n={probe['count']}"
+        )
+    print("-" * 60)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m core.headless", description="Run the tracking pipeline headless.")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds to run (default 10 without --frames).")
+    parser.add_argument("--frames", type=int, default=None, help="Stop after this many loop iterations.")
+    parser.add_argument(
+        "--config", dest="config_path", default=None, help="Config JSON to load instead of config.json."
+    )
+    parser.add_argument(
+        "--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE", help="Override a config value."
+    )
+    parser.add_argument("--live-input", action="store_true", help="Send real input (default: recording backend).")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write the report as JSON ('-' for stdout).")
+    parser.add_argument(
+        "--telemetry", dest="telemetry_path", default=None, help="Stream per-frame records to this binary file."
+    )
+    parser.add_argument(
+        "--trace", dest="trace_path", default=None, help="Capture per-frame spans and write a Chrome trace JSON."
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, default=None, help="Serve Prometheus metrics on 127.0.0.1 at this port."
+    )
+    parser.add_argument(
+        "--profile", dest="profile_path", default=None, help="Sample the loop's stack and write collapsed stacks."
+    )
+    parser.add_argument(
+        "--slow-frames", dest="slow_frames_dir", default=None, help="Write a JSON snapshot per slow frame to this dir."
+    )
+    args = parser.parse_args(argv)
+    if args.duration is None and args.frames is None:
+        args.duration = 10.0
+    return args
+
+
+def _run(args: argparse.Namespace) -> dict[str, Any] | None:
+    from utils.config import Config
+
+    config = Config()
+    if args.config_path and not config.import_from_file(args.config_path):
+        return None
+    try:
+        apply_overrides(config, parse_overrides(args.overrides))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return None
+    if not args.live_input:
+        config.input_method = "recording"
+    if args.trace_path:
+        config.trace_spans = True
+    if args.metrics_port is not None:
+        config.metrics_endpoint = True
+        config.metrics_port = args.metrics_port
+    if args.profile_path:
+        config.sampling_profiler = True
+    config.enabled = True
+
+    runner = HeadlessRunner(config)
+    try:
+        report = runner.run(
+            duration=args.duration,
+            max_frames=args.frames,
+            telemetry_path=args.telemetry_path,
+            slow_frames_dir=args.slow_frames_dir,
+        )
+        if args.trace_path and not runner.perf_monitor.export_trace(args.trace_path):
+            print(f"No spans captured; trace not written to {args.trace_path}", file=sys.stderr)
+        if args.profile_path and not (runner.profiler and runner.profiler.write_collapsed(args.profile_path)):
+            print(f"No stack samples; profile not written to {args.profile_path}", file=sys.stderr)
+        return report
+    finally:
+        runner.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    if args.json_path == "-":
+        # Keep stdout clean for the JSON document (config and backend messages go to stderr)
+        with contextlib.redirect_stdout(sys.stderr):
+            report = _run(args)
+    else:
+        report = _run(args)
+    if report is None:
+        return 2
+
+    if args.json_path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+        if args.json_path:
+            with open(args.json_path, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"Report: {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
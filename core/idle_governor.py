@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+"""
+Idle Governor Module
+
+Adaptive scan-rate governor for the logic loop.
+With tracking enabled but nothing in view, the loop would keep running full-FOV
+searches at `target_fps`. After `idle_after_misses` consecutive misses the governor
+drops to `idle_scan_fps`; the first hit snaps straight back to the full rate.
+OPTIMIZATIONS:
+- One branch and one counter update per frame; the frame interval is precomputed
+  for both states, so the loop just reads the returned value.
+- Miss-to-acquire latency is bounded: a target that appears while idle is seen at
+  the next idle scan, at most one idle interval (1 / `idle_scan_fps`) later.
+"""
+
+from typing import Any
+
+
+class IdleGovernor:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Two-state (active / idle) rate governor driven by consecutive detection misses.
+    """
+
+    __slots__ = (
+        "enabled",
+        "active_interval",
+        "idle_interval",
+        "idle_after_misses",
+        "idle",
+        "miss_streak",
+        "idle_entries",
+        "idle_frames",
+    )
+
+    def __init__(
+        self,
+        target_fps: int = 240,
+        idle_scan_fps: int = 30,
+        idle_after_misses: int = 120,
+        enabled: bool = False,
+    ) -> None:
+        self.enabled = enabled
+        self.active_interval = 1.0 / max(1, target_fps)
+        self.idle_interval = self.active_interval
+        self.idle_after_misses = 1
+        self.idle = False
+        self.miss_streak = 0
+        # Telemetry: times the governor went idle, frames scanned at the idle rate
+        self.idle_entries = 0
+        self.idle_frames = 0
+        self.configure(target_fps, idle_scan_fps, idle_after_misses, enabled)
+
+    def configure(self, target_fps: int, idle_scan_fps: int, idle_after_misses: int, enabled: bool) -> None:
+        """Apply settings. The idle rate never exceeds the active rate."""
+        self.enabled = enabled
+        self.active_interval = 1.0 / max(1, target_fps)
+        self.idle_interval = max(self.active_interval, 1.0 / max(1, idle_scan_fps))
+        self.idle_after_misses = max(1, idle_after_misses)
+        if not enabled:
+            self.reset()
+
+    @classmethod
+    def from_config(cls, config: Any) -> "IdleGovernor":
+        governor = cls()
+        governor.update_config(config)
+        return governor
+
+    def update_config(self, config: Any) -> None:
+        """Read `target_fps`, `idle_throttle`, `idle_scan_fps` and `idle_after_misses` from config."""
+        self.configure(
+            _get_int(config, "target_fps", 240),
+            _get_int(config, "idle_scan_fps", 30),
+            _get_int(config, "idle_after_misses", 120),
+            getattr(config, "idle_throttle", False) is True,
+        )
+
+    @property
+    def interval(self) -> float:
+        """Frame interval for the current state (seconds)."""
+        return self.idle_interval if self.idle else self.active_interval
+
+    @property
+    def max_acquire_delay(self) -> float:
+        """Worst-case extra delay before a newly visible target is scanned (seconds)."""
+        return self.idle_interval - self.active_interval if self.enabled else 0.0
+
+    def update(self, target_found: bool) -> float:
+        """
+        Feed one detection result.
+
+        Returns:
+            The frame interval to pace the next iteration with.
+        """
+        if target_found:
+            self.miss_streak = 0
+            if self.idle:
+                # First hit: snap back to the full rate immediately
+                self.idle = False
+            return self.active_interval
+
+        self.miss_streak += 1
+        if self.idle:
+            self.idle_frames += 1
+            return self.idle_interval
+        if self.enabled and self.miss_streak >= self.idle_after_misses:
+            self.idle = True
+            self.idle_entries += 1
+            return self.idle_interval
+        return self.active_interval
+
+    def reset(self) -> None:
+        """Back to the active state (e.g. when tracking is toggled)."""
+        self.idle = False
+        self.miss_streak = 0
+
+    def get_stats(self) -> dict[str, float]:
+        return {
+            "idle": float(self.idle),
+            "miss_streak": float(self.miss_streak),
+            "idle_entries": float(self.idle_entries),
+            "idle_frames": float(self.idle_frames),
+            "interval_ms": self.interval * 1000.0,
+            "max_acquire_delay_ms": self.max_acquire_delay * 1000.0,
+        }
+
+
+def _get_int(config: Any, name: str, default: int) -> int:
+    value = getattr(config, name, default)
+    return value if isinstance(value, int) and not isinstance(value, bool) else default
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+"""
+Input Backend Module
+
+Pluggable mouse-output backends for `LowLevelMovementSystem`.
+- `SendInputBackend`: Windows `SendInput` (default; the structure-reusing
+  implementation lives in `LowLevelMovementSystem`).
+- `GHubBackend`: Relative moves through the bundled `libs/ghub_device.dll` driver proxy.
+- `RecordingBackend`: Sends nothing; timestamps every move into a pre-allocated
+  NumPy ring buffer so headless (Linux) runs can measure input cost and cadence.
+"""
+
+import ctypes
+import os
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from utils.clock import SYSTEM_CLOCK, Clock
+
+INPUT_METHODS = ("sendinput", "ghub", "recording")
+
+# Known relative-move exports of Logitech driver proxy DLLs (see tools/inspect_logitech_dll.py)
+GHUB_EXPORTS = ("logi_mouse_move", "move_relative", "mouse_event", "dl_move")
+
+
+class InputBackend(ABC):
+    """
+    Abstract base class for mouse input backends.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def move_relative(self, dx: int, dy: int) -> bool:
+        """
+        Move the cursor by a relative offset (mickeys).
+
+        Returns:
+            True if the move was delivered.
+        """
+        pass
+
+    def move_absolute(self, x: int, y: int) -> bool:
+        """
+        Move the cursor to an absolute screen pixel. Backends without absolute
+        positioning return False (callers then have no fallback path).
+        """
+        return False
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Cleanup resources.
+        """
+        pass
+
+
+class SendInputBackend(InputBackend):
+    """
+    Windows SendInput backend.
+    Delegates to the owning `LowLevelMovementSystem`, which keeps the cached
+    INPUT structure and SendInput function pointer.
+    """
+
+    name = "sendinput"
+
+    def __init__(self, movement: Any) -> None:
+        self._send_relative = movement._send_input_relative
+        self._send_absolute = movement._send_input_absolute
+
+    def move_relative(self, dx: int, dy: int) -> bool:
+        return self._send_relative(dx, dy)
+
+    def move_absolute(self, x: int, y: int) -> bool:
+        return self._send_absolute(x, y)
+
+    def close(self) -> None:
+        pass
+
+
+class GHubBackend(InputBackend):
+    """
+    Logitech driver proxy backend (relative moves only).
+    """
+
+    name = "ghub"
+
+    def __init__(self, dll_path: str | None = None) -> None:
+        if dll_path is None:
+            from utils.paths import get_app_dir
+
+            dll_path = os.path.join(get_app_dir(), "libs", "ghub_device.dll")
+
+        if not os.path.exists(dll_path):
+            raise FileNotFoundError(f"Logitech DLL not found: {dll_path}")
+
+        # Raises OSError on non-Windows or architecture mismatch
+        self._dll = ctypes.CDLL(dll_path)
+
+        self._move = None
+        for export in GHUB_EXPORTS:
+            if hasattr(self._dll, export):
+                self._move = getattr(self._dll, export)
+                break
+        if self._move is None:
+            raise RuntimeError(f"No known mouse-move export in {dll_path} (expected one of {GHUB_EXPORTS})")
+
+        self._move.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.export_name = self._move.__name__
+
+    def move_relative(self, dx: int, dy: int) -> bool:
+        try:
+            self._move(dx, dy)
+            return True
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        self._move = None
+        self._dll = None
+
+
+class RecordingBackend(InputBackend):
+    """
+    Null backend that records every move (timestamp, dx, dy, absolute flag) into a
+    pre-allocated ring buffer. Nothing is allocated per move; once full, the oldest
+    records are overwritten.
+    """
+
+    name = "recording"
+
+    def __init__(self, capacity: int = 65536, clock: Clock | None = None) -> None:
+        # Power-of-two capacity so the ring index is a mask, not a modulo
+        capacity = 1 << max(1, int(capacity) - 1).bit_length()
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._perf_counter = (clock or SYSTEM_CLOCK).perf_counter
+
+        self._t = np.zeros(capacity, dtype=np.float64)
+        self._dx = np.zeros(capacity, dtype=np.int32)
+        self._dy = np.zeros(capacity, dtype=np.int32)
+        self._absolute = np.zeros(capacity, dtype=np.bool_)
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """Total moves recorded (including overwritten ones)."""
+        return self._count
+
+    def move_relative(self, dx: int, dy: int) -> bool:
+        i = self._count & self._mask
+        self._t[i] = self._perf_counter()
+        self._dx[i] = dx
+        self._dy[i] = dy
+        self._absolute[i] = False
+        self._count += 1
+        return True
+
+    def move_absolute(self, x: int, y: int) -> bool:
+        i = self._count & self._mask
+        self._t[i] = self._perf_counter()
+        self._dx[i] = x
+        self._dy[i] = y
+        self._absolute[i] = True
+        self._count += 1
+        return True
+
+    def clear(self) -> None:
+        self._count = 0
+
+    def close(self) -> None:
+        pass
+
+    def get_records(self) -> dict[str, NDArray[Any]]:
+        """Retained records in chronological order (copies): t, dx, dy, absolute."""
+        n = min(self._count, self.capacity)
+        start = (self._count - n) & self._mask
+        order = (start + np.arange(n)) & self._mask
+        return {
+            "t": self._t[order],
+            "dx": self._dx[order],
+            "dy": self._dy[order],
+            "absolute": self._absolute[order],
+        }
+
+    def get_stats(self) -> dict[str, float]:
+        """Dispatch cadence over the retained records."""
+        records = self.get_records()
+        t = records["t"]
+        stats = {
+            "moves": float(self._count),
+            "rate_hz": 0.0,
+            "interval_avg_ms": 0.0,
+            "interval_max_ms": 0.0,
+            "total_dx": float(records["dx"][~records["absolute"]].sum()),
+            "total_dy": float(records["dy"][~records["absolute"]].sum()),
+        }
+        if t.size > 1:
+            intervals = np.diff(t)
+            span = t[-1] - t[0]
+            stats["rate_hz"] = (t.size - 1) / span if span > 0 else 0.0
+            stats["interval_avg_ms"] = float(intervals.mean() * 1000.0)
+            stats["interval_max_ms"] = float(intervals.max() * 1000.0)
+        return stats
+
+
+def create_input_backend(method: str, movement: Any, clock: Clock | None = None) -> InputBackend:
+    """
+    Build the backend for an `input_method` config value.
+    Raises on initialization failure (callers fall back to SendInput).
+    """
+    if method == "ghub":
+        return GHubBackend()
+    if method == "recording":
+        return RecordingBackend(clock=clock)
+    return SendInputBackend(movement)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+"""
+Input Dispatcher Module
+
+Moves `SendInput` off the logic thread.
+OPTIMIZATIONS:
+- Single-slot, latest-wins mailbox: the logic loop posts a target and returns
+  immediately. A target that has not been sent yet is overwritten, never queued,
+  so a stall in the input path cannot build a backlog of stale aim points.
+- The `movement_input` probe (and any GetCursorPos/absolute-move fallback) runs on
+  the dispatcher thread, keeping input spikes out of the detection frame time.
+- Latency samples are handed to the logic thread (`post_pipeline_latency`) rather than
+  recorded here, so the monitor's latency histograms keep a single writer.
+- Sub-frame micro-moves (`substeps` > 1): each correction is spread over the
+  expected interval until the next vision frame as evenly timed relative moves.
+  Steps follow the rounded cumulative path, so sub-pixel residuals carry from
+  step to step and the steps always sum to the full correction.
+"""
+
+import math
+import threading
+from typing import Any
+
+from utils.clock import SYSTEM_CLOCK, Clock
+
+# Vision frame interval assumed before any measurement (144 Hz)
+DEFAULT_FRAME_INTERVAL = 1.0 / 144.0
+# Gaps longer than this are pauses (no target), not frame intervals
+MAX_FRAME_INTERVAL = 0.05
+# EMA weight for the measured interval between posted targets
+FRAME_INTERVAL_ALPHA = 0.2
+
+
+def _round_half_away(value: float) -> int:
+    """Round half away from zero (symmetric for left/right and up/down moves)."""
+    return int(value + 0.5) if value >= 0.0 else -int(-value + 0.5)
+
+
+class InputDispatcher:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Background input thread fed by a latest-wins mailbox.
+    """
+
+    def __init__(self, movement: Any, perf_monitor: Any, clock: Clock | None = None) -> None:
+        """
+        Args:
+            movement: LowLevelMovementSystem (`aim_at`, plus `get_move_delta` /
+                `move_relative_with_fallback` for micro-moves)
+            perf_monitor: PerformanceMonitor receiving the capture-to-input latency (posted for
+                the logic thread to record)
+            clock: Time source for pacing and the latency measurement
+        """
+        self.movement = movement
+        self.perf_monitor = perf_monitor
+        self._perf_counter = (clock or SYSTEM_CLOCK).perf_counter
+
+        self._cond = threading.Condition(threading.Lock())
+        # (target_x, target_y, capture_time, frame_time, config snapshot)
+        self._slot: tuple[int, int, float, float, Any] | None = None
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+        # Micro-move settings: 1 = one move per target (no interpolation)
+        self.substeps = 1
+        # Measured interval between posted targets (vision cadence)
+        self.frame_interval = DEFAULT_FRAME_INTERVAL
+        self._last_post_time = 0.0
+
+        # Counters (written under the mailbox lock or by the dispatcher thread only)
+        self.posted_count = 0
+        self.dropped_count = 0
+        self.dispatched_count = 0
+        self.micro_move_count = 0
+        self.error_count = 0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """Start the dispatcher thread (no-op if already running)."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._slot = None
+            self._last_post_time = 0.0
+        self._thread = threading.Thread(target=self._dispatch_loop, name="InputDispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the dispatcher thread. A target still in the mailbox is discarded."""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._slot = None
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def post(
+        self, target_x: int, target_y: int, capture_time: float = 0.0, frame_time: float = 0.0, cfg: Any = None
+    ) -> None:
+        """
+        Hand a target to the dispatcher thread and return immediately.
+
+        Args:
+            target_x, target_y: Screen coordinates for `aim_at`
+            capture_time: Capture timestamp of the frame the target came from
+                (0 = do not record pipeline latency)
+            frame_time: Acquisition time of that frame (earlier than `capture_time` for a reused
+                cached frame; 0 = unknown)
+            cfg: Config snapshot of the frame the target came from, used for the move
+                (None = the movement system reads the live config)
+        """
+        now = self._perf_counter()
+        with self._cond:
+            # Track the vision cadence so micro-moves span exactly one frame
+            interval = now - self._last_post_time
+            if self._last_post_time > 0.0 and 0.0 < interval < MAX_FRAME_INTERVAL:
+                self.frame_interval += FRAME_INTERVAL_ALPHA * (interval - self.frame_interval)
+            self._last_post_time = now
+
+            if self._slot is not None:
+                # Previous target was never sent: it is stale now, drop it
+                self.dropped_count += 1
+            self._slot = (target_x, target_y, capture_time, frame_time, cfg)
+            self.posted_count += 1
+            self._cond.notify()
+
+    def _dispatch_loop(self) -> None:
+        cond = self._cond
+        movement = self.movement
+        perf_counter = self._perf_counter
+        post_latency = self.perf_monitor.post_pipeline_latency
+
+        # Active micro-move schedule: total correction, steps sent / planned, pixels sent
+        total_x = total_y = 0
+        steps_done = steps_total = 0
+        sent_x = sent_y = 0
+        step_interval = 0.0
+        next_step_time = 0.0
+
+        while True:
+            with cond:
+                while self._running and self._slot is None:
+                    if steps_done >= steps_total:
+                        cond.wait()
+                        continue
+                    remaining = next_step_time - perf_counter()
+                    if remaining <= 0.0:
+                        break
+                    cond.wait(remaining)
+                if not self._running:
+                    break
+                job = self._slot
+                self._slot = None
+
+            if job is not None:
+                target_x, target_y, capture_time, frame_time, cfg = job
+                substeps = self.substeps
+                try:
+                    if substeps <= 1:
+                        steps_done = steps_total = 0
+                        movement.aim_at(target_x, target_y, cfg)
+                    else:
+                        # A fresh correction replaces whatever is left of the previous one
+                        total_x, total_y = movement.get_move_delta(target_x, target_y, cfg)
+                        steps_done, steps_total = 1, substeps
+                        step_interval = self.frame_interval / substeps
+                        next_step_time = perf_counter() + step_interval
+                        sent_x, sent_y = self._send_step(total_x, total_y, 1, substeps, 0, 0)
+                except Exception:
+                    self.error_count += 1
+                    steps_done = steps_total = 0
+                    continue
+
+                # End-to-end latency: capture timestamp / frame acquisition -> first SendInput return
+                if capture_time > 0.0:
+                    input_time = perf_counter()
+                    post_latency(input_time - capture_time, input_time - frame_time if frame_time > 0.0 else math.nan)
+                self.dispatched_count += 1
+                continue
+
+            # Timed micro-move step
+            steps_done += 1
+            next_step_time += step_interval
+            try:
+                sent_x, sent_y = self._send_step(total_x, total_y, steps_done, steps_total, sent_x, sent_y)
+            except Exception:
+                self.error_count += 1
+                steps_done = steps_total = 0
+
+    def _send_step(
+        self, total_x: int, total_y: int, step: int, steps: int, sent_x: int, sent_y: int
+    ) -> tuple[int, int]:
+        """
+        Send step `step` of `steps`: the difference between the rounded cumulative share of
+        the correction and what was already sent. Returns the new cumulative (sent_x, sent_y).
+        """
+        want_x = _round_half_away(total_x * step / steps)
+        want_y = _round_half_away(total_y * step / steps)
+        move_x = want_x - sent_x
+        move_y = want_y - sent_y
+        if move_x != 0 or move_y != 0:
+            self.movement.move_relative_with_fallback(move_x, move_y)
+            self.micro_move_count += 1
+        return want_x, want_y
+
+    def get_stats(self) -> dict[str, float]:
+        """Mailbox counters (posted / dropped as stale / dispatched / failed) and pacing."""
+        return {
+            "posted": self.posted_count,
+            "dropped": self.dropped_count,
+            "dispatched": self.dispatched_count,
+            "micro_moves": self.micro_move_count,
+            "errors": self.error_count,
+            "frame_interval_ms": self.frame_interval * 1000.0,
+        }
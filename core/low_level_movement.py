@@ -13,6 +13,10 @@ import sys
 import time
 from typing import Any
 
+from core.input_backend import INPUT_METHODS, InputBackend, SendInputBackend, create_input_backend
+from utils.clock import Clock
+from utils.config import ConfigSnapshot
+
 # Conditionally import Windows-specific libraries or mock them
 if sys.platform == "win32":
     try:
@@ -99,16 +103,22 @@ class LowLevelMovementSystem:
     pre-allocated structure reuse for zero-allocation interaction.
     """
 
-    def __init__(self, config: Any, perf_monitor: Any) -> None:
+    def __init__(
+        self, config: Any, perf_monitor: Any, clock: Clock | None = None, backend: InputBackend | None = None
+    ) -> None:
         """
         Initialize the low-level movement system
 
         Args:
             config: Configuration object with movement settings
             perf_monitor: PerformanceMonitor instance for telemetry
+            clock: Time source for backends that timestamp moves (recording)
+            backend: Input backend to use instead of the one selected by `input_method`
+                (e.g. the simulator's virtual camera); `update_backend` then keeps it
         """
         self.config = config
         self.perf_monitor = perf_monitor
+        self.clock = clock
 
         # Movement settings
         # Dynamic access to config is used instead of caching
@@ -119,30 +129,18 @@ class LowLevelMovementSystem:
         self.zero_latency_mode = getattr(config, "zero_latency_mode", False)
 
         # Get screen dimensions for absolute positioning
-        self.screen_width = 1920
-        self.screen_height = 1080
+        # (setting screen_width/screen_height recomputes the cached center and scale factors)
+        self._screen_width = 1920
+        self._screen_height = 1080
+        self._update_geometry()
 
         # Try to get actual metrics, respecting mocks
-        try:
-            user32 = self._get_user32()
-            if user32:
-                self.screen_width = user32.GetSystemMetrics(0)  # type: ignore
-                self.screen_height = user32.GetSystemMetrics(1)  # type: ignore
-        except Exception:
-            pass
-
-        # ULTRATHINK OPTIMIZATION: Pre-calculate coordinate scaling factors
-        # Replaces division in hot path with multiplication
-        # Formula: (x * 65535) / (width - 1) -> x * scale
-        try:
-            self._x_scale = 65535.0 / (self.screen_width - 1) if self.screen_width > 1 else 0.0
-            self._y_scale = 65535.0 / (self.screen_height - 1) if self.screen_height > 1 else 0.0
-        except ZeroDivisionError:
-            self._x_scale = 0.0
-            self._y_scale = 0.0
+        self.refresh_geometry()
 
-        # Aim offset based on aim point
+        # Aim offset based on aim point (cached per config version)
         self.aim_offset_y = 0
+        self._aim_center_y = self._center_y
+        self._last_config_version: Any = None
 
         # Optimization: Cache INPUT structure to avoid reallocation
         self._mouse_input = MOUSEINPUT()
@@ -154,6 +152,49 @@ class LowLevelMovementSystem:
         if user32:
             self._send_input = user32.SendInput
 
+        # Output backend (SendInput unless config selects another)
+        self._injected_backend = backend is not None
+        if backend is not None:
+            self.input_method = backend.name
+            self._backend: InputBackend = backend
+        else:
+            self.input_method = "sendinput"
+            self._backend = SendInputBackend(self)
+            self.update_backend()
+
+    @property
+    def backend(self) -> InputBackend:
+        return self._backend
+
+    def update_backend(self) -> None:
+        """
+        Switch to the backend selected by `input_method` if it changed.
+        Falls back to SendInput when the backend cannot be initialized.
+        """
+        if self._injected_backend:
+            return
+
+        method = getattr(self.config, "input_method", "sendinput")
+        if not isinstance(method, str) or method not in INPUT_METHODS:
+            method = "sendinput"
+        if method == self.input_method:
+            return
+
+        try:
+            backend = create_input_backend(method, self, clock=self.clock)
+        except Exception as e:
+            print(f"Input backend '{method}' init failed: {e}. Falling back to SendInput.")
+            method, backend = "sendinput", SendInputBackend(self)
+
+        old_backend = self._backend
+        self._backend = backend
+        self.input_method = method
+        old_backend.close()
+
+    def close(self) -> None:
+        """Release the active input backend."""
+        self._backend.close()
+
     def _get_user32(self):
         """Helper to get the correct user32 instance (real or mocked)"""
         # First check if ctypes.windll exists and has user32 (this catches the test mocks)
@@ -186,7 +227,7 @@ class LowLevelMovementSystem:
 
     def move_mouse_relative(self, dx: int, dy: int) -> bool:
         """
-        Move mouse by relative offset using SendInput (low-level)
+        Move mouse by relative offset through the active input backend (SendInput by default)
         """
         # Safety: Clamp to 32-bit signed LONG range to prevent ctypes overflow
         dx = max(-2147483648, min(2147483647, int(dx)))
@@ -194,114 +235,211 @@ class LowLevelMovementSystem:
 
         self.perf_monitor.start_probe("movement_input")
         try:
-            # Use cached function pointer if available
-            send_input = self._send_input
-            if not send_input:
-                user32 = self._get_user32()
-                if user32:
-                    send_input = user32.SendInput
-
-            if not send_input:
-                return True
-
-            # Optimization: Reuse cached structure by updating fields directly
-            # Note: We must update the structure inside the union, not a separate MOUSEINPUT object
-            self._input_structure.ii.mi.dx = dx
-            self._input_structure.ii.mi.dy = dy
-            self._input_structure.ii.mi.mouseData = 0
-            self._input_structure.ii.mi.dwFlags = MOUSEEVENTF_MOVE
-            self._input_structure.ii.mi.time = 0
-            self._input_structure.ii.mi.dwExtraInfo = None
-
-            # Send the input using Windows API with safety check
-            result = send_input(1, ctypes.byref(self._input_structure), ctypes.sizeof(INPUT))  # type: ignore
-            return result == 1
+            return self._backend.move_relative(dx, dy)
         except Exception:
             return False
         finally:
             self.perf_monitor.stop_probe("movement_input")
 
+    def _send_input_relative(self, dx: int, dy: int) -> bool:
+        """
+        Relative move using SendInput (low-level)
+        """
+        # Use cached function pointer if available
+        send_input = self._send_input
+        if not send_input:
+            user32 = self._get_user32()
+            if user32:
+                send_input = user32.SendInput
+
+        if not send_input:
+            return True
+
+        # Optimization: Reuse cached structure by updating fields directly
+        # Note: We must update the structure inside the union, not a separate MOUSEINPUT object
+        self._input_structure.ii.mi.dx = dx
+        self._input_structure.ii.mi.dy = dy
+        self._input_structure.ii.mi.mouseData = 0
+        self._input_structure.ii.mi.dwFlags = MOUSEEVENTF_MOVE
+        self._input_structure.ii.mi.time = 0
+        self._input_structure.ii.mi.dwExtraInfo = None
+
+        # Send the input using Windows API with safety check
+        result = send_input(1, ctypes.byref(self._input_structure), ctypes.sizeof(INPUT))  # type: ignore
+        return result == 1
+
     def move_mouse_absolute(self, x: int, y: int) -> bool:
         """
-        Move mouse to absolute position using SendInput (low-level)
-        Using round() for better precision and (width-1) for correct mapping.
+        Move mouse to absolute position through the active input backend (SendInput by default)
         """
         self.perf_monitor.start_probe("movement_input")
         try:
-            # Use cached function pointer if available
-            send_input = self._send_input
-            if not send_input:
-                user32 = self._get_user32()
-                if user32:
-                    send_input = user32.SendInput
-
-            if not send_input:
-                return True
-
-            # Normalize coordinates to 0-65535 range
-            # ULTRATHINK OPTIMIZATION: Use pre-calculated scale and int(x + 0.5) for speed
-            # We subtract 1 from screen dimensions because pixel coordinates are 0-indexed
-            # e.g. x=1919 should map to 65535 on a 1920-wide screen
-            normalized_x = max(0, min(65535, int(x * self._x_scale + 0.5)))
-            normalized_y = max(0, min(65535, int(y * self._y_scale + 0.5)))
-
-            # Optimization: Reuse cached structure by updating fields directly
-            self._input_structure.ii.mi.dx = normalized_x
-            self._input_structure.ii.mi.dy = normalized_y
-            self._input_structure.ii.mi.mouseData = 0
-            self._input_structure.ii.mi.dwFlags = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE
-            self._input_structure.ii.mi.time = 0
-            self._input_structure.ii.mi.dwExtraInfo = None
-
-            # Send the input using Windows API with safety check
-            result = send_input(1, ctypes.byref(self._input_structure), ctypes.sizeof(INPUT))
-            return result == 1
+            return self._backend.move_absolute(x, y)
         except Exception:
             return False
         finally:
             self.perf_monitor.stop_probe("movement_input")
 
-    def move_to_target(self, target_x: int, target_y: int) -> None:
+    def _send_input_absolute(self, x: int, y: int) -> bool:
+        """
+        Absolute move using SendInput (low-level)
+        Using round() for better precision and (width-1) for correct mapping.
+        """
+        # Use cached function pointer if available
+        send_input = self._send_input
+        if not send_input:
+            user32 = self._get_user32()
+            if user32:
+                send_input = user32.SendInput
+
+        if not send_input:
+            return True
+
+        # Normalize coordinates to 0-65535 range
+        # ULTRATHINK OPTIMIZATION: Use pre-calculated scale and int(x + 0.5) for speed
+        # We subtract 1 from screen dimensions because pixel coordinates are 0-indexed
+        # e.g. x=1919 should map to 65535 on a 1920-wide screen
+        normalized_x = max(0, min(65535, int(x * self._x_scale + 0.5)))
+        normalized_y = max(0, min(65535, int(y * self._y_scale + 0.5)))
+
+        # Optimization: Reuse cached structure by updating fields directly
+        self._input_structure.ii.mi.dx = normalized_x
+        self._input_structure.ii.mi.dy = normalized_y
+        self._input_structure.ii.mi.mouseData = 0
+        self._input_structure.ii.mi.dwFlags = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE
+        self._input_structure.ii.mi.time = 0
+        self._input_structure.ii.mi.dwExtraInfo = None
+
+        # Send the input using Windows API with safety check
+        result = send_input(1, ctypes.byref(self._input_structure), ctypes.sizeof(INPUT))
+        return result == 1
+
+    def move_to_target(self, target_x: int, target_y: int, cfg: ConfigSnapshot | None = None) -> None:
         """
         Move the mouse to center the target on the crosshair (screen center)
         """
-        adjusted_target_y: int = self._apply_aim_offset(target_y)
+        move_x, move_y = self.get_move_delta(target_x, target_y, cfg)
 
-        screen_center_x: int = self.screen_width // 2
-        screen_center_y: int = self.screen_height // 2
+        if move_x != 0 or move_y != 0:
+            self.move_relative_with_fallback(move_x, move_y)
 
-        distance_x: int = target_x - screen_center_x
-        distance_y: int = adjusted_target_y - screen_center_y
+    def get_move_delta(self, target_x: int, target_y: int, cfg: ConfigSnapshot | None = None) -> tuple[int, int]:
+        """
+        Relative move (dx, dy) that brings the target (plus aim offset) to the screen center
 
-        move_x: int = distance_x
-        move_y: int = distance_y
+        Args:
+            cfg: Config snapshot for this frame (reads the live config when omitted)
+        """
+        # ULTRATHINK: O(1) Version Check (aim offset folded into the cached center)
+        # Use getattr to support mocked config in tests which might not have _version
+        current_version = cfg.version if cfg is not None else getattr(self.config, "_version", 0)
+        if current_version != self._last_config_version:
+            self._update_aim_cache(cfg)
+            self._last_config_version = current_version
 
-        if move_x != 0 or move_y != 0:
-            success = self.move_mouse_relative(move_x, move_y)
-            if not success:
-                current_x, current_y = self.get_cursor_position()
-                self.move_mouse_absolute(current_x + move_x, current_y + move_y)
+        return target_x - self._center_x, target_y - self._aim_center_y
+
+    def _update_aim_cache(self, cfg: Any = None) -> None:
+        """
+        Recompute the cached aim offset. Triggered only when config version
+        (or screen geometry) changes.
+        """
+        self.aim_offset_y = self._apply_aim_offset(0, cfg)
+        # distance_y = (target_y + offset) - center_y = target_y - (center_y - offset)
+        self._aim_center_y = self._center_y - self.aim_offset_y
+
+    @property
+    def screen_width(self) -> int:
+        return self._screen_width
+
+    @screen_width.setter
+    def screen_width(self, value: int) -> None:
+        self._screen_width = value
+        self._update_geometry()
+
+    @property
+    def screen_height(self) -> int:
+        return self._screen_height
+
+    @screen_height.setter
+    def screen_height(self, value: int) -> None:
+        self._screen_height = value
+        self._update_geometry()
+
+    def _update_geometry(self) -> None:
+        """Recompute screen center and absolute-move scale factors from the screen size."""
+        self._center_x = self._screen_width // 2
+        self._center_y = self._screen_height // 2
+
+        # ULTRATHINK OPTIMIZATION: Pre-calculate coordinate scaling factors
+        # Replaces division in hot path with multiplication
+        # Formula: (x * 65535) / (width - 1) -> x * scale
+        self._x_scale = 65535.0 / (self._screen_width - 1) if self._screen_width > 1 else 0.0
+        self._y_scale = 65535.0 / (self._screen_height - 1) if self._screen_height > 1 else 0.0
+
+        # Force the aim cache to rebuild against the new center
+        self._last_config_version = None
 
-    def _apply_aim_offset(self, target_y: int) -> int:
+    def refresh_geometry(self) -> bool:
+        """
+        Re-read the screen size from GetSystemMetrics (e.g. after a resolution change).
+
+        Returns:
+            True if the dimensions changed.
+        """
+        try:
+            user32 = self._get_user32()
+            if not user32:
+                return False
+            width = user32.GetSystemMetrics(0)  # type: ignore
+            height = user32.GetSystemMetrics(1)  # type: ignore
+        except Exception:
+            return False
+
+        if not isinstance(width, int) or not isinstance(height, int):
+            return False
+        if width <= 0 or height <= 0 or (width, height) == (self._screen_width, self._screen_height):
+            return False
+
+        self._screen_width = width
+        self._screen_height = height
+        self._update_geometry()
+        return True
+
+    def move_relative_with_fallback(self, move_x: int, move_y: int) -> None:
+        """
+        Relative SendInput move; falls back to an absolute move from the current cursor position
+        """
+        success = self.move_mouse_relative(move_x, move_y)
+        if not success:
+            current_x, current_y = self.get_cursor_position()
+            self.move_mouse_absolute(current_x + move_x, current_y + move_y)
+
+    def _apply_aim_offset(self, target_y: int, cfg: Any = None) -> int:
         """
         Apply vertical offset based on aim point setting
         """
-        aim_point: int = getattr(self.config, "aim_point", 1)
+        if cfg is None:
+            cfg = self.config
+        aim_point: int = getattr(cfg, "aim_point", 1)
 
         if aim_point == 0:
-            return target_y - int(getattr(self.config, "head_offset", 10))
+            return target_y - int(getattr(cfg, "head_offset", 10))
         elif aim_point == 1:
             return target_y
         elif aim_point == 2:
-            return target_y + int(getattr(self.config, "leg_offset", 20))
+            return target_y + int(getattr(cfg, "leg_offset", 20))
         else:
             return target_y
 
-    def aim_at(self, target_x: int, target_y: int) -> None:
+    def aim_at(self, target_x: int, target_y: int, cfg: ConfigSnapshot | None = None) -> None:
         """
         Aim at the specified target coordinates
+
+        Args:
+            cfg: Config snapshot for this frame (reads the live config when omitted)
         """
-        self.move_to_target(target_x, target_y)
+        self.move_to_target(target_x, target_y, cfg)
 
     def test_movement(self) -> None:
         """
@@ -8,19 +8,40 @@ OPTIMIZATIONS (V3.3.0 ULTRATHINK):
 - Pre-calculated Math Constants to reduce FLOPs.
 - Syscall Avoidance: Reuses time deltas to skip redundant `perf_counter` calls.
 - Velocity Gate Logic: Uses Chebyshev distance (max(dx, dy)) for O(1) velocity magnitude estimation.
+- Batch APIs: `OneEuroFilter.filter_batch` / `MotionEngine.process_batch` replay whole
+  trajectories (or stacks of them) through the same JIT kernels for offline analysis.
+- Latency-Compensated Horizon: In "auto" prediction mode the lookahead tracks the measured
+  capture-to-input latency from `PerformanceMonitor` instead of a fixed 0.1s.
+- Config Snapshots: `process` takes the loop's per-frame `ConfigSnapshot` and re-reads
+  settings only when its version changes (no periodic polling, no per-frame lookups).
 """
 
 import math
-import time
 from typing import Any
+
 import numpy as np
+from numpy.typing import NDArray
 
 # Phase 6: Bare Metal Performance
-from core.fast_math import one_euro_filter_step, calculate_prediction, HAS_NUMBA
+from core.fast_math import (
+    HAS_NUMBA,
+    calculate_prediction,
+    motion_process_batch,
+    one_euro_filter_batch,
+    one_euro_filter_step,
+)
+from utils.clock import SYSTEM_CLOCK, Clock
+from utils.config import ConfigSnapshot
 
 # ULTRATHINK: Pre-calculated constants (Still useful for non-JIT fallback)
 TWO_PI = 2 * math.pi
 
+# Prediction horizon (seconds at prediction_scale 1.0)
+DEFAULT_LOOKAHEAD = 0.1
+# Auto mode bounds: ignore implausible latency estimates (stalls, clock glitches)
+MIN_AUTO_LOOKAHEAD = 0.001
+MAX_AUTO_LOOKAHEAD = 0.25
+
 
 class OneEuroFilter:
     """
@@ -56,6 +77,51 @@ class OneEuroFilter:
 
         return x_hat
 
+    @staticmethod
+    def filter_batch(
+        t: NDArray[np.float64] | Any,
+        x: NDArray[np.float64] | Any,
+        min_cutoff: float = 1.0,
+        beta: float = 0.0,
+        d_cutoff: float = 1.0,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Filter whole trajectories in one compiled loop.
+
+        Equivalent to seeding a fresh filter with the first sample of each trajectory
+        and calling it on the rest, bit for bit.
+
+        Args:
+            t: Timestamps, shape (n,) shared by all trajectories or same shape as x
+            x: Values, shape (n,) for one trajectory or (n_traj, n) for many
+
+        Returns:
+            (x_hat, dx_hat) - Filtered values and derivatives, shaped like x
+        """
+        x_arr, t_arr, squeeze = _as_trajectory_batch(x, t)
+        out_x = np.empty_like(x_arr)
+        out_dx = np.empty_like(x_arr)
+        one_euro_filter_batch(t_arr, x_arr, float(min_cutoff), float(beta), float(d_cutoff), out_x, out_dx)
+        if squeeze:
+            return out_x[0], out_dx[0]
+        return out_x, out_dx
+
+
+def _as_trajectory_batch(x: Any, t: Any) -> tuple[NDArray[np.float64], NDArray[np.float64], bool]:
+    """Normalize (x, t) to contiguous float64 (n_traj, n) arrays for the batch kernels."""
+    x_arr = np.asarray(x, dtype=np.float64)
+    squeeze = x_arr.ndim == 1
+    if squeeze:
+        x_arr = x_arr[np.newaxis, :]
+    if x_arr.ndim != 2:
+        raise ValueError(f"Expected 1D or 2D trajectory array, got shape {x_arr.shape}")
+
+    t_arr = np.asarray(t, dtype=np.float64)
+    if t_arr.shape[-1] != x_arr.shape[1]:
+        raise ValueError(f"Timestamp length {t_arr.shape[-1]} does not match trajectory length {x_arr.shape[1]}")
+    t_arr = np.ascontiguousarray(np.broadcast_to(t_arr, x_arr.shape))
+    return np.ascontiguousarray(x_arr), t_arr, squeeze
+
 
 class MotionEngine:
     """
@@ -70,9 +136,23 @@ class MotionEngine:
     _screen_height: float = 1080.0
     _fov_x: float = 50.0
     _fov_y: float = 50.0
+    _auto_lookahead: bool = False
+    _capture_method: str = "mss"
+    _config_version: Any = None
 
-    def __init__(self, config: Any) -> None:
+    def __init__(self, config: Any, perf_monitor: Any = None, clock: Clock | None = None) -> None:
+        """
+        Args:
+            config: Configuration object with motion settings
+            perf_monitor: Optional PerformanceMonitor providing the measured pipeline
+                latency used by the "auto" prediction mode
+            clock: Time source (defaults to the system clock; inject a SimulatedClock
+                for deterministic faster-than-real-time runs)
+        """
         self.config = config
+        self.perf_monitor = perf_monitor
+        self.clock = clock or SYSTEM_CLOCK
+        self._perf_counter = self.clock.perf_counter
 
         # State
         self.x_filter: OneEuroFilter | None = None
@@ -84,25 +164,48 @@ class MotionEngine:
         # Initialize configuration
         self.update_config()
 
-    def _get_config_float(self, key: str, default: float) -> float:
+    def _get_config_float(self, key: str, default: float, cfg: Any = None) -> float:
         """Helper to safely get float from config, avoiding MagicMock poisoning"""
         try:
-            val = getattr(self.config, key, default)
+            val = getattr(self.config if cfg is None else cfg, key, default)
             if isinstance(val, (int, float)):
                 return float(val)
             return default
         except (TypeError, ValueError, AttributeError):
             return default
 
-    def update_config(self) -> None:
-        """Update cached config values if changed"""
-        self._min_cutoff = self._get_config_float("motion_min_cutoff", 0.5)
-        self._beta = self._get_config_float("motion_beta", 0.005)
-        self._prediction_scale = self._get_config_float("prediction_scale", 1.0)
-        self._screen_width = self._get_config_float("screen_width", 1920.0)
-        self._screen_height = self._get_config_float("screen_height", 1080.0)
-        self._fov_x = self._get_config_float("fov_x", 50.0)
-        self._fov_y = self._get_config_float("fov_y", 50.0)
+    def _get_config_str(self, key: str, default: str, cfg: Any = None) -> str:
+        """Helper to safely get str from config, avoiding MagicMock poisoning"""
+        val = getattr(self.config if cfg is None else cfg, key, default)
+        return val if isinstance(val, str) else default
+
+    def update_config(self, cfg: ConfigSnapshot | None = None) -> None:
+        """
+        Update cached config values if changed
+
+        Args:
+            cfg: Config snapshot to read (reads the live config when omitted)
+        """
+        prev_capture_method = self._capture_method
+        prev_fov = (self._fov_x, self._fov_y)
+        self._config_version = cfg.version if cfg is not None else None
+
+        self._min_cutoff = self._get_config_float("motion_min_cutoff", 0.5, cfg)
+        self._beta = self._get_config_float("motion_beta", 0.005, cfg)
+        self._prediction_scale = self._get_config_float("prediction_scale", 1.0, cfg)
+        self._screen_width = self._get_config_float("screen_width", 1920.0, cfg)
+        self._screen_height = self._get_config_float("screen_height", 1080.0, cfg)
+        self._fov_x = self._get_config_float("fov_x", 50.0, cfg)
+        self._fov_y = self._get_config_float("fov_y", 50.0, cfg)
+        self._auto_lookahead = self._get_config_str("prediction_mode", "manual", cfg) == "auto"
+        self._capture_method = self._get_config_str("capture_method", "mss", cfg)
+
+        # A different backend or capture area changes the pipeline latency:
+        # drop the stale estimate so auto mode re-converges from fresh samples.
+        if self.perf_monitor is not None and (
+            self._capture_method != prev_capture_method or (self._fov_x, self._fov_y) != prev_fov
+        ):
+            self.perf_monitor.reset_latency_estimate()
 
         # Ensure parameters are valid
         if not math.isfinite(self._min_cutoff):
@@ -120,21 +223,49 @@ class MotionEngine:
             self.y_filter.min_cutoff = self._min_cutoff
             self.y_filter.beta = self._beta
 
-    def process(self, x: float, y: float, dt: float) -> tuple[int, int]:
+    def get_lookahead(self) -> float:
+        """
+        Get the current prediction horizon in seconds (before prediction_scale).
+        Manual mode uses the fixed 0.1s; auto mode uses the measured pipeline latency,
+        falling back to the fixed horizon until the first sample arrives.
+        """
+        if not self._auto_lookahead or self.perf_monitor is None:
+            return DEFAULT_LOOKAHEAD
+
+        latency = self.perf_monitor.pipeline_latency_ema
+        if not isinstance(latency, float) or latency <= 0.0:
+            return DEFAULT_LOOKAHEAD
+        if latency < MIN_AUTO_LOOKAHEAD:
+            return MIN_AUTO_LOOKAHEAD
+        if latency > MAX_AUTO_LOOKAHEAD:
+            return MAX_AUTO_LOOKAHEAD
+        return latency
+
+    def process(self, x: float, y: float, dt: float, cfg: ConfigSnapshot | None = None) -> tuple[int, int]:
         """
         Process a new target coordinate through the engine.
+
+        Args:
+            cfg: Config snapshot for this frame; settings are re-read when its version changes
+                (without one, cached settings change only via `update_config`)
         """
-        # Determine current time using dt if provided, otherwise real time.
+        if cfg is not None and cfg.version != self._config_version:
+            self.update_config(cfg)
+
+        # Determine current time using dt if provided, otherwise clock time.
         # This ensures deterministic behavior in tests that pass dt=0.016.
+        # All reads go through the injected clock, so a SimulatedClock keeps the
+        # drift check below consistent with simulated (not wall) time.
+        perf_counter = self._perf_counter
         if dt > 1e-6:
             # ULTRATHINK: Avoid accumulation drift by syncing with perf_counter periodically
             # or simply using perf_counter if accuracy is needed over determinism.
             # For tests, we use the internal_time but clamp it to actual time if drift is high.
             if self._internal_time == 0.0:
-                self._internal_time = time.perf_counter()
+                self._internal_time = perf_counter()
 
             # Record actual counter for drift compensation
-            actual_now = time.perf_counter()
+            actual_now = perf_counter()
             self._internal_time += dt
 
             # If drift exceeds 50ms, re-sync to avoid runaway desync
@@ -143,7 +274,7 @@ class MotionEngine:
 
             current_time = self._internal_time
         else:
-            current_time = time.perf_counter()
+            current_time = perf_counter()
             self._internal_time = current_time
 
         # Guard against NaN/Inf inputs
@@ -177,6 +308,7 @@ class MotionEngine:
             self._prev_dy,
             dt,
             self._prediction_scale,
+            self.get_lookahead(),
             smoothed_x,
             smoothed_y,
             self._screen_width,
@@ -192,6 +324,51 @@ class MotionEngine:
         # OPTIMIZATION: Use int(val + 0.5) for faster rounding of positive coordinates
         return int(final_x + 0.5), int(final_y + 0.5)
 
+    def process_batch(
+        self,
+        t: NDArray[np.float64] | Any,
+        x: NDArray[np.float64] | Any,
+        y: NDArray[np.float64] | Any,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Replay whole trajectories through smoothing + prediction using the current
+        config, as if each trajectory were fed to a freshly reset engine with `process`.
+        Streaming state is not touched.
+
+        Args:
+            t: Timestamps in seconds, shape (n,) or same shape as x
+            x, y: Target coordinates, shape (n,) or (n_traj, n)
+
+        Returns:
+            (out_x, out_y) - Integer aim coordinates, shaped like x
+        """
+        x_arr, t_arr, squeeze = _as_trajectory_batch(x, t)
+        y_arr, _, _ = _as_trajectory_batch(y, t)
+        if y_arr.shape != x_arr.shape:
+            raise ValueError(f"x and y shapes differ: {x_arr.shape} vs {y_arr.shape}")
+
+        out_x = np.empty(x_arr.shape, dtype=np.int64)
+        out_y = np.empty(x_arr.shape, dtype=np.int64)
+        motion_process_batch(
+            t_arr,
+            x_arr,
+            y_arr,
+            self._min_cutoff,
+            self._beta,
+            1.0,  # d_cutoff: OneEuroFilter default used by process()
+            self._prediction_scale,
+            self.get_lookahead(),
+            self._screen_width,
+            self._screen_height,
+            self._fov_x,
+            self._fov_y,
+            out_x,
+            out_y,
+        )
+        if squeeze:
+            return out_x[0], out_y[0]
+        return out_x, out_y
+
     def reset(self):
         """Reset filter state"""
         self.x_filter = None
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+
+"""
+Motion Parameter Autotuner
+
+Searches `motion_min_cutoff`, `motion_beta` and `prediction_scale` for the lowest
+tracking error of the `MotionEngine` over a trajectory corpus.
+OPTIMIZATIONS:
+- Replays every candidate through `MotionEngine.process_batch` (compiled, bit-identical
+  to the live engine) instead of the per-sample Python path.
+- Grid search (log-spaced for cutoff/beta) followed by coordinate-descent refinement
+  around the best grid points.
+- Evaluations are spread across a process pool; the corpus is shipped to each worker
+  once via the pool initializer, not per task.
+"""
+
+import csv
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from core.motion_engine import MotionEngine
+from core.trajectory import Trajectory, generate_suite
+from utils.config import Config
+
+# Parameters searched by the tuner (all are Config keys)
+PARAM_KEYS = ("motion_min_cutoff", "motion_beta", "prediction_scale")
+
+# Keys searched on a log scale (multiplicative steps)
+_LOG_KEYS = ("motion_min_cutoff", "motion_beta")
+
+
+class _TunerConfig:
+    """Minimal config object consumed by MotionEngine during evaluation."""
+
+    def __init__(self, params: dict[str, float], settings: dict[str, Any]) -> None:
+        self.motion_min_cutoff = params["motion_min_cutoff"]
+        self.motion_beta = params["motion_beta"]
+        self.prediction_scale = params["prediction_scale"]
+        self.screen_width = settings["screen_width"]
+        self.screen_height = settings["screen_height"]
+        self.fov_x = settings["fov_x"]
+        self.fov_y = settings["fov_y"]
+
+
+DEFAULT_SETTINGS: dict[str, Any] = {
+    "latency": 0.02,  # Seconds between detection and the input taking effect
+    "warmup": 30,  # Samples skipped per trajectory while the filter settles
+    "screen_width": 1920,
+    "screen_height": 1080,
+    "fov_x": 200,
+    "fov_y": 200,
+}
+
+
+def evaluate_params(params: dict[str, float], corpus: list[Trajectory], settings: dict[str, Any]) -> float:
+    """
+    Score one parameter set: RMSE (px) between the engine's aim point and where the
+    target actually is `latency` seconds later, pooled over the whole corpus.
+    """
+    engine = MotionEngine(_TunerConfig(params, settings))
+    latency = float(settings["latency"])
+    warmup = int(settings["warmup"])
+
+    sq_sum = 0.0
+    count = 0
+    for traj in corpus:
+        out_x, out_y = engine.process_batch(traj.t, traj.x, traj.y)
+        aim_t = traj.t + latency
+        err_x = out_x - np.interp(aim_t, traj.t, traj.true_x)
+        err_y = out_y - np.interp(aim_t, traj.t, traj.true_y)
+        sq = (err_x * err_x + err_y * err_y)[warmup:]
+        sq_sum += float(sq.sum())
+        count += sq.size
+
+    if count == 0:
+        return math.inf
+    return math.sqrt(sq_sum / count)
+
+
+# Worker-process globals (populated once per worker by the pool initializer)
+_WORKER_CORPUS: list[Trajectory] = []
+_WORKER_SETTINGS: dict[str, Any] = {}
+
+
+def _init_worker(corpus: list[Trajectory], settings: dict[str, Any]) -> None:
+    global _WORKER_CORPUS, _WORKER_SETTINGS
+    _WORKER_CORPUS = corpus
+    _WORKER_SETTINGS = settings
+
+
+def _evaluate_worker(params: dict[str, float]) -> float:
+    return evaluate_params(params, _WORKER_CORPUS, _WORKER_SETTINGS)
+
+
+def _param_bounds(key: str) -> tuple[float, float]:
+    schema = Config.DEFAULT_CONFIG[key]
+    return float(schema["min"]), float(schema["max"])
+
+
+def default_grid(size: int = 8) -> dict[str, list[float]]:
+    """
+    Build the default search grid spanning the Config ranges.
+    Cutoff/beta are log-spaced; prediction_scale is linear over the useful 0-3 range.
+    """
+    grid: dict[str, list[float]] = {}
+    for key in _LOG_KEYS:
+        lo, hi = _param_bounds(key)
+        grid[key] = [float(v) for v in np.geomspace(lo, hi, size)]
+    grid["prediction_scale"] = [float(v) for v in np.linspace(0.0, 3.0, max(2, size - 2))]
+    return grid
+
+
+class MotionTuner:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Grid search + local refinement of motion parameters over a trajectory corpus.
+    """
+
+    def __init__(self, corpus: list[Trajectory], workers: int | None = None, **settings: Any) -> None:
+        """
+        Args:
+            corpus: Trajectories to evaluate against
+            workers: Process count (None = os.cpu_count(), 1 = evaluate in-process)
+            **settings: Overrides for DEFAULT_SETTINGS (latency, warmup, screen/FOV geometry)
+        """
+        if not corpus:
+            raise ValueError("Tuning corpus is empty")
+
+        unknown = set(settings) - set(DEFAULT_SETTINGS)
+        if unknown:
+            raise ValueError(f"Unknown tuner settings: {sorted(unknown)}")
+
+        self.corpus = corpus
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.settings = {**DEFAULT_SETTINGS, **settings}
+
+        # Memoized scores keyed by the parameter tuple (grid and refinement overlap)
+        self._scores: dict[tuple[float, float, float], float] = {}
+        self._pool: ProcessPoolExecutor | None = None
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _key(params: dict[str, float]) -> tuple[float, float, float]:
+        return (params["motion_min_cutoff"], params["motion_beta"], params["prediction_scale"])
+
+    def evaluate(self, candidates: list[dict[str, float]]) -> list[float]:
+        """Score candidates (in parallel when workers > 1), reusing memoized results."""
+        pending = []
+        seen = set()
+        for params in candidates:
+            key = self._key(params)
+            if key not in self._scores and key not in seen:
+                seen.add(key)
+                pending.append(params)
+
+        if pending:
+            if self.workers > 1 and len(pending) > 1:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        initializer=_init_worker,
+                        initargs=(self.corpus, self.settings),
+                    )
+                chunksize = max(1, len(pending) // (self.workers * 4))
+                scores = list(self._pool.map(_evaluate_worker, pending, chunksize=chunksize))
+            else:
+                scores = [evaluate_params(p, self.corpus, self.settings) for p in pending]
+
+            for params, score in zip(pending, scores, strict=True):
+                self._scores[self._key(params)] = score
+
+        return [self._scores[self._key(p)] for p in candidates]
+
+    @property
+    def evaluation_count(self) -> int:
+        """Number of distinct parameter sets evaluated so far."""
+        return len(self._scores)
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "MotionTuner":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    def grid_search(self, grid: dict[str, list[float]] | None = None) -> list[dict[str, float]]:
+        """Evaluate the full cartesian grid. Returns results sorted best-first."""
+        grid = grid or default_grid()
+        candidates = [
+            {"motion_min_cutoff": c, "motion_beta": b, "prediction_scale": s}
+            for c in grid["motion_min_cutoff"]
+            for b in grid["motion_beta"]
+            for s in grid["prediction_scale"]
+        ]
+        scores = self.evaluate(candidates)
+        return self._ranked(candidates, scores)
+
+    def refine(self, seeds: list[dict[str, float]], iterations: int = 12) -> list[dict[str, float]]:
+        """
+        Coordinate-descent refinement from each seed.
+
+        Every iteration tries one step up and down per parameter for all seeds at once
+        (one parallel batch), moves each seed to its best improving neighbour, and
+        halves the step size of seeds that did not improve.
+        """
+        states = []
+        for seed in seeds:
+            params = {k: seed[k] for k in PARAM_KEYS}
+            states.append({"params": params, "score": self.evaluate([params])[0], "factor": 2.0, "step": 0.25})
+
+        for _ in range(iterations):
+            neighbours = [self._neighbours(s) for s in states]
+            flat = [n for group in neighbours for n in group]
+            if not flat:
+                break
+            scores = iter(self.evaluate(flat))
+
+            for state, group in zip(states, neighbours, strict=True):
+                best_params, best_score = state["params"], state["score"]
+                for params in group:
+                    score = next(scores)
+                    if score < best_score:
+                        best_params, best_score = params, score
+
+                if best_params is state["params"]:
+                    state["factor"] = math.sqrt(state["factor"])
+                    state["step"] *= 0.5
+                else:
+                    state["params"], state["score"] = best_params, best_score
+
+        candidates = [dict(s["params"]) for s in states]
+        return self._ranked(candidates, [s["score"] for s in states])
+
+    def _neighbours(self, state: dict[str, Any]) -> list[dict[str, float]]:
+        out = []
+        for key in PARAM_KEYS:
+            lo, hi = _param_bounds(key)
+            current = state["params"][key]
+            if key in _LOG_KEYS:
+                options = (current * state["factor"], current / state["factor"])
+            else:
+                options = (current + state["step"], current - state["step"])
+            for value in options:
+                value = min(hi, max(lo, value))
+                if value != current:
+                    out.append({**state["params"], key: value})
+        return out
+
+    def run(
+        self, grid: dict[str, list[float]] | None = None, top_k: int = 4, iterations: int = 12
+    ) -> list[dict[str, float]]:
+        """Grid search, then refine the `top_k` best grid points. Returns every result ranked."""
+        grid_results = self.grid_search(grid)
+        refined = self.refine(grid_results[:top_k], iterations=iterations)
+
+        # Merge both stages, dropping duplicates (refinement may not move a seed)
+        merged: dict[tuple[float, float, float], dict[str, float]] = {}
+        for result in refined + grid_results:
+            merged.setdefault(self._key(result), result)
+        return sorted(merged.values(), key=lambda r: r["rmse"])
+
+    @staticmethod
+    def _ranked(candidates: list[dict[str, float]], scores: list[float]) -> list[dict[str, float]]:
+        results = [{**params, "rmse": score} for params, score in zip(candidates, scores, strict=True)]
+        results.sort(key=lambda r: r["rmse"])
+        return results
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+    def write_report(self, filepath: str, results: list[dict[str, float]]) -> None:
+        """Write the ranked results (JSON, or CSV when the path ends with .csv)."""
+        if filepath.endswith(".csv"):
+            with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(["rank", *PARAM_KEYS, "rmse_px"])
+                for rank, r in enumerate(results, start=1):
+                    writer.writerow([rank, *(r[k] for k in PARAM_KEYS), r["rmse"]])
+            return
+
+        report = {
+            "settings": self.settings,
+            "corpus": [{"name": t.name, "samples": int(t.t.size)} for t in self.corpus],
+            "evaluations": self.evaluation_count,
+            "results": [{"rank": i, **r} for i, r in enumerate(results, start=1)],
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+
+    @staticmethod
+    def write_preset(filepath: str, result: dict[str, float], name: str = "tuned") -> None:
+        """
+        Write a preset file for `Config.load_preset_file` / `Config.apply_preset`.
+        Values are rounded to what the GUI sliders can represent.
+        """
+        values = {
+            "motion_min_cutoff": round(result["motion_min_cutoff"], 2),
+            "motion_beta": round(result["motion_beta"], 4),
+            "prediction_scale": round(result["prediction_scale"], 2),
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump({"name": name, "values": values, "rmse_px": result["rmse"]}, f, indent=4)
+
+
+def load_trajectory(filepath: str) -> Trajectory:
+    """
+    Load a recorded trajectory.
+
+    Supports `.npz` (arrays `t`, `x`, `y`, optional `true_x`, `true_y`) and `.csv`
+    (header row with at least `t`, `x`, `y` columns).
+    """
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    if filepath.endswith(".npz"):
+        with np.load(filepath) as data:
+            return Trajectory(
+                name,
+                data["t"],
+                data["x"],
+                data["y"],
+                data["true_x"] if "true_x" in data else None,
+                data["true_y"] if "true_y" in data else None,
+            )
+
+    with open(filepath, newline="", encoding="utf-8") as csvfile:
+        rows = list(csv.DictReader(csvfile))
+    if not rows:
+        raise ValueError(f"Empty trajectory file: {filepath}")
+    columns = {key: np.array([float(row[key]) for row in rows]) for key in rows[0].keys() if key}
+    return Trajectory(name, columns["t"], columns["x"], columns["y"], columns.get("true_x"), columns.get("true_y"))
+
+
+def synthetic_corpus(
+    seed: int = 0, duration: float = 4.0, rate: float = 240.0, per_pattern: int = 1, jitter: float = 0.0
+) -> list[Trajectory]:
+    """
+    Default corpus: `per_pattern` trajectories of every `core.trajectory` pattern
+    (constant velocity, sine strafe, random jerk, stop-and-go, direction flips),
+    each with pixel noise on the observed positions.
+    """
+    suite = generate_suite(per_pattern, seed=seed, duration=duration, rate=rate, jitter=jitter)
+    return [traj for batch in suite.values() for traj in batch.to_list()]
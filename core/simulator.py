@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+
+"""
+Closed-Loop Tracking Simulator
+
+Runs the real `DetectionSystem` -> `MotionEngine` -> `LowLevelMovementSystem` pipeline
+against a virtual camera, with no game, display or input device:
+- `VirtualScene` renders a colored target moving along a `Trajectory` into BGRA frames.
+- Relative moves emitted by `LowLevelMovementSystem` pan the scene's camera, so every
+  correction changes what the next frame shows (closed loop).
+- Capture latency (frames show the scene as it was) and input latency (moves land later)
+  are configurable; all timing runs on a `SimulatedClock`, faster than real time.
+OPTIMIZATIONS:
+- Only the captured region is rendered (background fill + one masked slice assignment).
+- Frames are re-rendered only when the source refresh tick or the capture region changes,
+  so the detection frame-identity cache behaves as it does with a real capture backend.
+- Camera history is an append-only timeline (one entry per move) searched with bisect.
+
+Reported metrics: time-to-acquire, steady-state error and pipeline frames per second.
+The loop applies each correction in full, so when capture + input latency exceed one
+loop interval a correction is re-applied before its effect is visible; the simulator
+reproduces the resulting overshoot as-is rather than hiding it.
+"""
+
+import math
+import time
+from bisect import bisect_right
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from core.capture import CaptureBackend
+from core.detection import DetectionSystem
+from core.frame_loop import FrameLoop
+from core.idle_governor import IdleGovernor
+from core.input_backend import InputBackend
+from core.input_dispatcher import InputDispatcher
+from core.low_level_movement import LowLevelMovementSystem
+from core.motion_engine import MotionEngine
+from core.trajectory import Trajectory, generate
+from utils.clock import SimulatedClock
+from utils.config import Config
+from utils.performance_monitor import PerformanceMonitor
+
+# Simulated time at which every run starts (non-zero: 0.0 means "unset" for several timestamps)
+SIM_START_TIME = 1.0
+
+
+def simulation_config(**overrides: Any) -> SimpleNamespace:
+    """
+    Default configuration for simulated runs, built from the schema defaults.
+    Never reads or writes config.json, so runs are reproducible on any machine.
+    """
+    values = {key: schema["default"] for key, schema in Config.DEFAULT_CONFIG.items()}
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class VirtualScene:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    One target moving through world space, viewed by a panning camera.
+
+    Screen position = world position - camera position. The target is drawn as a
+    triangle whose apex is its anchor point: detection reports the first matching
+    pixel in scan order, which is exactly the apex, so tracking error is measured
+    against the anchor without any shape bias.
+    """
+
+    def __init__(
+        self,
+        path: Trajectory,
+        width: int = 1920,
+        height: int = 1080,
+        target_color: int = 0xC9008D,
+        background_color: int = 0x202020,
+        target_size: int = 16,
+        sensitivity: float = 1.0,
+        start_offset: tuple[float, float] = (30.0, 20.0),
+        start_time: float = SIM_START_TIME,
+    ) -> None:
+        """
+        Args:
+            path: Target motion (`true_x`/`true_y` are used; re-centred so the target
+                starts at screen center + `start_offset`)
+            width, height: Virtual screen size
+            target_color, background_color: 0xRRGGBB colors
+            target_size: Triangle height in pixels
+            sensitivity: Camera pixels per input count (1.0 = perfect calibration)
+            start_offset: Initial target offset from the screen center (px)
+            start_time: Clock time corresponding to `path.t[0]`
+        """
+        self.width = width
+        self.height = height
+        self.sensitivity = sensitivity
+        self.start_time = start_time
+
+        self._t = path.t - path.t[0]
+        self._x = path.true_x - path.true_x[0] + width / 2 + start_offset[0]
+        self._y = path.true_y - path.true_y[0] + height / 2 + start_offset[1]
+
+        self._target_bgra = self._to_bgra(target_color)
+        self._background_bgra = self._to_bgra(background_color)
+
+        # Triangle mask: row k spans [-k, +k] around the apex column
+        size = max(1, int(target_size))
+        rows = np.arange(size)[:, None]
+        cols = np.arange(-(size - 1), size)[None, :]
+        self._mask = np.abs(cols) <= rows
+        self._mask_half_width = size - 1
+
+        # Camera timeline: (time the move lands, cumulative camera x/y)
+        self._move_times: list[float] = [-math.inf]
+        self._camera_x: list[float] = [0.0]
+        self._camera_y: list[float] = [0.0]
+
+    @staticmethod
+    def _to_bgra(color: int) -> NDArray[np.uint8]:
+        return np.array([color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF, 255], dtype=np.uint8)
+
+    def world_position(self, t: float) -> tuple[float, float]:
+        """Target anchor in world space at clock time `t` (held at the path ends)."""
+        rel = t - self.start_time
+        return float(np.interp(rel, self._t, self._x)), float(np.interp(rel, self._t, self._y))
+
+    def camera_at(self, t: float) -> tuple[float, float]:
+        """Camera position after every move that has landed by clock time `t`."""
+        i = bisect_right(self._move_times, t) - 1
+        return self._camera_x[i], self._camera_y[i]
+
+    def screen_position(self, t: float) -> tuple[float, float]:
+        """Target anchor in screen space at clock time `t`."""
+        wx, wy = self.world_position(t)
+        cx, cy = self.camera_at(t)
+        return wx - cx, wy - cy
+
+    def pan(self, dx: int, dy: int, at: float) -> None:
+        """Pan the camera by an input move (counts) that lands at clock time `at`."""
+        last = self._move_times[-1]
+        if at < last:
+            at = last  # Moves land in order
+        self._move_times.append(at)
+        self._camera_x.append(self._camera_x[-1] + dx * self.sensitivity)
+        self._camera_y.append(self._camera_y[-1] + dy * self.sensitivity)
+
+    def render(self, region: dict, t: float) -> NDArray[np.uint8]:
+        """Render the screen region (`left`/`top`/`width`/`height`) as it looks at clock time `t`."""
+        left, top = region["left"], region["top"]
+        w, h = region["width"], region["height"]
+        frame = np.empty((h, w, 4), dtype=np.uint8)
+        frame[:] = self._background_bgra
+
+        sx, sy = self.screen_position(t)
+        # Mask origin (top-left) in region coordinates
+        ox = int(round(sx)) - self._mask_half_width - left
+        oy = int(round(sy)) - top
+        mh, mw = self._mask.shape
+
+        x0, y0 = max(ox, 0), max(oy, 0)
+        x1, y1 = min(ox + mw, w), min(oy + mh, h)
+        if x0 < x1 and y0 < y1:
+            view = frame[y0:y1, x0:x1]
+            view[self._mask[y0 - oy : y1 - oy, x0 - ox : x1 - ox]] = self._target_bgra
+        return frame
+
+
+class SimulatedCaptureBackend(CaptureBackend):
+    """
+    Capture backend that renders the virtual scene.
+    Frames are produced at `refresh_rate` (like a monitor) and show the scene
+    `latency` seconds in the past.
+    """
+
+    name = "simulated"
+
+    def __init__(self, scene: VirtualScene, clock: SimulatedClock, latency: float = 0.0, refresh_rate: float = 0.0):
+        self.scene = scene
+        self.latency = latency
+        self.refresh_rate = refresh_rate
+        self.clock = clock
+        self._perf_counter = clock.perf_counter
+        # A fixed refresh rate gives a presentation schedule to wait on
+        self.frame_events = refresh_rate > 0.0
+
+        self._last_tick: int | None = None
+        self._last_key: tuple[int, int, int, int, int] | None = None
+        self._last_frame: NDArray[np.uint8] | None = None
+        self.frames_rendered = 0
+
+    def grab(self, region: dict) -> tuple[bool, NDArray[np.uint8] | None]:
+        t = self._perf_counter() - self.latency
+        if self.refresh_rate > 0.0:
+            # Tolerance: a clock sitting on a presentation time (to the ns) belongs to that tick
+            tick = math.floor(t * self.refresh_rate + 1e-6)
+            t = tick / self.refresh_rate
+        else:
+            tick = self.frames_rendered
+
+        key = (tick, region["left"], region["top"], region["width"], region["height"])
+        self.frames_captured += 1
+        if key == self._last_key:
+            # Same presented frame and area: hand back the same object (like DXGI's frame cache)
+            self.duplicate_frames += 1
+            return True, self._last_frame
+
+        self._last_frame = self.scene.render(region, t)
+        # Scene time shown: frame age includes the capture latency and refresh quantization
+        self.frame_time = t
+        self._last_key = key
+        self._last_tick = tick
+        self.frames_rendered += 1
+        return True, self._last_frame
+
+    def wait_for_frame(self, timeout: float, region: dict | None = None) -> bool:
+        # Any region can be rendered from the scene: the watched area does not matter here
+        if not self.frame_events or self._last_tick is None:
+            return True
+        # The tick after the last one grabbed becomes visible `latency` after presentation
+        ready_at = (self._last_tick + 1) / self.refresh_rate + self.latency
+        now = self._perf_counter()
+        if ready_at <= now:
+            return True
+        if ready_at - now > timeout:
+            self.clock.sleep(timeout)
+            return False
+        self.clock.sleep_until(ready_at)
+        return True
+
+    def close(self) -> None:
+        self._last_frame = None
+        self._last_key = None
+
+
+class SimulatedInputBackend(InputBackend):
+    """
+    Input backend that pans the virtual camera. Moves land `latency` seconds after they are sent.
+    """
+
+    name = "simulated"
+
+    def __init__(self, scene: VirtualScene, clock: SimulatedClock, latency: float = 0.0) -> None:
+        self.scene = scene
+        self.latency = latency
+        self._perf_counter = clock.perf_counter
+        self.move_count = 0
+
+    def move_relative(self, dx: int, dy: int) -> bool:
+        self.scene.pan(dx, dy, self._perf_counter() + self.latency)
+        self.move_count += 1
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+class ClosedLoopSimulator:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Runs the unmodified tracking pipeline against a `VirtualScene` through the app's own
+    frame step (`core.frame_loop.FrameLoop`), so scores measure the loop that ships.
+    """
+
+    def __init__(
+        self,
+        config: Any,
+        path: Trajectory,
+        capture_latency: float = 0.0,
+        input_latency: float = 0.0,
+        refresh_rate: float = 0.0,
+        sensitivity: float = 1.0,
+        start_offset: tuple[float, float] = (30.0, 20.0),
+        target_size: int = 16,
+    ) -> None:
+        """
+        Args:
+            config: Pipeline configuration (see `simulation_config`)
+            path: Target motion in world space
+            capture_latency: Age of the scene shown in a captured frame (s)
+            input_latency: Delay between a move being sent and the camera panning (s)
+            refresh_rate: Rate at which the virtual display presents new frames (Hz; 0 = a fresh frame every grab)
+            sensitivity: Camera pixels per input count
+            start_offset: Initial target offset from the crosshair (px); keep it inside the FOV
+            target_size: Target triangle height (px)
+        """
+        self.config = config
+        self.path = path
+        self.clock = SimulatedClock(start=SIM_START_TIME)
+
+        self.scene = VirtualScene(
+            path,
+            width=config.screen_width,
+            height=config.screen_height,
+            target_color=config.target_color,
+            target_size=target_size,
+            sensitivity=sensitivity,
+            start_offset=start_offset,
+            start_time=SIM_START_TIME,
+        )
+        self.capture = SimulatedCaptureBackend(self.scene, self.clock, capture_latency, refresh_rate)
+        self.input = SimulatedInputBackend(self.scene, self.clock, input_latency)
+
+        self.perf_monitor = PerformanceMonitor(clock=self.clock)
+        self.detection = DetectionSystem(config, self.perf_monitor, clock=self.clock, backend=self.capture)
+        self.motion_engine = MotionEngine(config, self.perf_monitor, clock=self.clock)
+        self.movement = LowLevelMovementSystem(config, self.perf_monitor, clock=self.clock, backend=self.input)
+        # The virtual screen, not the host display, defines the crosshair
+        self.movement.screen_width = config.screen_width
+        self.movement.screen_height = config.screen_height
+        self.input_dispatcher = InputDispatcher(self.movement, self.perf_monitor, clock=self.clock)
+        self.idle_governor = IdleGovernor.from_config(config)
+        self.perf_monitor.governor = self.idle_governor
+        self.frame_loop = FrameLoop(
+            config,
+            self.detection,
+            self.motion_engine,
+            self.movement,
+            self.input_dispatcher,
+            self.perf_monitor,
+            self.idle_governor,
+            self.clock,
+        )
+
+    def run(
+        self,
+        duration: float | None = None,
+        acquire_radius: float = 5.0,
+        acquire_hold: float = 0.1,
+        steady_fraction: float = 0.5,
+    ) -> dict[str, Any]:
+        """
+        Run the loop and score it. With `loop_mode` "event" and a fixed `refresh_rate`,
+        the loop waits for each presented frame instead of pacing at `target_fps`.
+        With `idle_throttle` set, the idle governor paces empty stretches as in the app loop.
+
+        Args:
+            duration: Simulated seconds (defaults to the path length)
+            acquire_radius: Error (px) within which the target counts as on the crosshair
+            acquire_hold: Time (s) the error must stay within `acquire_radius` to count as acquired
+            steady_fraction: Trailing fraction of the run scored as steady state
+
+        Returns:
+            Dict with time_to_acquire (s, NaN if never acquired), steady_state_error
+            (RMS px), steady_state_max (px), detection_rate, frames, fps (pipeline
+            iterations per wall-clock second) and per-frame `t` / `error` / `found` arrays.
+            Error is sampled at the start of every frame, before the pipeline acts.
+        """
+        if duration is None:
+            duration = float(self.path.t[-1] - self.path.t[0])
+
+        perf_counter = self.clock.perf_counter
+        end_time = SIM_START_TIME + duration
+        frame_loop = self.frame_loop
+        wait_for_frame = frame_loop.wait_for_frame
+        begin_frame = frame_loop.begin_frame
+        refresh_config = frame_loop.refresh_config
+        process_frame = frame_loop.process
+        end_frame = frame_loop.end_frame
+        pace = frame_loop.pace
+        get_move_delta = self.movement.get_move_delta
+        screen_position = self.scene.screen_position
+
+        times: list[float] = []
+        errors_list: list[float] = []
+        found_list: list[bool] = []
+
+        frame_loop.start()
+        wall_start = time.perf_counter()
+        try:
+            while perf_counter() < end_time:
+                waited, frame_ready = wait_for_frame()
+                if not frame_ready:
+                    continue
+                loop_start = begin_frame(waited)
+                refresh_config()
+
+                # Ground-truth error: where the target really is vs the (offset) crosshair
+                dx, dy = get_move_delta(*screen_position(loop_start))
+                times.append(loop_start - SIM_START_TIME)
+                errors_list.append(math.hypot(dx, dy))
+
+                found_list.append(process_frame())
+                pace(end_frame(loop_start, waited))
+        finally:
+            self.input_dispatcher.stop()
+        wall_time = time.perf_counter() - wall_start
+
+        frames = len(errors_list)
+        errors = np.array(errors_list)
+
+        # Acquired = first frame that starts a run of frames on target lasting `acquire_hold`
+        hold = min(frames, max(1, int(round(acquire_hold * frames / duration))))
+        on_target = np.concatenate(([0], np.cumsum(errors <= acquire_radius)))
+        acquired = np.flatnonzero(on_target[hold:] - on_target[:-hold] == hold)
+        steady = errors[int(frames * (1.0 - steady_fraction)) :]
+        return {
+            "time_to_acquire": times[acquired[0]] if acquired.size else float("nan"),
+            "steady_state_error": float(np.sqrt(np.mean(steady**2))),
+            "steady_state_max": float(steady.max()),
+            "detection_rate": sum(found_list) / frames,
+            "frames": frames,
+            "fps": frames / wall_time if wall_time > 0 else float("inf"),
+            "t": np.array(times),
+            "error": errors,
+            "found": np.array(found_list, dtype=bool),
+        }
+
+
+def simulate(
+    pattern: str = "constant_velocity",
+    config: Any = None,
+    duration: float = 2.0,
+    speed: float = 300.0,
+    seed: int | None = 0,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Generate one ground-truth path of `pattern` and run it through a `ClosedLoopSimulator`.
+    Extra keyword arguments go to the simulator (latencies, refresh_rate, ...).
+    """
+    if config is None:
+        config = simulation_config()
+    rate = max(240.0, float(config.target_fps))
+    path = generate(pattern, n=1, duration=duration, rate=rate, speed=speed, noise=0.0, seed=seed).to_list()[0]
+    return ClosedLoopSimulator(config, path, **kwargs).run(duration)
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+
+"""
+Trajectory Library
+
+Synthetic target paths and tracking-error metrics for evaluating the `MotionEngine`.
+OPTIMIZATIONS:
+- Generators build whole batches as (n_traj, n_samples) arrays with NumPy (no
+  per-sample Python), matching the layout `MotionEngine.process_batch` consumes.
+- Per-trajectory parameters (speed, direction, frequency, ...) are drawn as column
+  vectors and broadcast, so a batch of 1000 paths costs about the same as one.
+- Metrics are reduced along the sample axis in a single pass per metric.
+
+Patterns:
+- constant_velocity: Straight line at a random speed and heading
+- sine_strafe: Sinusoidal strafe (x) with a slow vertical bob (y)
+- random_jerk: Integrated random jerk (smooth but unpredictable)
+- stop_and_go: Move, stop dead, move back
+- direction_flips: Triangle waves on both axes (instant velocity reversals)
+"""
+
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+PATTERNS = ("constant_velocity", "sine_strafe", "random_jerk", "stop_and_go", "direction_flips")
+
+# Default path centre (1080p screen centre)
+CENTER_X = 960.0
+CENTER_Y = 540.0
+
+
+class Trajectory:
+    """
+    A single target path.
+
+    `x`/`y` are what detection would report (possibly noisy); `true_x`/`true_y`
+    are the ground-truth positions used for scoring. For recorded traces without
+    ground truth both are the same arrays.
+    """
+
+    __slots__ = ("name", "t", "x", "y", "true_x", "true_y")
+
+    def __init__(
+        self,
+        name: str,
+        t: NDArray[np.float64],
+        x: NDArray[np.float64],
+        y: NDArray[np.float64],
+        true_x: NDArray[np.float64] | None = None,
+        true_y: NDArray[np.float64] | None = None,
+    ) -> None:
+        self.name = name
+        self.t = np.asarray(t, dtype=np.float64)
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.true_x = self.x if true_x is None else np.asarray(true_x, dtype=np.float64)
+        self.true_y = self.y if true_y is None else np.asarray(true_y, dtype=np.float64)
+
+
+class TrajectoryBatch:
+    """
+    Many trajectories of one pattern, stored as (n_traj, n_samples) arrays.
+    Each row has its own timestamps (frame-interval jitter differs per row).
+    """
+
+    __slots__ = ("pattern", "t", "x", "y", "true_x", "true_y")
+
+    def __init__(
+        self,
+        pattern: str,
+        t: NDArray[np.float64],
+        x: NDArray[np.float64],
+        y: NDArray[np.float64],
+        true_x: NDArray[np.float64],
+        true_y: NDArray[np.float64],
+    ) -> None:
+        self.pattern = pattern
+        self.t = t
+        self.x = x
+        self.y = y
+        self.true_x = true_x
+        self.true_y = true_y
+
+    def __len__(self) -> int:
+        return self.t.shape[0]
+
+    def to_list(self) -> list[Trajectory]:
+        """Split into individual `Trajectory` objects (views, no copies)."""
+        return [
+            Trajectory(f"{self.pattern}_{i}", self.t[i], self.x[i], self.y[i], self.true_x[i], self.true_y[i])
+            for i in range(len(self))
+        ]
+
+
+# ----------------------------------------------------------------------
+# Generators
+# ----------------------------------------------------------------------
+def _timestamps(rng: np.random.Generator, n: int, samples: int, rate: float, jitter: float) -> NDArray[np.float64]:
+    """
+    Frame timestamps starting at 0. `jitter` is the relative frame-interval spread
+    (0.2 = each interval uniformly within +/-20% of 1/rate).
+    """
+    frame = 1.0 / rate
+    if jitter <= 0.0:
+        return np.broadcast_to(np.arange(samples) * frame, (n, samples)).copy()
+
+    intervals = frame * (1.0 + rng.uniform(-jitter, jitter, (n, samples)))
+    intervals = np.maximum(intervals, frame * 0.05)
+    intervals[:, 0] = 0.0
+    return np.cumsum(intervals, axis=1)
+
+
+def _column(rng: np.random.Generator, n: int, low: float, high: float) -> NDArray[np.float64]:
+    """Per-trajectory random parameter as an (n, 1) column for broadcasting."""
+    return rng.uniform(low, high, (n, 1))
+
+
+def _heading(rng: np.random.Generator, n: int) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    angle = _column(rng, n, 0.0, 2.0 * np.pi)
+    return np.cos(angle), np.sin(angle)
+
+
+def _integrate(v: NDArray[np.float64], t: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Rectangle-rule integral of v over (possibly jittered) per-row timestamps, starting at 0."""
+    dt = np.diff(t, axis=1, prepend=t[:, :1])
+    return np.cumsum(v * dt, axis=1)
+
+
+def _constant_velocity(rng, t, speed):
+    n = t.shape[0]
+    hx, hy = _heading(rng, n)
+    v = speed * _column(rng, n, 0.5, 1.5)
+    # Centre the path on the screen centre over its duration
+    tc = t - t[:, -1:] * 0.5
+    return CENTER_X + v * hx * tc, CENTER_Y + v * hy * tc
+
+
+def _sine_strafe(rng, t, speed):
+    n = t.shape[0]
+    freq = _column(rng, n, 0.3, 1.5)
+    # Peak speed of A*sin(2*pi*f*t) is 2*pi*f*A
+    amp = speed * _column(rng, n, 0.5, 1.5) / (2.0 * np.pi * freq)
+    phase = _column(rng, n, 0.0, 2.0 * np.pi)
+    bob = 0.1 * amp * np.sin(2.0 * np.pi * 0.3 * freq * t + phase)
+    return CENTER_X + amp * np.sin(2.0 * np.pi * freq * t + phase), CENTER_Y + bob
+
+
+def _random_jerk(rng, t, speed):
+    n, samples = t.shape
+    # Jerk scaled so the velocity random walk reaches roughly `speed` within a second
+    jerk = rng.normal(0.0, speed * 25.0, (n, samples, 2))
+    paths = []
+    for axis in range(2):
+        acc = _integrate(jerk[:, :, axis], t)
+        vel = _integrate(acc, t)
+        vel -= vel.mean(axis=1, keepdims=True)  # Remove drift so paths stay on screen
+        paths.append(_integrate(vel, t))
+    return CENTER_X + paths[0], CENTER_Y + paths[1]
+
+
+def _stop_and_go(rng, t, speed):
+    n = t.shape[0]
+    hx, hy = _heading(rng, n)
+    period = _column(rng, n, 0.4, 1.0)
+    duty = _column(rng, n, 0.4, 0.7)
+    v = speed * _column(rng, n, 0.5, 1.5)
+
+    cycle = t / period
+    moving = (cycle % 1.0) < duty
+    # Alternate direction every cycle so the target shuttles back and forth
+    sign = np.where(np.floor(cycle) % 2.0 == 0.0, 1.0, -1.0)
+    dist = _integrate(np.where(moving, v * sign, 0.0), t)
+    return CENTER_X + hx * dist, CENTER_Y + hy * dist
+
+
+def _direction_flips(rng, t, speed):
+    n = t.shape[0]
+    paths = []
+    for scale in (1.0, 0.5):
+        period = _column(rng, n, 0.3, 1.2)
+        v = scale * speed * _column(rng, n, 0.5, 1.5)
+        # Triangle wave with peak speed v: amplitude v * period / 4
+        amp = v * period * 0.25
+        phase = _column(rng, n, 0.0, 1.0)
+        tri = 2.0 * np.abs(((t / period + phase) % 1.0) * 2.0 - 1.0) - 1.0
+        paths.append(amp * tri)
+    return CENTER_X + paths[0], CENTER_Y + paths[1]
+
+
+_GENERATORS = {
+    "constant_velocity": _constant_velocity,
+    "sine_strafe": _sine_strafe,
+    "random_jerk": _random_jerk,
+    "stop_and_go": _stop_and_go,
+    "direction_flips": _direction_flips,
+}
+
+
+def generate(
+    pattern: str,
+    n: int = 1,
+    duration: float = 2.0,
+    rate: float = 240.0,
+    speed: float = 300.0,
+    noise: float = 1.5,
+    jitter: float = 0.0,
+    seed: int | np.random.Generator | None = None,
+) -> TrajectoryBatch:
+    """
+    Generate `n` random trajectories of one pattern.
+
+    Args:
+        pattern: One of PATTERNS
+        n: Number of trajectories
+        duration: Length in seconds
+        rate: Nominal detection rate (Hz)
+        speed: Typical target speed (px/s); each trajectory draws 0.5-1.5x of it
+        noise: Gaussian pixel noise (std) added to the observed positions
+        jitter: Relative frame-interval jitter (0 = perfectly regular frames)
+        seed: Seed or Generator for reproducible batches
+    """
+    if pattern not in _GENERATORS:
+        raise ValueError(f"Unknown trajectory pattern '{pattern}' (expected one of {PATTERNS})")
+
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    samples = max(2, int(duration * rate))
+    t = _timestamps(rng, n, samples, rate, jitter)
+    true_x, true_y = _GENERATORS[pattern](rng, t, speed)
+
+    if noise > 0.0:
+        x = true_x + rng.normal(0.0, noise, true_x.shape)
+        y = true_y + rng.normal(0.0, noise, true_y.shape)
+    else:
+        x, y = true_x.copy(), true_y.copy()
+    return TrajectoryBatch(pattern, t, x, y, true_x, true_y)
+
+
+def generate_suite(n: int = 1, seed: int | None = 0, **kwargs: Any) -> dict[str, TrajectoryBatch]:
+    """Generate `n` trajectories of every pattern (same options for all), keyed by pattern."""
+    rng = np.random.default_rng(seed)
+    return {pattern: generate(pattern, n, seed=rng, **kwargs) for pattern in PATTERNS}
+
+
+# ----------------------------------------------------------------------
+# Metrics
+# ----------------------------------------------------------------------
+def _interp_rows(
+    query: NDArray[np.float64], t: NDArray[np.float64], values: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Row-wise linear interpolation (np.interp per row; rows have their own timestamps)."""
+    if t.ndim == 1:
+        return np.interp(query, t, values)
+    return np.stack([np.interp(query[i], t[i], values[i]) for i in range(t.shape[0])])
+
+
+def _rolling_extrema(values: NDArray[np.float64], half_window: int) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Centred rolling min/max along the last axis (edges padded by repetition)."""
+    padded = np.pad(values, ((0, 0), (half_window, half_window)), mode="edge")
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * half_window + 1, axis=1)
+    return windows.min(axis=2), windows.max(axis=2)
+
+
+def compute_metrics(
+    t: NDArray[np.float64],
+    out_x: NDArray[np.float64] | NDArray[np.int64],
+    out_y: NDArray[np.float64] | NDArray[np.int64],
+    true_x: NDArray[np.float64],
+    true_y: NDArray[np.float64],
+    latency: float = 0.0,
+    warmup: int = 30,
+    settle_tolerance: float = 3.0,
+    overshoot_window: float = 0.5,
+) -> dict[str, NDArray[np.float64]]:
+    """
+    Per-trajectory tracking metrics for engine output against ground truth.
+
+    The aim point at time t is compared with where the target is at `t + latency`
+    (the moment the input actually lands). The first `warmup` samples are skipped.
+
+    Returns a dict of (n_traj,) arrays (length 1 for a single 1D trajectory):
+        rmse: Root-mean-square aim error (px)
+        lag: Least-squares time shift of the aim behind the target (s, negative = leading)
+        overshoot: Largest excursion beyond the target's local range of motion (px)
+        settling_time: Worst time from the target stopping until the aim stays within
+            `settle_tolerance` (s, NaN when the target never stops)
+        jitter: RMS second difference of the aim error (px/frame^2) - frame-to-frame shake
+    """
+    t = np.atleast_2d(np.asarray(t, dtype=np.float64))
+    out_x = np.atleast_2d(np.asarray(out_x, dtype=np.float64))
+    out_y = np.atleast_2d(np.asarray(out_y, dtype=np.float64))
+    true_x = np.atleast_2d(np.asarray(true_x, dtype=np.float64))
+    true_y = np.atleast_2d(np.asarray(true_y, dtype=np.float64))
+    t = np.broadcast_to(t, out_x.shape)
+    true_x = np.broadcast_to(true_x, out_x.shape)
+    true_y = np.broadcast_to(true_y, out_x.shape)
+
+    if out_x.shape[1] - warmup < 3:
+        raise ValueError(f"Trajectory too short for metrics ({out_x.shape[1]} samples, warmup {warmup})")
+
+    if latency:
+        ref_x = _interp_rows(t + latency, t, true_x)
+        ref_y = _interp_rows(t + latency, t, true_y)
+    else:
+        ref_x, ref_y = true_x, true_y
+
+    err_x = (out_x - ref_x)[:, warmup:]
+    err_y = (out_y - ref_y)[:, warmup:]
+    ts = t[:, warmup:]
+    rx, ry = ref_x[:, warmup:], ref_y[:, warmup:]
+
+    # RMSE
+    rmse = np.sqrt(np.mean(err_x * err_x + err_y * err_y, axis=1))
+
+    # Lag: out(t) ~ ref(t - lag) ~ ref(t) - lag * v(t)  =>  err ~ -lag * v
+    vx = np.gradient(rx, axis=1) / np.maximum(np.gradient(ts, axis=1), 1e-9)
+    vy = np.gradient(ry, axis=1) / np.maximum(np.gradient(ts, axis=1), 1e-9)
+    v_sq = np.sum(vx * vx + vy * vy, axis=1)
+    lag = np.where(v_sq > 0.0, -np.sum(err_x * vx + err_y * vy, axis=1) / np.maximum(v_sq, 1e-12), 0.0)
+
+    # Overshoot: aim leaving the range the target covered nearby in time
+    frame = float(np.median(np.diff(t[0]))) if t.shape[1] > 1 else 0.0
+    half_window = max(1, int(round(overshoot_window / frame))) if frame > 0.0 else 1
+    overshoot = np.zeros(out_x.shape[0])
+    for aim, ref in ((out_x, ref_x), (out_y, ref_y)):
+        # Windows include the warmup samples so the first scored frames see their past
+        lo, hi = _rolling_extrema(ref, half_window)
+        excess = np.maximum(aim - hi, lo - aim)[:, warmup:]
+        overshoot = np.maximum(overshoot, np.maximum(excess, 0.0).max(axis=1))
+
+    # Settling time: within stopped runs, last moment the error exceeds tolerance
+    moving = np.ones_like(rx, dtype=bool)
+    moving[:, 1:] = (np.diff(rx, axis=1) != 0.0) | (np.diff(ry, axis=1) != 0.0)
+    idx = np.broadcast_to(np.arange(rx.shape[1]), rx.shape)
+    stop_start = np.maximum.accumulate(np.where(moving, idx, 0), axis=1)
+    since_stop = ts - np.take_along_axis(ts, stop_start, axis=1)
+    unsettled = ~moving & (np.hypot(err_x, err_y) > settle_tolerance)
+    settling_time = np.where(unsettled, since_stop, 0.0).max(axis=1)
+    settling_time = np.where((~moving).any(axis=1), settling_time, np.nan)
+
+    # Jitter: curvature of the error signal (smooth lag contributes ~0)
+    d2x = np.diff(err_x, n=2, axis=1)
+    d2y = np.diff(err_y, n=2, axis=1)
+    jitter = np.sqrt(np.mean(d2x * d2x + d2y * d2y, axis=1))
+
+    return {"rmse": rmse, "lag": lag, "overshoot": overshoot, "settling_time": settling_time, "jitter": jitter}
+
+
+def summarize(metrics: dict[str, NDArray[np.float64]]) -> dict[str, float]:
+    """Collapse per-trajectory metrics to `<name>_mean` / `<name>_max` floats (NaNs ignored)."""
+    summary: dict[str, float] = {}
+    for name, values in metrics.items():
+        finite = values[np.isfinite(values)]
+        summary[f"{name}_mean"] = float(finite.mean()) if finite.size else float("nan")
+        summary[f"{name}_max"] = float(finite.max()) if finite.size else float("nan")
+    return summary
+
+
+def score_engine(
+    engine: Any, batch: TrajectoryBatch | Trajectory, latency: float = 0.0, warmup: int = 30, **kwargs: Any
+) -> dict[str, NDArray[np.float64]]:
+    """Replay a batch through `engine.process_batch` and compute its metrics."""
+    out_x, out_y = engine.process_batch(batch.t, batch.x, batch.y)
+    return compute_metrics(batch.t, out_x, out_y, batch.true_x, batch.true_y, latency, warmup, **kwargs)
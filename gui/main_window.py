@@ -533,6 +533,22 @@ def setup_gui(app):
                 with dpg.tooltip(app.prediction_scale_slider):
                     dpg.add_text("Multiplies movement to lead the target.")
 
+                with dpg.group(horizontal=True):
+                    dpg.add_text("Horizon:")
+                    app.prediction_mode_combo = dpg.add_combo(
+                        items=["manual", "auto"],
+                        default_value=getattr(app.config, "prediction_mode", "manual"),
+                        callback=lambda s, a: app.config.update("prediction_mode", a),
+                        width=120,
+                    )
+                    with dpg.tooltip(app.prediction_mode_combo):
+                        dpg.add_text(
+                            "Prediction Horizon.\n"
+                            "• manual: Fixed 100ms lookahead\n"
+                            "• auto: Follows measured capture-to-input latency\n"
+                            "  (re-adapts after backend or FOV changes)"
+                        )
+
                 dpg.add_spacer(height=10)
 
                 def _reset_motion_clicked():
@@ -1130,6 +1146,25 @@ def setup_gui(app):
 
                 dpg.add_spacer(height=5)
 
+                with dpg.group(horizontal=True):
+                    dpg.add_text("Input Backend:")
+                    app.input_method_combo = dpg.add_combo(
+                        items=["sendinput", "ghub", "recording"],
+                        default_value=getattr(app.config, "input_method", "sendinput"),
+                        callback=lambda s, a: app.config.update("input_method", a),
+                        width=120,
+                    )
+                    with dpg.tooltip(app.input_method_combo):
+                        dpg.add_text(
+                            "Mouse Output Path.\n"
+                            "• sendinput: Windows SendInput (default)\n"
+                            "• ghub: Logitech driver proxy (libs/ghub_device.dll)\n"
+                            "• recording: No output; timestamps moves for benchmarking\n"
+                            "Falls back to sendinput if the backend fails to load."
+                        )
+
+                dpg.add_spacer(height=5)
+
                 app.fps_slider = _create_styled_slider_int(
                     "Target FPS Loop",
                     app.config.target_fps,
@@ -1139,6 +1174,182 @@ def setup_gui(app):
                     "Max cycles per second for the core thread.",
                 )
 
+                dpg.add_spacer(height=5)
+
+                with dpg.group(horizontal=True):
+                    dpg.add_text("Loop Pacing:")
+                    app.loop_mode_combo = dpg.add_combo(
+                        items=["fixed", "event"],
+                        default_value=getattr(app.config, "loop_mode", "fixed"),
+                        callback=lambda s, a: app.config.update("loop_mode", a),
+                        width=120,
+                    )
+                    with dpg.tooltip(app.loop_mode_combo):
+                        dpg.add_text(
+                            "How the core loop is timed.\n"
+                            "• fixed: Run at Target FPS (re-processes cached frames between captures)\n"
+                            "• event: Wake once per new captured frame; no idle spinning\n"
+                            "Event mode needs dxgi/bettercam capture; mss falls back to fixed."
+                        )
+
+                dpg.add_spacer(height=5)
+
+                app.async_input_checkbox = dpg.add_checkbox(
+                    label="Async Input Dispatch",
+                    default_value=getattr(app.config, "async_input", False),
+                    callback=lambda s, a: app.config.update("async_input", a),
+                )
+                with dpg.tooltip(app.async_input_checkbox):
+                    dpg.add_text(
+                        "Send mouse input from a dedicated thread.\n"
+                        "The core loop posts the latest target and moves on;\n"
+                        "stale targets are dropped, so input stalls never delay detection."
+                    )
+
+                app.output_substeps_slider = _create_styled_slider_int(
+                    "Output Micro-Steps",
+                    getattr(app.config, "output_substeps", 1),
+                    1,
+                    16,
+                    lambda s, a: app.config.update("output_substeps", a),
+                    "Split each correction into N small moves spread across one capture frame.\n"
+                    "Raises the input rate above the capture rate (1 = off, >1 enables async input).",
+                )
+
+                dpg.add_spacer(height=5)
+
+                app.idle_throttle_checkbox = dpg.add_checkbox(
+                    label="Idle Power Saving",
+                    default_value=getattr(app.config, "idle_throttle", False),
+                    callback=lambda s, a: app.config.update("idle_throttle", a),
+                )
+                with dpg.tooltip(app.idle_throttle_checkbox):
+                    dpg.add_text(
+                        "Scan at a low rate while no target is in view.\n"
+                        "Full rate returns on the first detection; a target that appears\n"
+                        "while idle is picked up within one idle interval (1 / Idle Scan FPS)."
+                    )
+
+                app.idle_scan_fps_slider = _create_styled_slider_int(
+                    "Idle Scan FPS",
+                    getattr(app.config, "idle_scan_fps", 30),
+                    10,
+                    240,
+                    lambda s, a: app.config.update("idle_scan_fps", a),
+                    "Scan rate while idle. Lower saves more CPU; worst-case extra acquire delay is 1000 / value ms.",
+                )
+
+                app.idle_after_misses_slider = _create_styled_slider_int(
+                    "Idle After Misses",
+                    getattr(app.config, "idle_after_misses", 120),
+                    1,
+                    2000,
+                    lambda s, a: app.config.update("idle_after_misses", a),
+                    "Consecutive empty frames before dropping to the idle scan rate.",
+                )
+
+                dpg.add_spacer(height=5)
+
+                app.trace_spans_checkbox = dpg.add_checkbox(
+                    label="Frame Span Tracing",
+                    default_value=getattr(app.config, "trace_spans", False),
+                    callback=lambda s, a: app.config.update("trace_spans", a),
+                )
+                with dpg.tooltip(app.trace_spans_checkbox):
+                    dpg.add_text(
+                        "Record every timing probe as a span (thread + frame number) in a fixed-size buffer.\n"
+                        "Cheap enough to leave on: after a stutter, use 'Export Trace' on the Stats tab\n"
+                        "and open the file in ui.perfetto.dev or chrome://tracing."
+                    )
+
+                app.telemetry_stream_checkbox = dpg.add_checkbox(
+                    label="Stream Frame Telemetry",
+                    default_value=getattr(app.config, "telemetry_stream", False),
+                    callback=lambda s, a: app.config.update("telemetry_stream", a),
+                )
+                with dpg.tooltip(app.telemetry_stream_checkbox):
+                    dpg.add_text(
+                        "Write one compact record per frame (frame/detection/probe times, target found,\n"
+                        "frame age) to logs/telemetry/ from a background thread, for whole-session analysis.\n"
+                        "Load a file with utils.telemetry_sink.load_telemetry()."
+                    )
+
+                app.metrics_endpoint_checkbox = dpg.add_checkbox(
+                    label="Local Metrics Endpoint",
+                    default_value=getattr(app.config, "metrics_endpoint", False),
+                    callback=lambda s, a: app.config.update("metrics_endpoint", a),
+                )
+                with dpg.tooltip(app.metrics_endpoint_checkbox):
+                    dpg.add_text(
+                        "Serve frame/probe histograms, capture and process counters in Prometheus text format\n"
+                        "at http://127.0.0.1:<metrics_port>/metrics (default port 9464, localhost only).\n"
+                        "Rendered on the server thread from snapshots; the logic loop does no extra work."
+                    )
+
+                app.sampling_profiler_checkbox = dpg.add_checkbox(
+                    label="Sampling Profiler",
+                    default_value=getattr(app.config, "sampling_profiler", False),
+                    callback=lambda s, a: app.config.update("sampling_profiler", a),
+                )
+                with dpg.tooltip(app.sampling_profiler_checkbox):
+                    dpg.add_text(
+                        "Sample the logic thread's Python stack from a background thread (no hooks in the loop).\n"
+                        "Use 'Export Flamegraph' on the Stats tab for collapsed stacks (speedscope, flamegraph.pl);\n"
+                        "the export reports the sampling overhead."
+                    )
+
+                app.profiler_interval_slider = _create_styled_slider_int(
+                    "Profiler Interval (ms)",
+                    getattr(app.config, "profiler_interval_ms", 5),
+                    1,
+                    100,
+                    lambda s, a: app.config.update("profiler_interval_ms", a),
+                    "Time between stack samples. Shorter resolves brief stalls at a higher (reported) overhead.",
+                )
+
+                app.gc_tracking_checkbox = dpg.add_checkbox(
+                    label="GC Pause Tracking",
+                    default_value=getattr(app.config, "gc_tracking", False),
+                    callback=lambda s, a: app.config.update("gc_tracking", a),
+                )
+                with dpg.tooltip(app.gc_tracking_checkbox):
+                    dpg.add_text(
+                        "Record every garbage-collection pause and the net allocations of each frame,\n"
+                        "and count how many missed frames contained a GC pause (Stats tab, CSV export)."
+                    )
+
+                app.gc_freeze_checkbox = dpg.add_checkbox(
+                    label="Freeze GC After Startup",
+                    default_value=getattr(app.config, "gc_freeze", False),
+                    callback=lambda s, a: app.config.update("gc_freeze", a),
+                )
+                with dpg.tooltip(app.gc_freeze_checkbox):
+                    dpg.add_text(
+                        "With GC tracking on: collect once, gc.freeze() all startup objects and hold off\n"
+                        "gen2 collections while the loop runs, so remaining pauses only scan young objects."
+                    )
+
+                app.slow_frame_forensics_checkbox = dpg.add_checkbox(
+                    label="Slow-Frame Snapshots",
+                    default_value=getattr(app.config, "slow_frame_forensics", False),
+                    callback=lambda s, a: app.config.update("slow_frame_forensics", a),
+                )
+                with dpg.tooltip(app.slow_frame_forensics_checkbox):
+                    dpg.add_text(
+                        "When a frame takes longer than the factor below x the median frame time, write the last\n"
+                        "120 frames (probes, frame age, GC), the capture backend and the loop's stack during the\n"
+                        "overrun to logs/slow_frames/ as JSON. At most one snapshot every 5 seconds."
+                    )
+
+                app.slow_frame_factor_slider = _create_styled_slider(
+                    "Slow Frame Factor",
+                    getattr(app.config, "slow_frame_factor", 3.0),
+                    1.5,
+                    20.0,
+                    lambda s, a: app.config.update("slow_frame_factor", a),
+                    "A frame is slow when it takes longer than this multiple of the rolling median frame time.",
+                )
+
                 dpg.add_spacer(height=10)
 
                 dpg.add_spacer(height=15)
@@ -1330,6 +1541,63 @@ def setup_gui(app):
                     if hasattr(app, "fps_slider") and dpg.does_item_exist(app.fps_slider):
                         dpg.set_value(app.fps_slider, app.config.target_fps)
 
+                    if hasattr(app, "loop_mode_combo") and dpg.does_item_exist(app.loop_mode_combo):
+                        dpg.set_value(app.loop_mode_combo, getattr(app.config, "loop_mode", "fixed"))
+
+                    if hasattr(app, "input_method_combo") and dpg.does_item_exist(app.input_method_combo):
+                        dpg.set_value(app.input_method_combo, getattr(app.config, "input_method", "sendinput"))
+
+                    if hasattr(app, "output_substeps_slider") and dpg.does_item_exist(app.output_substeps_slider):
+                        dpg.set_value(app.output_substeps_slider, getattr(app.config, "output_substeps", 1))
+
+                    if hasattr(app, "async_input_checkbox") and dpg.does_item_exist(app.async_input_checkbox):
+                        dpg.set_value(app.async_input_checkbox, getattr(app.config, "async_input", False))
+
+                    if hasattr(app, "idle_throttle_checkbox") and dpg.does_item_exist(app.idle_throttle_checkbox):
+                        dpg.set_value(app.idle_throttle_checkbox, getattr(app.config, "idle_throttle", False))
+
+                    if hasattr(app, "trace_spans_checkbox") and dpg.does_item_exist(app.trace_spans_checkbox):
+                        dpg.set_value(app.trace_spans_checkbox, getattr(app.config, "trace_spans", False))
+
+                    if hasattr(app, "telemetry_stream_checkbox") and dpg.does_item_exist(app.telemetry_stream_checkbox):
+                        dpg.set_value(app.telemetry_stream_checkbox, getattr(app.config, "telemetry_stream", False))
+
+                    if hasattr(app, "metrics_endpoint_checkbox") and dpg.does_item_exist(app.metrics_endpoint_checkbox):
+                        dpg.set_value(app.metrics_endpoint_checkbox, getattr(app.config, "metrics_endpoint", False))
+
+                    if hasattr(app, "sampling_profiler_checkbox") and dpg.does_item_exist(
+                        app.sampling_profiler_checkbox
+                    ):
+                        dpg.set_value(app.sampling_profiler_checkbox, getattr(app.config, "sampling_profiler", False))
+
+                    if hasattr(app, "profiler_interval_slider") and dpg.does_item_exist(app.profiler_interval_slider):
+                        dpg.set_value(app.profiler_interval_slider, getattr(app.config, "profiler_interval_ms", 5))
+
+                    if hasattr(app, "gc_tracking_checkbox") and dpg.does_item_exist(app.gc_tracking_checkbox):
+                        dpg.set_value(app.gc_tracking_checkbox, getattr(app.config, "gc_tracking", False))
+
+                    if hasattr(app, "gc_freeze_checkbox") and dpg.does_item_exist(app.gc_freeze_checkbox):
+                        dpg.set_value(app.gc_freeze_checkbox, getattr(app.config, "gc_freeze", False))
+
+                    if hasattr(app, "slow_frame_forensics_checkbox") and dpg.does_item_exist(
+                        app.slow_frame_forensics_checkbox
+                    ):
+                        dpg.set_value(
+                            app.slow_frame_forensics_checkbox, getattr(app.config, "slow_frame_forensics", False)
+                        )
+
+                    if hasattr(app, "slow_frame_factor_slider") and dpg.does_item_exist(app.slow_frame_factor_slider):
+                        dpg.set_value(app.slow_frame_factor_slider, getattr(app.config, "slow_frame_factor", 3.0))
+
+                    if hasattr(app, "idle_scan_fps_slider") and dpg.does_item_exist(app.idle_scan_fps_slider):
+                        dpg.set_value(app.idle_scan_fps_slider, getattr(app.config, "idle_scan_fps", 30))
+
+                    if hasattr(app, "idle_after_misses_slider") and dpg.does_item_exist(app.idle_after_misses_slider):
+                        dpg.set_value(app.idle_after_misses_slider, getattr(app.config, "idle_after_misses", 120))
+
+                    if hasattr(app, "prediction_mode_combo") and dpg.does_item_exist(app.prediction_mode_combo):
+                        dpg.set_value(app.prediction_mode_combo, getattr(app.config, "prediction_mode", "manual"))
+
                     if hasattr(app, "aim_point_radio") and dpg.does_item_exist(app.aim_point_radio):
                         dpg.set_value(
                             app.aim_point_radio,
@@ -1390,6 +1658,38 @@ def setup_gui(app):
                     dpg.add_text("Missed Frames:")
                     app.analytics_missed_val = dpg.add_text("0", color=(255, 50, 50))
 
+                # Session frame-time percentiles (tail stalls that the averages hide)
+                with dpg.group(horizontal=True):
+                    dpg.add_text("Frame p50/p99/p99.9:")
+                    app.analytics_percentiles_val = dpg.add_text("-", color=(255, 200, 0))
+
+                # End-to-end latency at SendInput: from the grab call, and from frame acquisition
+                # (frame age includes time a cached DXGI/BetterCam frame was reused)
+                with dpg.group(horizontal=True):
+                    dpg.add_text("Capture-to-Input p50/p99:")
+                    app.analytics_input_latency_val = dpg.add_text("-", color=(0, 255, 255))
+                with dpg.group(horizontal=True):
+                    dpg.add_text("Frame Age at Input p50/p99:")
+                    app.analytics_frame_age_val = dpg.add_text("-", color=(0, 255, 255))
+
+                # GC pauses vs missed frames (only while GC tracking is enabled)
+                with dpg.group(horizontal=True):
+                    dpg.add_text("GC Pauses:")
+                    app.analytics_gc_val = dpg.add_text("off", color=(255, 150, 50))
+
+                # Slow-frame snapshots written to logs/slow_frames/ (only while enabled)
+                with dpg.group(horizontal=True):
+                    dpg.add_text("Slow-Frame Snapshots:")
+                    app.analytics_slow_frames_val = dpg.add_text("off", color=(255, 150, 50))
+
+                # Pacing: how late frames start vs the schedule, and the real start-to-start interval
+                with dpg.group(horizontal=True):
+                    dpg.add_text("Start Error p50/p99:")
+                    app.analytics_pacing_val = dpg.add_text("-", color=(180, 140, 255))
+                with dpg.group(horizontal=True):
+                    dpg.add_text("Frame Interval p50/p99:")
+                    app.analytics_interval_val = dpg.add_text("-", color=(180, 140, 255))
+
                 dpg.add_spacer(height=10)
 
                 # FPS Graph
@@ -1411,6 +1711,16 @@ def setup_gui(app):
                         app.analytics_latency_series = dpg.add_line_series([], [], label="Frame Time")
                         app.analytics_detection_series = dpg.add_line_series([], [], label="Detection Time")
 
+                dpg.add_spacer(height=10)
+
+                # Pacing Graph (signed: negative = woke early)
+                dpg.add_text("Frame Start Error (ms, actual - intended)")
+                with dpg.plot(label="Pacing", height=150, width=-1):
+                    dpg.add_plot_legend()
+                    dpg.add_plot_axis(dpg.mvXAxis, label="Time", no_tick_labels=True)
+                    with dpg.plot_axis(dpg.mvYAxis, label="ms"):
+                        app.analytics_pacing_series = dpg.add_line_series([], [], label="Start Error")
+
                 def update_analytics():
                     if not hasattr(app, "perf_monitor"):
                         return
@@ -1423,6 +1733,45 @@ def setup_gui(app):
                     dpg.set_value(app.analytics_latency_val, f"{stats['avg_frame_ms']:.2f}ms")
                     dpg.set_value(app.analytics_low_val, f"{stats['one_percent_low_fps']:.1f}")
                     dpg.set_value(app.analytics_missed_val, f"{int(stats['missed_frames'])}")
+                    dpg.set_value(
+                        app.analytics_percentiles_val,
+                        f"{stats['frame_p50_ms']:.2f} / {stats['frame_p99_ms']:.2f} / {stats['frame_p99_9_ms']:.2f}ms",
+                    )
+                    dpg.set_value(
+                        app.analytics_input_latency_val,
+                        f"{stats['capture_to_input_p50_ms']:.2f} / {stats['capture_to_input_p99_ms']:.2f}ms",
+                    )
+                    dpg.set_value(
+                        app.analytics_frame_age_val,
+                        f"{stats['input_frame_age_p50_ms']:.2f} / {stats['input_frame_age_p99_ms']:.2f}ms",
+                    )
+                    dpg.set_value(
+                        app.analytics_pacing_val,
+                        f"{stats['pacing_start_error_p50_ms']:.3f} / {stats['pacing_start_error_p99_ms']:.3f}ms | "
+                        f"late {int(stats['pacing_late_starts'])} | drift {stats['pacing_drift_ms']:.1f}ms",
+                    )
+                    dpg.set_value(
+                        app.analytics_interval_val,
+                        f"{stats['pacing_interval_p50_ms']:.2f} / {stats['pacing_interval_p99_ms']:.2f}ms",
+                    )
+                    if "gc_pauses" in stats:
+                        dpg.set_value(
+                            app.analytics_gc_val,
+                            f"{int(stats['gc_pauses'])} (gen2 {int(stats['gc_gen2_pauses'])}), "
+                            f"worst {stats['gc_pause_max_ms']:.2f}ms | missed frames hit "
+                            f"{int(stats['gc_slow_frames_with_gc'])}/{int(stats['gc_slow_frames'])} | "
+                            f"alloc/frame {stats['gc_alloc_blocks_avg']:.1f}",
+                        )
+                    else:
+                        dpg.set_value(app.analytics_gc_val, "off")
+                    if "slow_snapshots" in stats:
+                        dpg.set_value(
+                            app.analytics_slow_frames_val,
+                            f"{int(stats['slow_snapshots'])} written, {int(stats['slow_suppressed'])} rate limited | "
+                            f"threshold {stats['slow_threshold_ms']:.2f}ms (median {stats['slow_median_ms']:.2f}ms)",
+                        )
+                    else:
+                        dpg.set_value(app.analytics_slow_frames_val, "off")
 
                     # Update Graphs
                     if history["fps"]:
@@ -1443,6 +1792,10 @@ def setup_gui(app):
                             [x_data, history["detection_times"]],
                         )
 
+                    if history["start_errors"]:
+                        x_data = list(range(len(history["start_errors"])))
+                        dpg.set_value(app.analytics_pacing_series, [x_data, history["start_errors"]])
+
                 app.update_analytics = update_analytics
 
                 dpg.add_spacer(height=15)
@@ -1507,6 +1860,92 @@ def setup_gui(app):
                 with dpg.tooltip(export_stats_btn):
                     dpg.add_text("Export FPS, frame times, and detection times to a CSV file.")
 
+                def _on_trace_export_file_selected(sender, app_data):
+                    """Callback when user selects a file path for the span trace."""
+                    filepath = app_data.get("file_path_name", "")
+                    if not filepath:
+                        return
+                    if not filepath.endswith(".json"):
+                        filepath += ".json"
+                    if hasattr(app, "perf_monitor") and app.perf_monitor.export_trace(filepath):
+                        dpg.set_value("stats_export_status_text", f"Trace exported: {filepath}")
+                        dpg.configure_item("stats_export_status_text", color=(100, 255, 100))
+                        if hasattr(app, "show_success_toast"):
+                            app.show_success_toast("Trace exported!")
+                    else:
+                        dpg.set_value("stats_export_status_text", "No spans captured! Enable Frame Span Tracing.")
+                        dpg.configure_item("stats_export_status_text", color=(255, 100, 100))
+                        if hasattr(app, "show_error_toast"):
+                            app.show_error_toast("Trace Export Failed!")
+
+                with dpg.file_dialog(
+                    directory_selector=False,
+                    show=False,
+                    callback=_on_trace_export_file_selected,
+                    cancel_callback=_on_stats_export_dialog_cancel,
+                    tag="trace_export_file_dialog",
+                    width=500,
+                    height=400,
+                    default_filename="frame_trace",
+                ):
+                    dpg.add_file_extension(".json", color=(0, 255, 0, 255))
+                    dpg.add_file_extension(".*", color=(150, 150, 150, 255))
+
+                export_trace_btn = dpg.add_button(
+                    label="🧵 Export Trace",
+                    callback=lambda: dpg.show_item("trace_export_file_dialog"),
+                    width=150,
+                    height=28,
+                )
+                with dpg.tooltip(export_trace_btn):
+                    dpg.add_text("Save captured per-frame spans as Chrome Trace Event JSON (ui.perfetto.dev).")
+
+                def _on_profile_export_file_selected(sender, app_data):
+                    """Callback when user selects a file path for the collapsed-stack profile."""
+                    filepath = app_data.get("file_path_name", "")
+                    if not filepath:
+                        return
+                    if not filepath.endswith(".folded"):
+                        filepath += ".folded"
+                    profiler = getattr(app, "profiler", None)
+                    if profiler is not None and profiler.write_collapsed(filepath):
+                        overhead = profiler.get_overhead()
+                        dpg.set_value(
+                            "stats_export_status_text",
+                            f"Profile exported: {filepath} ({int(overhead['samples'])} samples, "
+                            f"overhead {overhead['overhead_pct']:.2f}%)",
+                        )
+                        dpg.configure_item("stats_export_status_text", color=(100, 255, 100))
+                        if hasattr(app, "show_success_toast"):
+                            app.show_success_toast("Profile exported!")
+                    else:
+                        dpg.set_value("stats_export_status_text", "No stack samples! Enable Sampling Profiler.")
+                        dpg.configure_item("stats_export_status_text", color=(255, 100, 100))
+                        if hasattr(app, "show_error_toast"):
+                            app.show_error_toast("Profile Export Failed!")
+
+                with dpg.file_dialog(
+                    directory_selector=False,
+                    show=False,
+                    callback=_on_profile_export_file_selected,
+                    cancel_callback=_on_stats_export_dialog_cancel,
+                    tag="profile_export_file_dialog",
+                    width=500,
+                    height=400,
+                    default_filename="logic_loop",
+                ):
+                    dpg.add_file_extension(".folded", color=(0, 255, 0, 255))
+                    dpg.add_file_extension(".*", color=(150, 150, 150, 255))
+
+                export_profile_btn = dpg.add_button(
+                    label="🔥 Export Flamegraph",
+                    callback=lambda: dpg.show_item("profile_export_file_dialog"),
+                    width=150,
+                    height=28,
+                )
+                with dpg.tooltip(export_profile_btn):
+                    dpg.add_text("Save sampled logic-loop stacks in collapsed format (speedscope.app, flamegraph.pl).")
+
             # ---------------------------
             # TAB 5: DEBUG (Rules)
             # ---------------------------
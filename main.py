@@ -20,13 +20,19 @@ import psutil
 import dearpygui.dearpygui as dpg
 
 from core.detection import DetectionSystem
+from core.frame_loop import FrameLoop
+from core.idle_governor import IdleGovernor
+from core.input_dispatcher import InputDispatcher
 from core.low_level_movement import LowLevelMovementSystem
 from core.motion_engine import MotionEngine
 from gui.main_window import setup_gui, update_picker_preview
+from utils.clock import SYSTEM_CLOCK, Clock
 from utils.config import Config
 from utils.keyboard_listener import KeyboardListener
 from utils.logger import Logger
+from utils.metrics_server import DEFAULT_METRICS_PORT, MetricsServer
 from utils.performance_monitor import PerformanceMonitor
+from utils.sampling_profiler import SamplingProfiler
 from utils.screen_info import ScreenInfo
 
 # Make the application DPI aware to fix coordinate scaling issues on high-DPI monitors
@@ -67,7 +73,11 @@ class ColorTrackerAlgo:
     update_tolerance_preview: Any
     show_success_toast: Any
 
-    def __init__(self):
+    def __init__(self, clock: Clock | None = None):
+        # Time source shared by the logic loop and all core systems.
+        # Inject a SimulatedClock for deterministic faster-than-real-time runs.
+        self.clock = clock or SYSTEM_CLOCK
+
         # State Initialization
         self._running_lock = threading.Lock()
         self._running = False
@@ -167,17 +177,38 @@ class ColorTrackerAlgo:
         self.logger.debug(f"Screen resolution detected: {screen_width}x{screen_height}")
 
         # 5. Initialize performance monitor
-        self.perf_monitor = PerformanceMonitor()
+        self.perf_monitor = PerformanceMonitor(clock=self.clock)
 
         # 6. Initialize systems with optimized settings
         self.logger.debug("Initializing detection system...")
-        self.detection = DetectionSystem(self.config, self.perf_monitor)
+        self.detection = DetectionSystem(self.config, self.perf_monitor, clock=self.clock)
         self.logger.debug("Initializing unified motion engine...")
-        self.motion_engine = MotionEngine(self.config)
+        self.motion_engine = MotionEngine(self.config, self.perf_monitor, clock=self.clock)
 
         # 7. Initialize movement system with optimized settings
         self.logger.debug("Initializing low-level movement system for game compatibility...")
-        self.movement = LowLevelMovementSystem(self.config, self.perf_monitor)
+        self.movement = LowLevelMovementSystem(self.config, self.perf_monitor, clock=self.clock)
+        # Optional off-thread input path (started by the loop when async_input is enabled)
+        self.input_dispatcher = InputDispatcher(self.movement, self.perf_monitor, clock=self.clock)
+        # Drops the scan rate while nothing is in view (idle_throttle); state is reported via perf stats
+        self.idle_governor = IdleGovernor.from_config(self.config)
+        self.perf_monitor.governor = self.idle_governor
+        # Per-frame pipeline and pacing, shared with the headless runner
+        self.frame_loop = FrameLoop(
+            self.config,
+            self.detection,
+            self.motion_engine,
+            self.movement,
+            self.input_dispatcher,
+            self.perf_monitor,
+            self.idle_governor,
+            self.clock,
+            on_warning=self.logger.warning,
+        )
+        # Localhost Prometheus endpoint (started by the loop when metrics_endpoint is enabled)
+        self.metrics_server: MetricsServer | None = None
+        # Logic-thread stack sampler (started by the loop when sampling_profiler is enabled; kept for export)
+        self.profiler: SamplingProfiler | None = None
         self.logger.debug("All core systems initialized successfully with low-level mouse input")
 
         # 8. Initialize keyboard listener with optimized settings
@@ -363,46 +394,63 @@ class ColorTrackerAlgo:
         self.logger.debug("Algorithm loop started - beginning main detection and tracking cycle")
         loop_count = 0
 
-        # Performance optimization: cache frequently used values
-        config_enabled = self.config.enabled
-        target_fps = self.config.target_fps
-        frame_interval = 1.0 / target_fps
-
-        # Ultra-precision timing setup
-        self.start_time = time.perf_counter()
+        # Performance optimization: one frozen config snapshot per iteration, swapped on version change
+        frame_loop = self.frame_loop
+        frame_loop.start()
+        cfg = frame_loop.cfg
+        config_enabled = cfg.enabled
+        idle_governor = self.idle_governor
+        self._sync_telemetry(cfg.telemetry_stream is True)
+        self._sync_metrics_endpoint(cfg.metrics_endpoint is True, cfg.metrics_port)
+        self._sync_profiler(cfg.sampling_profiler is True, cfg.profiler_interval_ms)
+        self._sync_gc_tracking(cfg.gc_tracking is True, cfg.gc_freeze is True)
+        self._sync_forensics(cfg.slow_frame_forensics is True, cfg.slow_frame_factor)
+
+        # Ultra-precision timing setup (all loop timing goes through the injected clock)
+        perf_counter = self.clock.perf_counter
+        self.start_time = perf_counter()
         self.last_fps_update = self.start_time
         self.last_perf_log_time = self.start_time
 
         # Local references to methods to avoid self. lookup overhead
-        find_target = self.detection.find_target
-        process_motion = self.motion_engine.process
-        aim_at = self.movement.aim_at
+        wait_for_frame = frame_loop.wait_for_frame
+        begin_frame = frame_loop.begin_frame
+        refresh_config = frame_loop.refresh_config
+        process_frame = frame_loop.process
+        end_frame = frame_loop.end_frame
+        pace = frame_loop.pace
         update_target_status = self._update_target_status
         update_fps_display = self._update_fps_display
         perf_monitor = self.perf_monitor
 
-        # High-performance timing variables
-        target_frame_time = frame_interval
-
         try:
             while self.running:
-                loop_start_time = time.perf_counter()
-                perf_monitor.start_probe("main_loop_active")
+                # Event mode waits for a new captured frame (only while tracking is enabled)
+                waited, frame_ready = wait_for_frame(config_enabled)
+                loop_start_time = begin_frame(waited)
                 loop_count += 1
 
-                # Update cached config values periodically (less frequent for performance)
-                if loop_count % 500 == 0:
-                    config_enabled = self.config.enabled
-                    target_fps = self.config.target_fps
-                    new_frame_interval = 1.0 / max(1, target_fps)
-                    if abs(new_frame_interval - frame_interval) > 0.0001:
-                        frame_interval = new_frame_interval
-                        target_frame_time = frame_interval
-                    # Sync motion engine config cache
-                    self.motion_engine.update_config()
+                # One snapshot reference per frame: every stage sees the same settings,
+                # and a new version (e.g. the enable toggle) takes effect on the next frame
+                if refresh_config():
+                    cfg = frame_loop.cfg
+                    config_enabled = cfg.enabled
+                    if not config_enabled:
+                        frame_loop.reset_idle()
+                    self._sync_telemetry(cfg.telemetry_stream is True)
+                    self._sync_metrics_endpoint(cfg.metrics_endpoint is True, cfg.metrics_port)
+                    self._sync_profiler(cfg.sampling_profiler is True, cfg.profiler_interval_ms)
+                    self._sync_gc_tracking(cfg.gc_tracking is True, cfg.gc_freeze is True)
+                    self._sync_forensics(cfg.slow_frame_forensics is True, cfg.slow_frame_factor)
+
+                # Display mode is OS state, not config: poll it periodically
+                if loop_count % 500 == 0 and self.movement.refresh_geometry():
+                    # Re-center detection FOV on the new resolution (bumps the config version)
+                    self.config.screen_width = self.movement.screen_width
+                    self.config.screen_height = self.movement.screen_height
 
                 # Ultra-efficient FPS calculation (every 1 second for better responsiveness)
-                current_time = time.perf_counter()
+                current_time = perf_counter()
 
                 # Use PerformanceMonitor for stats
                 if current_time - self.last_fps_update >= 1.0:
@@ -422,7 +470,9 @@ class ColorTrackerAlgo:
                             f"Avg FPS: {avg_fps:.1f} | "
                             f"Avg Frame: {stats['avg_frame_ms']:.2f}ms | "
                             f"Max Frame: {stats['worst_frame_ms']:.2f}ms | "
-                            f"Missed: {int(stats['missed_frames'])}"
+                            f"Missed: {int(stats['missed_frames'])} | "
+                            f"Wake Err: {stats['wake_error_ms'] * 1000.0:.0f}us | "
+                            f"Scan: {'IDLE' if idle_governor.idle else 'ACTIVE'}"
                         )
                         # Reset aggregate counters in monitor
                         perf_monitor.reset_aggregates()
@@ -430,57 +480,34 @@ class ColorTrackerAlgo:
                     # Update UI with rate limiting
                     update_fps_display()
 
-                # Only run if enabled
-                if config_enabled:
+                # Only run if enabled (and, in event mode, only on a new frame):
+                # detect, then predict and move (see FrameLoop.process)
+                if config_enabled and frame_ready:
                     try:
-                        # Step 1: Detect target
-                        t0_detect = time.perf_counter()
-                        target_found, target_x, target_y = find_target()
-                        t1_detect = time.perf_counter()
-                        perf_monitor.record_detection(t1_detect - t0_detect)
-
-                        # Update target status with rate limiting (less frequent at high FPS)
-                        if loop_count % 100 == 0:
-                            update_target_status(target_found)
-
-                        # Step 2: If target found, predict and move
-                        if target_found:
-                            try:
-                                # Calculate motion (smoothing + prediction)
-                                predicted_x, predicted_y = process_motion(target_x, target_y, target_frame_time)
-
-                                # Move mouse to target
-                                aim_at(predicted_x, predicted_y)
-                            except Exception as move_error:
-                                if loop_count % 500 == 0:
-                                    self.logger.error(f"Movement subsystem error: {move_error}")
-
-                    except Exception as detection_error:
+                        process_frame()
+                    except Exception as pipeline_error:
                         if loop_count % 100 == 0:
-                            self.logger.error(f"Detection subsystem fault: {detection_error}")
-
-                # Ultra-precise frame timing without busy waiting
-                frame_end_time = time.perf_counter()
-                perf_monitor.stop_probe("main_loop_active")
-                actual_frame_time = frame_end_time - loop_start_time
+                            self.logger.error(f"Tracking pipeline fault: {pipeline_error}")
 
-                # Calculate precise sleep time
-                sleep_time = target_frame_time - actual_frame_time
+                    # Update target status with rate limiting (less frequent at high FPS)
+                    if loop_count % 100 == 0:
+                        update_target_status(frame_loop.target_found)
 
-                # Record performance metrics for every frame (fix for 0 FPS stats)
-                perf_monitor.record_frame(actual_frame_time, missed=(sleep_time <= 0))
-
-                # Use hybrid precision sleep
-                if sleep_time > 0:
-                    self._smart_sleep(sleep_time, loop_start_time + target_frame_time)
-
-                # No else block needed for record_frame anymore
+                # Record the frame, then hybrid precision sleep to the next deadline
+                # (event mode is paced by the frame wait instead)
+                pace(end_frame(loop_start_time, waited))
 
         except Exception as fatal_error:
             # Fatal errors should always be logged
             self.logger.critical(f"Fatal error in algorithm loop: {fatal_error}")
 
         finally:
+            self.input_dispatcher.stop()
+            self._sync_telemetry(False)
+            self._sync_metrics_endpoint(False)
+            self._sync_profiler(False)
+            self._sync_gc_tracking(False)
+            self._sync_forensics(False)
             if hasattr(self, "detection"):
                 try:
                     self.detection.close()
@@ -488,6 +515,97 @@ class ColorTrackerAlgo:
                     self.logger.error(f"Error closing detection system: {e}")
             self.logger.debug(f"Algorithm loop ended after {loop_count} iterations")
 
+    def _sync_telemetry(self, enabled: bool) -> None:
+        """Start/stop the per-frame telemetry stream to match config (called from the logic thread)."""
+        perf_monitor = self.perf_monitor
+        if enabled and perf_monitor.telemetry_sink is None:
+            try:
+                path = perf_monitor.start_telemetry()
+                self.logger.info(f"Streaming frame telemetry to {path}")
+            except OSError as e:
+                self.logger.error(f"Telemetry stream could not be opened: {e}")
+        elif not enabled and perf_monitor.telemetry_sink is not None:
+            sink = perf_monitor.telemetry_sink
+            perf_monitor.stop_telemetry()
+            self.logger.info(f"Telemetry stream closed: {sink.rows_written} frames, {sink.dropped_rows} dropped")
+
+    def _sync_metrics_endpoint(self, enabled: bool, port: int = DEFAULT_METRICS_PORT) -> None:
+        """Start/stop (or move) the localhost metrics endpoint to match config."""
+        server = self.metrics_server
+        if server is not None and (not enabled or server.port != port):
+            server.stop()
+            self.metrics_server = None
+            self.logger.info("Metrics endpoint stopped")
+        if enabled and self.metrics_server is None:
+            server = MetricsServer(self.perf_monitor, self.detection, port)
+            try:
+                server.start()
+            except OSError as e:
+                self.logger.error(f"Metrics endpoint could not bind port {port}: {e}")
+                return
+            self.metrics_server = server
+            self.logger.info(f"Serving metrics at {server.url}")
+
+    def _sync_profiler(self, enabled: bool, interval_ms: int = 5) -> None:
+        """
+        Start/stop the sampling profiler on the calling (logic) thread to match config.
+        A new run starts a fresh profile; the last one stays available for export.
+        """
+        profiler = self.profiler
+        running = profiler is not None and profiler.running
+        if enabled and running:
+            profiler.interval = interval_ms / 1000.0
+        elif enabled:
+            self.profiler = SamplingProfiler(threading.get_ident(), interval_ms / 1000.0)
+            self.profiler.start()
+            self.logger.info(f"Sampling profiler started ({interval_ms} ms interval)")
+        elif running:
+            profiler.stop()
+            overhead = profiler.get_overhead()
+            self.logger.info(
+                f"Sampling profiler stopped: {int(overhead['samples'])} samples, "
+                f"{overhead['avg_sample_us']:.1f} us/sample, overhead {overhead['overhead_pct']:.2f}%"
+            )
+
+    def _sync_gc_tracking(self, enabled: bool, freeze: bool = False) -> None:
+        """Start/stop GC pause and allocation tracking (and freeze mode) to match config."""
+        perf_monitor = self.perf_monitor
+        gc_monitor = perf_monitor.gc_monitor
+        if enabled:
+            if gc_monitor is None or gc_monitor.frozen != freeze:
+                perf_monitor.start_gc_tracking(freeze)
+                self.logger.info(f"GC tracking enabled{' (frozen, gen2 held off)' if freeze else ''}")
+        elif gc_monitor is not None:
+            stats = gc_monitor.get_stats()
+            perf_monitor.stop_gc_tracking()
+            self.logger.info(
+                f"GC tracking stopped: {int(stats['pauses'])} pauses ({stats['pause_total_ms']:.1f} ms, "
+                f"worst {stats['pause_max_ms']:.2f} ms), {int(stats['slow_frames_with_gc'])}/"
+                f"{int(stats['slow_frames'])} slow frames hit by GC"
+            )
+
+    def _sync_forensics(self, enabled: bool, factor: float = 3.0) -> None:
+        """Start/stop slow-frame snapshots to match config (called from the logic thread, whose stack is captured)."""
+        perf_monitor = self.perf_monitor
+        forensics = perf_monitor.forensics
+        if enabled and forensics is not None:
+            forensics.factor = factor  # Applied at the next median refresh
+        elif enabled:
+            try:
+                forensics = perf_monitor.start_forensics(factor=factor)
+            except OSError as e:
+                self.logger.error(f"Slow-frame snapshots could not be enabled: {e}")
+                return
+            config = self.config
+            forensics.context_sources["capture"] = self.detection.get_capture_stats
+            forensics.context_sources["config_version"] = lambda: config._version
+            self.logger.info(f"Slow-frame snapshots (> {factor:g}x median) go to {forensics.directory}")
+        elif forensics is not None:
+            perf_monitor.stop_forensics()
+            self.logger.info(
+                f"Slow-frame snapshots stopped: {forensics.snapshots} written, {forensics.suppressed} rate limited"
+            )
+
     def _update_fps_display(self):
         """Update FPS display with caching"""
         if hasattr(self, "fps_text"):
@@ -510,17 +628,13 @@ class ColorTrackerAlgo:
             self.update_target_status(target_found)
 
     def _smart_sleep(self, duration: float, target_time: float):
-        """Hybrid precision sleep: Fused sleep and spin-wait"""
+        """Precision sleep to the frame deadline (delegated to the clock); records the wake-up error"""
         if duration <= 0:
             return
 
-        # 1. Yield-based sleep for the majority of the duration (imprecise)
-        if duration > 0.002:
-            time.sleep(duration - 0.0015)
-
-        # 2. High-precision spin-wait for the final ~1.5ms
-        while time.perf_counter() < target_time:
-            pass
+        # SystemClock waits on a high-resolution kernel timer, then spins ~100µs;
+        # SimulatedClock jumps straight to the deadline.
+        self.perf_monitor.record_wake_error(self.clock.sleep_until(target_time))
 
     def _start_picking_mode(self):
         """Enables color picking mode."""
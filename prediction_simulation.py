@@ -7,7 +7,9 @@ import sys
 
 sys.path.insert(0, ".")
 
-from core.motion_engine import MotionEngine
+import numpy as np  # noqa: E402
+
+from core.motion_engine import MotionEngine  # noqa: E402
 
 
 class MockConfig:
@@ -26,24 +28,16 @@ def simulate_linear_motion(
     config = MockConfig(prediction_scale)
     engine = MotionEngine(config)
 
-    results = []
-    t = 0.0
-    x = start_x
-    y = start_y
-
-    # First frame to initialize
-    out_x, out_y = engine.process(x, y, dt)
-    results.append((t, x, y, out_x, out_y, 0, 0))
-
+    # Whole trajectory in one compiled pass (deterministic timestamps, no wall clock)
     steps = int(duration / dt)
-    for _ in range(1, steps):
-        t += dt
-        x = start_x + velocity_x * t
-        y = start_y + velocity_y * t
-        out_x, out_y = engine.process(x, y, dt)
-        error_x = out_x - x
-        error_y = out_y - y
-        results.append((t, x, y, out_x, out_y, error_x, error_y))
+    t = np.arange(steps) * dt
+    x = start_x + velocity_x * t
+    y = start_y + velocity_y * t
+    out_x, out_y = engine.process_batch(t, x, y)
+
+    results = [(t[0], x[0], y[0], int(out_x[0]), int(out_y[0]), 0, 0)]
+    for i in range(1, steps):
+        results.append((t[i], x[i], y[i], int(out_x[i]), int(out_y[i]), out_x[i] - x[i], out_y[i] - y[i]))
 
     return results
 
@@ -83,23 +77,13 @@ if __name__ == "__main__":
         config = MockConfig(scale)
         engine = MotionEngine(config)
         dt = 0.016
-        t = 0.0
-        x = 0
-        results = []
-        for i in range(50):
-            # Alternate direction every 10 frames
-            if i < 10:
-                vx = 100
-            elif i < 20:
-                vx = -100
-            else:
-                vx = 100
-            x += vx * dt
-            out_x, out_y = engine.process(x, 0, dt)
-            error = out_x - x
-            results.append((t, x, out_x, error))
-            t += dt
-        return results
+        # Alternate direction every 10 frames
+        vx = np.full(50, 100.0)
+        vx[10:20] = -100.0
+        x = np.cumsum(vx * dt)
+        t = np.arange(50) * dt
+        out_x, _ = engine.process_batch(t, x, np.zeros(50))
+        return [(t[i], x[i], out_x[i], out_x[i] - x[i]) for i in range(50)]
 
     for scale in [0.0, 1.0, 5.0, 10.0]:
         res = simulate_oscillation(scale)
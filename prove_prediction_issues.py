@@ -1,7 +1,9 @@
 import sys
 
 sys.path.insert(0, ".")
-from core.motion_engine import MotionEngine
+import numpy as np  # noqa: E402
+
+from core.motion_engine import MotionEngine  # noqa: E402
 
 
 class MockConfig:
@@ -18,42 +20,28 @@ def run_analysis(scale):
     engine = MotionEngine(config)
     dt = 0.016
 
-    # 1. Constant Velocity Phase (to measure steady-state lead/lag)
+    # Build the whole scenario up front and replay it in one batch pass
     vx = 500  # Fast movement
-    x = 0
-    t = 0
-
-    steady_state_errors = []
-    for i in range(100):
-        x += vx * dt
-        out_x, _ = engine.process(x, 540, dt)
-        if i > 50:  # Wait for filter to stabilize
-            steady_state_errors.append(out_x - x)
-        t += dt
-
-    avg_ss_error = sum(steady_state_errors) / len(steady_state_errors)
-
-    # 2. Sudden Stop Phase (to measure overshoot)
-    overshoot_errors = []
-    # x is currently at some value, now it stops moving
-    for _ in range(30):
-        # x stays same
-        out_x, _ = engine.process(x, 540, dt)
-        overshoot_errors.append(out_x - x)
-        t += dt
-
-    max_overshoot = max(overshoot_errors) if vx > 0 else min(overshoot_errors)
-
-    # 3. Direction Reversal (to measure "weirdness" during turn)
     vx_rev = -500
-    reversal_errors = []
-    for _ in range(50):
-        x += vx_rev * dt
-        out_x, _ = engine.process(x, 540, dt)
-        reversal_errors.append(out_x - x)
-        t += dt
-
-    max_reversal_error = max([abs(e) for e in reversal_errors])
+    velocity = np.concatenate(
+        [
+            np.full(100, float(vx)),  # 1. Constant Velocity Phase (steady-state lead/lag)
+            np.zeros(30),  # 2. Sudden Stop Phase (overshoot)
+            np.full(50, float(vx_rev)),  # 3. Direction Reversal ("weirdness" during turn)
+        ]
+    )
+    x = np.cumsum(velocity * dt)
+    t = np.arange(x.size) * dt
+    out_x, _ = engine.process_batch(t, x, np.full(x.size, 540.0))
+    errors = out_x - x
+
+    # Wait for filter to stabilize before measuring steady state
+    avg_ss_error = float(np.mean(errors[51:100]))
+
+    overshoot_errors = errors[100:130]
+    max_overshoot = float(overshoot_errors.max() if vx > 0 else overshoot_errors.min())
+
+    max_reversal_error = float(np.abs(errors[130:]).max())
 
     return {
         "scale": scale,
@@ -1,9 +1,12 @@
+import time
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from core.capture import MSSBackend
 from core.detection import DetectionSystem
+from utils.clock import SimulatedClock
 from utils.config import Config
 
 
@@ -39,6 +42,20 @@ def test_switch_to_dxgi_success(detection_system):
         MockDXGI.assert_called_once()
 
 
+def test_backend_follows_the_frame_snapshot(detection_system):
+    """A capture_method edit made mid-frame applies from the next snapshot, not within this frame"""
+    config = detection_system.config
+    config.capture_method = "mss"
+    cfg = config.snapshot()
+    config.capture_method = "dxgi"
+
+    with patch("core.detection.DXGIBackend") as MockDXGI, patch("core.detection.MSSBackend") as MockMSS:
+        detection_system.find_target(cfg)
+        assert detection_system.supports_frame_events(cfg) is False
+        MockDXGI.assert_not_called()
+        MockMSS.assert_called()
+
+
 def test_fallback_to_mss_on_dxgi_failure(detection_system):
     """Verify fallback to MSS if DXGI initialization fails"""
     detection_system.config.capture_method = "dxgi"
@@ -69,3 +86,148 @@ def test_backend_cleanup_on_switch(detection_system):
 
         # Verify MSS was closed
         mss_backend.close.assert_called()
+
+
+class _FakeCamera:
+    """dxcam-style camera: grab() returns None until the next frame is 'presented'."""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.grab_calls = 0
+
+    def grab(self, region=None):
+        self.grab_calls += 1
+        return self.frames.pop(0) if self.frames else None
+
+
+def _grab_mode_backend(frames, clock=None):
+    from core.capture import _GrabModeBackend
+
+    class FakeBackend(_GrabModeBackend):
+        def __init__(self):
+            super().__init__(clock)
+            self._camera = _FakeCamera(frames)
+
+    return FakeBackend()
+
+
+def test_mss_has_no_frame_events():
+    """Backends that grab a fresh frame every call are always ready"""
+    with patch("core.capture.mss.mss"):
+        backend = MSSBackend()
+    assert backend.frame_events is False
+    assert backend.wait_for_frame(0.0) is True
+
+
+def test_grab_mode_wait_for_frame_hands_frame_to_next_grab():
+    """The frame found while waiting is returned by the next grab of the same region"""
+    region = {"left": 10, "top": 20, "width": 30, "height": 40}
+    first, second = object(), object()
+    backend = _grab_mode_backend([first, None, None, second])
+
+    assert backend.grab(region) == (True, first)
+    assert backend.wait_for_frame(1.0) is True
+    calls = backend._camera.grab_calls
+
+    assert backend.grab(region) == (True, second)
+    assert backend._camera.grab_calls == calls  # No extra camera grab
+    assert backend.grab(region) == (True, second)  # Nothing new: cached frame
+
+
+def test_grab_mode_wait_frame_serves_other_regions():
+    """A frame acquired over the search area feeds grabs of any box inside it (tracking moves the box)"""
+    watch = {"left": 100, "top": 200, "width": 300, "height": 200}
+    screen = np.arange(1080 * 1920, dtype=np.uint32).reshape(1080, 1920)
+    first = screen[0:50, 0:50]
+    waited = screen[200:400, 100:400]
+    backend = _grab_mode_backend([first, None, waited])
+
+    backend.grab({"left": 0, "top": 0, "width": 50, "height": 50})
+    assert backend.wait_for_frame(1.0, watch) is True
+    calls = backend._camera.grab_calls
+
+    local = {"left": 150, "top": 250, "width": 40, "height": 30}
+    ok, image = backend.grab(local)
+    assert ok and np.array_equal(image, screen[250:280, 150:190])
+    assert backend._camera.grab_calls == calls  # Served from the waited frame
+    assert backend.duplicate_frames == 0
+
+    # Full-search fallback in the same iteration: same frame, another region (no new frame presented)
+    ok, image = backend.grab(watch)
+    assert ok and image is waited
+    assert backend.duplicate_frames == 1
+    # Same region again: same object, so detection can skip re-processing
+    assert backend.grab(local)[1] is backend.grab(local)[1]
+
+
+def test_detection_waits_over_fov_and_local_margin(detection_system):
+    backend = MagicMock()
+    detection_system._get_backend = MagicMock(return_value=backend)
+    config = detection_system.config
+    config.screen_width, config.screen_height, config.fov_x, config.fov_y = 1920, 1080, 50, 40
+    detection_system._update_fov_cache()
+
+    detection_system.wait_for_frame(0.01)
+    backend.wait_for_frame.assert_called_once_with(0.01, {"left": 810, "top": 400, "width": 300, "height": 280})
+
+
+def test_grab_mode_cached_frame_keeps_acquisition_time():
+    """Reusing the cached frame must not refresh frame_time (its age keeps growing)"""
+    region = {"left": 0, "top": 0, "width": 8, "height": 8}
+    frame = object()
+    backend = _grab_mode_backend([frame])
+
+    backend.grab(region)
+    acquired = backend.frame_time
+    assert acquired > 0.0
+    time.sleep(0.002)
+    assert backend.grab(region) == (True, frame)
+    assert backend.frame_time == acquired
+    assert backend.duplicate_frames == 1
+
+
+def test_grab_mode_frame_time_uses_owner_clock():
+    """Frame stamps come from the clock the backend was given (the detection/loop clock)"""
+    clock = SimulatedClock(start=5.0)
+    region = {"left": 0, "top": 0, "width": 8, "height": 8}
+    backend = _grab_mode_backend([object(), None, object()], clock)
+
+    backend.grab(region)
+    assert backend.frame_time == 5.0
+    clock.advance(0.25)
+    assert backend.wait_for_frame(1.0) is True
+    backend.grab(region)
+    assert backend.frame_time == 5.25
+
+
+def test_detection_passes_its_clock_to_dxgi(mock_config):
+    clock = SimulatedClock(start=1.0)
+    detection = DetectionSystem(mock_config, MagicMock(), clock=clock)
+    mock_config.capture_method = "dxgi"
+    with patch("core.detection.DXGIBackend") as MockDXGI:
+        detection._get_backend()
+    MockDXGI.assert_called_once_with(clock)
+
+
+def test_grab_mode_wait_for_frame_timeout():
+    region = {"left": 0, "top": 0, "width": 8, "height": 8}
+    frame = object()
+    backend = _grab_mode_backend([frame])
+    backend.grab(region)
+
+    assert backend.wait_for_frame(0.002) is False
+    assert backend.grab(region) == (True, frame)
+
+
+def test_detection_delegates_frame_wait(detection_system):
+    backend = MagicMock()
+    backend.frame_events = True
+    backend.wait_for_frame.return_value = False
+    detection_system._get_backend = MagicMock(return_value=backend)
+
+    assert detection_system.supports_frame_events() is True
+    assert detection_system.wait_for_frame(0.01) is False
+    backend.wait_for_frame.assert_called_once_with(0.01, None)  # No search area yet: the last region
+
+    backend.wait_for_frame.side_effect = RuntimeError("device lost")
+    assert detection_system.wait_for_frame(0.01) is False
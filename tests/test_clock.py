@@ -0,0 +1,109 @@
+"""
+Tests for the injectable clock (SystemClock / SimulatedClock) and its consumers.
+"""
+
+import time
+
+import pytest
+
+from core.motion_engine import MotionEngine
+from utils.clock import SYSTEM_CLOCK, SimulatedClock
+from utils.performance_monitor import PerformanceMonitor
+
+
+class MockConfig:
+    def __init__(self):
+        self.motion_min_cutoff = 0.5
+        self.motion_beta = 0.005
+        self.prediction_scale = 1.0
+
+
+class TestSimulatedClock:
+    def test_advance_and_sleep(self):
+        clock = SimulatedClock(start=10.0)
+        assert clock.perf_counter() == 10.0
+
+        clock.advance(0.5)
+        clock.sleep(0.25)
+        assert clock.perf_counter() == pytest.approx(10.75)
+        assert clock.perf_counter_ns() == 10_750_000_000
+
+    def test_monotonic(self):
+        clock = SimulatedClock(start=1.0)
+        clock.advance(-5.0)
+        clock.sleep_until(0.5)
+        assert clock.perf_counter() == 1.0
+
+        clock.sleep_until(2.0)
+        assert clock.perf_counter() == 2.0
+
+    def test_no_accumulated_drift(self):
+        clock = SimulatedClock()
+        for _ in range(1_000_000):
+            clock.advance(0.001)
+        # Integer nanoseconds: exactly 1000s, not 999.9999999...
+        assert clock.perf_counter_ns() == 1_000_000_000_000
+
+    def test_sleep_does_not_block(self):
+        clock = SimulatedClock()
+        wall_start = time.perf_counter()
+        clock.sleep(3600.0)
+        assert time.perf_counter() - wall_start < 0.5
+        assert clock.perf_counter() == 3600.0
+
+
+def test_system_clock_sleep_until():
+    deadline = time.perf_counter() + 0.003
+    SYSTEM_CLOCK.sleep_until(deadline)
+    assert time.perf_counter() >= deadline
+
+
+class TestMotionEngineSimulatedTime:
+    def _run(self, frames, dt=1.0 / 240.0):
+        clock = SimulatedClock(start=1.0)
+        engine = MotionEngine(MockConfig(), clock=clock)
+        outputs = []
+        for i in range(frames):
+            # Target sweeps back and forth 200px every 2 seconds
+            phase = (i * dt) % 2.0
+            x = 760.0 + 200.0 * (phase if phase < 1.0 else 2.0 - phase)
+            outputs.append(engine.process(x, 540.0, dt))
+            clock.advance(dt)
+        return engine, clock, outputs
+
+    def test_faster_than_real_time_keeps_simulated_time(self):
+        """Without clock injection the 50ms drift guard would snap back to wall time."""
+        wall_start = time.perf_counter()
+        engine, clock, _ = self._run(2400)  # 10 simulated seconds
+
+        assert time.perf_counter() - wall_start < 10.0
+        # Internal time tracks simulated time, not wall time
+        assert engine._internal_time == pytest.approx(clock.perf_counter(), abs=0.01)
+        assert engine.x_filter.t_prev == pytest.approx(clock.perf_counter() - 1.0 / 240.0, abs=0.01)
+
+    def test_deterministic(self):
+        _, _, first = self._run(1200)
+        _, _, second = self._run(1200)
+        assert first == second
+
+
+def test_performance_monitor_simulated_fps():
+    clock = SimulatedClock()
+    monitor = PerformanceMonitor(clock=clock)
+
+    for _ in range(1000):
+        clock.advance(0.001)
+        monitor.record_frame(0.0005)
+
+    assert monitor.get_stats()["fps"] == pytest.approx(1000.0, rel=0.01)
+
+
+def test_performance_monitor_simulated_probe():
+    clock = SimulatedClock()
+    monitor = PerformanceMonitor(clock=clock)
+
+    monitor.start_probe("work")
+    clock.advance(0.0025)
+    monitor.stop_probe("work")
+
+    assert monitor.get_probe_stats("work")["avg_ms"] == pytest.approx(2.5)
@@ -93,3 +93,29 @@ def test_create_backup_failure_handling(clean_config):
     with patch("shutil.copy2", side_effect=OSError("Disk full")):
         backup_path = clean_config.create_backup()
         assert backup_path == ""
+
+
+def test_snapshot_reused_until_version_changes(clean_config):
+    """Snapshots are cached per version and swapped when a config key changes."""
+    snap = clean_config.snapshot()
+    assert clean_config.snapshot() is snap
+    assert snap.version == clean_config._version
+    assert snap.fov_x == clean_config.fov_x
+
+    clean_config.fov_x = 123
+    new_snap = clean_config.snapshot()
+    assert new_snap is not snap
+    assert new_snap.fov_x == 123
+    assert snap.fov_x != 123  # Old snapshot keeps its values
+
+
+def test_snapshot_is_read_only(clean_config):
+    """Snapshots reject writes and freeze list values."""
+    clean_config.add_color_to_history(0x123456)
+    snap = clean_config.snapshot()
+
+    with pytest.raises(AttributeError):
+        snap.fov_x = 10  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        del snap.enabled
+    assert isinstance(snap.color_history, tuple)
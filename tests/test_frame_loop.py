@@ -0,0 +1,107 @@
+"""
+Tests for the shared logic-loop step (`core.frame_loop.FrameLoop`).
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+
+from core.headless import HeadlessRunner
+from core.input_backend import RecordingBackend
+from core.simulator import SimulatedCaptureBackend, VirtualScene, simulation_config
+from core.trajectory import Trajectory
+from utils.clock import SimulatedClock
+from utils.config import Config
+
+
+def _runner(config):
+    clock = SimulatedClock(start=1.0)
+    path = Trajectory("static", np.array([0.0, 10.0]), np.array([960.0, 960.0]), np.array([540.0, 540.0]))
+    runner = HeadlessRunner(
+        config,
+        clock=clock,
+        capture_backend=SimulatedCaptureBackend(VirtualScene(path, start_time=1.0), clock),
+        input_backend=RecordingBackend(clock=clock),
+    )
+    runner.movement.screen_width, runner.movement.screen_height = 1920, 1080
+    config.screen_width, config.screen_height = 1920, 1080
+    return runner
+
+
+def test_config_change_applies_loop_settings():
+    config = Config()
+    config.async_input = False
+    config.output_substeps = 1
+    config.target_fps = 100
+    runner = _runner(config)
+    loop = runner.frame_loop
+    try:
+        loop.start()
+        assert not loop.async_input
+        assert loop.target_frame_time == 0.01
+        assert not loop.refresh_config()
+
+        config.async_input = True
+        config.target_fps = 200
+        with patch.object(runner.movement, "update_backend") as update_backend:
+            assert loop.refresh_config()
+        update_backend.assert_called_once_with()
+        assert loop.async_input
+        assert runner.input_dispatcher.running
+        assert loop.target_frame_time == 0.005
+    finally:
+        runner.close()
+
+
+def test_static_config_is_read_directly():
+    runner = _runner(simulation_config(output_substeps=3))
+    loop = runner.frame_loop
+    try:
+        loop.start()
+        assert loop.cfg is None
+        assert not loop.refresh_config()
+        # Substeps imply the input thread
+        assert loop.async_input
+        assert runner.input_dispatcher.substeps == 3
+    finally:
+        runner.close()
+
+
+def test_frame_step_records_and_paces():
+    runner = _runner(simulation_config(target_fps=100))
+    loop = runner.frame_loop
+    clock = runner.clock
+    try:
+        loop.start()
+        waited, ready = loop.wait_for_frame()
+        assert (waited, ready) == (False, True)
+        loop_start = loop.begin_frame(waited)
+        assert loop.process()
+        sleep_time = loop.end_frame(loop_start, waited)
+        assert loop.next_frame_start == loop_start + 0.01
+        loop.pace(sleep_time)
+        assert clock.perf_counter() == loop.next_frame_start
+    finally:
+        runner.close()
+
+
+def test_sync_helpers_read_the_frame_snapshot():
+    config = Config()
+    config.async_input = False
+    config.output_substeps = 1
+    config.loop_mode = "fixed"
+    runner = _runner(config)
+    loop = runner.frame_loop
+    try:
+        loop.start()
+        cfg = loop.cfg
+        # Written after this frame's snapshot was taken: applies from the next frame on
+        config.async_input = True
+        config.loop_mode = "event"
+        assert not loop.sync_input_dispatcher(cfg)
+        assert not loop.use_frame_events(cfg)
+        assert not runner.input_dispatcher.running
+        assert loop.sync_input_dispatcher(config.snapshot())
+        assert runner.input_dispatcher.running
+    finally:
+        runner.close()
@@ -0,0 +1,68 @@
+"""
+Tests for frame-pacing (start error / interval) tracking.
+"""
+
+import pytest
+
+from utils.clock import SimulatedClock
+from utils.frame_pacing import FramePacing
+from utils.performance_monitor import PerformanceMonitor
+
+
+def test_on_schedule_frames_have_no_error():
+    pacing = FramePacing()
+    for i in range(1, 11):
+        pacing.record(1.0 + i * 0.01, 1.0 + i * 0.01, 0.01)
+
+    stats = pacing.get_stats()
+    assert stats["frames"] == 10
+    assert stats["late_starts"] == stats["early_starts"] == 0
+    assert stats["drift_ms"] == pytest.approx(0.0)
+    assert stats["start_error_max_ms"] == 0.0
+    assert stats["interval_p50_ms"] == pytest.approx(10.0, rel=0.01)
+    assert pacing.interval_histogram.count == 9
+
+
+def test_late_and_early_starts():
+    pacing = FramePacing()
+    pacing.record(1.000, 1.000, 0.01)
+    pacing.record(1.0105, 1.010, 0.01)  # 0.5ms late: within tolerance
+    pacing.record(1.024, 1.0205, 0.01)  # 3.5ms late: a late start
+    pacing.record(1.0339, 1.034, 0.01)  # Woke 0.1ms early
+
+    stats = pacing.get_stats()
+    assert stats["late_starts"] == 1
+    assert stats["early_starts"] == 1
+    assert stats["drift_ms"] == pytest.approx(3.9)
+    assert stats["start_error_max_ms"] == pytest.approx(3.5, rel=0.01)
+    assert list(pacing.start_errors) == pytest.approx([0.0, 0.5, 3.5, -0.1])
+
+
+def test_unscheduled_start_breaks_interval_chain():
+    monitor = PerformanceMonitor()
+    monitor.record_frame_start(1.00, 0.0, 0.01)  # First frame: nothing to compare
+    monitor.record_frame_start(1.01, 1.01, 0.01)
+    monitor.record_frame_start(1.50, 0.0, 0.01)  # Event-driven frame
+    monitor.record_frame_start(1.51, 1.51, 0.01)
+
+    assert monitor.pacing.frames == 2
+    assert monitor.pacing.interval_histogram.count == 0
+
+
+def test_exported_with_stats_and_percentiles():
+    clock = SimulatedClock(start=1.0)
+    monitor = PerformanceMonitor(clock=clock)
+    intended = 0.0
+    for _ in range(20):
+        start = clock.perf_counter()
+        monitor.record_frame_start(start, intended, 0.005)
+        intended = start + 0.005
+        clock.sleep_until(intended)
+        clock.advance(0.0002)  # Every wake-up lands 0.2ms late
+
+    stats = monitor.get_stats()
+    assert stats["pacing_start_error_p50_ms"] == pytest.approx(0.2, rel=0.01)
+    assert stats["pacing_interval_p99_ms"] == pytest.approx(5.2, rel=0.01)
+    assert stats["pacing_drift_ms"] == pytest.approx(19 * 0.2)
+    assert {"frame_interval", "start_error"} <= set(monitor.get_latency_percentiles())
+    assert len(monitor.get_history()["start_errors"]) == 19
@@ -0,0 +1,86 @@
+"""
+Tests for GC pause and per-frame allocation tracking.
+"""
+
+import gc
+
+from utils.gc_monitor import GEN2_HOLD_THRESHOLD, GCMonitor
+from utils.performance_monitor import PerformanceMonitor
+
+
+class _Cycle:
+    def __init__(self):
+        self.ref = self
+
+
+def test_records_pause_with_generation_and_frame():
+    gc_monitor = GCMonitor()
+    gc_monitor.install()
+    try:
+        gc_monitor.end_frame(slow=False)
+        gc.collect(1)
+        pause_ms, _ = gc_monitor.end_frame(slow=True)
+    finally:
+        gc_monitor.uninstall()
+
+    assert gc.callbacks.count(gc_monitor._on_gc) == 0
+    frame, generation, duration_ms, _ = gc_monitor.recent_pauses[-1]
+    assert (frame, generation) == (1, 1)
+    assert pause_ms >= duration_ms > 0.0
+    stats = gc_monitor.get_stats()
+    assert stats["gen1_pauses"] >= 1
+    assert stats["slow_frames"] == stats["slow_frames_with_gc"] == 1
+
+
+def test_counts_net_allocations_per_frame():
+    gc_monitor = GCMonitor()
+    gc.disable()  # A collection inside the frame would free unrelated garbage
+    try:
+        gc_monitor.end_frame(slow=False)
+        kept = [_Cycle() for _ in range(500)]
+        _, allocated = gc_monitor.end_frame(slow=False)
+    finally:
+        gc.enable()
+
+    assert allocated >= 500
+    assert gc_monitor.get_stats()["alloc_blocks_max"] >= 500
+    del kept
+
+
+def test_freeze_holds_off_gen2_and_restores():
+    threshold = gc.get_threshold()
+    gc_monitor = GCMonitor()
+    gc_monitor.freeze()
+    try:
+        assert gc.get_threshold()[2] == GEN2_HOLD_THRESHOLD
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc_monitor.uninstall()
+    assert gc.get_threshold() == threshold
+    assert gc.get_freeze_count() == 0
+
+
+def test_performance_monitor_correlates_missed_frames(tmp_path):
+    monitor = PerformanceMonitor()
+    monitor.record_frame(0.001)  # Recorded before tracking: empty GC columns
+    monitor.start_gc_tracking()
+    try:
+        monitor.record_frame(0.001)
+        gc.collect(0)
+        monitor.record_frame(0.008, missed=True)
+        stats = monitor.get_stats()
+        percentiles = monitor.get_latency_percentiles()
+        path = tmp_path / "stats.csv"
+        assert monitor.export_to_csv(str(path))
+    finally:
+        monitor.stop_gc_tracking()
+
+    assert stats["gc_slow_frames"] == stats["gc_slow_frames_with_gc"] == 1
+    assert stats["gc_pauses"] >= 1
+    assert "gc_pause" in percentiles
+    assert "gc_pauses" not in monitor.get_stats()
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == "frame,fps,frame_time_ms,detection_time_ms,gc_pause_ms,alloc_blocks"
+    assert lines[1].endswith(",,")
+    assert float(lines[3].split(",")[4]) > 0.0
@@ -0,0 +1,146 @@
+"""
+Tests for the headless pipeline runner (`python -m core.headless`).
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from core.headless import HeadlessRunner, apply_overrides, main, parse_args, parse_overrides
+from core.input_backend import RecordingBackend
+from core.simulator import SimulatedCaptureBackend, VirtualScene, simulation_config
+from core.trajectory import Trajectory
+from utils.clock import SimulatedClock
+from utils.config import Config
+
+
+def _runner(**overrides):
+    values = {"motion_min_cutoff": 25.0, "motion_beta": 0.0, "prediction_scale": 0.0}
+    values.update(overrides)
+    config = simulation_config(**values)
+    clock = SimulatedClock(start=1.0)
+    path = Trajectory("static", np.array([0.0, 10.0]), np.array([960.0, 960.0]), np.array([540.0, 540.0]))
+    scene = VirtualScene(path, start_time=1.0)
+    recorder = RecordingBackend(clock=clock)
+    runner = HeadlessRunner(
+        config, clock=clock, capture_backend=SimulatedCaptureBackend(scene, clock), input_backend=recorder
+    )
+    runner.movement.screen_width, runner.movement.screen_height = 1920, 1080
+    config.screen_width, config.screen_height = 1920, 1080
+    return runner, recorder
+
+
+class TestHeadlessRunner:
+    def test_frame_count_limit(self):
+        runner, recorder = _runner()
+        report = runner.run(max_frames=50)
+        runner.close()
+
+        assert report["frames"] == 50
+        assert report["detections"] == 50
+        assert report["errors"] == 0
+        assert report["input"]["method"] == "recording"
+        assert report["input"]["moves"] == recorder.count > 0
+        assert report["stats"]["avg_frame_ms"] >= 0.0
+        assert "main_loop_active" in report["probes"]
+
+    def test_duration_limit_paces_at_target_fps(self):
+        runner, _ = _runner(target_fps=100)
+        report = runner.run(duration=0.5)
+        runner.close()
+
+        assert report["frames"] == 50
+        assert report["elapsed_s"] == pytest.approx(0.5)
+        assert report["loop_fps"] == pytest.approx(100.0)
+        # Simulated sleeps wake exactly on the deadline
+        assert report["stats"]["pacing_frames"] == 49
+        assert report["stats"]["pacing_start_error_max_ms"] == 0.0
+        assert report["stats"]["pacing_interval_p50_ms"] == pytest.approx(10.0, rel=0.01)
+
+    def test_report_is_json_serializable(self):
+        runner, _ = _runner()
+        report = runner.run(max_frames=5)
+        runner.close()
+        assert json.loads(json.dumps(report))["frames"] == 5
+
+    def test_trace_spans_export_per_frame(self, tmp_path):
+        runner, _ = _runner(trace_spans=True)
+        runner.run(max_frames=20)
+        runner.close()
+
+        path = tmp_path / "trace.json"
+        assert runner.perf_monitor.export_trace(str(path))
+        events = json.loads(path.read_text())["traceEvents"]
+        frames = [e for e in events if e["name"] == "main_loop_active"]
+        assert [e["args"]["frame"] for e in frames] == list(range(20))
+        assert all(e["ph"] == "X" and e["dur"] >= 0.0 for e in frames)
+
+    def test_telemetry_stream_covers_every_frame(self, tmp_path):
+        from utils.telemetry_sink import load_telemetry
+
+        runner, _ = _runner()
+        report = runner.run(max_frames=30, telemetry_path=str(tmp_path / "run.cttl"))
+        runner.close()
+
+        data = load_telemetry(report["telemetry"]["path"])
+        assert report["telemetry"]["frames"] == 30
+        assert data["frame_ms"].size == 30
+        assert data["target_found"].all()
+        assert (data["frame_age_ms"] >= 0.0).all()
+
+    def test_sampling_profiler_reports_overhead(self):
+        runner, _ = _runner(sampling_profiler=True, profiler_interval_ms=1)
+        report = runner.run(max_frames=200)
+        runner.close()
+
+        assert not runner.profiler.running
+        assert report["profiler"]["samples"] == runner.profiler.sample_count
+        assert report["profiler"]["elapsed_s"] > 0.0
+
+    def test_gc_tracking_report(self):
+        runner, _ = _runner(gc_tracking=True, gc_freeze=True)
+        report = runner.run(max_frames=50)
+        runner.close()
+
+        assert runner.perf_monitor.gc_monitor is None  # Tracking (and freeze) ends with the run
+        assert report["gc"]["frozen"] == 1.0
+        assert report["gc"]["slow_frames"] >= 0.0
+
+    def test_slow_frames_report(self, tmp_path):
+        runner, _ = _runner()
+        report = runner.run(max_frames=50, slow_frames_dir=str(tmp_path))
+        runner.close()
+
+        assert runner.perf_monitor.forensics is None
+        assert report["slow_frames"]["directory"] == str(tmp_path)
+        assert report["slow_frames"]["snapshots"] == len(list(tmp_path.glob("slow_frame_*.json")))
+
+    def test_needs_a_limit(self):
+        runner, _ = _runner()
+        with pytest.raises(ValueError):
+            runner.run()
+        runner.close()
+
+
+class TestHeadlessCli:
+    def test_parse_overrides(self):
+        assert parse_overrides(["target_fps=500", " fov_x = 80 "]) == {"target_fps": "500", "fov_x": "80"}
+        with pytest.raises(ValueError):
+            parse_overrides(["target_fps"])
+
+    def test_apply_overrides_validates(self):
+        config = Config()
+        apply_overrides(config, {"target_fps": "5000", "async_input": "yes"})
+        assert config.target_fps == 1000  # Clamped to the schema max
+        assert config.async_input is True
+        with pytest.raises(ValueError):
+            apply_overrides(config, {"no_such_key": "1"})
+
+    def test_default_duration(self):
+        assert parse_args([]).duration == 10.0
+        assert parse_args(["--frames", "10"]).duration is None
+
+    def test_unknown_key_exits_with_error(self, capsys):
+        assert main(["--frames", "1", "--set", "no_such_key=1"]) == 2
+        assert "Unknown configuration key" in capsys.readouterr().err
@@ -0,0 +1,119 @@
+"""
+Tests for the idle scan-rate governor.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core.idle_governor import IdleGovernor
+from core.simulator import ClosedLoopSimulator, simulation_config
+from core.trajectory import Trajectory
+from utils.performance_monitor import PerformanceMonitor
+
+
+def _governor(**overrides):
+    values = {"target_fps": 200, "idle_scan_fps": 20, "idle_after_misses": 3, "enabled": True}
+    values.update(overrides)
+    return IdleGovernor(**values)
+
+
+class TestIdleGovernor:
+    def test_drops_to_idle_rate_after_misses(self):
+        governor = _governor()
+        assert [governor.update(False) for _ in range(2)] == [0.005, 0.005]
+        assert not governor.idle
+
+        assert governor.update(False) == pytest.approx(0.05)
+        assert governor.idle
+        assert governor.idle_entries == 1
+
+    def test_first_hit_snaps_back(self):
+        governor = _governor()
+        for _ in range(10):
+            governor.update(False)
+        assert governor.idle
+
+        assert governor.update(True) == 0.005
+        assert not governor.idle
+        assert governor.miss_streak == 0
+        assert governor.idle_frames == 7
+
+    def test_hit_resets_miss_streak(self):
+        governor = _governor()
+        governor.update(False)
+        governor.update(False)
+        governor.update(True)
+        governor.update(False)
+        assert not governor.idle
+
+    def test_disabled_never_idles(self):
+        governor = _governor(enabled=False)
+        for _ in range(100):
+            assert governor.update(False) == 0.005
+        assert governor.max_acquire_delay == 0.0
+
+    def test_idle_rate_never_exceeds_active_rate(self):
+        governor = _governor(target_fps=30, idle_scan_fps=240)
+        assert governor.idle_interval == governor.active_interval
+
+    def test_disabling_leaves_idle(self):
+        governor = _governor()
+        for _ in range(5):
+            governor.update(False)
+        governor.configure(200, 20, 3, enabled=False)
+        assert not governor.idle
+        assert governor.interval == 0.005
+
+    def test_from_config_ignores_invalid_values(self):
+        config = SimpleNamespace(target_fps=100, idle_throttle="yes", idle_scan_fps=None, idle_after_misses=True)
+        governor = IdleGovernor.from_config(config)
+        assert governor.enabled is False
+        assert governor.idle_interval == pytest.approx(1.0 / 30)
+        assert governor.idle_after_misses == 120
+
+    def test_state_in_monitor_stats(self):
+        monitor = PerformanceMonitor()
+        assert "governor_idle" not in monitor.get_stats()
+
+        governor = _governor()
+        monitor.governor = governor
+        for _ in range(4):
+            governor.update(False)
+        stats = monitor.get_stats()
+        assert stats["governor_idle"] == 1.0
+        assert stats["governor_miss_streak"] == 4.0
+        assert stats["governor_interval_ms"] == pytest.approx(50.0)
+        assert stats["governor_max_acquire_delay_ms"] == pytest.approx(45.0)
+
+
+class TestIdleGovernorClosedLoop:
+    @staticmethod
+    def _appearing_target(appear_at):
+        # Out of the FOV (300px right of the crosshair) until `appear_at`, then centred
+        t = np.array([0.0, appear_at, appear_at + 1e-4, appear_at + 0.5])
+        x = np.array([960.0, 960.0, 660.0, 660.0])
+        return Trajectory("appear", t, x, np.full(4, 540.0))
+
+    @pytest.mark.parametrize("appear_at", [0.5, 0.51, 0.533])
+    def test_miss_to_acquire_latency_is_bounded(self, appear_at):
+        config = simulation_config(
+            idle_throttle=True,
+            idle_scan_fps=30,
+            idle_after_misses=24,
+            motion_min_cutoff=25.0,
+            motion_beta=0.0,
+            prediction_scale=0.0,
+        )
+        path = self._appearing_target(appear_at)
+        result = ClosedLoopSimulator(config, path, start_offset=(300.0, 0.0)).run()
+
+        t, found = result["t"], result["found"]
+        first_hit = t[np.flatnonzero(found)[0]]
+        assert appear_at <= first_hit <= appear_at + 1.0 / 30 + 1e-6
+
+        # Idle for most of the empty stretch, back to full rate once the target is tracked
+        assert np.flatnonzero(~found).size < 24 + appear_at * 30 + 2
+        after = np.diff(t[found])
+        assert after.max() == pytest.approx(1.0 / 240)
@@ -0,0 +1,211 @@
+"""
+Tests for the asynchronous, latest-wins input dispatcher.
+"""
+
+import threading
+import time
+
+from core.input_dispatcher import InputDispatcher
+from utils.performance_monitor import PerformanceMonitor
+
+
+class BlockingMovement:
+    """aim_at blocks until released, recording every target it receives."""
+
+    def __init__(self):
+        self.targets = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def aim_at(self, x, y, cfg=None):
+        self.targets.append((x, y))
+        self.entered.set()
+        self.release.wait(timeout=2.0)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def test_latest_target_wins():
+    movement = BlockingMovement()
+    dispatcher = InputDispatcher(movement, PerformanceMonitor())
+    dispatcher.start()
+    try:
+        dispatcher.post(1, 1)
+        assert movement.entered.wait(timeout=2.0)
+
+        # While the first SendInput is stalled, later targets coalesce in the mailbox
+        for i in range(2, 11):
+            dispatcher.post(i, i)
+
+        movement.release.set()
+        assert _wait_for(lambda: dispatcher.dispatched_count == 2)
+    finally:
+        dispatcher.stop()
+
+    assert movement.targets == [(1, 1), (10, 10)]
+    stats = dispatcher.get_stats()
+    assert stats["posted"] == 10
+    assert stats["dropped"] == 8
+    assert stats["dispatched"] == 2
+
+
+def test_post_does_not_block_on_stalled_input():
+    movement = BlockingMovement()
+    dispatcher = InputDispatcher(movement, PerformanceMonitor())
+    dispatcher.start()
+    try:
+        dispatcher.post(5, 5)
+        assert movement.entered.wait(timeout=2.0)
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            dispatcher.post(6, 6)
+        assert time.perf_counter() - start < 0.5
+    finally:
+        movement.release.set()
+        dispatcher.stop()
+    assert not dispatcher.running
+
+
+def test_moves_use_the_posted_snapshot():
+    class SnapshotMovement:
+        def __init__(self):
+            self.cfgs = []
+
+        def aim_at(self, x, y, cfg=None):
+            self.cfgs.append(cfg)
+
+    movement = SnapshotMovement()
+    dispatcher = InputDispatcher(movement, PerformanceMonitor())
+    cfg = object()
+    dispatcher.start()
+    try:
+        dispatcher.post(1, 1, cfg=cfg)
+        assert _wait_for(lambda: dispatcher.dispatched_count == 1)
+    finally:
+        dispatcher.stop()
+
+    assert movement.cfgs == [cfg]
+
+
+def test_records_pipeline_latency_and_errors():
+    class FailingOnce:
+        calls = 0
+
+        def aim_at(self, x, y, cfg=None):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("SendInput failed")
+
+    monitor = PerformanceMonitor()
+    dispatcher = InputDispatcher(FailingOnce(), monitor)
+    dispatcher.start()
+    try:
+        dispatcher.post(1, 1, capture_time=time.perf_counter())
+        assert _wait_for(lambda: dispatcher.error_count == 1)
+        dispatcher.post(2, 2, capture_time=time.perf_counter() - 0.01)
+        assert _wait_for(lambda: dispatcher.dispatched_count == 1)
+    finally:
+        dispatcher.stop()
+
+    # Handed over, not recorded on the dispatcher thread: the next frame records it
+    assert monitor.pipeline_latency_samples == 0
+    monitor.record_frame(0.001)
+    assert monitor.pipeline_latency_samples == 1
+    assert monitor.get_latency_estimate() >= 0.01
+    assert monitor.get_input_latency_histograms()["capture_to_input"].count == 1
+
+
+def test_restart():
+    movement = BlockingMovement()
+    movement.release.set()
+    dispatcher = InputDispatcher(movement, PerformanceMonitor())
+
+    for round_ in range(3):
+        dispatcher.start()
+        dispatcher.start()  # Idempotent
+        dispatcher.post(round_, round_)
+        assert _wait_for(lambda r=round_: dispatcher.dispatched_count == r + 1)
+        dispatcher.stop()
+        dispatcher.stop()  # Idempotent
+
+    assert movement.targets == [(0, 0), (1, 1), (2, 2)]
+
+
+class RecordingMovement:
+    """Relative-move recorder with a 1920x1080 screen centre."""
+
+    def __init__(self):
+        self.moves = []
+
+    def aim_at(self, x, y, cfg=None):
+        self.move_relative_with_fallback(*self.get_move_delta(x, y))
+
+    def get_move_delta(self, x, y, cfg=None):
+        return x - 960, y - 540
+
+    def move_relative_with_fallback(self, dx, dy):
+        self.moves.append((time.perf_counter(), dx, dy))
+
+
+def test_micro_moves_sum_to_correction():
+    movement = RecordingMovement()
+    dispatcher = InputDispatcher(movement, PerformanceMonitor())
+    dispatcher.substeps = 4
+    dispatcher.frame_interval = 0.02
+    dispatcher.start()
+    try:
+        dispatcher.post(960 + 10, 540 - 7)
+        assert _wait_for(lambda: len(movement.moves) == 4)
+    finally:
+        dispatcher.stop()
+
+    steps = [(dx, dy) for _, dx, dy in movement.moves]
+    assert sum(dx for dx, _ in steps) == 10
+    assert sum(dy for _, dy in steps) == -7
+    # Residuals carried: every step is within one pixel of the exact share
+    assert all(abs(dx - 2.5) <= 1 and abs(dy + 1.75) <= 1 for dx, dy in steps)
+
+    # Spread across the frame interval: last step ~3/4 of the interval after the first
+    span = movement.moves[-1][0] - movement.moves[0][0]
+    assert 0.01 <= span < 0.1
+    assert dispatcher.get_stats()["micro_moves"] == 4
+
+
+def test_new_target_replaces_remaining_micro_moves():
+    movement = RecordingMovement()
+    dispatcher = InputDispatcher(movement, PerformanceMonitor())
+    dispatcher.substeps = 4
+    dispatcher.frame_interval = 0.2  # Slow schedule: 50ms between steps
+    dispatcher.start()
+    try:
+        dispatcher.post(960 + 100, 540)
+        assert _wait_for(lambda: len(movement.moves) == 1)
+        dispatcher.post(960 - 8, 540)
+        assert _wait_for(lambda: sum(dx for _, dx, _ in movement.moves) == 25 - 8, timeout=3.0)
+        time.sleep(0.25)
+    finally:
+        dispatcher.stop()
+
+    # First correction stopped after its first quarter; the second ran to completion
+    assert movement.moves[0][1] == 25
+    assert sum(dx for _, dx, _ in movement.moves[1:]) == -8
+
+
+def test_frame_interval_tracks_post_cadence():
+    dispatcher = InputDispatcher(RecordingMovement(), PerformanceMonitor())
+    dispatcher.start()
+    try:
+        for _ in range(40):
+            dispatcher.post(960, 540)
+            time.sleep(0.01)
+    finally:
+        dispatcher.stop()
+    assert 0.008 < dispatcher.frame_interval < 0.03
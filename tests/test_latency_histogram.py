@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from utils.latency_histogram import (
+    BUCKET_COUNT,
+    MAX_TRACKABLE_NS,
+    SUB_BUCKET_HALF,
+    LatencyHistogram,
+    bucket_bounds,
+    bucket_index,
+    percentile_key,
+)
+from utils.performance_monitor import PerformanceMonitor
+
+
+def test_bucket_layout_is_contiguous_and_bounded():
+    """Every value maps into a bucket whose bounds contain it, within the relative precision."""
+    for value in [0, 1, 255, 256, 257, 1_000, 999_999, 16_666_667, MAX_TRACKABLE_NS]:
+        index = bucket_index(value)
+        low, width = bucket_bounds(index)
+        assert low <= value < low + width
+        assert width <= max(1, value / SUB_BUCKET_HALF)
+    assert bucket_index(MAX_TRACKABLE_NS * 10) == BUCKET_COUNT - 1
+
+
+def test_percentiles_match_numpy_within_precision():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(mean=np.log(2_000_000), sigma=0.6, size=20_000).astype(np.int64)
+    histogram = LatencyHistogram()
+    for v in values:
+        histogram.record(int(v))
+
+    assert histogram.count == values.size
+    assert histogram.max_ns == values.max()
+    for p, value in histogram.percentiles((50.0, 90.0, 99.0, 99.9)).items():
+        assert value == pytest.approx(np.percentile(values, p), rel=0.02)
+
+
+def test_merge_equals_single_histogram():
+    a, b, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for v in range(1_000, 500_000, 997):
+        (a if v % 2 else b).record(v)
+        combined.record(v)
+
+    merged = a.copy()
+    merged.merge(b)
+    assert merged.count == combined.count
+    assert merged.min_ns == combined.min_ns
+    assert merged.max_ns == combined.max_ns
+    assert np.array_equal(merged.counts, combined.counts)
+
+
+def test_negative_values_count_as_zero():
+    """A backwards clock step must not land in a bogus bucket or drive min/total negative."""
+    histogram = LatencyHistogram()
+    histogram.record(-5_000)
+    histogram.record(1_000)
+
+    assert histogram.counts[0] == 1
+    assert sum(histogram.counts) == 2
+    assert histogram.min_ns == 0
+    assert histogram.total_ns == 1_000
+    assert histogram.percentile(50.0) == 0.0
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(99.9) == 0.0
+    assert histogram.mean_ns == 0.0
+    assert percentile_key(99.9) == "p99_9"
+    assert percentile_key(50.0) == "p50"
+
+
+def test_monitor_reports_tail_percentiles(tmp_path):
+    """A rare stall shows up in p99.9 even though the average barely moves."""
+    monitor = PerformanceMonitor()
+    for i in range(2_000):
+        monitor.record_frame(0.020 if i % 500 == 0 else 0.004)
+
+    stats = monitor.get_stats()
+    assert stats["frame_p50_ms"] == pytest.approx(4.0, rel=0.01)
+    assert stats["frame_p99_9_ms"] == pytest.approx(20.0, rel=0.01)
+    assert stats["one_percent_low_fps"] == pytest.approx(250.0, rel=0.01)
+    assert stats["session_one_percent_low_fps"] == pytest.approx(250.0, rel=0.01)
+
+    monitor.start_probe("work")
+    monitor.stop_probe("work")
+    assert "p99_9_ms" in monitor.get_probe_stats("work")
+
+    path = tmp_path / "stats.csv"
+    assert monitor.export_to_csv(str(path))
+    # The history stays one table; percentiles go to a companion file
+    history = path.read_text().splitlines()
+    assert len(history) == monitor.history_size + 1
+    assert all(line.count(",") == 5 for line in history)
+    lines = (tmp_path / "stats_percentiles.csv").read_text().splitlines()
+    assert lines[0] == "series,count,p50_ms,p90_ms,p99_ms,p99_9_ms,max_ms"
+    assert any(line.startswith("frame_time,2000,") for line in lines)
+    assert any(line.startswith("work,1,") for line in lines)
+
+
+def test_one_percent_low_recovers_over_the_window():
+    """The headline 1% low follows recent frames; the session value keeps the early stalls."""
+    monitor = PerformanceMonitor(history_size=200)
+    for _ in range(50):
+        monitor.record_frame(0.050)
+    for _ in range(1_000):
+        monitor.record_frame(0.004)
+
+    stats = monitor.get_stats()
+    assert stats["one_percent_low_fps"] == pytest.approx(250.0, rel=0.01)
+    assert stats["session_one_percent_low_fps"] == pytest.approx(20.0, rel=0.01)
@@ -0,0 +1,143 @@
+"""
+Tests for the latency-compensated prediction horizon ("auto" prediction mode).
+"""
+
+import pytest
+
+from core.fast_math import calculate_prediction
+from core.motion_engine import DEFAULT_LOOKAHEAD, MAX_AUTO_LOOKAHEAD, MotionEngine
+from utils.performance_monitor import PerformanceMonitor
+
+
+class MockConfig:
+    def __init__(self, prediction_mode="auto"):
+        self.motion_min_cutoff = 0.5
+        self.motion_beta = 0.005
+        self.prediction_scale = 1.0
+        self.prediction_mode = prediction_mode
+        self.capture_method = "mss"
+        self.fov_x = 50
+        self.fov_y = 50
+
+
+class TestPipelineLatencyEstimate:
+    def test_first_sample_seeds_estimate(self):
+        monitor = PerformanceMonitor()
+        assert monitor.get_latency_estimate() == 0.0
+
+        monitor.record_pipeline_latency(0.020)
+        assert monitor.get_latency_estimate() == pytest.approx(0.020)
+
+    def test_estimate_converges(self):
+        monitor = PerformanceMonitor()
+        monitor.record_pipeline_latency(0.010)
+        for _ in range(500):
+            monitor.record_pipeline_latency(0.030)
+        assert monitor.get_latency_estimate() == pytest.approx(0.030, rel=1e-3)
+
+    def test_rejects_invalid_samples(self):
+        monitor = PerformanceMonitor()
+        monitor.record_pipeline_latency(0.015)
+        monitor.record_pipeline_latency(-1.0)
+        monitor.record_pipeline_latency(float("nan"))
+        assert monitor.get_latency_estimate() == pytest.approx(0.015)
+
+    def test_reset(self):
+        monitor = PerformanceMonitor()
+        monitor.record_pipeline_latency(0.015)
+        monitor.reset_latency_estimate()
+        assert monitor.get_latency_estimate() == 0.0
+
+        # Next sample warm-starts instead of blending with the stale value
+        monitor.record_pipeline_latency(0.040)
+        assert monitor.get_latency_estimate() == pytest.approx(0.040)
+
+    def test_exposed_in_stats(self):
+        monitor = PerformanceMonitor()
+        monitor.record_pipeline_latency(0.012)
+        assert monitor.get_stats()["pipeline_latency_ms"] == pytest.approx(12.0)
+
+    def test_session_histograms_include_frame_age(self):
+        monitor = PerformanceMonitor()
+        for _ in range(99):
+            monitor.record_pipeline_latency(0.004, 0.005)
+        monitor.record_pipeline_latency(0.004, 0.020)  # Cached frame reused for 16ms
+        monitor.record_pipeline_latency(0.004)  # Frame time unknown: latency only
+        monitor.reset_latency_estimate()  # Session histograms are kept
+
+        histograms = monitor.get_input_latency_histograms()
+        assert histograms["capture_to_input"].count == 101
+        assert histograms["input_frame_age"].count == 100
+
+        stats = monitor.get_stats()
+        assert stats["capture_to_input_p99_ms"] == pytest.approx(4.0, rel=0.01)
+        assert stats["input_frame_age_p50_ms"] == pytest.approx(5.0, rel=0.01)
+        assert stats["input_frame_age_p99_9_ms"] == pytest.approx(20.0, rel=0.01)
+        assert "input_frame_age" in monitor.get_latency_percentiles()
+
+
+class TestAutoLookahead:
+    def test_manual_mode_uses_fixed_horizon(self):
+        monitor = PerformanceMonitor()
+        monitor.record_pipeline_latency(0.030)
+        engine = MotionEngine(MockConfig("manual"), monitor)
+        assert engine.get_lookahead() == DEFAULT_LOOKAHEAD
+
+    def test_auto_mode_without_samples_falls_back(self):
+        engine = MotionEngine(MockConfig("auto"), PerformanceMonitor())
+        assert engine.get_lookahead() == DEFAULT_LOOKAHEAD
+
+    def test_auto_mode_without_monitor_falls_back(self):
+        engine = MotionEngine(MockConfig("auto"))
+        assert engine.get_lookahead() == DEFAULT_LOOKAHEAD
+
+    def test_auto_mode_follows_measured_latency(self):
+        monitor = PerformanceMonitor()
+        engine = MotionEngine(MockConfig("auto"), monitor)
+        monitor.record_pipeline_latency(0.025)
+        assert engine.get_lookahead() == pytest.approx(0.025)
+
+    def test_auto_mode_clamps_outliers(self):
+        monitor = PerformanceMonitor()
+        engine = MotionEngine(MockConfig("auto"), monitor)
+        monitor.record_pipeline_latency(5.0)
+        assert engine.get_lookahead() == MAX_AUTO_LOOKAHEAD
+
+    def test_backend_switch_resets_estimate(self):
+        monitor = PerformanceMonitor()
+        config = MockConfig("auto")
+        engine = MotionEngine(config, monitor)
+        monitor.record_pipeline_latency(0.030)
+
+        # Unrelated change keeps the estimate
+        config.motion_beta = 0.01
+        engine.update_config()
+        assert monitor.get_latency_estimate() == pytest.approx(0.030)
+
+        config.capture_method = "dxgi"
+        engine.update_config()
+        assert monitor.get_latency_estimate() == 0.0
+
+    def test_fov_change_resets_estimate(self):
+        monitor = PerformanceMonitor()
+        config = MockConfig("auto")
+        engine = MotionEngine(config, monitor)
+        monitor.record_pipeline_latency(0.030)
+
+        config.fov_x = 200
+        engine.update_config()
+        assert monitor.get_latency_estimate() == 0.0
+
+
+def test_prediction_offset_scales_with_lookahead():
+    """The lookahead horizon directly scales the predicted lead."""
+    # 200 px/s on X, no direction flip, velocity gate fully open (>= 100 px/s)
+    short_x, _ = calculate_prediction(
+        200.0, 0.0, 200.0, 0.0, 0.004, 1.0, 0.01, 500.0, 500.0, 1920.0, 1080.0, 200.0, 200.0
+    )
+    long_x, _ = calculate_prediction(
+        200.0, 0.0, 200.0, 0.0, 0.004, 1.0, 0.05, 500.0, 500.0, 1920.0, 1080.0, 200.0, 200.0
+    )
+
+    assert short_x == pytest.approx(502.0)
+    assert long_x == pytest.approx(510.0)
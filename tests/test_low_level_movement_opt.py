@@ -75,3 +75,62 @@ class TestLowLevelMovementOptimization:
             obj2 = args2[1]._obj
 
             assert obj1 is obj2, "INPUT structure was recreated in absolute movement!"
+
+
+class TestVersionCachedGeometry:
+    class VersionedConfig:
+        def __init__(self):
+            self._version = 0
+            self.aim_point = 1
+            self.head_offset = 10
+            self.leg_offset = 20
+
+    def test_aim_offset_follows_config_version(self):
+        config = self.VersionedConfig()
+        system = LowLevelMovementSystem(config, MagicMock())
+        system.screen_width, system.screen_height = 1920, 1080
+
+        assert system.get_move_delta(1000, 600) == (40, 60)
+
+        # Without a version bump the cached offset is reused (no per-frame config reads)
+        config.aim_point = 0
+        assert system.get_move_delta(1000, 600) == (40, 60)
+
+        config._version += 1
+        assert system.get_move_delta(1000, 600) == (40, 50)
+        assert system.aim_offset_y == -10
+
+        config.aim_point = 2
+        config._version += 1
+        assert system.get_move_delta(1000, 600) == (40, 80)
+
+    def test_screen_size_updates_center_and_scale(self):
+        config = self.VersionedConfig()
+        config.aim_point = 0
+        system = LowLevelMovementSystem(config, MagicMock())
+
+        system.screen_width = 2560
+        system.screen_height = 1440
+        assert system.get_move_delta(1280, 720) == (0, -10)
+        assert system._x_scale == pytest.approx(65535.0 / 2559)
+        assert system._y_scale == pytest.approx(65535.0 / 1439)
+
+    def test_refresh_geometry_detects_display_change(self):
+        system = LowLevelMovementSystem(self.VersionedConfig(), MagicMock())
+        system.screen_width, system.screen_height = 1920, 1080
+
+        mock_user32 = MagicMock()
+        mock_user32.GetSystemMetrics.side_effect = lambda i: 3840 if i == 0 else 2160
+        with patch.object(system, "_get_user32", return_value=mock_user32):
+            assert system.refresh_geometry() is True
+            assert system.refresh_geometry() is False  # Unchanged
+
+        assert (system.screen_width, system.screen_height) == (3840, 2160)
+        assert system.get_move_delta(1920, 1080) == (0, 0)
+
+        # Garbage metrics are ignored
+        mock_user32.GetSystemMetrics.side_effect = None
+        mock_user32.GetSystemMetrics.return_value = MagicMock()
+        with patch.object(system, "_get_user32", return_value=mock_user32):
+            assert system.refresh_geometry() is False
+        assert system.screen_width == 3840
@@ -0,0 +1,111 @@
+"""
+Tests for the localhost Prometheus metrics endpoint.
+"""
+
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from utils.clock import SimulatedClock
+from utils.latency_histogram import LatencyHistogram
+from utils.metrics_server import METRICS_HOST, MetricsServer, render_metrics
+from utils.performance_monitor import PerformanceMonitor
+
+
+class _Detection:
+    def __init__(self, backend: str, frames: int, duplicates: int):
+        self.stats = {"backend": backend, "frames": frames, "duplicate_frames": duplicates}
+
+    def get_capture_stats(self):
+        return self.stats
+
+
+def _samples(text: str) -> dict[str, float]:
+    """Map 'name{labels}' -> value for every sample line."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, value = line.rsplit(" ", 1)
+            samples[key] = float(value)
+    return samples
+
+
+@pytest.fixture
+def monitor():
+    clock = SimulatedClock()
+    perf = PerformanceMonitor(clock=clock)
+    perf.start_publishing(0.0)  # Every frame, so the snapshot covers all 10
+    for i in range(10):
+        perf.start_probe("detection_capture")
+        clock.advance(0.0003)
+        perf.stop_probe("detection_capture")
+        perf.record_frame(0.0015 if i < 9 else 0.02, missed=i == 9)
+    return perf
+
+
+def test_cumulative_counts_match_bounds():
+    histogram = LatencyHistogram()
+    for value in (100, 1_000, 10_000, 100_000, 1_000_000):
+        histogram.record(value)
+    assert histogram.cumulative_counts([50, 100, 999, 1_100, 10**7]) == [0, 1, 1, 2, 5]
+
+
+def test_render_counters_and_histograms(monitor):
+    monitor.reset_aggregates()  # Session counters are not affected
+    samples = _samples(render_metrics(monitor, _Detection("dxgi", 200, 50)))
+
+    assert samples["colortracker_frames_total"] == 10
+    assert samples["colortracker_missed_frames_total"] == 1
+    assert samples['colortracker_frame_seconds_bucket{le="0.002"}'] == 9
+    assert samples['colortracker_frame_seconds_bucket{le="0.016"}'] == 9
+    assert samples['colortracker_frame_seconds_bucket{le="0.033"}'] == 10
+    assert samples['colortracker_frame_seconds_bucket{le="+Inf"}'] == 10
+    assert samples["colortracker_frame_seconds_count"] == 10
+    assert samples["colortracker_frame_seconds_sum"] == pytest.approx(0.0335, rel=0.01)
+    assert samples['colortracker_probe_seconds_bucket{probe="detection_capture",le="0.0005"}'] == 10
+    assert samples['colortracker_probe_seconds_bucket{probe="detection_capture",le="0.00025"}'] == 0
+    assert samples['colortracker_capture_info{backend="dxgi"}'] == 1
+    assert samples["colortracker_capture_duplicate_ratio"] == pytest.approx(0.25)
+    assert samples["process_resident_memory_bytes"] > 0
+    assert "process_cpu_seconds_total" in samples
+
+
+def test_render_reads_the_published_snapshot_without_the_frame_lock(monitor):
+    texts = []
+    with monitor._lock:  # A frame holding the lock must not stall the scrape
+        scrape = threading.Thread(target=lambda: texts.append(render_metrics(monitor)))
+        scrape.start()
+        scrape.join(timeout=5)
+    assert texts and "colortracker_frames_total 10" in texts[0]
+
+    monitor.stop_publishing()
+    monitor.record_frame(0.001)
+    assert _samples(render_metrics(monitor))["colortracker_frames_total"] == 10  # Last published snapshot
+    assert _samples(render_metrics(PerformanceMonitor()))["colortracker_frames_total"] == 0
+
+
+def test_family_declared_once(monitor):
+    text = render_metrics(monitor)
+    assert text.count("# TYPE colortracker_probe_seconds histogram") == 1
+    assert "colortracker_capture_info" not in text
+
+
+def test_http_scrape_localhost_only(monitor):
+    server = MetricsServer(monitor, port=0)
+    server.start()
+    try:
+        assert server.running
+        assert server._server.server_address[0] == METRICS_HOST
+        with urllib.request.urlopen(server.url, timeout=5) as response:
+            assert response.status == 200
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            body = response.read().decode("utf-8")
+        assert "colortracker_frames_total 10" in body
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://{METRICS_HOST}:{server.port}/other", timeout=5)
+    finally:
+        server.stop()
+    assert not server.running
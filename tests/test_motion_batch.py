@@ -0,0 +1,119 @@
+"""
+Tests for the vectorized batch APIs (OneEuroFilter.filter_batch / MotionEngine.process_batch).
+The batch path must be bit-compatible with the streaming path.
+"""
+
+import numpy as np
+import pytest
+
+from core.motion_engine import MotionEngine, OneEuroFilter
+from utils.clock import SimulatedClock
+
+
+class MockConfig:
+    def __init__(self):
+        self.motion_min_cutoff = 0.5
+        self.motion_beta = 0.005
+        self.prediction_scale = 1.0
+        self.screen_width = 1920
+        self.screen_height = 1080
+        self.fov_x = 50
+        self.fov_y = 50
+
+
+def _random_walk(rng, n, start=500.0, step=3.0):
+    return start + np.cumsum(rng.normal(0.0, step, n))
+
+
+def _stream_engine(clock, engine, t, x, y, dt):
+    """Feed samples to MotionEngine.process with the simulated clock pinned to t[i]."""
+    out = []
+    for i in range(len(x)):
+        clock.sleep_until(t[i])
+        out.append(engine.process(x[i], y[i], dt))
+    return np.array(out, dtype=np.int64)
+
+
+def test_filter_batch_matches_streaming():
+    rng = np.random.default_rng(7)
+    t = np.cumsum(rng.uniform(0.0005, 0.01, 2000))
+    x = _random_walk(rng, 2000)
+
+    x_hat, dx_hat = OneEuroFilter.filter_batch(t, x, min_cutoff=0.7, beta=0.01)
+
+    f = OneEuroFilter(t[0], x[0], min_cutoff=0.7, beta=0.01)
+    expected_x = [x[0]]
+    expected_dx = [0.0]
+    for i in range(1, len(x)):
+        expected_x.append(f(t[i], x[i]))
+        expected_dx.append(f.deriv_prev)
+
+    # Bit-exact, not approximately equal
+    assert np.array_equal(x_hat, np.array(expected_x))
+    assert np.array_equal(dx_hat, np.array(expected_dx))
+
+
+def test_filter_batch_many_trajectories():
+    rng = np.random.default_rng(3)
+    t = np.arange(500) * 0.004
+    xs = np.stack([_random_walk(rng, 500) for _ in range(8)])
+
+    x_hat, dx_hat = OneEuroFilter.filter_batch(t, xs, min_cutoff=1.0, beta=0.05)
+    assert x_hat.shape == xs.shape
+    assert dx_hat.shape == xs.shape
+
+    for row in range(xs.shape[0]):
+        single, _ = OneEuroFilter.filter_batch(t, xs[row], min_cutoff=1.0, beta=0.05)
+        assert np.array_equal(x_hat[row], single)
+
+
+def test_filter_batch_rejects_mismatched_timestamps():
+    with pytest.raises(ValueError):
+        OneEuroFilter.filter_batch(np.arange(10.0), np.zeros(11))
+
+
+def test_process_batch_matches_streaming():
+    rng = np.random.default_rng(11)
+    n = 1500
+    dt = 0.004
+    # Build timestamps exactly the way the engine accumulates its internal clock
+    t = np.empty(n)
+    acc = 100.0
+    for i in range(n):
+        if i:
+            acc += dt
+        t[i] = acc
+    x = _random_walk(rng, n, step=4.0)
+    y = _random_walk(rng, n, start=400.0, step=2.0)
+    x[250] = np.nan  # Exercise the NaN guard
+
+    batch_x, batch_y = MotionEngine(MockConfig()).process_batch(t, x, y)
+    clock = SimulatedClock(start=t[0])
+    streamed = _stream_engine(clock, MotionEngine(MockConfig(), clock=clock), t, x, y, dt)
+
+    assert np.array_equal(batch_x, streamed[:, 0])
+    assert np.array_equal(batch_y, streamed[:, 1])
+
+
+def test_process_batch_does_not_touch_streaming_state():
+    engine = MotionEngine(MockConfig())
+    t = np.arange(100) * 0.004
+    engine.process_batch(t, np.linspace(0, 100, 100), np.zeros(100))
+    assert engine.x_filter is None
+    assert engine.y_filter is None
+
+
+def test_process_batch_many_trajectories():
+    rng = np.random.default_rng(5)
+    t = np.arange(300) * 0.004
+    xs = np.stack([_random_walk(rng, 300) for _ in range(4)])
+    ys = np.stack([_random_walk(rng, 300) for _ in range(4)])
+
+    engine = MotionEngine(MockConfig())
+    out_x, out_y = engine.process_batch(t, xs, ys)
+    assert out_x.shape == (4, 300)
+    assert out_x.dtype == np.int64
+
+    single_x, single_y = engine.process_batch(t, xs[2], ys[2])
+    assert np.array_equal(out_x[2], single_x)
+    assert np.array_equal(out_y[2], single_y)
@@ -146,3 +146,21 @@ def test_config_update(motion_engine):
     assert motion_engine._min_cutoff == 2.0
     assert motion_engine._beta == 0.08
     assert motion_engine._prediction_scale == 0.0
+
+
+def test_process_picks_up_snapshot_changes(tmp_path):
+    """Passing a ConfigSnapshot re-reads settings only when its version changes"""
+    from unittest.mock import patch
+
+    from utils.config import Config
+
+    with patch("utils.paths.get_app_dir", return_value=str(tmp_path)):
+        config = Config()
+    engine = MotionEngine(config)
+
+    engine.process(100.0, 100.0, 0.016, config.snapshot())
+    assert engine._min_cutoff == config.motion_min_cutoff
+
+    config.motion_min_cutoff = 2.0
+    engine.process(100.0, 100.0, 0.016, config.snapshot())
+    assert engine._min_cutoff == 2.0
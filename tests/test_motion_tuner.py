@@ -0,0 +1,116 @@
+"""
+Tests for the motion parameter autotuner and preset files.
+"""
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from core.motion_tuner import MotionTuner, Trajectory, evaluate_params, load_trajectory, synthetic_corpus
+from utils.config import Config
+
+SMALL_GRID = {
+    "motion_min_cutoff": [0.1, 1.0, 10.0],
+    "motion_beta": [0.001, 0.05],
+    "prediction_scale": [0.0, 1.0],
+}
+
+
+@pytest.fixture
+def corpus():
+    return synthetic_corpus(seed=1, duration=1.5)
+
+
+def test_evaluate_params_prefers_responsive_settings(corpus):
+    settings = {"latency": 0.0, "warmup": 30, "screen_width": 1920, "screen_height": 1080, "fov_x": 200, "fov_y": 200}
+    sluggish = {"motion_min_cutoff": 0.01, "motion_beta": 0.0001, "prediction_scale": 0.0}
+    responsive = {"motion_min_cutoff": 5.0, "motion_beta": 0.05, "prediction_scale": 0.0}
+
+    assert evaluate_params(responsive, corpus, settings) < evaluate_params(sluggish, corpus, settings)
+
+
+def test_grid_search_ranks_results(corpus):
+    with MotionTuner(corpus, workers=1) as tuner:
+        results = tuner.grid_search(SMALL_GRID)
+
+    assert len(results) == 12
+    scores = [r["rmse"] for r in results]
+    assert scores == sorted(scores)
+
+
+def test_refinement_never_worse_than_grid(corpus):
+    with MotionTuner(corpus, workers=1) as tuner:
+        grid_results = tuner.grid_search(SMALL_GRID)
+        results = tuner.run(grid=SMALL_GRID, top_k=2, iterations=4)
+
+    assert results[0]["rmse"] <= grid_results[0]["rmse"]
+    # Refined values stay inside the Config schema ranges
+    for key in ("motion_min_cutoff", "motion_beta", "prediction_scale"):
+        schema = Config.DEFAULT_CONFIG[key]
+        assert schema["min"] <= results[0][key] <= schema["max"]
+
+
+def test_parallel_matches_serial(corpus):
+    with MotionTuner(corpus, workers=1) as serial:
+        serial_results = serial.grid_search(SMALL_GRID)
+    with MotionTuner(corpus, workers=2) as parallel:
+        parallel_results = parallel.grid_search(SMALL_GRID)
+
+    assert serial_results == parallel_results
+
+
+def test_rejects_bad_arguments(corpus):
+    with pytest.raises(ValueError):
+        MotionTuner([])
+    with pytest.raises(ValueError):
+        MotionTuner(corpus, not_a_setting=1)
+
+
+def test_report_and_preset_round_trip(corpus, tmp_path):
+    with MotionTuner(corpus, workers=1) as tuner:
+        results = tuner.grid_search(SMALL_GRID)
+        tuner.write_report(str(tmp_path / "report.json"), results)
+        tuner.write_report(str(tmp_path / "report.csv"), results)
+        tuner.write_preset(str(tmp_path / "preset.json"), results[0], name="tuned")
+
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["results"][0]["rank"] == 1
+    assert report["evaluations"] == 12
+    assert (tmp_path / "report.csv").read_text().startswith("rank,")
+
+    with patch("utils.paths.get_app_dir", return_value=str(tmp_path)):
+        config = Config()
+    config.config_file = str(tmp_path / "config.json")
+
+    name = config.load_preset_file(str(tmp_path / "preset.json"))
+    assert name == "tuned"
+    assert "tuned" not in Config.PRESETS  # Registered per instance only
+
+    assert config.apply_preset(name)
+    assert config.motion_min_cutoff == pytest.approx(results[0]["motion_min_cutoff"], abs=0.01)
+    assert config.preset_name == "tuned"
+
+
+def test_load_preset_file_failure(tmp_path):
+    with patch("utils.paths.get_app_dir", return_value=str(tmp_path)):
+        config = Config()
+    (tmp_path / "bad.json").write_text('{"values": {}}')
+    assert config.load_preset_file(str(tmp_path / "bad.json")) == ""
+    assert config.load_preset_file(str(tmp_path / "missing.json")) == ""
+
+
+def test_load_trajectory_formats(tmp_path):
+    t = np.arange(5) * 0.01
+    x = np.arange(5) * 2.0
+    y = np.arange(5) * 3.0
+    np.savez(tmp_path / "trace.npz", t=t, x=x, y=y)
+    (tmp_path / "trace.csv").write_text("t,x,y\n" + "\n".join(f"{a},{b},{c}" for a, b, c in zip(t, x, y, strict=True)))
+
+    for path in ("trace.npz", "trace.csv"):
+        traj = load_trajectory(str(tmp_path / path))
+        assert isinstance(traj, Trajectory)
+        assert np.allclose(traj.x, x)
+        # Recorded traces score against themselves
+        assert traj.true_y is traj.y
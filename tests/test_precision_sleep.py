@@ -0,0 +1,65 @@
+"""
+Tests for the precision sleep module and wake-up error telemetry.
+"""
+
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from utils.clock import SimulatedClock, SystemClock
+from utils.performance_monitor import PerformanceMonitor
+from utils.precision_sleep import NanosleepSleeper, SleepSleeper, create_precision_sleeper
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="clock_nanosleep is Linux-only")
+def test_linux_uses_clock_nanosleep():
+    sleeper = create_precision_sleeper()
+    assert isinstance(sleeper, NanosleepSleeper)
+    assert sleeper.absolute  # CPython's perf_counter reads CLOCK_MONOTONIC on Linux
+
+
+@pytest.mark.parametrize("factory", [create_precision_sleeper, SleepSleeper])
+def test_sleep_until_reaches_deadline(factory):
+    sleeper = factory()
+    for duration in (0.00005, 0.002, 0.01):
+        deadline = time.perf_counter() + duration
+        error = sleeper.sleep_until(deadline)
+        assert time.perf_counter() >= deadline
+        assert 0.0 <= error < 0.01  # Loose bound: CI schedulers can be noisy
+
+
+def test_past_deadline_returns_immediately():
+    sleeper = create_precision_sleeper()
+    assert sleeper.sleep_until(time.perf_counter() - 1.0) == 0.0
+
+
+def test_timer_failure_falls_back_to_sleep():
+    with patch("utils.precision_sleep.sys.platform", "linux"):
+        with patch("utils.precision_sleep.NanosleepSleeper", side_effect=AttributeError("no clock_nanosleep")):
+            assert isinstance(create_precision_sleeper(), SleepSleeper)
+
+
+def test_clock_sleep_until_reports_wake_error():
+    clock = SystemClock(sleeper=SleepSleeper())
+    assert clock.sleep_until(time.perf_counter() + 0.001) >= 0.0
+
+    simulated = SimulatedClock()
+    assert simulated.sleep_until(5.0) == 0.0
+
+
+def test_performance_monitor_wake_error():
+    monitor = PerformanceMonitor()
+    for error in (0.0001, 0.0001, 0.002):
+        monitor.record_wake_error(error)
+    monitor.record_wake_error(-1.0)
+    monitor.record_wake_error(float("nan"))
+
+    stats = monitor.get_stats()
+    assert monitor.wake_error_samples == 3
+    assert 0.1 < stats["wake_error_ms"] < 2.0
+    assert stats["worst_wake_error_ms"] == pytest.approx(2.0)
+
+    monitor.reset_aggregates()
+    assert monitor.get_stats()["worst_wake_error_ms"] == 0.0
@@ -0,0 +1,74 @@
+"""
+Tests for the logic-thread sampling profiler.
+"""
+
+import sys
+import threading
+import time
+
+from utils.sampling_profiler import SamplingProfiler
+
+
+def _spin_in_hot_function(stop: threading.Event) -> None:
+    while not stop.is_set():
+        time.sleep(0.0005)
+
+
+def _profile_worker(interval: float = 0.001, duration: float = 0.2) -> SamplingProfiler:
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin_in_hot_function, args=(stop,))
+    worker.start()
+    profiler = SamplingProfiler(worker.ident, interval)
+    profiler.start()
+    time.sleep(duration)
+    profiler.stop()
+    stop.set()
+    worker.join()
+    return profiler
+
+
+def test_samples_target_thread_stack():
+    profiler = _profile_worker()
+    stacks = profiler.get_collapsed()
+
+    assert profiler.sample_count == sum(stacks.values()) > 10
+    assert not profiler.running
+    # Outermost frame first, the sampled function inside it; the sampler's own stack never appears
+    assert all("_spin_in_hot_function (test_sampling_profiler.py:" in stack for stack in stacks)
+    assert all(stack.split(";")[0].startswith("_bootstrap ") for stack in stacks)
+    assert not any("_sample_loop" in stack for stack in stacks)
+
+
+def test_write_collapsed_format(tmp_path):
+    profiler = _profile_worker()
+    path = tmp_path / "loop.folded"
+    assert profiler.write_collapsed(str(path))
+
+    lines = path.read_text().splitlines()
+    counts = [int(line.rsplit(" ", 1)[1]) for line in lines]
+    assert sum(counts) == profiler.sample_count
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_overhead_reported():
+    profiler = _profile_worker()
+    overhead = profiler.get_overhead()
+
+    assert overhead["samples"] == profiler.sample_count
+    assert overhead["elapsed_s"] >= 0.2
+    assert overhead["avg_sample_us"] > 0.0
+    assert 0.0 < overhead["overhead_pct"] < 50.0
+
+
+def test_max_depth_keeps_innermost_frames():
+    profiler = SamplingProfiler(threading.get_ident(), max_depth=2)
+    profiler.sample(sys._getframe())
+    (stack,) = profiler.get_collapsed()
+    assert stack.split(";")[-1].startswith("test_max_depth_keeps_innermost_frames ")
+    assert stack.count(";") == 1
+
+
+def test_nothing_sampled_writes_nothing(tmp_path):
+    profiler = SamplingProfiler(threading.get_ident())
+    assert not profiler.write_collapsed(str(tmp_path / "empty.folded"))
+    assert profiler.get_overhead()["samples"] == 0.0
@@ -0,0 +1,197 @@
+"""
+Tests for the closed-loop tracking simulator (virtual camera + injected backends).
+"""
+
+import numpy as np
+import pytest
+
+from core.detection import DetectionSystem
+from core.low_level_movement import LowLevelMovementSystem
+from core.simulator import (
+    ClosedLoopSimulator,
+    SimulatedCaptureBackend,
+    SimulatedInputBackend,
+    VirtualScene,
+    simulate,
+    simulation_config,
+)
+from core.trajectory import PATTERNS, Trajectory, generate
+from utils.clock import SimulatedClock
+from utils.performance_monitor import PerformanceMonitor
+
+TARGET_BGRA = (0x8D, 0x00, 0xC9, 255)  # Default target_color 0xC9008D
+
+
+def _static_path(duration=1.0):
+    t = np.array([0.0, duration])
+    return Trajectory("static", t, np.array([960.0, 960.0]), np.array([540.0, 540.0]))
+
+
+def _responsive_config(**overrides):
+    values = {"motion_min_cutoff": 25.0, "motion_beta": 0.0, "prediction_scale": 0.0}
+    values.update(overrides)
+    return simulation_config(**values)
+
+
+class TestVirtualScene:
+    def test_render_places_apex_at_target(self):
+        scene = VirtualScene(_static_path(), start_offset=(10.0, 5.0), start_time=0.0)
+        frame = scene.render({"left": 900, "top": 500, "width": 120, "height": 80}, 0.0)
+        assert frame.shape == (80, 120, 4)
+
+        ys, xs = np.nonzero((frame == TARGET_BGRA).all(axis=2))
+        # First matching pixel in scan order is the apex at (970, 545)
+        assert (ys[0] + 500, xs[0] + 900) == (545, 970)
+
+    def test_pan_lands_after_latency(self):
+        scene = VirtualScene(_static_path(), start_offset=(0.0, 0.0), start_time=0.0)
+        scene.pan(12, -4, at=0.5)
+        assert scene.screen_position(0.4) == (960.0, 540.0)
+        assert scene.screen_position(0.5) == (948.0, 544.0)
+
+    def test_render_clips_offscreen_target(self):
+        scene = VirtualScene(_static_path(), start_offset=(400.0, 0.0), start_time=0.0)
+        frame = scene.render({"left": 900, "top": 500, "width": 50, "height": 50}, 0.0)
+        assert not (frame == TARGET_BGRA).all(axis=2).any()
+
+
+class TestSimulatedBackends:
+    def test_capture_reuses_frame_within_refresh_tick(self):
+        clock = SimulatedClock(start=1.0)
+        scene = VirtualScene(_static_path(), start_time=1.0)
+        capture = SimulatedCaptureBackend(scene, clock, refresh_rate=100.0)
+        region = {"left": 0, "top": 0, "width": 64, "height": 64}
+
+        _, first = capture.grab(region)
+        clock.advance(0.001)
+        _, same = capture.grab(region)
+        clock.advance(0.01)
+        _, fresh = capture.grab(region)
+
+        assert same is first
+        assert fresh is not first
+        assert capture.frames_rendered == 2
+        assert capture.frames_captured == 3
+        assert capture.duplicate_frames == 1
+
+    def test_capture_latency_shows_past_scene(self):
+        clock = SimulatedClock(start=1.0)
+        scene = VirtualScene(_static_path(), start_offset=(0.0, 0.0), start_time=1.0)
+        capture = SimulatedCaptureBackend(scene, clock, latency=0.01)
+        scene.pan(20, 0, at=1.005)
+        region = {"left": 900, "top": 530, "width": 120, "height": 40}
+
+        clock.advance(0.012)  # Move landed 7ms ago, frame shows 10ms ago
+        _, img = capture.grab(region)
+        assert (img[10, 60] == TARGET_BGRA).all()  # Apex still at (960, 540)
+
+    def test_detection_frame_time_includes_capture_latency(self):
+        config = simulation_config(input_method="recording")
+        clock = SimulatedClock(start=1.0)
+        scene = VirtualScene(_static_path(), start_time=1.0)
+        capture = SimulatedCaptureBackend(scene, clock, latency=0.01, refresh_rate=100.0)
+        detection = DetectionSystem(config, PerformanceMonitor(clock=clock), clock=clock, backend=capture)
+
+        clock.advance(0.025)
+        detection.find_target()
+        assert detection.last_capture_time == pytest.approx(1.025)
+        assert detection.last_frame_time == pytest.approx(1.01)  # 10ms latency + 5ms into the refresh tick
+
+    def test_injected_backends_are_used(self):
+        config = simulation_config(input_method="recording")
+        clock = SimulatedClock(start=1.0)
+        scene = VirtualScene(_static_path(), start_time=1.0)
+        capture = SimulatedCaptureBackend(scene, clock)
+        mover = SimulatedInputBackend(scene, clock, latency=0.002)
+        monitor = PerformanceMonitor(clock=clock)
+
+        detection = DetectionSystem(config, monitor, clock=clock, backend=capture)
+        found, x, y = detection.find_target()
+        assert (found, x, y) == (True, 990, 560)
+
+        movement = LowLevelMovementSystem(config, monitor, clock=clock, backend=mover)
+        movement.screen_width, movement.screen_height = 1920, 1080
+        movement.update_backend()  # Config asks for "recording": the injected backend stays
+        assert movement.backend is mover
+        movement.aim_at(x, y)
+        assert mover.move_count == 1
+        assert scene.camera_at(1.002) == (30.0, 20.0)
+
+        detection.close()
+        assert capture._last_frame is not None  # Caller-owned backend is not closed
+
+
+class TestClosedLoop:
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    def test_regression_gate(self, pattern):
+        """CI gate: a responsive config must acquire and hold every pattern."""
+        result = simulate(pattern, config=_responsive_config(), capture_latency=0.001, input_latency=0.001)
+        assert result["detection_rate"] == 1.0
+        assert result["time_to_acquire"] < 0.1
+        assert result["steady_state_error"] < 4.0
+        assert result["fps"] > 0.0
+
+    def test_latency_increases_error(self):
+        config = _responsive_config()
+        fast = simulate("constant_velocity", config=config)
+        slow = simulate("constant_velocity", config=config, capture_latency=0.002, input_latency=0.002)
+        assert fast["steady_state_error"] < slow["steady_state_error"]
+
+    def test_deterministic(self):
+        path = generate("random_jerk", n=1, duration=0.5, noise=0.0, seed=3).to_list()[0]
+        first = ClosedLoopSimulator(_responsive_config(), path, input_latency=0.001).run()
+        second = ClosedLoopSimulator(_responsive_config(), path, input_latency=0.001).run()
+        assert np.array_equal(first["error"], second["error"])
+
+    def test_never_acquired_reports_nan(self):
+        # Target starts outside the FOV: detection never sees it
+        path = _static_path(0.25)
+        sim = ClosedLoopSimulator(_responsive_config(), path, start_offset=(300.0, 0.0))
+        result = sim.run()
+        assert result["detection_rate"] == 0.0
+        assert np.isnan(result["time_to_acquire"])
+        assert result["steady_state_error"] == pytest.approx(300.0)
+
+    def test_event_loop_runs_once_per_presented_frame(self):
+        kwargs = {"refresh_rate": 144.0, "capture_latency": 0.002, "input_latency": 0.002}
+        fixed = simulate("sine_strafe", config=_responsive_config(), **kwargs)
+        event = simulate("sine_strafe", config=_responsive_config(loop_mode="event"), **kwargs)
+
+        # One iteration per presented frame (2s at 144Hz) instead of 240Hz on cached frames
+        assert event["frames"] == pytest.approx(288, abs=2)
+        assert fixed["frames"] == 480
+        # Re-aiming on a cached frame repeats a correction that has not landed yet
+        assert event["steady_state_error"] < 4.0
+        assert fixed["steady_state_error"] > event["steady_state_error"]
+
+    def test_runs_the_app_frame_step(self):
+        """Frames go through FrameLoop: frame starts, pacing and frame results are recorded."""
+        sim = ClosedLoopSimulator(_responsive_config(), _static_path(0.25))
+        result = sim.run()
+        stats = sim.perf_monitor.get_stats()
+
+        assert stats["pacing_frames"] == result["frames"] - 1
+        assert stats["pacing_start_error_max_ms"] == 0.0
+        assert stats["missed_frames"] == 0.0
+        assert sim.perf_monitor.get_probe_stats("main_loop_active")["count"] > 0
+
+    def test_async_input_uses_the_dispatcher(self):
+        sim = ClosedLoopSimulator(_responsive_config(async_input=True), _static_path(0.25))
+        result = sim.run()
+
+        assert result["detection_rate"] == 1.0
+        assert sim.input.move_count > 0
+        # Dispatcher thread has exited: its samples live on in the session histogram
+        assert sim.perf_monitor.get_probe_histogram("movement_input").count > 0
+        assert not sim.input_dispatcher.running
+
+    def test_frame_wait_timeout(self):
+        clock = SimulatedClock(start=1.0)
+        scene = VirtualScene(_static_path(), start_time=1.0)
+        capture = SimulatedCaptureBackend(scene, clock, refresh_rate=10.0)
+        capture.grab({"left": 0, "top": 0, "width": 8, "height": 8})
+
+        assert capture.wait_for_frame(0.05) is False
+        assert clock.perf_counter() == pytest.approx(1.05)
+        assert capture.wait_for_frame(0.1) is True
+        assert clock.perf_counter() == pytest.approx(1.1)
@@ -0,0 +1,136 @@
+"""
+Tests for slow-frame detection and snapshot writing.
+"""
+
+import gc
+import json
+import threading
+import time
+
+from utils.clock import SimulatedClock
+from utils.performance_monitor import PerformanceMonitor
+from utils.slow_frame_forensics import MEDIAN_REFRESH_FRAMES, SlowFrameForensics
+
+
+def _warm_up(forensics, frame_ms=1.0, t=1.0):
+    """Feed enough normal frames for the first median (returns the next frame index)."""
+    for frame in range(MEDIAN_REFRESH_FRAMES):
+        forensics.frame_finished(frame, t + frame * 0.004, frame_ms, 0.5, 2.0, {"detection_capture": 0.3})
+    return MEDIAN_REFRESH_FRAMES
+
+
+def _snapshots(directory):
+    return [json.loads(path.read_text()) for path in sorted(directory.glob("slow_frame_*.json"))]
+
+
+def test_no_snapshot_until_median_is_known(tmp_path):
+    forensics = SlowFrameForensics(str(tmp_path))
+    assert not forensics.frame_finished(0, 1.0, 50.0, 0.5, 2.0, {})
+    frame = _warm_up(forensics)
+    forensics.close()
+
+    assert forensics.median_ms == 1.0
+    assert forensics.threshold_ms == 3.0
+    assert frame == MEDIAN_REFRESH_FRAMES
+    assert _snapshots(tmp_path) == []
+
+
+def test_slow_frame_writes_snapshot_with_context(tmp_path):
+    forensics = SlowFrameForensics(str(tmp_path), context_frames=10)
+    forensics.context_sources["capture"] = lambda: {"backend": "mss"}
+    forensics.context_sources["broken"] = lambda: 1 / 0
+    frame = _warm_up(forensics)
+    assert not forensics.frame_finished(frame, 2.0, 2.9, 0.5, 2.0, {})
+    assert forensics.frame_finished(frame + 1, 2.01, 12.0, 11.0, 14.0, {"detection_capture": 10.5})
+    forensics.close()
+
+    (snapshot,) = _snapshots(tmp_path)
+    assert snapshot["frame"] == frame + 1
+    assert snapshot["frame_ms"] == 12.0
+    assert snapshot["frame_age_ms"] == 14.0
+    assert snapshot["threshold_ms"] == 3.0
+    assert snapshot["context"]["capture"] == {"backend": "mss"}
+    assert snapshot["context"]["broken"].startswith("unavailable")
+    assert snapshot["gc"] is None
+    assert snapshot["stack"] == []  # No watchdog
+    recent = snapshot["recent_frames"]
+    assert len(recent) == 10
+    assert recent[-1]["probes_ms"] == {"detection_capture": 10.5}
+    assert recent[-1]["detection_ms"] == 11.0
+    assert forensics.get_stats()["snapshots"] == 1.0
+
+
+def test_rate_limit_counts_suppressed_frames(tmp_path):
+    forensics = SlowFrameForensics(str(tmp_path), min_interval=5.0)
+    frame = _warm_up(forensics)
+    assert forensics.frame_finished(frame, 10.0, 20.0, 0.5, 2.0, {})
+    assert not forensics.frame_finished(frame + 1, 12.0, 20.0, 0.5, 2.0, {})
+    assert not forensics.frame_finished(frame + 2, 14.0, 20.0, 0.5, 2.0, {})
+    assert forensics.frame_finished(frame + 3, 15.5, 20.0, 0.5, 2.0, {})
+    forensics.close()
+
+    first, second = _snapshots(tmp_path)
+    assert first["suppressed_before"] == 0
+    assert second["suppressed_before"] == 2
+    assert forensics.suppressed == 2
+    assert forensics.snapshots == 2
+
+
+def test_min_slow_ms_floor(tmp_path):
+    forensics = SlowFrameForensics(str(tmp_path), min_slow_ms=2.0)
+    frame = _warm_up(forensics, frame_ms=0.1)
+    assert forensics.threshold_ms == 2.0
+    assert not forensics.frame_finished(frame, 2.0, 1.5, 0.5, 2.0, {})
+    forensics.close()
+
+
+def test_watchdog_captures_stack_during_the_overrun(tmp_path):
+    forensics = SlowFrameForensics(str(tmp_path))
+    forensics.watch(threading.get_ident())
+    try:
+        frame = _warm_up(forensics)
+        start = time.perf_counter()
+        forensics.frame_started(start)
+        time.sleep(0.1)  # The "slow work" the stack should point at
+        assert forensics.frame_finished(
+            frame, time.perf_counter(), (time.perf_counter() - start) * 1000.0, 0.5, 2.0, {}
+        )
+    finally:
+        forensics.close()
+
+    (snapshot,) = _snapshots(tmp_path)
+    assert snapshot["stack_source"].startswith("watchdog")
+    assert "test_watchdog_captures_stack_during_the_overrun" in snapshot["stack"][-1]
+
+
+def test_performance_monitor_feeds_probes_and_gc(tmp_path):
+    clock = SimulatedClock(start=1.0)
+    monitor = PerformanceMonitor(clock=clock)
+    monitor.start_gc_tracking()
+    forensics = monitor.start_forensics(str(tmp_path), min_interval=0.0)
+    try:
+        for _ in range(MEDIAN_REFRESH_FRAMES):
+            monitor.record_frame_start(clock.perf_counter(), 0.0, 0.004)
+            monitor.start_probe("detection_capture")
+            monitor.stop_probe("detection_capture")
+            monitor.record_detection(0.0005)
+            monitor.record_frame(0.001)
+            clock.advance(0.004)
+        gc.collect(0)
+        monitor.record_frame(0.020, missed=True, frame_age=0.025)
+        stats = monitor.get_stats()
+    finally:
+        monitor.stop_forensics()
+        monitor.stop_gc_tracking()
+
+    assert monitor.forensics is None
+    assert not monitor._frame_probe_totals
+    assert stats["slow_snapshots"] == 1.0
+    (snapshot,) = _snapshots(tmp_path)
+    assert snapshot["frame"] == MEDIAN_REFRESH_FRAMES
+    assert snapshot["frame_age_ms"] == 25.0
+    assert "detection_capture" in snapshot["recent_frames"][-2]["probes_ms"]
+    assert snapshot["recent_frames"][-2]["detection_ms"] == 0.5
+    assert snapshot["gc"]["pauses"][-1]["frames_ago"] == 0
+    assert snapshot["recent_frames"][-1]["gc_pause_ms"] > 0.0
+    assert forensics.snapshots == 1
@@ -1,3 +1,5 @@
+import json
+import threading
 import time
 
 import pytest
@@ -43,23 +45,85 @@ class TestTelemetryProbes:
         assert stats_a["count"] == 1
         assert stats_b["count"] == 1
 
-    def test_probe_overwrite(self):
-        """Ensure starting a probe that is already running resets the start time."""
+    def test_nested_probe_same_name(self):
+        """Re-starting a running probe nests: each stop closes the innermost start."""
         monitor = PerformanceMonitor()
-        name = "overwrite_test"
+        name = "nested_test"
 
         monitor.start_probe(name)
-        first_start = monitor._active_probes[name]
-
-        time.sleep(0.001)
+        time.sleep(0.002)
         monitor.start_probe(name)
-        second_start = monitor._active_probes[name]
-
-        assert second_start > first_start
+        monitor.stop_probe(name)
+        assert monitor.get_probe_stats(name)["count"] == 1
 
         monitor.stop_probe(name)
         stats = monitor.get_probe_stats(name)
-        assert stats["count"] == 1
+        assert stats["count"] == 2
+        assert stats["max_ms"] > stats["min_ms"]
+
+    def test_probes_are_per_thread(self):
+        """The same probe name used from two threads keeps separate timings and merges on read."""
+        monitor = PerformanceMonitor()
+        barrier = threading.Barrier(3)
+        done = threading.Event()
+
+        def worker(hold: float):
+            for _ in range(5):
+                monitor.start_probe("shared")
+                barrier.wait()  # Both threads have the probe open at once
+                time.sleep(hold)
+                monitor.stop_probe("shared")
+                barrier.wait()
+            barrier.wait()
+            done.wait()  # Recent samples are reported for live threads only
+
+        threads = [threading.Thread(target=worker, args=(hold,)) for hold in (0.001, 0.02)]
+        for t in threads:
+            t.start()
+        for _ in range(11):
+            barrier.wait()
+
+        samples = monitor.get_probe_samples("shared")
+        done.set()
+        for t in threads:
+            t.join()
+        assert samples.size == 10
+        # The short-hold thread's samples are not stretched by the other thread's stop
+        assert (samples < 10.0).sum() == 5
+
+    def test_exited_thread_store_is_released(self):
+        """A finished thread's recent samples are dropped; its session histogram is kept."""
+        monitor = PerformanceMonitor()
+        monitor.start_probe("shared")
+        monitor.stop_probe("shared")
+
+        def worker():
+            for _ in range(3):
+                monitor.start_probe("shared")
+                monitor.stop_probe("shared")
+            monitor.start_probe("worker_only")
+            monitor.stop_probe("worker_only")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert len(monitor._probe_threads) == 2
+
+        assert monitor.get_probe_stats("shared")["count"] == 1
+        assert len(monitor._probe_threads) == 1
+        assert monitor.get_probe_samples("worker_only").size == 0
+        assert monitor.get_probe_stats("worker_only") == {}
+        assert "worker_only" not in monitor.get_probe_names()
+        # Session percentiles still cover the exited thread
+        assert monitor.get_probe_histogram("shared").count == 4
+        assert monitor.get_probe_histogram("worker_only").count == 1
+
+    def test_probe_ring_keeps_latest_window(self):
+        monitor = PerformanceMonitor(history_size=8)
+        for _ in range(20):
+            monitor.start_probe("ring")
+            monitor.stop_probe("ring")
+        assert monitor.get_probe_stats("ring")["count"] == 8
 
     def test_stop_unknown_probe(self):
         """Ensure stopping a probe that was never started does not crash."""
@@ -74,3 +138,50 @@ class TestTelemetryProbes:
         stats = monitor.get_probe_stats("unknown")
         assert stats == {}
 
+
+class TestSpanTracing:
+    def test_tracing_is_opt_in(self):
+        monitor = PerformanceMonitor()
+        monitor.start_probe("work")
+        monitor.stop_probe("work")
+        assert monitor.get_trace_events() == []
+        assert not monitor.export_trace("unused.json")
+
+    def test_spans_carry_thread_and_frame(self, tmp_path):
+        monitor = PerformanceMonitor()
+        monitor.set_tracing(True)
+        for _ in range(3):
+            monitor.start_probe("frame")
+            monitor.start_probe("inner")
+            monitor.stop_probe("inner")
+            monitor.stop_probe("frame")
+            monitor.record_frame(0.001)
+
+        worker = threading.Thread(target=lambda: (monitor.start_probe("io"), monitor.stop_probe("io")), name="io")
+        worker.start()
+        worker.join()
+
+        events = monitor.get_trace_events()
+        spans = [e for e in events if e["ph"] == "X"]
+        assert [e["args"]["frame"] for e in spans if e["name"] == "frame"] == [0, 1, 2]
+        io_span = next(e for e in spans if e["name"] == "io")
+        assert io_span["tid"] != spans[0]["tid"]
+        assert {"name": "io"} in [e["args"] for e in events if e["ph"] == "M"]
+
+        path = tmp_path / "trace.json"
+        assert monitor.export_trace(str(path))
+        assert "traceEvents" in json.loads(path.read_text())
+
+    def test_trace_ring_is_bounded(self):
+        monitor = PerformanceMonitor(trace_capacity=4)
+        monitor.set_tracing(True)
+        for _ in range(10):
+            monitor.start_probe("work")
+            monitor.stop_probe("work")
+            monitor.record_frame(0.001)
+
+        frames = [e["args"]["frame"] for e in monitor.get_trace_events() if e["ph"] == "X"]
+        assert frames == [6, 7, 8, 9]
+
+        monitor.set_tracing(True, clear=True)
+        assert monitor.get_trace_events() == []
@@ -0,0 +1,124 @@
+"""
+Tests for the streaming binary telemetry sink.
+"""
+
+import math
+import threading
+
+import numpy as np
+import pytest
+
+from utils.clock import SimulatedClock
+from utils.performance_monitor import PerformanceMonitor
+from utils.telemetry_sink import TelemetrySink, iter_telemetry, load_telemetry
+
+
+def test_round_trip_across_chunks(tmp_path):
+    path = str(tmp_path / "session.cttl")
+    sink = TelemetrySink(
+        path, probes=("work",), chunk_rows=64, pool_chunks=32
+    )  # Pool holds the whole run: nothing dropped
+    for i in range(1000):
+        sink.write_frame(i * 0.001, 1.0 + i, 0.5, i % 3 == 0, 2.0, {"work": 0.25} if i % 2 else {})
+    sink.close()
+
+    data = load_telemetry(path)
+    assert sink.rows_written == 1000
+    assert sink.dropped_rows == 0
+    assert set(data) == {"t", "frame_ms", "detection_ms", "target_found", "frame_age_ms", "work_ms"}
+    assert np.allclose(data["t"], np.arange(1000) * 0.001)
+    assert np.allclose(data["frame_ms"], 1.0 + np.arange(1000))
+    assert data["target_found"].sum() == 334
+    assert np.isnan(data["work_ms"][0::2]).all()
+    assert np.allclose(data["work_ms"][1::2], 0.25)
+
+
+def test_load_range_and_columns(tmp_path):
+    path = str(tmp_path / "session.cttl")
+    sink = TelemetrySink(path, probes=("work",), chunk_rows=64, pool_chunks=32)
+    for i in range(1000):
+        sink.write_frame(i * 0.001, float(i), 0.5, False, 2.0, {"work": 0.25})
+    sink.close()
+
+    # A slice across chunk boundaries, selected columns only
+    data = load_telemetry(path, columns=("frame_ms", "work_ms"), start=100, stop=300)
+    assert set(data) == {"frame_ms", "work_ms"}
+    assert np.array_equal(data["frame_ms"], np.arange(100, 300, dtype=np.float32))
+    assert load_telemetry(path, columns=("t",), start=-10)["t"].size == 10
+    assert load_telemetry(path, start=2000)["t"].size == 0
+    with pytest.raises(KeyError):
+        load_telemetry(path, columns=("no_such_column",))
+
+    chunks = list(iter_telemetry(path, columns=("frame_ms",)))
+    assert [chunk["frame_ms"].size for chunk in chunks] == [64] * 15 + [40]
+    assert np.array_equal(np.concatenate([chunk["frame_ms"] for chunk in chunks]), np.arange(1000))
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    path = tmp_path / "session.cttl"
+    sink = TelemetrySink(str(path), probes=(), chunk_rows=10)
+    for i in range(25):
+        sink.write_frame(float(i), 1.0, 1.0, True, 1.0, {})
+    sink.close()
+
+    raw = path.read_bytes()
+    path.write_bytes(raw[:-7])  # Cut into the last (5-row) chunk
+    assert load_telemetry(str(path))["t"].size == 20
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not_telemetry.bin"
+    path.write_bytes(b"hello world, definitely not telemetry")
+    with pytest.raises(ValueError):
+        load_telemetry(str(path))
+
+
+def test_monitor_streams_one_record_per_frame(tmp_path):
+    clock = SimulatedClock(start=1.0)
+    monitor = PerformanceMonitor(clock=clock)
+    path = monitor.start_telemetry(str(tmp_path / "frames.cttl"), probes=("main_loop_active",))
+
+    for i in range(5):
+        monitor.start_probe("main_loop_active")
+        clock.advance(0.002)
+        monitor.record_detection(0.001)
+        monitor.stop_probe("main_loop_active")
+        monitor.record_frame(0.002, target_found=i == 3, frame_age=0.004)
+    monitor.record_frame(0.001)  # Frame without detection or probes
+    monitor.stop_telemetry()
+
+    data = load_telemetry(path)
+    assert data["t"].size == 6
+    assert data["target_found"].tolist() == [0, 0, 0, 1, 0, 0]
+    assert np.allclose(data["main_loop_active_ms"][:5], 2.0)
+    assert np.allclose(data["frame_age_ms"][:5], 4.0)
+    assert math.isnan(data["main_loop_active_ms"][5])
+    assert math.isnan(data["detection_ms"][5])
+    assert monitor.telemetry_sink is None
+
+
+def test_probes_from_other_threads_count_toward_the_frame(tmp_path):
+    """movement_input timed on the async input thread lands in the frame it finished in."""
+    monitor = PerformanceMonitor()
+    path = monitor.start_telemetry(str(tmp_path / "frames.cttl"), probes=("main_loop_active", "movement_input"))
+    done = threading.Event()
+
+    def dispatcher():
+        monitor.start_probe("movement_input")
+        monitor.stop_probe("movement_input")
+        done.set()
+
+    monitor.start_probe("main_loop_active")
+    thread = threading.Thread(target=dispatcher)
+    thread.start()
+    done.wait(2.0)
+    monitor.stop_probe("main_loop_active")
+    monitor.record_frame(0.001)
+    thread.join()
+    monitor.record_frame(0.001)  # Nothing new on the other thread
+    monitor.stop_telemetry()
+
+    data = load_telemetry(path)
+    assert data["movement_input_ms"][0] >= 0.0
+    assert math.isnan(data["movement_input_ms"][1])
+    assert not math.isnan(data["main_loop_active_ms"][0])
@@ -0,0 +1,122 @@
+"""
+Tests for the synthetic trajectory generators and tracking-error metrics.
+"""
+
+import numpy as np
+import pytest
+
+from core.motion_engine import MotionEngine
+from core.trajectory import PATTERNS, compute_metrics, generate, generate_suite, score_engine, summarize
+
+
+class MockConfig:
+    def __init__(self, prediction_scale=0.0):
+        self.motion_min_cutoff = 0.5
+        self.motion_beta = 0.005
+        self.prediction_scale = prediction_scale
+        self.screen_width = 1920
+        self.screen_height = 1080
+        self.fov_x = 200
+        self.fov_y = 200
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_generate_shapes_and_reproducibility(pattern):
+    batch = generate(pattern, n=16, duration=1.0, rate=200.0, jitter=0.2, seed=4)
+    assert len(batch) == 16
+    for arr in (batch.t, batch.x, batch.y, batch.true_x, batch.true_y):
+        assert arr.shape == (16, 200)
+        assert np.isfinite(arr).all()
+
+    # Jittered but strictly increasing timestamps, starting at 0
+    assert (batch.t[:, 0] == 0.0).all()
+    assert (np.diff(batch.t, axis=1) > 0.0).all()
+
+    again = generate(pattern, n=16, duration=1.0, rate=200.0, jitter=0.2, seed=4)
+    assert np.array_equal(batch.x, again.x)
+
+
+def test_noise_only_affects_observations():
+    batch = generate("sine_strafe", n=8, noise=2.0, seed=1)
+    residual = batch.x - batch.true_x
+    assert residual.std() == pytest.approx(2.0, rel=0.1)
+
+    clean = generate("sine_strafe", n=8, noise=0.0, seed=1)
+    assert np.array_equal(clean.x, clean.true_x)
+
+
+def test_pattern_shapes():
+    # Stop-and-go holds still for part of every cycle
+    stop = generate("stop_and_go", n=4, noise=0.0, seed=2)
+    assert (np.diff(stop.true_x, axis=1) == 0.0).any(axis=1).all()
+
+    # Direction flips reverse velocity on both axes
+    flips = generate("direction_flips", n=4, noise=0.0, seed=2)
+    for axis in (flips.true_x, flips.true_y):
+        sign_changes = np.diff(np.sign(np.diff(axis, axis=1)), axis=1) != 0
+        assert sign_changes.any(axis=1).all()
+
+    # Constant velocity has (numerically) no acceleration
+    line = generate("constant_velocity", n=4, noise=0.0, seed=2)
+    assert np.abs(np.diff(line.true_x, n=2, axis=1)).max() < 1e-9
+
+
+def test_generate_rejects_unknown_pattern():
+    with pytest.raises(ValueError):
+        generate("teleport")
+
+
+def test_metrics_on_known_signals():
+    t = np.arange(480) / 240.0
+    true_x = 500.0 + 200.0 * t
+    true_y = np.full_like(t, 300.0)
+
+    # Output trailing the target by exactly 25ms
+    metrics = compute_metrics(t, true_x - 200.0 * 0.025, true_y, true_x, true_y)
+    assert metrics["rmse"][0] == pytest.approx(5.0)
+    assert metrics["lag"][0] == pytest.approx(0.025)
+    assert metrics["jitter"][0] == pytest.approx(0.0, abs=1e-9)
+    assert np.isnan(metrics["settling_time"][0])  # Target never stops
+
+    # Perfect tracking scored against a future position shows the same lag
+    delayed = compute_metrics(t, true_x, true_y, true_x, true_y, latency=0.025)
+    assert delayed["lag"][0] == pytest.approx(0.025, rel=1e-3)
+
+
+def test_overshoot_and_settling():
+    t = np.arange(480) / 240.0
+    # Target moves to x=100 and stops at t=1s
+    true_x = np.minimum(t, 1.0) * 100.0
+    true_y = np.zeros_like(t)
+
+    # Aim overshoots by 8px at the stop, then decays back
+    out_x = true_x.copy()
+    after = t >= 1.0
+    out_x[after] += 8.0 * np.exp(-(t[after] - 1.0) / 0.05)
+
+    metrics = compute_metrics(t, out_x, true_y, true_x, true_y, settle_tolerance=1.0)
+    assert metrics["overshoot"][0] == pytest.approx(8.0, abs=0.1)
+    # 8 * exp(-s / 0.05) < 1  =>  s > 0.104s
+    assert metrics["settling_time"][0] == pytest.approx(0.104, abs=0.01)
+
+
+def test_summarize_ignores_nan():
+    summary = summarize({"settling_time": np.array([0.1, np.nan, 0.3])})
+    assert summary["settling_time_mean"] == pytest.approx(0.2)
+    assert summary["settling_time_max"] == pytest.approx(0.3)
+
+
+def test_bulk_regression_gate():
+    """CI gate: the default engine must track every pattern within bounds."""
+    suite = generate_suite(n=64, seed=0, duration=2.0, jitter=0.2)
+    engine = MotionEngine(MockConfig(prediction_scale=0.0))
+
+    for pattern, batch in suite.items():
+        summary = summarize(score_engine(engine, batch))
+        assert summary["rmse_mean"] < 20.0, pattern
+        assert 0.0 < summary["lag_mean"] < 0.05, pattern
+        assert summary["overshoot_mean"] < 2.0, pattern
+
+    # Prediction trades lag for lead on steady motion
+    predicted = score_engine(MotionEngine(MockConfig(prediction_scale=1.0)), suite["constant_velocity"])
+    assert summarize(predicted)["lag_mean"] < 0.0
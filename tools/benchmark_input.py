@@ -1,6 +1,16 @@
 import ctypes
+import os
+import sys
+import time
 import timeit
 
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.input_dispatcher import InputDispatcher
+from core.low_level_movement import LowLevelMovementSystem
+from utils.performance_monitor import PerformanceMonitor
+
 
 def benchmark_ctypes_caching():
     # Simulate a user32 object
@@ -31,5 +41,53 @@ def benchmark_ctypes_caching():
     print(f"Lookup (100k): {t1:.4f}s")
     print(f"Cached (100k): {t2:.4f}s")
 
+
+class _RecordingConfig:
+    input_method = "recording"
+    aim_point = 1
+
+
+def benchmark_input_dispatch(targets=20000, substeps=4, frame_interval=1.0 / 144.0):
+    """End-to-end input dispatch cost and cadence using the recording backend (runs headless)."""
+    monitor = PerformanceMonitor()
+    movement = LowLevelMovementSystem(_RecordingConfig(), monitor)
+    backend = movement.backend
+
+    # Synchronous path: aim_at on the logic thread
+    start = time.perf_counter()
+    for i in range(targets):
+        movement.aim_at(960 + (i % 21) - 10, 540 + (i % 11) - 5)
+    sync_us = (time.perf_counter() - start) / targets * 1e6
+    print(f"Sync aim_at: {sync_us:.2f} us/call ({backend.count} moves recorded)")
+
+    # Async path: post at the vision cadence, dispatcher emits micro-moves
+    backend.clear()
+    dispatcher = InputDispatcher(movement, monitor)
+    dispatcher.substeps = substeps
+    dispatcher.start()
+    frames = int(1.0 / frame_interval)
+    post_cost = 0.0
+    try:
+        next_frame = time.perf_counter()
+        for i in range(frames):
+            t0 = time.perf_counter()
+            dispatcher.post(960 + 40 * (1 if i % 2 else -1), 540)
+            post_cost += time.perf_counter() - t0
+            next_frame += frame_interval
+            while time.perf_counter() < next_frame:
+                time.sleep(0.0005)
+    finally:
+        dispatcher.stop()
+
+    stats = backend.get_stats()
+    print(f"Async post(): {post_cost / frames * 1e6:.2f} us/call over {frames} frames")
+    print(
+        f"Output: {stats['moves']:.0f} moves, {stats['rate_hz']:.0f} Hz, "
+        f"avg interval {stats['interval_avg_ms']:.2f} ms, max {stats['interval_max_ms']:.2f} ms"
+    )
+    print(f"Dispatcher: {dispatcher.get_stats()}")
+
+
 if __name__ == "__main__":
     benchmark_ctypes_caching()
+    benchmark_input_dispatch()
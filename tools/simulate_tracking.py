@@ -0,0 +1,76 @@
+import argparse
+import json
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.simulator import simulate, simulation_config
+from core.trajectory import PATTERNS
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Closed-loop tracking simulation (virtual camera, no display needed).")
+    parser.add_argument("--pattern", choices=(*PATTERNS, "all"), default="all", help="Target motion pattern.")
+    parser.add_argument("--duration", type=float, default=2.0, help="Simulated seconds per run.")
+    parser.add_argument("--speed", type=float, default=300.0, help="Typical target speed (px/s).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the target paths.")
+    parser.add_argument("--capture-latency-ms", type=float, default=0.0, help="Age of the scene in captured frames.")
+    parser.add_argument("--input-latency-ms", type=float, default=0.0, help="Delay before a move pans the camera.")
+    parser.add_argument("--refresh-rate", type=float, default=0.0, help="Virtual display Hz (0 = fresh every grab).")
+    parser.add_argument("--sensitivity", type=float, default=1.0, help="Camera pixels per input count.")
+    parser.add_argument("--fps", type=int, default=240, help="Logic loop target FPS.")
+    parser.add_argument("--fov", type=int, default=50, help="FOV (px) in both axes.")
+    parser.add_argument("--min-cutoff", type=float, default=None, help="Override motion_min_cutoff.")
+    parser.add_argument("--beta", type=float, default=None, help="Override motion_beta.")
+    parser.add_argument("--prediction-scale", type=float, default=None, help="Override prediction_scale.")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write the results to this JSON file.")
+    return parser.parse_args()
+
+
+def simulate_tracking():
+    args = parse_args()
+
+    overrides = {"target_fps": args.fps, "fov_x": args.fov, "fov_y": args.fov}
+    if args.min_cutoff is not None:
+        overrides["motion_min_cutoff"] = args.min_cutoff
+    if args.beta is not None:
+        overrides["motion_beta"] = args.beta
+    if args.prediction_scale is not None:
+        overrides["prediction_scale"] = args.prediction_scale
+    config = simulation_config(**overrides)
+
+    patterns = PATTERNS if args.pattern == "all" else (args.pattern,)
+    results = {}
+
+    print("-" * 80)
+    print(f"{'Pattern':<20}{'Acquire (ms)':>14}{'Steady RMS':>12}{'Steady Max':>12}{'Detected':>10}{'FPS':>12}")
+    print("-" * 80)
+    for pattern in patterns:
+        r = simulate(
+            pattern,
+            config=config,
+            duration=args.duration,
+            speed=args.speed,
+            seed=args.seed,
+            capture_latency=args.capture_latency_ms / 1000.0,
+            input_latency=args.input_latency_ms / 1000.0,
+            refresh_rate=args.refresh_rate,
+            sensitivity=args.sensitivity,
+        )
+        results[pattern] = {k: v for k, v in r.items() if k not in ("t", "error")}
+        print(
+            f"{pattern:<20}{r['time_to_acquire'] * 1000.0:>14.1f}{r['steady_state_error']:>12.2f}"
+            f"{r['steady_state_max']:>12.2f}{r['detection_rate'] * 100.0:>9.0f}%{r['fps']:>12.0f}"
+        )
+    print("-" * 80)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results: {args.json_path}")
+
+
+if __name__ == "__main__":
+    simulate_tracking()
@@ -0,0 +1,83 @@
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.motion_tuner import MotionTuner, default_grid, load_trajectory, synthetic_corpus
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Autotune motion_min_cutoff / motion_beta / prediction_scale.")
+    parser.add_argument(
+        "trajectories",
+        nargs="*",
+        help="Recorded trajectories (.npz or .csv with t,x,y columns). Uses a synthetic corpus if omitted.",
+    )
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Detection-to-effect delay to score against.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    parser.add_argument("--grid-size", type=int, default=8, help="Grid points per log-scaled parameter.")
+    parser.add_argument("--top-k", type=int, default=4, help="Grid points to refine locally.")
+    parser.add_argument("--iterations", type=int, default=12, help="Refinement iterations.")
+    parser.add_argument("--fov", type=int, default=200, help="FOV (px) used for prediction clamping.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic corpus.")
+    parser.add_argument("--per-pattern", type=int, default=1, help="Synthetic trajectories per motion pattern.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Relative frame-interval jitter (synthetic corpus).")
+    parser.add_argument("--out-dir", default="tuning", help="Directory for the report and preset.")
+    parser.add_argument("--preset-name", default="tuned", help="Name of the generated preset.")
+    return parser.parse_args()
+
+
+def tune_motion():
+    args = parse_args()
+
+    if args.trajectories:
+        corpus = [load_trajectory(path) for path in args.trajectories]
+    else:
+        corpus = synthetic_corpus(seed=args.seed, per_pattern=args.per_pattern, jitter=args.jitter)
+
+    total_samples = sum(t.t.size for t in corpus)
+    print(f"Corpus: {len(corpus)} trajectories, {total_samples:,} samples")
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    start_time = time.perf_counter()
+
+    with MotionTuner(
+        corpus,
+        workers=args.workers,
+        latency=args.latency_ms / 1000.0,
+        fov_x=args.fov,
+        fov_y=args.fov,
+    ) as tuner:
+        print(f"Searching with {tuner.workers} worker(s)...")
+        results = tuner.run(grid=default_grid(args.grid_size), top_k=args.top_k, iterations=args.iterations)
+
+        report_path = os.path.join(args.out_dir, "tuning_report.json")
+        tuner.write_report(report_path, results)
+        tuner.write_report(os.path.join(args.out_dir, "tuning_report.csv"), results)
+
+        preset_path = os.path.join(args.out_dir, f"preset_{args.preset_name}.json")
+        tuner.write_preset(preset_path, results[0], name=args.preset_name)
+        evaluations = tuner.evaluation_count
+
+    total_time = time.perf_counter() - start_time
+
+    print("-" * 72)
+    print(f"{'Rank':<6}{'Min Cutoff':>12}{'Beta':>12}{'Pred Scale':>12}{'RMSE (px)':>12}")
+    print("-" * 72)
+    for rank, r in enumerate(results[:10], start=1):
+        print(
+            f"{rank:<6}{r['motion_min_cutoff']:>12.3f}{r['motion_beta']:>12.4f}"
+            f"{r['prediction_scale']:>12.2f}{r['rmse']:>12.2f}"
+        )
+    print("-" * 72)
+    print(f"{evaluations} evaluations in {total_time:.1f}s")
+    print(f"Report: {report_path}")
+    print(f"Preset: {preset_path}")
+    print("Apply with: config.apply_preset(config.load_preset_file(path))")
+
+
+if __name__ == "__main__":
+    tune_motion()
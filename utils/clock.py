@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+"""
+Clock Utility
+
+Injectable time source for the tracking pipeline.
+- `SystemClock`: Wall clock (`time.perf_counter`) paced by a high-resolution
+  kernel timer (see `utils/precision_sleep.py`).
+- `SimulatedClock`: Manually advanced clock for deterministic, faster-than-real-time
+  simulation. Sleeping jumps straight to the deadline.
+
+Hot paths should cache the bound method once (e.g. `now = clock.perf_counter`)
+rather than resolving it every frame.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from utils.precision_sleep import PrecisionSleeper, create_precision_sleeper
+
+
+class Clock(ABC):
+    """
+    Abstract base class for time sources.
+    """
+
+    @abstractmethod
+    def perf_counter(self) -> float:
+        """Monotonic time in seconds."""
+        pass
+
+    @abstractmethod
+    def perf_counter_ns(self) -> int:
+        """Monotonic time in integer nanoseconds."""
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """Block for (at least) the given duration."""
+        pass
+
+    @abstractmethod
+    def sleep_until(self, deadline: float) -> float:
+        """
+        Block until `perf_counter()` reaches the deadline.
+
+        Returns:
+            Wake-up error in seconds (0.0 if the deadline had already passed).
+        """
+        pass
+
+
+class SystemClock(Clock):
+    """
+    Real time backed by `time.perf_counter`.
+    """
+
+    def __init__(self, sleeper: PrecisionSleeper | None = None) -> None:
+        # Created on first use so importing the module never touches the OS timer APIs
+        self._sleeper = sleeper
+
+    @property
+    def sleeper(self) -> PrecisionSleeper:
+        if self._sleeper is None:
+            self._sleeper = create_precision_sleeper()
+        return self._sleeper
+
+    def perf_counter(self) -> float:
+        return time.perf_counter()
+
+    def perf_counter_ns(self) -> int:
+        return time.perf_counter_ns()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def sleep_until(self, deadline: float) -> float:
+        """Kernel timer wait plus a ~100µs spin tail (sleep + 1.5ms spin where no timer is available)"""
+        return self.sleeper.sleep_until(deadline)
+
+
+class SimulatedClock(Clock):
+    """
+    Deterministic clock advanced explicitly (or by sleeping).
+
+    Time is kept as integer nanoseconds so repeated advances never accumulate
+    floating-point drift and runs are bit-reproducible.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now_ns = int(round(start * 1e9))
+        self._lock = threading.Lock()
+
+    def perf_counter(self) -> float:
+        return self._now_ns / 1e9
+
+    def perf_counter_ns(self) -> int:
+        return self._now_ns
+
+    def advance(self, seconds: float) -> None:
+        """Move time forward (negative values are ignored: the clock is monotonic)."""
+        if seconds > 0:
+            with self._lock:
+                self._now_ns += int(round(seconds * 1e9))
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+
+    def sleep_until(self, deadline: float) -> float:
+        with self._lock:
+            deadline_ns = int(round(deadline * 1e9))
+            if deadline_ns > self._now_ns:
+                self._now_ns = deadline_ns
+        return 0.0
+
+
+# Shared default instance (stateless)
+SYSTEM_CLOCK = SystemClock()
@@ -7,6 +7,8 @@ Handles loading and saving configuration settings.
 OPTIMIZATIONS (V3.3.0 ULTRATHINK):
 - Implements Observer Pattern via `__setattr__` override.
 - Provides O(1) version integer for rapid change detection in hot loops.
+- Publishes a frozen `ConfigSnapshot` per version: hot paths read one consistent
+  set of values per frame with plain slot reads, and pick up changes immediately.
 - Atomic file I/O for robust persistence.
 """
 
@@ -28,6 +30,7 @@ class Config:
     screen_height: int
     target_color: int
     _version: int
+    _snapshot: "ConfigSnapshot | None"
     FOV_COLOR: tuple[int, int, int]
     color_tolerance: int
     # search_area removed per user request
@@ -39,9 +42,27 @@ class Config:
     motion_min_cutoff: float
     motion_beta: float
     prediction_scale: float
+    prediction_mode: str
     start_key: str
     stop_key: str
     target_fps: int
+    loop_mode: str
+    async_input: bool
+    output_substeps: int
+    idle_throttle: bool
+    idle_scan_fps: int
+    idle_after_misses: int
+    trace_spans: bool
+    telemetry_stream: bool
+    metrics_endpoint: bool
+    metrics_port: int
+    sampling_profiler: bool
+    profiler_interval_ms: int
+    gc_tracking: bool
+    gc_freeze: bool
+    slow_frame_forensics: bool
+    slow_frame_factor: float
+    input_method: str
     enabled: bool
     debug_mode: bool
     color_history: list[int]
@@ -62,10 +83,43 @@ class Config:
         "motion_min_cutoff": {"type": float, "default": 0.5, "min": 0.01, "max": 25.0},
         "motion_beta": {"type": float, "default": 0.005, "min": 0.0001, "max": 0.3},
         "prediction_scale": {"type": float, "default": 1.0, "min": 0.0, "max": 10.0},
+        # "manual": fixed 0.1s horizon; "auto": horizon follows measured capture-to-input latency
+        "prediction_mode": {"type": str, "default": "manual", "options": ["manual", "auto"]},
         "start_key": {"type": str, "default": "page_up"},
         "stop_key": {"type": str, "default": "page_down"},
         "target_fps": {"type": int, "default": 240, "min": 30, "max": 1000},
         "capture_method": {"type": str, "default": "mss", "options": ["mss", "dxgi", "bettercam"]},
+        # "fixed": pace the loop at target_fps; "event": wake once per new captured frame
+        "loop_mode": {"type": str, "default": "fixed", "options": ["fixed", "event"]},
+        # Send input from a dedicated thread (latest-wins) instead of inside the logic loop
+        "async_input": {"type": bool, "default": False},
+        # Split each correction into N timed micro-moves spanning one vision frame (1 = off)
+        "output_substeps": {"type": int, "default": 1, "min": 1, "max": 16},
+        # Drop to idle_scan_fps after idle_after_misses empty frames; the first hit restores target_fps.
+        # Worst-case extra acquire delay is one idle interval (1 / idle_scan_fps).
+        "idle_throttle": {"type": bool, "default": False},
+        "idle_scan_fps": {"type": int, "default": 30, "min": 10, "max": 240},
+        "idle_after_misses": {"type": int, "default": 120, "min": 1, "max": 10000},
+        # Keep every probe as a per-frame span in a fixed ring (Chrome trace export from the Stats tab)
+        "trace_spans": {"type": bool, "default": False},
+        # Stream one record per frame to logs/telemetry/*.cttl (load with utils.telemetry_sink.load_telemetry)
+        "telemetry_stream": {"type": bool, "default": False},
+        # Serve Prometheus-format metrics at http://127.0.0.1:<metrics_port>/metrics (localhost only)
+        "metrics_endpoint": {"type": bool, "default": False},
+        "metrics_port": {"type": int, "default": 9464, "min": 1024, "max": 65535},
+        # Sample the logic thread's stack every N ms (collapsed stacks for flame graphs, Stats tab export)
+        "sampling_profiler": {"type": bool, "default": False},
+        "profiler_interval_ms": {"type": int, "default": 5, "min": 1, "max": 100},
+        # Record GC pauses and per-frame allocations; gc_freeze (with tracking) also gc.freeze()s startup
+        # objects and holds off gen2 collections while the loop runs
+        "gc_tracking": {"type": bool, "default": False},
+        "gc_freeze": {"type": bool, "default": False},
+        # Write a context snapshot (recent frames, probes, GC, stack) to logs/slow_frames/ when a frame takes
+        # longer than slow_frame_factor x the rolling median (at most one snapshot per 5 s)
+        "slow_frame_forensics": {"type": bool, "default": False},
+        "slow_frame_factor": {"type": float, "default": 3.0, "min": 1.5, "max": 20.0},
+        # "recording" sends nothing and timestamps every move (headless benchmarks)
+        "input_method": {"type": str, "default": "sendinput", "options": ["sendinput", "ghub", "recording"]},
         "enabled": {"type": bool, "default": False},
         "debug_mode": {"type": bool, "default": False},
         "color_history": {"type": list, "default": []},
@@ -81,6 +135,7 @@ class Config:
         # Initialize versioning (ULTRATHINK Optimization)
         # Use super().__setattr__ to bypass the overridden __setattr__ during init
         super().__setattr__("_version", 0)
+        super().__setattr__("_snapshot", None)
 
         for key, schema in self.DEFAULT_CONFIG.items():
             setattr(self, key, schema["default"])
@@ -112,6 +167,22 @@ class Config:
             # We use super() to set _version to avoid re-triggering logic, though it's safe either way
             super().__setattr__("_version", self._version + 1)
 
+    def snapshot(self) -> "ConfigSnapshot":
+        """
+        Frozen view of the current settings, rebuilt only when the version changes.
+
+        The new snapshot is published with a single reference store, so a reader
+        holds either the old or the new one, never a mix of both.
+        """
+        snap = self._snapshot
+        version = self._version
+        if snap is None or snap.version != version:
+            # Version is read before the values: a concurrent update yields a snapshot
+            # labelled with the older version, which the next call simply rebuilds.
+            snap = ConfigSnapshot(self, version)
+            super().__setattr__("_snapshot", snap)
+        return snap
+
     def validate(self, key: str, value: Any) -> Any:
         """
         Validates and repairs a specific configuration value using a declarative approach.
@@ -509,6 +580,46 @@ class Config:
 
         return True
 
+    def register_preset(self, preset_name: str, values: dict[str, Any]) -> None:
+        """
+        Register (or replace) a preset on this instance so `apply_preset` can use it.
+
+        Args:
+            preset_name: Name of the preset
+            values: Config keys and values; unknown keys are dropped, values are validated
+        """
+        validated = {key: self.validate(key, value) for key, value in values.items() if key in self.DEFAULT_CONFIG}
+        # Copy-on-write: never mutate the class-level PRESETS shared by all instances
+        self.PRESETS = {**self.PRESETS, preset_name: validated}
+
+    def load_preset_file(self, filepath: str) -> str:
+        """
+        Load a preset file (e.g. written by tools/tune_motion.py) and register it.
+
+        The file holds `{"name": ..., "values": {...}}`.
+
+        Args:
+            filepath: Path to the preset JSON file
+
+        Returns:
+            Name of the registered preset, or "" on failure.
+        """
+        try:
+            with open(filepath, encoding="utf-8") as f:
+                data = json.load(f)
+
+            preset_name = str(data["name"])
+            values = data["values"]
+            if not isinstance(values, dict):
+                raise ValueError("'values' must be an object")
+
+            self.register_preset(preset_name, values)
+            print(f"Preset '{preset_name}' loaded from {filepath}")
+            return preset_name
+        except Exception as e:
+            print(f"Error loading preset from {filepath}: {e}")
+            return ""
+
     def reset_to_defaults(self) -> None:
         """
         Reset all configuration settings to their default values.
@@ -536,7 +647,15 @@ class Config:
 
     def reset_motion_settings(self) -> None:
         """Reset motion-related settings."""
-        keys = ["motion_min_cutoff", "motion_beta", "prediction_scale", "aim_point", "head_offset", "leg_offset"]
+        keys = [
+            "motion_min_cutoff",
+            "motion_beta",
+            "prediction_scale",
+            "prediction_mode",
+            "aim_point",
+            "head_offset",
+            "leg_offset",
+        ]
         self.reset_section(keys)
 
     def reset_vision_settings(self) -> None:
@@ -575,3 +694,28 @@ class Config:
         except Exception as e:
             print(f"Backup failed: {e}")
             return ""
+
+
+class ConfigSnapshot:
+    """
+    [Archetype A: The Sage - Logic/Data]
+    Immutable per-version copy of every config key, read by the hot paths.
+    """
+
+    __slots__ = ("version", *Config.DEFAULT_CONFIG)
+
+    def __init__(self, config: Config, version: int) -> None:
+        set_slot = object.__setattr__
+        set_slot(self, "version", version)
+        for key in Config.DEFAULT_CONFIG:
+            value = getattr(config, key)
+            set_slot(self, key, tuple(value) if isinstance(value, list) else value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"ConfigSnapshot is read-only (tried to set '{name}')")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"ConfigSnapshot is read-only (tried to delete '{name}')")
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot(version={self.version})"
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+Frame Pacing
+
+Measures how well the fixed-rate loop keeps its schedule: each paced frame has an
+intended start (previous start + frame interval, the deadline `_smart_sleep` waits for)
+and an actual start. The difference is the frame's start error, which is where sleep
+strategies, timer resolution and process priority show up. `record_frame` only sees
+overruns of the work itself.
+
+OPTIMIZATIONS:
+- O(1) per frame: two histogram records, a few counters and one deque append.
+- Session-long distributions come from log-bucketed histograms (no sorting on read);
+  the recent signed errors are kept in a bounded deque for plotting.
+"""
+
+import collections
+
+from utils.latency_histogram import REPORTED_PERCENTILES, LatencyHistogram, percentile_key
+
+# A start later than this fraction of the frame interval counts as a late start (drift counter)
+LATE_START_FRACTION = 0.25
+
+
+class FramePacing:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Start-time error and inter-frame interval tracker for a paced loop.
+
+    Single writer (the logic thread); readers take histogram copies.
+    """
+
+    def __init__(self, history_size: int = 1000) -> None:
+        self.interval_histogram = LatencyHistogram()  # Actual start-to-start interval
+        self.start_error_histogram = LatencyHistogram()  # Lateness vs the intended start (early = 0)
+        self.start_errors: collections.deque[float] = collections.deque(maxlen=history_size)  # Signed, ms
+        self.frames = 0
+        self.late_starts = 0
+        self.early_starts = 0
+        # Signed sum of start errors: how far the loop has fallen behind an ideal fixed-rate schedule
+        self.drift = 0.0
+        self._last_start = 0.0
+
+    def record(self, actual_start: float, intended_start: float, interval: float) -> None:
+        """
+        Record one paced frame start (seconds, loop clock).
+
+        Args:
+            actual_start: When the frame started
+            intended_start: Deadline the loop slept towards (previous start + `interval`)
+            interval: Target frame interval in effect for that deadline
+        """
+        error = actual_start - intended_start
+        self.start_errors.append(error * 1000.0)
+        self.drift += error
+        if error >= 0.0:
+            self.start_error_histogram.record(int(error * 1_000_000_000))
+            if error > interval * LATE_START_FRACTION:
+                self.late_starts += 1
+        else:
+            self.start_error_histogram.record(0)
+            self.early_starts += 1
+
+        last_start = self._last_start
+        if last_start > 0.0 and actual_start > last_start:
+            self.interval_histogram.record(int((actual_start - last_start) * 1_000_000_000))
+        self._last_start = actual_start
+        self.frames += 1
+
+    def break_schedule(self) -> None:
+        """The next start has no predecessor (loop paused or switched to frame-event pacing)."""
+        self._last_start = 0.0
+
+    def get_histograms(self) -> dict[str, LatencyHistogram]:
+        return {
+            "frame_interval": self.interval_histogram.copy(),
+            "start_error": self.start_error_histogram.copy(),
+        }
+
+    def get_stats(self) -> dict[str, float]:
+        """`interval_pXX_ms`, `start_error_pXX_ms`, max, late/early start counts and drift."""
+        stats = {
+            "frames": float(self.frames),
+            "late_starts": float(self.late_starts),
+            "early_starts": float(self.early_starts),
+            "drift_ms": self.drift * 1000.0,
+        }
+        histograms = self.get_histograms()
+        for prefix, histogram in (
+            ("interval", histograms["frame_interval"]),
+            ("start_error", histograms["start_error"]),
+        ):
+            for p, value_ns in histogram.percentiles(REPORTED_PERCENTILES).items():
+                stats[f"{prefix}_{percentile_key(p)}_ms"] = value_ns / 1_000_000.0
+            stats[f"{prefix}_max_ms"] = histogram.max_ns / 1_000_000.0
+        return stats
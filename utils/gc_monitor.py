@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+"""
+GC Monitor
+
+Runtime check of the "zero-allocation hot path" claims: records every garbage-collection
+pause (via `gc.callbacks`) and the net allocation count of each logic-loop frame
+(`sys.getallocatedblocks` deltas), so slow frames can be attributed to GC or not.
+
+OPTIMIZATIONS:
+- The GC callback does two clock reads and a histogram record per collection; nothing
+  runs between collections.
+- Per-frame accounting is one `sys.getallocatedblocks()` call and a subtraction
+  (tracemalloc would trace every allocation and slow the loop down several-fold).
+- Optional freeze mode: after startup, `gc.collect()` + `gc.freeze()` move every live object
+  to the permanent generation (never scanned again) and gen2 collections are held off by
+  a high threshold, so the remaining collections only scan young objects created by the loop.
+"""
+
+import collections
+import gc
+import sys
+import time
+
+from utils.latency_histogram import LatencyHistogram
+
+# Gen2 threshold while frozen: effectively "never" for a loop that allocates nothing per frame
+GEN2_HOLD_THRESHOLD = 1_000_000
+# Recent pauses kept for inspection
+PAUSE_HISTORY = 1024
+
+
+class GCMonitor:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    GC pause recorder and per-frame allocation counter.
+
+    `end_frame` is called once per frame by the loop thread (through
+    `PerformanceMonitor.record_frame`); the GC callback may fire on any thread.
+    """
+
+    def __init__(self) -> None:
+        self.installed = False
+        self.frozen = False
+        self._saved_threshold: tuple[int, int, int] | None = None
+        self._perf_counter_ns = time.perf_counter_ns
+        self._getallocatedblocks = sys.getallocatedblocks
+
+        self.frame = 0  # Index of the frame in progress (pauses are attributed to it)
+        self.pause_histogram = LatencyHistogram()
+        self.pauses_by_generation = [0, 0, 0]
+        # (frame, generation, duration_ms, objects collected), newest last
+        self.recent_pauses: collections.deque[tuple[int, int, float, int]] = collections.deque(maxlen=PAUSE_HISTORY)
+        self._pause_start_ns = 0
+        self._frame_pause_ns = 0
+
+        self._last_blocks = self._getallocatedblocks()
+        self.alloc_frames = 0
+        self.alloc_total = 0
+        self.alloc_max = 0
+
+        # Slow-frame correlation (slow = frame missed its deadline)
+        self.slow_frames = 0
+        self.slow_frames_with_gc = 0
+        self.slow_frame_gc_ns = 0
+
+    def install(self) -> None:
+        if not self.installed:
+            gc.callbacks.append(self._on_gc)
+            self.installed = True
+            self._last_blocks = self._getallocatedblocks()
+
+    def uninstall(self) -> None:
+        if self.installed:
+            try:
+                gc.callbacks.remove(self._on_gc)
+            except ValueError:
+                pass
+            self.installed = False
+        self.unfreeze()
+
+    def freeze(self) -> None:
+        """Collect once, move all survivors to the permanent generation and hold off gen2."""
+        if self.frozen:
+            return
+        gc.collect()
+        gc.freeze()
+        self._saved_threshold = gc.get_threshold()
+        gen0, gen1, _ = self._saved_threshold
+        gc.set_threshold(gen0, gen1, GEN2_HOLD_THRESHOLD)
+        self.frozen = True
+
+    def unfreeze(self) -> None:
+        if not self.frozen:
+            return
+        if self._saved_threshold is not None:
+            gc.set_threshold(*self._saved_threshold)
+            self._saved_threshold = None
+        gc.unfreeze()
+        self.frozen = False
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._pause_start_ns = self._perf_counter_ns()
+            return
+        duration_ns = self._perf_counter_ns() - self._pause_start_ns
+        generation = info.get("generation", 0)
+        self.pause_histogram.record(duration_ns)
+        self.pauses_by_generation[generation] += 1
+        self.recent_pauses.append((self.frame, generation, duration_ns / 1_000_000.0, info.get("collected", 0)))
+        self._frame_pause_ns += duration_ns
+
+    def end_frame(self, slow: bool) -> tuple[float, int]:
+        """
+        Close the current frame.
+
+        Returns:
+            (GC pause inside the frame in ms, net allocated blocks during the frame)
+        """
+        blocks = self._getallocatedblocks()
+        allocated = blocks - self._last_blocks
+        self._last_blocks = blocks
+        self.alloc_frames += 1
+        self.alloc_total += allocated
+        if allocated > self.alloc_max:
+            self.alloc_max = allocated
+
+        pause_ns = self._frame_pause_ns
+        self._frame_pause_ns = 0
+        if slow:
+            self.slow_frames += 1
+            if pause_ns:
+                self.slow_frames_with_gc += 1
+                self.slow_frame_gc_ns += pause_ns
+        self.frame += 1
+        return pause_ns / 1_000_000.0, allocated
+
+    def get_pause_histogram(self) -> LatencyHistogram:
+        return self.pause_histogram.copy()
+
+    def get_stats(self) -> dict[str, float]:
+        pauses = self.pause_histogram.copy()
+        gen0, gen1, gen2 = self.pauses_by_generation
+        return {
+            "pauses": float(pauses.count),
+            "gen0_pauses": float(gen0),
+            "gen1_pauses": float(gen1),
+            "gen2_pauses": float(gen2),
+            "pause_total_ms": pauses.total_ns / 1_000_000.0,
+            "pause_max_ms": pauses.max_ns / 1_000_000.0,
+            "pause_p99_ms": pauses.percentile(99.0) / 1_000_000.0,
+            "alloc_blocks_avg": self.alloc_total / self.alloc_frames if self.alloc_frames else 0.0,
+            "alloc_blocks_max": float(self.alloc_max),
+            "slow_frames": float(self.slow_frames),
+            "slow_frames_with_gc": float(self.slow_frames_with_gc),
+            "slow_frame_gc_ms": self.slow_frame_gc_ns / 1_000_000.0,
+            "frozen": float(self.frozen),
+        }
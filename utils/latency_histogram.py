@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+"""
+Latency Histogram
+
+Fixed-memory, log-bucketed (HDR-style) histogram of durations in integer nanoseconds.
+- Values below 2**SUB_BUCKET_BITS ns get exact buckets; above that every power of two
+  is split into 2**(SUB_BUCKET_BITS - 1) linear sub-buckets, so any recorded value is
+  known to within 1 / 2**(SUB_BUCKET_BITS - 1) (< 0.8%) of itself.
+- Recording is O(1): one `bit_length`, a shift and a counter increment. Counts live in a
+  pre-sized Python list (an int increment there is several times cheaper than a NumPy
+  scalar update); readers convert them to NumPy for percentile math.
+- Histograms with the same layout merge by adding their counts, so per-thread
+  histograms can be combined into one snapshot on the reader side.
+- Durations above `MAX_TRACKABLE_NS` land in the top bucket; the exact max is kept separately.
+"""
+
+import numpy as np
+
+SUB_BUCKET_BITS = 8
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+# 2**36 ns is about 68.7s, far beyond any frame or probe duration worth resolving
+MAX_TRACKABLE_NS = (1 << 36) - 1
+BUCKET_COUNT = (MAX_TRACKABLE_NS.bit_length() - SUB_BUCKET_BITS + 2) * SUB_BUCKET_HALF
+
+# Percentiles reported by PerformanceMonitor (get_stats, get_probe_stats, CSV export)
+REPORTED_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def percentile_key(percentile: float) -> str:
+    """Stats key for a percentile: 50 -> "p50", 99.9 -> "p99_9"."""
+    return "p" + f"{percentile:g}".replace(".", "_")
+
+
+def bucket_index(value_ns: int) -> int:
+    """Bucket holding `value_ns` (clamped to [0, MAX_TRACKABLE_NS])."""
+    if value_ns >= MAX_TRACKABLE_NS:
+        value_ns = MAX_TRACKABLE_NS
+    elif value_ns < 0:
+        value_ns = 0
+    shift = value_ns.bit_length() - SUB_BUCKET_BITS
+    if shift < 0:
+        shift = 0
+    return shift * SUB_BUCKET_HALF + (value_ns >> shift)
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """Lowest value and width (ns) of a bucket."""
+    shift = max(0, index // SUB_BUCKET_HALF - 1)
+    return (index - shift * SUB_BUCKET_HALF) << shift, 1 << shift
+
+
+# Highest value held by each bucket (for cumulative bucket queries)
+_BUCKET_UPPER = np.array([sum(bucket_bounds(i)) - 1 for i in range(BUCKET_COUNT)], dtype=np.int64)
+
+
+class LatencyHistogram:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Log-bucketed duration histogram with exact count, sum, min and max.
+
+    Single writer: `record` takes no lock. Readers should work on a `copy()`.
+    """
+
+    __slots__ = ("counts", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self.counts: list[int] = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int) -> None:
+        """Record one duration in integer nanoseconds (negative values, e.g. clock skew, count as 0)."""
+        value_ns = max(value_ns, 0)
+        # bucket_index inlined (hot path)
+        shift = value_ns.bit_length() - SUB_BUCKET_BITS
+        if shift <= 0:
+            index = value_ns
+        elif value_ns < MAX_TRACKABLE_NS:
+            index = shift * SUB_BUCKET_HALF + (value_ns >> shift)
+        else:
+            index = BUCKET_COUNT - 1
+        self.counts[index] += 1
+        if self.count == 0 or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.total_ns += value_ns
+        self.count += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples to this one."""
+        if other.count == 0:
+            return
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        if self.count == 0 or other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        if other.max_ns > self.max_ns:
+            self.max_ns = other.max_ns
+        self.total_ns += other.total_ns
+        self.count += other.count
+
+    def copy(self) -> "LatencyHistogram":
+        snap = LatencyHistogram()
+        snap.counts = list(self.counts)
+        snap.count = self.count
+        snap.total_ns = self.total_ns
+        snap.min_ns = self.min_ns
+        snap.max_ns = self.max_ns
+        return snap
+
+    def reset(self) -> None:
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentiles(self, percentiles: tuple[float, ...] = REPORTED_PERCENTILES) -> dict[float, float]:
+        """
+        Value (ns) at each percentile: the midpoint of the bucket holding that rank,
+        clamped to the exact min/max. Returns 0.0 for every percentile when empty.
+        """
+        if self.count == 0:
+            return {p: 0.0 for p in percentiles}
+
+        cumulative = np.cumsum(np.asarray(self.counts, dtype=np.int64))
+        # Rank against the bucket total: a copy taken mid-`record` may disagree with `count` by one
+        total = int(cumulative[-1])
+        result = {}
+        for p in percentiles:
+            rank = max(1, int(np.ceil(min(max(p, 0.0), 100.0) / 100.0 * total)))
+            index = int(np.searchsorted(cumulative, rank))
+            low, width = bucket_bounds(index)
+            result[p] = float(min(max(low + (width - 1) / 2.0, self.min_ns), self.max_ns))
+        return result
+
+    def cumulative_counts(self, bounds_ns: list[int]) -> list[int]:
+        """
+        Samples at or below each bound (ascending), as Prometheus-style cumulative buckets.
+        A bucket straddling a bound counts toward the next bound (same relative precision).
+        """
+        cumulative = np.cumsum(np.asarray(self.counts, dtype=np.int64))
+        ends = np.searchsorted(_BUCKET_UPPER, np.asarray(bounds_ns, dtype=np.int64), side="right")
+        return [int(cumulative[end - 1]) if end > 0 else 0 for end in ends]
+
+    def percentile(self, percentile: float) -> float:
+        """Value (ns) at a single percentile (see `percentiles`)."""
+        return self.percentiles((percentile,))[percentile]
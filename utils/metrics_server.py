@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+
+"""
+Metrics Server
+
+Opt-in, localhost-only HTTP endpoint serving `PerformanceMonitor` counters in the
+Prometheus text exposition format (version 0.0.4), so a session can be scraped by
+Prometheus / Grafana Agent or inspected with `curl http://127.0.0.1:<port>/metrics`.
+
+OPTIMIZATIONS:
+- Near-zero cost on the hot path: while the server runs, the loop swaps in a read-only
+  `MetricsSnapshot` every 250ms (a few histogram copies). Scrapes render from that snapshot
+  and the lock-free per-thread probe histograms on the server's own daemon thread, so they
+  never take the lock `record_frame` uses.
+- Histograms are derived from the session-long log-bucketed histograms by a cumulative
+  sum over fixed `le` bounds; no per-sample state is kept for the endpoint.
+- Bound to 127.0.0.1 only; the server never listens on external interfaces.
+"""
+
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import psutil
+
+from utils.latency_histogram import LatencyHistogram
+
+METRICS_HOST = "127.0.0.1"
+DEFAULT_METRICS_PORT = 9464
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram bucket upper bounds (seconds): 100µs .. 1s, covering probe and frame times
+HISTOGRAM_BOUNDS_SEC = (0.0001, 0.00025, 0.0005, 0.001, 0.002, 0.004, 0.008, 0.016, 0.033, 0.066, 0.125, 0.25, 0.5, 1.0)
+_HISTOGRAM_BOUNDS_NS = [round(bound * 1_000_000_000) for bound in HISTOGRAM_BOUNDS_SEC]
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+class _Exposition:
+    """Accumulates metric families in text exposition order (HELP/TYPE once per family)."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self._declared: set[str] = set()
+
+    def declare(self, name: str, metric_type: str, help_text: str) -> None:
+        if name in self._declared:
+            return
+        self._declared.add(name)
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+
+    def sample(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        self.lines.append(f"{name}{_labels(labels or {})} {_format_value(value)}")
+
+    def histogram(self, name: str, histogram: LatencyHistogram, labels: dict[str, str] | None = None) -> None:
+        """Emit `_bucket`/`_sum`/`_count` samples (seconds) for a nanosecond histogram."""
+        labels = labels or {}
+        for bound, cumulative in zip(
+            HISTOGRAM_BOUNDS_SEC, histogram.cumulative_counts(_HISTOGRAM_BOUNDS_NS), strict=True
+        ):
+            self.sample(f"{name}_bucket", cumulative, {**labels, "le": repr(bound)})
+        self.sample(f"{name}_bucket", histogram.count, {**labels, "le": "+Inf"})
+        self.sample(f"{name}_sum", histogram.total_ns / 1_000_000_000.0, labels)
+        self.sample(f"{name}_count", histogram.count, labels)
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_metrics(perf_monitor: Any, detection: Any = None, process: psutil.Process | None = None) -> str:
+    """
+    Render the current metrics as Prometheus text.
+
+    Args:
+        perf_monitor: PerformanceMonitor to read. Only its published snapshot (see
+            `PerformanceMonitor.start_publishing`; empty until the loop publishes one) and the probe
+            histograms, merged outside the frame lock, are read
+        detection: Optional DetectionSystem, for capture backend name and duplicate-frame counts
+        process: psutil Process for CPU/RSS (defaults to the current process)
+    """
+    out = _Exposition()
+    snapshot = perf_monitor.get_published()
+
+    out.declare("colortracker_frames_total", "counter", "Logic-loop frames recorded this session.")
+    out.sample("colortracker_frames_total", snapshot.total_frames)
+    out.declare("colortracker_missed_frames_total", "counter", "Frames that overran their target frame time.")
+    out.sample("colortracker_missed_frames_total", snapshot.total_missed_frames)
+    out.declare("colortracker_fps", "gauge", "Logic-loop frames per second (last 1s window).")
+    out.sample("colortracker_fps", snapshot.fps)
+    out.declare("colortracker_pipeline_latency_seconds", "gauge", "Capture-to-input pipeline latency (EMA).")
+    out.sample("colortracker_pipeline_latency_seconds", snapshot.pipeline_latency_sec)
+    out.declare("colortracker_wake_error_seconds", "gauge", "Frame-limiter wake-up error (EMA).")
+    out.sample("colortracker_wake_error_seconds", snapshot.wake_error_sec)
+
+    out.declare("colortracker_frame_seconds", "histogram", "Logic-loop frame time.")
+    out.histogram("colortracker_frame_seconds", snapshot.frame_histogram)
+    out.declare("colortracker_frame_start_error_seconds", "histogram", "Paced frame start minus its intended start.")
+    out.histogram("colortracker_frame_start_error_seconds", snapshot.start_error_histogram)
+    out.declare("colortracker_frame_late_starts_total", "counter", "Paced frames that started over 25% late.")
+    out.sample("colortracker_frame_late_starts_total", snapshot.late_starts)
+    input_histograms = snapshot.input_histograms
+    out.declare("colortracker_capture_to_input_seconds", "histogram", "Grab call to SendInput return.")
+    out.histogram("colortracker_capture_to_input_seconds", input_histograms["capture_to_input"])
+    out.declare(
+        "colortracker_input_frame_age_seconds",
+        "histogram",
+        "Frame acquisition to SendInput return (includes cached-frame reuse).",
+    )
+    out.histogram("colortracker_input_frame_age_seconds", input_histograms["input_frame_age"])
+
+    if snapshot.gc_pause_histogram is not None:
+        out.declare("colortracker_gc_pause_seconds", "histogram", "Garbage-collection pauses (all generations).")
+        out.histogram("colortracker_gc_pause_seconds", snapshot.gc_pause_histogram)
+        out.declare("colortracker_gc_collections_total", "counter", "Garbage collections by generation.")
+        for generation, count in enumerate(snapshot.gc_pauses_by_generation):
+            out.sample("colortracker_gc_collections_total", count, {"generation": str(generation)})
+        out.declare("colortracker_slow_frames_with_gc_total", "counter", "Missed frames that contained a GC pause.")
+        out.sample("colortracker_slow_frames_with_gc_total", snapshot.slow_frames_with_gc)
+
+    if snapshot.slow_frame_snapshots is not None:
+        out.declare("colortracker_slow_frame_snapshots_total", "counter", "Slow-frame snapshots written.")
+        out.sample("colortracker_slow_frame_snapshots_total", snapshot.slow_frame_snapshots)
+        out.declare(
+            "colortracker_slow_frame_snapshots_suppressed_total", "counter", "Slow frames skipped by the rate limit."
+        )
+        out.sample("colortracker_slow_frame_snapshots_suppressed_total", snapshot.slow_frame_suppressed)
+
+    probe_names = perf_monitor.get_probe_names()
+    if probe_names:
+        out.declare("colortracker_probe_seconds", "histogram", "Duration of instrumented pipeline stages.")
+        for name in probe_names:
+            out.histogram("colortracker_probe_seconds", perf_monitor.get_probe_histogram(name), {"probe": name})
+
+    if detection is not None:
+        capture = detection.get_capture_stats()
+        frames = capture["frames"]
+        duplicates = capture["duplicate_frames"]
+        out.declare("colortracker_capture_info", "gauge", "Active capture backend.")
+        out.sample("colortracker_capture_info", 1, {"backend": capture["backend"]})
+        out.declare("colortracker_capture_frames_total", "counter", "Frames returned by the capture backend.")
+        out.sample("colortracker_capture_frames_total", frames)
+        out.declare(
+            "colortracker_capture_duplicate_frames_total", "counter", "Captured frames that repeated the previous one."
+        )
+        out.sample("colortracker_capture_duplicate_frames_total", duplicates)
+        out.declare("colortracker_capture_duplicate_ratio", "gauge", "Share of captured frames that were duplicates.")
+        out.sample("colortracker_capture_duplicate_ratio", duplicates / frames if frames else 0.0)
+
+    try:
+        process = process or psutil.Process(os.getpid())
+        cpu = process.cpu_times()
+        rss = process.memory_info().rss
+    except psutil.Error:
+        pass
+    else:
+        out.declare("process_cpu_seconds_total", "counter", "Total user and system CPU time spent in seconds.")
+        out.sample("process_cpu_seconds_total", cpu.user + cpu.system)
+        out.declare("process_resident_memory_bytes", "gauge", "Resident memory size in bytes.")
+        out.sample("process_resident_memory_bytes", rss)
+
+    return out.render()
+
+
+class MetricsServer:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Background HTTP server exposing `/metrics` on 127.0.0.1.
+    """
+
+    def __init__(self, perf_monitor: Any, detection: Any = None, port: int = DEFAULT_METRICS_PORT) -> None:
+        """
+        Args:
+            perf_monitor: PerformanceMonitor to expose
+            detection: Optional DetectionSystem (capture backend metrics)
+            port: TCP port on 127.0.0.1 (0 picks a free port; see `port` after `start`)
+        """
+        self.perf_monitor = perf_monitor
+        self.detection = detection
+        self.port = port
+        self._process = psutil.Process(os.getpid())
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    @property
+    def url(self) -> str:
+        return f"http://{METRICS_HOST}:{self.port}/metrics"
+
+    def render(self) -> str:
+        return render_metrics(self.perf_monitor, self.detection, self._process)
+
+    def start(self) -> None:
+        """Start serving (raises OSError if the port cannot be bound) and have the loop publish snapshots."""
+        if self._server is not None:
+            return
+
+        owner = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                try:
+                    body = owner.render().encode("utf-8")
+                except Exception as e:
+                    self.send_error(500, explain=str(e))
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass  # Scrapes every few seconds would flood the log
+
+        server = ThreadingHTTPServer((METRICS_HOST, self.port), _Handler)
+        server.daemon_threads = True
+        self.port = server.server_address[1]
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+        self.perf_monitor.start_publishing()
+
+    def stop(self) -> None:
+        server = self._server
+        if server is None:
+            return
+        self._server = None
+        self.perf_monitor.stop_publishing()
+        server.shutdown()
+        server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
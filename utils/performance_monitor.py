@@ -1,7 +1,165 @@
 import collections
 import csv
+import os
 import threading
-import time
+import weakref
+
+import numpy as np
+from numpy.typing import NDArray
+
+from utils.clock import SYSTEM_CLOCK, Clock
+from utils.frame_pacing import FramePacing
+from utils.gc_monitor import GCMonitor
+from utils.latency_histogram import REPORTED_PERCENTILES, LatencyHistogram, percentile_key
+from utils.slow_frame_forensics import SlowFrameForensics, default_forensics_dir
+from utils.span_trace import DEFAULT_TRACE_CAPACITY, SpanRing, chrome_trace_events, write_chrome_trace
+from utils.telemetry_sink import TelemetrySink, default_telemetry_path
+
+
+def percentiles_csv_path(filepath: str) -> str:
+    """Companion file of a history CSV holding its percentile table: stats.csv -> stats_percentiles.csv"""
+    root, ext = os.path.splitext(filepath)
+    return f"{root}_percentiles{ext or '.csv'}"
+
+
+# Span rings kept from exited threads, so a trace exported after a worker stops still shows it
+RETIRED_TRACE_THREADS = 8
+# Seconds between metrics snapshots published by the logic thread (see start_publishing)
+DEFAULT_PUBLISH_INTERVAL = 0.25
+# Latency samples another thread may hand over between two frames (oldest dropped beyond this)
+LATENCY_HANDOFF_SIZE = 256
+
+
+class _ProbeRing:
+    """
+    Pre-allocated ring of probe durations (ms) with a single writer thread.
+    The sample is stored before `count` is bumped, so a reader never sees an unwritten slot.
+    """
+
+    __slots__ = ("samples", "count")
+
+    def __init__(self, size: int) -> None:
+        self.samples = np.zeros(size, dtype=np.float64)
+        self.count = 0
+
+    def append(self, value: float) -> None:
+        samples = self.samples
+        samples[self.count % samples.shape[0]] = value
+        self.count += 1
+
+    def snapshot(self) -> NDArray[np.float64]:
+        """Copy of the samples currently in the window (oldest order is not preserved)."""
+        count = self.count
+        if count < self.samples.shape[0]:
+            return self.samples[:count].copy()
+        return self.samples.copy()
+
+
+class _ThreadProbes:
+    """Probe state owned by one thread: open start times, recent-sample rings, session histograms and spans."""
+
+    __slots__ = ("thread", "active", "rings", "histograms", "trace", "frame_probes", "reported")
+
+    def __init__(self) -> None:
+        # Owning thread (weak: the store must not keep a finished Thread object alive)
+        self.thread = weakref.ref(threading.current_thread())
+        # name -> stack of start times (ns); nested or repeated starts of one name each get a sample
+        self.active: dict[str, list[int]] = {}
+        self.rings: dict[str, _ProbeRing] = {}
+        self.histograms: dict[str, LatencyHistogram] = {}
+        # Span ring, allocated the first time this thread finishes a probe while tracing
+        self.trace: SpanRing | None = None
+        # Probe time (ms) accumulated while per-frame totals are on. On the thread calling
+        # record_frame it is cleared every frame; on other threads (e.g. the input dispatcher)
+        # it keeps growing and record_frame takes the difference to `reported`.
+        self.frame_probes: dict[str, float] = {}
+        # Totals of `frame_probes` already attributed to a frame (written by the record_frame thread only)
+        self.reported: dict[str, float] = {}
+
+
+class MetricsSnapshot:
+    """
+    [Archetype A: The Sage - Logic/Data]
+    Read-only copy of the monitor's session counters and histograms, built by the logic thread
+    (see `PerformanceMonitor.start_publishing`) so other threads can report without its lock.
+    """
+
+    __slots__ = (
+        "time",
+        "total_frames",
+        "total_missed_frames",
+        "fps",
+        "pipeline_latency_sec",
+        "wake_error_sec",
+        "late_starts",
+        "frame_histogram",
+        "start_error_histogram",
+        "input_histograms",
+        # None unless GC tracking / slow-frame forensics were running
+        "gc_pause_histogram",
+        "gc_pauses_by_generation",
+        "slow_frames_with_gc",
+        "slow_frame_snapshots",
+        "slow_frame_suppressed",
+    )
+
+    def __init__(self, monitor: "PerformanceMonitor | None" = None, time: float = 0.0) -> None:
+        """
+        Args:
+            monitor: Monitor to copy; None gives an empty snapshot (nothing published yet)
+            time: Monitor clock time of the copy
+        """
+        set_slot = object.__setattr__
+        set_slot(self, "time", time)
+        if monitor is None:
+            for name in ("total_frames", "total_missed_frames", "late_starts"):
+                set_slot(self, name, 0)
+            for name in ("fps", "pipeline_latency_sec", "wake_error_sec"):
+                set_slot(self, name, 0.0)
+            set_slot(self, "frame_histogram", LatencyHistogram())
+            set_slot(self, "start_error_histogram", LatencyHistogram())
+            set_slot(
+                self,
+                "input_histograms",
+                {"capture_to_input": LatencyHistogram(), "input_frame_age": LatencyHistogram()},
+            )
+            gc_monitor = forensics = None
+        else:
+            set_slot(self, "total_frames", monitor.total_frames)
+            set_slot(self, "total_missed_frames", monitor.total_missed_frames)
+            set_slot(self, "late_starts", monitor.pacing.late_starts)
+            set_slot(self, "fps", monitor.current_fps)
+            set_slot(self, "pipeline_latency_sec", monitor.pipeline_latency_ema)
+            set_slot(self, "wake_error_sec", monitor.wake_error_ema)
+            set_slot(self, "frame_histogram", monitor.frame_histogram.copy())
+            set_slot(self, "start_error_histogram", monitor.pacing.start_error_histogram.copy())
+            set_slot(self, "input_histograms", monitor.get_input_latency_histograms())
+            gc_monitor = monitor.gc_monitor
+            forensics = monitor.forensics
+
+        if gc_monitor is None:
+            set_slot(self, "gc_pause_histogram", None)
+            set_slot(self, "gc_pauses_by_generation", None)
+            set_slot(self, "slow_frames_with_gc", None)
+        else:
+            set_slot(self, "gc_pause_histogram", gc_monitor.get_pause_histogram())
+            set_slot(self, "gc_pauses_by_generation", tuple(gc_monitor.pauses_by_generation))
+            set_slot(self, "slow_frames_with_gc", gc_monitor.slow_frames_with_gc)
+        if forensics is None:
+            set_slot(self, "slow_frame_snapshots", None)
+            set_slot(self, "slow_frame_suppressed", None)
+        else:
+            set_slot(self, "slow_frame_snapshots", forensics.snapshots)
+            set_slot(self, "slow_frame_suppressed", forensics.suppressed)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"MetricsSnapshot is read-only (tried to set '{name}')")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"MetricsSnapshot is read-only (tried to delete '{name}')")
+
+    def __repr__(self) -> str:
+        return f"MetricsSnapshot(time={self.time}, total_frames={self.total_frames})"
 
 
 class PerformanceMonitor:
@@ -13,97 +171,532 @@ class PerformanceMonitor:
     - Lockless Single-Writer Pattern: Zero contention in critical logic loop.
     - Snapshot Reader Pattern: Atomic list copies for safe UI statistics access.
     - Ring Buffer: `collections.deque` for O(1) appends and automatic pruning.
+    - Per-Thread Probes: each thread writes its own pre-allocated NumPy rings without
+      locks; readers merge all threads' rings only when they ask for probe stats.
+    - Latency Histograms: frame times and every probe also feed fixed-memory log-bucketed
+      histograms covering the whole session (p50/p90/p99/p99.9 without sorting).
+    - Span Tracing (opt-in): with `tracing` set, every probe is also kept as a span
+      (thread, frame sequence) in a fixed per-thread ring, dumpable as a Chrome trace.
+    - Telemetry Stream (opt-in): with a `TelemetrySink` attached, `record_frame` hands one
+      columnar record per frame to a background writer (whole-session analysis on disk).
+    - Published Snapshots (opt-in): while publishing, `record_frame` swaps in a fresh
+      `MetricsSnapshot` every interval; scrapers read that reference and never take `_lock`.
     """
 
-    def __init__(self, history_size: int = 1000):
+    def __init__(
+        self, history_size: int = 1000, clock: Clock | None = None, trace_capacity: int = DEFAULT_TRACE_CAPACITY
+    ):
         """
         Initialize the Performance Monitor.
 
         Args:
             history_size: Number of data points to keep for graphs.
+            clock: Time source for FPS and probe timing (defaults to the system clock).
+            trace_capacity: Spans kept per thread while tracing.
         """
         self.history_size = history_size
+        # Guards the history deques and counters; probe registration has its own lock
         self._lock = threading.Lock()
+        self.clock = clock or SYSTEM_CLOCK
+        self._perf_counter = self.clock.perf_counter
+        self._perf_counter_ns = self.clock.perf_counter_ns
 
         # Data stores (Double-ended queues for efficient append/pop)
         self.frame_times = collections.deque(maxlen=history_size)  # ms
         self.fps_history = collections.deque(maxlen=history_size)
         self.detection_times = collections.deque(maxlen=history_size)  # ms
+        # Per frame, aligned with frame_times: (GC pause ms, net allocated blocks), None when not tracked
+        self.frame_gc = collections.deque(maxlen=history_size)
 
         # Aggregates
         self.total_frames = 0
         self.missed_frames = 0
+        # Never reset (missed_frames is cleared by reset_aggregates)
+        self.total_missed_frames = 0
         self.worst_frame_time = 0.0
+        # Session-long frame time distribution (single writer: record_frame; readers copy)
+        self.frame_histogram = LatencyHistogram()
 
         # FPS Calculation
-        self._last_fps_update = time.perf_counter()
+        self._last_fps_update = self._perf_counter()
         self._frame_counter = 0
         self.current_fps = 0.0
 
-        # Telemetry Probes
-        self._active_probes: dict[str, int] = {}  # name -> start_time_ns
-        self._probe_history: dict[str, collections.deque] = collections.defaultdict(
-            lambda: collections.deque(maxlen=history_size)
-        )
+        # Pipeline Latency Estimate (capture timestamp -> SendInput return)
+        # Exponential moving average in seconds; 0.0 means "no samples yet".
+        self.latency_ema_alpha = 0.05
+        self.pipeline_latency_ema = 0.0
+        self.pipeline_latency_samples = 0
+        # Session-long end-to-end latency at SendInput return (single writer: the logic thread):
+        # from the grab call, and from frame acquisition (adds the age of a reused cached frame)
+        self.input_latency_histogram = LatencyHistogram()
+        self.input_frame_age_histogram = LatencyHistogram()
+        # (duration, frame age) samples from the input thread, recorded by the next record_frame
+        self._posted_latency: collections.deque[tuple[float, float]] = collections.deque(maxlen=LATENCY_HANDOFF_SIZE)
+
+        # Pacing Accuracy (how late precision sleeps wake up), seconds
+        self.wake_error_ema = 0.0
+        self.worst_wake_error = 0.0
+        self.wake_error_samples = 0
+        # Schedule adherence of the paced loop: intended vs actual frame starts (see record_frame_start)
+        self.pacing = FramePacing(history_size)
+
+        # Scan-rate governor whose state is reported with the stats (set by the owner of the loop)
+        self.governor = None
+        # GC pause / allocation tracker fed by record_frame (see start_gc_tracking)
+        self.gc_monitor: GCMonitor | None = None
+
+        # Telemetry Probes (per-thread storage; the lock only guards the list of thread stores)
+        self._probe_local = threading.local()
+        self._probe_lock = threading.Lock()
+        self._probe_threads: list[_ThreadProbes] = []
+        # Stores of exited threads are released; their session histograms and last spans are kept here.
+        # Copy-on-write: pruning swaps in a new dict, so readers can merge it outside `_probe_lock`.
+        self._retired_histograms: dict[str, LatencyHistogram] = {}
+        self._retired_traces: collections.deque[SpanRing] = collections.deque(maxlen=RETIRED_TRACE_THREADS)
+
+        # Span tracing (toggled by the loop from `trace_spans`)
+        self.tracing = False
+        self.trace_capacity = trace_capacity
+
+        # Per-frame telemetry stream (see start_telemetry); detection time of the current frame in ms
+        self.telemetry_sink: TelemetrySink | None = None
+        self._frame_detection_ms = float("nan")
+        # Slow-frame snapshot writer fed by record_frame (see start_forensics)
+        self.forensics: SlowFrameForensics | None = None
+        # Latest MetricsSnapshot, replaced by record_frame while publishing (see start_publishing)
+        self.published: MetricsSnapshot | None = None
+        self.publish_interval: float | None = None
+        self._last_publish = 0.0
+        # Per-frame probe totals are accumulated only while a sink or forensics consumes them
+        self._frame_probe_totals = False
+
+    def _register_probe_thread(self) -> _ThreadProbes:
+        """Create the calling thread's probe storage (once per thread)."""
+        store = _ThreadProbes()
+        self._probe_local.store = store
+        with self._probe_lock:
+            self._prune_probe_threads()
+            self._probe_threads.append(store)
+        return store
+
+    def _prune_probe_threads(self) -> None:
+        """
+        Release the probe stores of exited threads (caller holds `_probe_lock`). Their histograms
+        are folded into a new retired aggregate so session percentiles survive; their recent-sample
+        rings are dropped. A dead thread no longer writes, so its store can be read without races.
+        """
+        live = []
+        retired = None
+        for store in self._probe_threads:
+            thread = store.thread()
+            if thread is not None and thread.is_alive():
+                live.append(store)
+                continue
+            if retired is None:
+                retired = dict(self._retired_histograms)
+            for name, histogram in store.histograms.items():
+                previous = retired.get(name)
+                merged = previous.copy() if previous is not None else LatencyHistogram()
+                merged.merge(histogram)
+                retired[name] = merged
+            if store.trace is not None:
+                self._retired_traces.append(store.trace)
+        if retired is not None:
+            self._retired_histograms = retired
+            self._probe_threads = live
+
+    def _probe_stores(self) -> list[_ThreadProbes]:
+        """Probe stores of the live threads (prunes exited ones first)."""
+        with self._probe_lock:
+            self._prune_probe_threads()
+            return list(self._probe_threads)
 
     def start_probe(self, name: str):
-        """Start a high-resolution timing probe."""
-        with self._lock:
-            self._active_probes[name] = time.perf_counter_ns()
+        """Start a high-resolution timing probe (lock-free; probes are per thread and may nest)."""
+        try:
+            store = self._probe_local.store
+        except AttributeError:
+            store = self._register_probe_thread()
+        stack = store.active.get(name)
+        if stack is None:
+            stack = store.active[name] = []
+        stack.append(self._perf_counter_ns())
 
     def stop_probe(self, name: str):
-        """Stop a timing probe and record duration in ms."""
-        now = time.perf_counter_ns()
-        with self._lock:
-            start_time = self._active_probes.pop(name, None)
-            if start_time is None:
-                return
+        """Stop the calling thread's innermost open probe of this name and record its duration in ms."""
+        now = self._perf_counter_ns()
+        try:
+            store = self._probe_local.store
+        except AttributeError:
+            return
+        stack = store.active.get(name)
+        if not stack:
+            return
+
+        start = stack.pop()
+        duration_ns = now - start
+        ring = store.rings.get(name)
+        if ring is None:
+            ring = store.rings[name] = _ProbeRing(self.history_size)
+            store.histograms[name] = LatencyHistogram()
+        ring.append(duration_ns / 1_000_000.0)
+        store.histograms[name].record(duration_ns)
+
+        if self.tracing:
+            trace = store.trace
+            if trace is None:
+                trace = store.trace = SpanRing(self.trace_capacity)
+            # Frame sequence = frames completed so far (record_frame runs at the end of each frame)
+            trace.append(name, start, now, self.total_frames)
+
+        if self._frame_probe_totals:
+            frame_probes = store.frame_probes
+            frame_probes[name] = frame_probes.get(name, 0.0) + duration_ns / 1_000_000.0
+
+    def set_tracing(self, enabled: bool, clear: bool = False):
+        """Turn span capture on or off; `clear` drops the spans captured so far."""
+        if clear:
+            for store in self._probe_stores():
+                if store.trace is not None:
+                    store.trace.clear()
+            self._retired_traces.clear()
+        self.tracing = enabled
+
+    def get_trace_events(self) -> list[dict]:
+        """
+        Captured spans from all threads as Chrome Trace Event dicts (see `utils/span_trace.py`),
+        including the last RETIRED_TRACE_THREADS threads that have exited.
+        """
+        stores = self._probe_stores()
+        rings = list(self._retired_traces) + [store.trace for store in stores if store.trace is not None]
+        return chrome_trace_events(rings)
+
+    def export_trace(self, filepath: str) -> bool:
+        """
+        Dump captured spans to a Chrome Trace Event JSON file (chrome://tracing, ui.perfetto.dev).
+
+        Returns:
+            True if spans were written, False if there were none or the write failed.
+        """
+        try:
+            events = self.get_trace_events()
+            if not any(event["ph"] == "X" for event in events):
+                return False
+            write_chrome_trace(filepath, events)
+            return True
+        except Exception:
+            return False
 
-            duration_ns = now - start_time
-            duration_ms = duration_ns / 1_000_000.0
-            self._probe_history[name].append(duration_ms)
+    def get_probe_samples(self, name: str) -> NDArray[np.float64]:
+        """Recent durations (ms) of a probe, merged across the live threads that recorded it."""
+        rings = [ring for store in self._probe_stores() if (ring := store.rings.get(name)) is not None]
+        if not rings:
+            return np.empty(0, dtype=np.float64)
+        return np.concatenate([ring.snapshot() for ring in rings])
+
+    def get_probe_histogram(self, name: str) -> LatencyHistogram:
+        """Session-long histogram of a probe, merged across all threads that recorded it (exited ones included)."""
+        merged = LatencyHistogram()
+        with self._probe_lock:
+            self._prune_probe_threads()
+            stores = list(self._probe_threads)
+            retired = self._retired_histograms.get(name)
+        # Retired aggregates are never mutated and live histograms have a single writer: merge unlocked
+        if retired is not None:
+            merged.merge(retired)
+        for store in stores:
+            histogram = store.histograms.get(name)
+            if histogram is not None:
+                merged.merge(histogram)
+        return merged
+
+    def get_probe_names(self) -> list[str]:
+        """Names of all probes with recent samples (any live thread)."""
+        names: dict[str, None] = {}
+        for store in self._probe_stores():
+            names.update(dict.fromkeys(list(store.rings)))
+        return list(names)
 
     def get_probe_stats(self, name: str) -> dict[str, float]:
-        """Get statistics for a specific probe."""
-        history = list(self._probe_history.get(name, []))
-        if not history:
+        """
+        Get statistics for a specific probe: avg/min/max/count over the recent window
+        plus session-long percentiles (`p50_ms`, `p90_ms`, `p99_ms`, `p99_9_ms`).
+        """
+        history = self.get_probe_samples(name)
+        if history.size == 0:
             return {}
 
-        return {
-            "avg_ms": sum(history) / len(history),
-            "min_ms": min(history),
-            "max_ms": max(history),
-            "count": len(history),
+        stats = {
+            "avg_ms": float(history.mean()),
+            "min_ms": float(history.min()),
+            "max_ms": float(history.max()),
+            "count": int(history.size),
         }
+        for p, value_ns in self.get_probe_histogram(name).percentiles().items():
+            stats[f"{percentile_key(p)}_ms"] = value_ns / 1_000_000.0
+        return stats
 
-    def record_frame(self, duration_sec: float, missed: bool = False):
+    def record_frame(
+        self, duration_sec: float, missed: bool = False, target_found: bool = False, frame_age: float = float("nan")
+    ):
         """
         Record the duration of a single logic loop frame.
+
+        Args:
+            duration_sec: Active time of the frame
+            missed: The frame overran its budget
+            target_found: Detection found the target (telemetry stream only)
+            frame_age: Age of the processed capture at the end of the frame in seconds (telemetry stream
+                and slow-frame snapshots only)
         """
         duration_ms = duration_sec * 1000.0
+        posted = self._posted_latency
+        while posted:  # Only this thread pops, so the deque cannot empty under us
+            self.record_pipeline_latency(*posted.popleft())
+        gc_monitor = self.gc_monitor
+        frame_gc = gc_monitor.end_frame(missed) if gc_monitor is not None else None
 
         with self._lock:
             self.total_frames += 1
             if missed:
                 self.missed_frames += 1
+                self.total_missed_frames += 1
 
             self.frame_times.append(duration_ms)
+            self.frame_gc.append(frame_gc)
             if duration_ms > self.worst_frame_time:
                 self.worst_frame_time = duration_ms
 
             # FPS tracking
             self._frame_counter += 1
-            now = time.perf_counter()
+            now = self._perf_counter()
             if now - self._last_fps_update >= 0.5:  # Update FPS every 500ms
                 self.current_fps = self._frame_counter / (now - self._last_fps_update)
                 self.fps_history.append(self.current_fps)
                 self._frame_counter = 0
                 self._last_fps_update = now
+        self.frame_histogram.record(int(duration_sec * 1_000_000_000))
+
+        publish_interval = self.publish_interval
+        if publish_interval is not None and now - self._last_publish >= publish_interval:
+            # Histograms are copied by their writer, then handed over as one reference swap
+            self._last_publish = now
+            self.published = MetricsSnapshot(self, now)
+
+        if self._frame_probe_totals:
+            # Caller is the logic thread: its probe totals describe this frame
+            store = getattr(self._probe_local, "store", None)
+            frame_probes = store.frame_probes if store is not None else {}
+            # Probes finished on other threads since the last frame (e.g. movement_input on the
+            # async input dispatcher) count toward the frame they completed in
+            for other in self._probe_threads:
+                totals = other.frame_probes
+                if other is store or not totals:
+                    continue
+                reported = other.reported
+                for name, total in list(totals.items()):
+                    delta = total - reported.get(name, 0.0)
+                    if delta > 0.0:
+                        reported[name] = total
+                        frame_probes[name] = frame_probes.get(name, 0.0) + delta
+            frame_age_ms = frame_age * 1000.0
+            sink = self.telemetry_sink
+            if sink is not None:
+                sink.write_frame(now, duration_ms, self._frame_detection_ms, target_found, frame_age_ms, frame_probes)
+            forensics = self.forensics
+            if forensics is not None:
+                forensics.frame_finished(
+                    self.total_frames - 1,
+                    now,
+                    duration_ms,
+                    self._frame_detection_ms,
+                    frame_age_ms,
+                    frame_probes,
+                    frame_gc,
+                    gc_monitor,
+                )
+            frame_probes.clear()
+            self._frame_detection_ms = float("nan")
+
+    def start_publishing(self, interval: float = DEFAULT_PUBLISH_INTERVAL):
+        """
+        Publish a `MetricsSnapshot` from `record_frame` at most every `interval` seconds
+        (read it with `get_published`). Used by the metrics endpoint.
+        """
+        self._last_publish = float("-inf")
+        self.publish_interval = interval
+
+    def stop_publishing(self):
+        """Stop publishing snapshots (the last one stays readable)."""
+        self.publish_interval = None
+
+    def get_published(self) -> MetricsSnapshot:
+        """Latest published snapshot, or an empty one before the first publish (lock-free)."""
+        return self.published or MetricsSnapshot()
+
+    def start_gc_tracking(self, freeze: bool = False) -> GCMonitor:
+        """
+        Record GC pauses and per-frame allocations (correlated with missed frames).
+
+        Args:
+            freeze: Also collect + `gc.freeze()` now and hold off gen2 collections until stopped
+        """
+        gc_monitor = self.gc_monitor
+        if gc_monitor is None:
+            gc_monitor = GCMonitor()
+            gc_monitor.install()
+            self.gc_monitor = gc_monitor
+        if freeze:
+            gc_monitor.freeze()
+        else:
+            gc_monitor.unfreeze()
+        return gc_monitor
+
+    def stop_gc_tracking(self):
+        """Remove the GC callback and undo freeze mode (no-op when not tracking)."""
+        gc_monitor = self.gc_monitor
+        if gc_monitor is None:
+            return
+        self.gc_monitor = None
+        gc_monitor.uninstall()
 
     def record_detection(self, duration_sec: float):
         """Record the time taken by the detection subsystem."""
         with self._lock:
             self.detection_times.append(duration_sec * 1000.0)
+        self._frame_detection_ms = duration_sec * 1000.0
+
+    def start_telemetry(self, path: str | None = None, **sink_options) -> str:
+        """
+        Start streaming per-frame records to a telemetry file (see `utils/telemetry_sink.py`).
+
+        Args:
+            path: Output file (defaults to a new session file under logs/telemetry/)
+            **sink_options: Passed to `TelemetrySink` (probes, chunk_rows, flush_interval, ...)
+
+        Returns:
+            The file path.
+        """
+        self.stop_telemetry()
+        sink = TelemetrySink(path or default_telemetry_path(), **sink_options)
+        self.telemetry_sink = sink
+        self._frame_probe_totals = True
+        return sink.path
+
+    def stop_telemetry(self):
+        """Stop streaming and flush the telemetry file (no-op when not streaming)."""
+        sink = self.telemetry_sink
+        if sink is None:
+            return
+        self.telemetry_sink = None
+        self._frame_probe_totals = self.forensics is not None
+        sink.close()
+
+    def start_forensics(self, directory: str | None = None, **options) -> SlowFrameForensics:
+        """
+        Write a context snapshot whenever a frame exceeds `factor` x the rolling median
+        (see `utils/slow_frame_forensics.py`). Call from the logic thread: its stack is the one
+        the watchdog captures.
+
+        Args:
+            directory: Snapshot directory (defaults to logs/slow_frames/)
+            **options: Passed to `SlowFrameForensics` (factor, context_frames, min_interval, ...)
+        """
+        self.stop_forensics()
+        forensics = SlowFrameForensics(directory or default_forensics_dir(), perf_counter=self._perf_counter, **options)
+        forensics.watch(threading.get_ident())
+        self.forensics = forensics
+        self._frame_probe_totals = True
+        return forensics
+
+    def stop_forensics(self):
+        """Stop the watchdog and finish writing queued snapshots (no-op when not running)."""
+        forensics = self.forensics
+        if forensics is None:
+            return
+        self.forensics = None
+        self._frame_probe_totals = self.telemetry_sink is not None
+        forensics.close()
+
+    def record_pipeline_latency(self, duration_sec: float, frame_age_sec: float = float("nan")):
+        """
+        Record one end-to-end latency sample at SendInput return.
+
+        Logic thread only (the thread calling `record_frame`), which keeps the histograms and
+        the EMA single-writer: readers copy them without a lock. Other threads hand their
+        samples over with `post_pipeline_latency`.
+
+        Args:
+            duration_sec: Capture-to-input latency (grab call to SendInput return)
+            frame_age_sec: Age of the frame the input was computed from (frame acquisition to
+                SendInput return); exceeds `duration_sec` when a cached frame was reused
+        """
+        if duration_sec <= 0.0 or duration_sec != duration_sec:  # Reject non-positive and NaN
+            return
+
+        self.input_latency_histogram.record(int(duration_sec * 1_000_000_000))
+        if frame_age_sec > 0.0:  # False for NaN
+            self.input_frame_age_histogram.record(int(frame_age_sec * 1_000_000_000))
+
+        if self.pipeline_latency_samples == 0:
+            # Warm start: first sample after a reset seeds the estimate directly
+            self.pipeline_latency_ema = duration_sec
+        else:
+            alpha = self.latency_ema_alpha
+            self.pipeline_latency_ema += alpha * (duration_sec - self.pipeline_latency_ema)
+        self.pipeline_latency_samples += 1
+
+    def post_pipeline_latency(self, duration_sec: float, frame_age_sec: float = float("nan")):
+        """
+        Hand a latency sample from another thread (e.g. the async input dispatcher) to the logic
+        thread, which records it at its next `record_frame`. Lock-free: `deque.append` is atomic.
+        """
+        self._posted_latency.append((duration_sec, frame_age_sec))
+
+    def record_frame_start(self, actual_start: float, intended_start: float, interval: float):
+        """
+        Record when a frame started against when the pacing schedule intended it to.
+
+        Single-writer (logic thread), lock-free like the latency EMA.
+
+        Args:
+            actual_start: Frame start time (monitor clock)
+            intended_start: Previous start + `interval` (0.0 = unscheduled, e.g. event-driven frames)
+            interval: Frame interval the schedule used
+        """
+        if intended_start > 0.0:
+            self.pacing.record(actual_start, intended_start, interval)
+        else:
+            self.pacing.break_schedule()
+        forensics = self.forensics
+        if forensics is not None:
+            forensics.frame_started(actual_start)
+
+    def record_wake_error(self, error_sec: float):
+        """
+        Record how late a pacing sleep woke up (single-writer, lock-free like the latency EMA).
+        """
+        if error_sec < 0.0 or error_sec != error_sec:  # Reject negative and NaN
+            return
+
+        if self.wake_error_samples == 0:
+            self.wake_error_ema = error_sec
+        else:
+            self.wake_error_ema += self.latency_ema_alpha * (error_sec - self.wake_error_ema)
+        self.wake_error_samples += 1
+        if error_sec > self.worst_wake_error:
+            self.worst_wake_error = error_sec
+
+    def get_latency_estimate(self) -> float:
+        """Get the rolling end-to-end latency estimate in seconds (0.0 if unknown)."""
+        return self.pipeline_latency_ema
+
+    def reset_latency_estimate(self):
+        """Discard the latency estimate (e.g. after a capture backend or FOV change)."""
+        self._posted_latency.clear()
+        self.pipeline_latency_samples = 0
+        self.pipeline_latency_ema = 0.0
 
     def get_stats(self) -> dict[str, float]:
         """Get snapshot of current statistics."""
@@ -114,11 +707,16 @@ class PerformanceMonitor:
             worst_frame = self.worst_frame_time
             missed = self.missed_frames
             fps = self.current_fps
+        frame_histogram = self.get_frame_histogram()
+        input_histograms = self.get_input_latency_histograms()
 
         avg_frame = (sum(frame_times_snap) / len(frame_times_snap)) if frame_times_snap else 0.0
         avg_detect = (sum(detection_times_snap) / len(detection_times_snap)) if detection_times_snap else 0.0
 
-        # 1% Lows calculation (99th percentile of frame time, converted to FPS)
+        # Session frame-time percentiles straight from the histogram (no sort)
+        frame_percentiles = {p: ns / 1_000_000.0 for p, ns in frame_histogram.percentiles().items()}
+
+        # 1% Lows calculation (99th percentile of frame time, converted to FPS) over the recent window
         one_percent_low = 0.0
         if len(frame_times_snap) > 100:
             sorted_times = sorted(frame_times_snap, reverse=True)
@@ -126,15 +724,46 @@ class PerformanceMonitor:
             p99_time_ms = sorted_times[p99_index]
             if p99_time_ms > 0:
                 one_percent_low = 1000.0 / p99_time_ms
+        # Same from the session histogram (every frame since start, no sort)
+        session_one_percent_low = 0.0
+        if frame_histogram.count > 100 and frame_percentiles[99.0] > 0:
+            session_one_percent_low = 1000.0 / frame_percentiles[99.0]
 
-        return {
+        stats = {
             "fps": fps,
             "avg_frame_ms": avg_frame,
             "worst_frame_ms": worst_frame,
             "avg_detection_ms": avg_detect,
             "missed_frames": float(missed),
             "one_percent_low_fps": one_percent_low,
+            "session_one_percent_low_fps": session_one_percent_low,
+            "pipeline_latency_ms": self.pipeline_latency_ema * 1000.0,
+            "wake_error_ms": self.wake_error_ema * 1000.0,
+            "worst_wake_error_ms": self.worst_wake_error * 1000.0,
         }
+        for p, value_ms in frame_percentiles.items():
+            stats[f"frame_{percentile_key(p)}_ms"] = value_ms
+        # capture_to_input_p99_ms, input_frame_age_p99_ms, ...
+        for series, histogram in input_histograms.items():
+            stats[f"{series}_avg_ms"] = histogram.mean_ns / 1_000_000.0
+            for p, value_ns in histogram.percentiles().items():
+                stats[f"{series}_{percentile_key(p)}_ms"] = value_ns / 1_000_000.0
+
+        governor = self.governor
+        if governor is not None:
+            for key, value in governor.get_stats().items():
+                stats[f"governor_{key}"] = value
+        for key, value in self.pacing.get_stats().items():
+            stats[f"pacing_{key}"] = value
+        gc_monitor = self.gc_monitor
+        if gc_monitor is not None:
+            for key, value in gc_monitor.get_stats().items():
+                stats[f"gc_{key}"] = value
+        forensics = self.forensics
+        if forensics is not None:
+            for key, value in forensics.get_stats().items():
+                stats[f"slow_{key}"] = value
+        return stats
 
     def get_history(self) -> dict[str, list[float]]:
         """Get historical data for plotting."""
@@ -143,16 +772,66 @@ class PerformanceMonitor:
                 "fps": list(self.fps_history),
                 "frame_times": list(self.frame_times),
                 "detection_times": list(self.detection_times),
+                "frame_gc": list(self.frame_gc),
+                "start_errors": list(self.pacing.start_errors),
             }
 
+    def get_frame_histogram(self) -> LatencyHistogram:
+        """Snapshot of the session frame-time histogram (lock-free copy, single writer)."""
+        return self.frame_histogram.copy()
+
+    def get_input_latency_histograms(self) -> dict[str, LatencyHistogram]:
+        """
+        Snapshots of the session end-to-end latency histograms:
+        "capture_to_input" (grab call to SendInput) and "input_frame_age" (frame acquisition to SendInput).
+        Lock-free copies: only the logic thread records them (see `record_pipeline_latency`).
+        """
+        return {
+            "capture_to_input": self.input_latency_histogram.copy(),
+            "input_frame_age": self.input_frame_age_histogram.copy(),
+        }
+
+    def get_latency_percentiles(self) -> dict[str, dict[str, float]]:
+        """
+        Session-long percentile summary (ms) for frame time, end-to-end input latency, frame pacing
+        (start interval and start error) and every recorded probe.
+
+        Returns:
+            {series: {"count", "p50_ms", "p90_ms", "p99_ms", "p99_9_ms", "max_ms"}}
+        """
+        histograms = {
+            "frame_time": self.get_frame_histogram(),
+            **self.get_input_latency_histograms(),
+            **self.pacing.get_histograms(),
+        }
+        gc_monitor = self.gc_monitor
+        if gc_monitor is not None:
+            histograms["gc_pause"] = gc_monitor.get_pause_histogram()
+        for name in self.get_probe_names():
+            histograms[name] = self.get_probe_histogram(name)
+
+        summary = {}
+        for series, histogram in histograms.items():
+            if histogram.count == 0:
+                continue
+            row = {"count": float(histogram.count)}
+            for p, value_ns in histogram.percentiles().items():
+                row[f"{percentile_key(p)}_ms"] = value_ns / 1_000_000.0
+            row["max_ms"] = histogram.max_ns / 1_000_000.0
+            summary[series] = row
+        return summary
+
     def reset_aggregates(self):
         """Reset max/min counters but keep history."""
         self.worst_frame_time = 0.0
         self.missed_frames = 0
+        self.worst_wake_error = 0.0
 
     def export_to_csv(self, filepath: str) -> bool:
         """
-        Export performance history to a CSV file.
+        Export performance history to a CSV file (one row per frame). The session percentile
+        table (one row per series, see `get_latency_percentiles`) goes to a separate file next
+        to it (see `percentiles_csv_path`), so each file stays a single table.
 
         Args:
             filepath: Path to the output CSV file.
@@ -166,6 +845,7 @@ class PerformanceMonitor:
             fps_data = history["fps"]
             frame_times_data = history["frame_times"]
             detection_times_data = history["detection_times"]
+            frame_gc_data = history["frame_gc"]
 
             # Determine the maximum length to iterate
             max_len = max(len(fps_data), len(frame_times_data), len(detection_times_data))
@@ -176,13 +856,25 @@ class PerformanceMonitor:
 
             with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerow(["frame", "fps", "frame_time_ms", "detection_time_ms"])
+                writer.writerow(["frame", "fps", "frame_time_ms", "detection_time_ms", "gc_pause_ms", "alloc_blocks"])
 
                 for i in range(max_len):
                     fps_val = fps_data[i] if i < len(fps_data) else ""
                     frame_time_val = frame_times_data[i] if i < len(frame_times_data) else ""
                     detection_time_val = detection_times_data[i] if i < len(detection_times_data) else ""
-                    writer.writerow([i, fps_val, frame_time_val, detection_time_val])
+                    # GC columns stay empty for frames recorded without GC tracking
+                    gc_val = frame_gc_data[i] if i < len(frame_gc_data) else None
+                    gc_pause_val, alloc_val = gc_val if gc_val is not None else ("", "")
+                    writer.writerow([i, fps_val, frame_time_val, detection_time_val, gc_pause_val, alloc_val])
+
+            percentiles = self.get_latency_percentiles()
+            if percentiles:
+                columns = [f"{percentile_key(p)}_ms" for p in REPORTED_PERCENTILES]
+                with open(percentiles_csv_path(filepath), "w", newline="", encoding="utf-8") as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(["series", "count", *columns, "max_ms"])
+                    for series, row in percentiles.items():
+                        writer.writerow([series, int(row["count"]), *(row[c] for c in columns), row["max_ms"]])
 
             return True
         except Exception:
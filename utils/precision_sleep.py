@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+"""
+Precision Sleep Module
+
+Timer-based high-resolution sleeping for loop pacing, replacing the hybrid
+`time.sleep` + 1.5ms spin-wait that kept a core busy whenever tracking ran.
+- Windows: high-resolution waitable timer (`CreateWaitableTimerExW` with
+  `CREATE_WAITABLE_TIMER_HIGH_RESOLUTION`, Windows 10 1803+). Older systems get a
+  classic waitable timer (timer resolution then follows `timeBeginPeriod`).
+- Linux: `clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME)` against the same clock
+  `time.perf_counter` reads, so the deadline is exact and EINTR restarts lose nothing.
+- Elsewhere: `time.sleep` with the legacy spin tail.
+OPTIMIZATIONS:
+- Only a short spin tail (100µs by default) remains after the kernel wakes the thread.
+- Each sleep returns its wake-up error (actual wake - deadline) so pacing accuracy
+  can be monitored (`PerformanceMonitor.record_wake_error`).
+- Timer handles are per thread (a shared handle would let threads re-arm each other's timer).
+"""
+
+import ctypes
+import ctypes.util
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+
+# Spin-wait kept after a timer wake (absorbs the kernel's wake-up latency)
+DEFAULT_SPIN_TAIL = 0.0001
+# Spin-wait of the legacy sleep + spin fallback
+LEGACY_SPIN_TAIL = 0.0015
+
+# Windows constants
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x1F0003
+INFINITE = 0xFFFFFFFF
+
+# Linux constants
+CLOCK_MONOTONIC = 1
+TIMER_ABSTIME = 1
+EINTR = 4
+
+
+class PrecisionSleeper(ABC):
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Sleeps until a `time.perf_counter` deadline: kernel timer wait, then a short spin.
+    """
+
+    name = "base"
+
+    def __init__(self, spin_tail: float = DEFAULT_SPIN_TAIL) -> None:
+        self.spin_tail = spin_tail
+
+    def sleep_until(self, deadline: float) -> float:
+        """
+        Block until `time.perf_counter()` reaches the deadline.
+
+        Returns:
+            Wake-up error in seconds (how late the call returned; 0.0 if the deadline had already passed).
+        """
+        perf_counter = time.perf_counter
+        remaining = deadline - perf_counter()
+        if remaining <= 0.0:
+            return 0.0
+
+        if remaining > self.spin_tail:
+            self._wait_until(deadline - self.spin_tail)
+
+        now = perf_counter()
+        while now < deadline:
+            now = perf_counter()
+        return now - deadline
+
+    @abstractmethod
+    def _wait_until(self, deadline: float) -> None:
+        """Kernel wait until (about) the deadline; may return slightly early or late."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release timer resources held by the calling thread."""
+        pass
+
+
+class SleepSleeper(PrecisionSleeper):
+    """
+    Portable fallback: `time.sleep` then spin (the legacy hybrid pacing).
+    """
+
+    name = "sleep"
+
+    def __init__(self, spin_tail: float = LEGACY_SPIN_TAIL) -> None:
+        super().__init__(spin_tail)
+
+    def _wait_until(self, deadline: float) -> None:
+        remaining = deadline - time.perf_counter()
+        if remaining > 0.0:
+            time.sleep(remaining)
+
+    def close(self) -> None:
+        pass
+
+
+class WaitableTimerSleeper(PrecisionSleeper):
+    """
+    Windows high-resolution waitable timer.
+    """
+
+    name = "waitable_timer"
+
+    def __init__(self, spin_tail: float = DEFAULT_SPIN_TAIL) -> None:
+        super().__init__(spin_tail)
+        from ctypes import wintypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+        self._create = kernel32.CreateWaitableTimerExW
+        self._create.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD]
+        self._create.restype = wintypes.HANDLE
+        self._set = kernel32.SetWaitableTimer
+        self._set.argtypes = [
+            wintypes.HANDLE,
+            ctypes.POINTER(ctypes.c_longlong),
+            wintypes.LONG,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            wintypes.BOOL,
+        ]
+        self._set.restype = wintypes.BOOL
+        self._wait = kernel32.WaitForSingleObject
+        self._wait.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        self._wait.restype = wintypes.DWORD
+        self._close_handle = kernel32.CloseHandle
+        self._close_handle.argtypes = [wintypes.HANDLE]
+
+        self._local = threading.local()
+        # Probe once so construction fails (and the caller falls back) if timers are unavailable
+        self.high_resolution = True
+        self._get_timer()
+
+    def _get_timer(self) -> int:
+        handle = getattr(self._local, "handle", None)
+        if handle:
+            return handle
+
+        handle = self._create(None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, TIMER_ALL_ACCESS)
+        if not handle:
+            # Pre-1803 Windows: the flag is rejected, use a classic timer
+            self.high_resolution = False
+            handle = self._create(None, None, 0, TIMER_ALL_ACCESS)
+        if not handle:
+            raise OSError(ctypes.get_last_error(), "CreateWaitableTimerExW failed")
+
+        self._local.handle = handle
+        return handle
+
+    def _wait_until(self, deadline: float) -> None:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0.0:
+            return
+        handle = self._get_timer()
+        # Negative due time = relative, in 100ns units
+        due = ctypes.c_longlong(-int(remaining * 10_000_000))
+        if self._set(handle, ctypes.byref(due), 0, None, None, False):
+            self._wait(handle, INFINITE)
+
+    def close(self) -> None:
+        handle = getattr(self._local, "handle", None)
+        if handle:
+            self._close_handle(handle)
+            self._local.handle = None
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class NanosleepSleeper(PrecisionSleeper):
+    """
+    Linux `clock_nanosleep` on CLOCK_MONOTONIC.
+    """
+
+    name = "clock_nanosleep"
+
+    def __init__(self, spin_tail: float = DEFAULT_SPIN_TAIL) -> None:
+        super().__init__(spin_tail)
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._nanosleep = libc.clock_nanosleep  # AttributeError if unavailable
+        self._nanosleep.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(_Timespec), ctypes.POINTER(_Timespec)]
+        self._nanosleep.restype = ctypes.c_int
+
+        # perf_counter deadlines are CLOCK_MONOTONIC times when CPython reads that clock
+        implementation = time.get_clock_info("perf_counter").implementation
+        self.absolute = "CLOCK_MONOTONIC" in implementation and "RAW" not in implementation
+
+    def _wait_until(self, deadline: float) -> None:
+        if self.absolute:
+            flags, target = TIMER_ABSTIME, deadline
+        else:
+            flags, target = 0, deadline - time.perf_counter()
+            if target <= 0.0:
+                return
+
+        seconds = int(target)
+        ts = _Timespec(seconds, int((target - seconds) * 1e9))
+        # Absolute sleeps restart with the same deadline after a signal (EINTR)
+        while self._nanosleep(CLOCK_MONOTONIC, flags, ctypes.byref(ts), None) == EINTR and self.absolute:
+            pass
+
+    def close(self) -> None:
+        pass
+
+
+def create_precision_sleeper(spin_tail: float = DEFAULT_SPIN_TAIL) -> PrecisionSleeper:
+    """Best sleeper for this platform; falls back to `SleepSleeper` if the timer cannot be set up."""
+    try:
+        if sys.platform == "win32":
+            return WaitableTimerSleeper(spin_tail)
+        if sys.platform.startswith("linux"):
+            return NanosleepSleeper(spin_tail)
+    except Exception as e:
+        print(f"Precision timer unavailable: {e}. Falling back to sleep + spin pacing.")
+    return SleepSleeper()
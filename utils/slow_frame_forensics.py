@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+
+"""
+Slow-Frame Forensics
+
+Automatic evidence capture for frame-time spikes. When a frame takes longer than
+`factor` x the rolling median frame time, a snapshot of the surrounding context is written
+as JSON to logs/slow_frames/:
+- the last K frames (frame time, frame age, per-probe totals, GC pause and allocations)
+- the logic thread's stack, grabbed by a watchdog thread *while* the frame was overrunning
+  (a stack taken after the frame ends would only ever show `record_frame`)
+- GC pauses inside the window, plus context sources registered by the loop owner
+  (capture backend, config version, ...)
+
+OPTIMIZATIONS:
+- Per frame: one deque append (with a small dict copy) and one ring store. The median is
+  refreshed with NumPy every MEDIAN_REFRESH_FRAMES frames, not per frame.
+- Rate limited: at most one snapshot per `min_interval` seconds; slow frames in between are
+  only counted (`suppressed`), so a storm of slow frames cannot add work to the loop.
+- Snapshots are serialized and written by a background thread.
+"""
+
+import collections
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+DEFAULT_SLOW_FACTOR = 3.0
+# Frames of history kept for a snapshot (K)
+DEFAULT_CONTEXT_FRAMES = 120
+# Shortest time between two snapshots (seconds)
+DEFAULT_MIN_INTERVAL = 5.0
+# Frames below this are never "slow", whatever the median (sub-ms jitter at very high FPS)
+DEFAULT_MIN_SLOW_MS = 2.0
+
+MEDIAN_WINDOW = 256
+MEDIAN_REFRESH_FRAMES = 64
+
+
+def default_forensics_dir() -> str:
+    """<app dir>/logs/slow_frames/"""
+    from utils.paths import get_app_dir
+
+    return os.path.join(get_app_dir(), "logs", "slow_frames")
+
+
+class SlowFrameForensics:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Slow-frame detector with rate-limited, asynchronously written context snapshots.
+
+    `frame_started` / `frame_finished` are called by the logic thread (through
+    `PerformanceMonitor.record_frame_start` / `record_frame`).
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        factor: float = DEFAULT_SLOW_FACTOR,
+        context_frames: int = DEFAULT_CONTEXT_FRAMES,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        min_slow_ms: float = DEFAULT_MIN_SLOW_MS,
+        perf_counter: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Args:
+            directory: Where snapshot JSON files are written (created; raises OSError if it cannot be)
+            factor: Slow threshold as a multiple of the rolling median frame time
+            context_frames: Frames of history included in each snapshot
+            min_interval: Minimum seconds between snapshots (rate limit)
+            min_slow_ms: Absolute floor of the slow threshold
+            perf_counter: Clock shared with the loop (frame start times come from it)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.factor = factor
+        self.min_interval = min_interval
+        self.min_slow_ms = min_slow_ms
+        self._perf_counter = perf_counter
+        # Named callables evaluated when a snapshot is taken (e.g. capture backend, config version)
+        self.context_sources: dict[str, Callable[[], Any]] = {}
+
+        # (frame, end time, frame ms, detection ms, frame age ms, probes, gc pause ms, alloc blocks)
+        self._frames: collections.deque[tuple] = collections.deque(maxlen=max(1, context_frames))
+        self._window = np.zeros(MEDIAN_WINDOW, dtype=np.float64)
+        self._window_count = 0
+        self.median_ms = 0.0
+        self.threshold_ms = float("inf")
+
+        self.snapshots = 0
+        self.suppressed = 0
+        self.last_snapshot_path: str | None = None
+        self._last_snapshot_time = -float("inf")
+
+        # Frame in progress, watched by the watchdog thread
+        self._frame_start = 0.0
+        self._frame_seq = 0
+        self._stack: tuple[int, list[str]] | None = None
+        self._thread_id: int | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+        self._pending: queue.SimpleQueue[tuple[str, dict] | None] = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, name="SlowFrameWriter", daemon=True)
+        self._writer.start()
+
+    # ------------------------------------------------------------------
+    # Logic thread
+    # ------------------------------------------------------------------
+    def watch(self, thread_id: int) -> None:
+        """Start the watchdog that grabs `thread_id`'s stack while a frame overruns the threshold."""
+        if self._watchdog is not None:
+            return
+        self._thread_id = thread_id
+        self._stop_event.clear()
+        self._watchdog = threading.Thread(target=self._watch_loop, name="SlowFrameWatchdog", daemon=True)
+        self._watchdog.start()
+
+    def frame_started(self, start: float) -> None:
+        self._frame_start = start
+
+    def frame_finished(
+        self,
+        frame: int,
+        end: float,
+        frame_ms: float,
+        detection_ms: float,
+        frame_age_ms: float,
+        probes: dict[str, float],
+        frame_gc: tuple[float, int] | None = None,
+        gc_monitor: Any = None,
+    ) -> bool:
+        """
+        Add one completed frame; take a snapshot if it was slow and the rate limit allows.
+
+        Returns:
+            True if a snapshot was queued for writing.
+        """
+        gc_pause_ms, alloc_blocks = frame_gc if frame_gc is not None else (None, None)
+        self._frames.append((frame, end, frame_ms, detection_ms, frame_age_ms, dict(probes), gc_pause_ms, alloc_blocks))
+        self._frame_seq = frame + 1
+        self._frame_start = 0.0
+
+        count = self._window_count
+        self._window[count % MEDIAN_WINDOW] = frame_ms
+        self._window_count = count + 1
+        if self._window_count % MEDIAN_REFRESH_FRAMES == 0:
+            self.median_ms = float(np.median(self._window[: min(self._window_count, MEDIAN_WINDOW)]))
+            self.threshold_ms = max(self.median_ms * self.factor, self.min_slow_ms)
+
+        if frame_ms <= self.threshold_ms:
+            return False
+        if end - self._last_snapshot_time < self.min_interval:
+            self.suppressed += 1
+            return False
+        self._last_snapshot_time = end
+        self._queue_snapshot(frame, frame_ms, frame_age_ms, gc_monitor)
+        return True
+
+    def _queue_snapshot(self, frame: int, frame_ms: float, frame_age_ms: float, gc_monitor: Any) -> None:
+        stack = self._stack
+        if stack is not None and stack[0] == frame:
+            stack_lines, stack_source = stack[1], "watchdog (during the frame)"
+        else:
+            stack_lines, stack_source = [], "not captured (frame ended before the watchdog saw it overrun)"
+
+        frames = list(self._frames)
+        context = {}
+        for name, source in self.context_sources.items():
+            try:
+                context[name] = source()
+            except Exception as e:
+                context[name] = f"unavailable: {e}"
+
+        gc_info = None
+        if gc_monitor is not None:
+            # GCMonitor counts frames from its own install; end_frame has already closed this one
+            last = gc_monitor.frame - 1
+            gc_info = {
+                "stats": gc_monitor.get_stats(),
+                "pauses": [
+                    {"frames_ago": last - f, "generation": g, "duration_ms": d, "collected": c}
+                    for f, g, d, c in list(gc_monitor.recent_pauses)
+                    if 0 <= last - f < len(frames)
+                ],
+            }
+
+        snapshot = {
+            "wall_time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "frame": frame,
+            "frame_ms": frame_ms,
+            "median_ms": self.median_ms,
+            "threshold_ms": self.threshold_ms,
+            "frame_age_ms": frame_age_ms,
+            "suppressed_before": self.suppressed,
+            "context": context,
+            "gc": gc_info,
+            "stack_source": stack_source,
+            "stack": stack_lines,
+            "recent_frames": [
+                {
+                    "frame": f,
+                    "t": t,
+                    "frame_ms": ms,
+                    "detection_ms": det,
+                    "frame_age_ms": age,
+                    "probes_ms": probes,
+                    "gc_pause_ms": gc_ms,
+                    "alloc_blocks": alloc,
+                }
+                for f, t, ms, det, age, probes, gc_ms, alloc in frames
+            ],
+        }
+        path = os.path.join(self.directory, time.strftime(f"slow_frame_%Y%m%d_%H%M%S_{frame}.json"))
+        self.snapshots += 1
+        self.last_snapshot_path = path
+        self._pending.put((path, snapshot))
+
+    # ------------------------------------------------------------------
+    # Background threads
+    # ------------------------------------------------------------------
+    def _watch_loop(self) -> None:
+        current_frames = sys._current_frames
+        perf_counter = self._perf_counter
+        wait = self._stop_event.wait
+        while True:
+            threshold = self.threshold_ms
+            # Poll at half the threshold, at least every 10 ms
+            if wait(min(max(threshold / 2000.0, 0.001), 0.01)):
+                break
+            start = self._frame_start
+            if start <= 0.0 or threshold == float("inf"):
+                continue
+            seq = self._frame_seq
+            if (self._stack is not None and self._stack[0] == seq) or (perf_counter() - start) * 1000.0 <= threshold:
+                continue
+            if perf_counter() - self._last_snapshot_time < self.min_interval:
+                continue  # Would be rate limited anyway: stay off the GIL
+            frame = current_frames().get(self._thread_id)
+            if frame is not None:
+                self._stack = (seq, [line.rstrip("\n") for line in traceback.format_stack(frame)])
+            del frame
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                break
+            path, snapshot = item
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, indent=1, default=str)
+            except (OSError, ValueError, TypeError):
+                pass
+
+    def close(self) -> None:
+        """Stop the watchdog and write any queued snapshots."""
+        if self._watchdog is not None:
+            self._stop_event.set()
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+        self._pending.put(None)
+        self._writer.join()
+
+    def get_stats(self) -> dict[str, float]:
+        return {
+            "snapshots": float(self.snapshots),
+            "suppressed": float(self.suppressed),
+            "median_ms": self.median_ms,
+            "threshold_ms": self.threshold_ms if self.threshold_ms != float("inf") else 0.0,
+        }
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+
+"""
+Telemetry Sink
+
+Streams one record per logic-loop frame to a compact, columnar, chunked binary file so
+multi-hour sessions can be analyzed in full (the in-memory history keeps ~1000 frames).
+
+File layout (little-endian):
+    b"CTTL" | uint16 format version | uint32 header length | JSON header {"columns": [[name, dtype], ...]}
+    chunk*: uint32 row count | column 0 bytes | column 1 bytes | ...
+
+OPTIMIZATIONS:
+- Bounded memory: a fixed pool of pre-allocated column chunks. The logic thread fills one
+  chunk with plain array stores; a background thread writes full chunks and recycles them.
+  If the writer falls behind and the pool runs dry, the current chunk is discarded and
+  its rows are counted in `dropped_rows`; the loop never blocks.
+- Periodic flush: a partially filled chunk is handed to the writer every `flush_interval`
+  seconds, so at most that much data is lost on a crash (low idle frame rates included).
+- A truncated final chunk (killed process) is ignored by `load_telemetry`.
+- Reading memory-maps the file: `load_telemetry` copies only the requested columns and
+  frame range, and `iter_telemetry` streams chunk by chunk, so hour-long sessions stay analyzable.
+"""
+
+import json
+import os
+import queue
+import struct
+import threading
+import time
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+MAGIC = b"CTTL"
+FORMAT_VERSION = 1
+# Probes streamed per frame by default (NaN when a probe did not run during the frame).
+# Probes timed on other threads (movement_input with async input) count toward the frame they finished in.
+DEFAULT_PROBES = ("main_loop_active", "frame_wait", "detection_capture", "detection_process", "movement_input")
+DEFAULT_CHUNK_ROWS = 4096
+DEFAULT_POOL_CHUNKS = 4
+
+_HEADER = struct.Struct("<4sHI")
+_ROWS = struct.Struct("<I")
+
+
+def telemetry_columns(probes: tuple[str, ...] = DEFAULT_PROBES) -> list[tuple[str, str]]:
+    """Column names and NumPy dtypes of a telemetry file."""
+    columns = [
+        ("t", "<f8"),  # Frame end time (s, monitor clock)
+        ("frame_ms", "<f4"),
+        ("detection_ms", "<f4"),  # NaN when detection did not run
+        ("target_found", "u1"),
+        ("frame_age_ms", "<f4"),  # Age of the captured frame when the frame ended (NaN if unknown)
+    ]
+    columns.extend((f"{name}_ms", "<f4") for name in probes)
+    return columns
+
+
+def default_telemetry_path() -> str:
+    """New session file under <app dir>/logs/telemetry/."""
+    from utils.paths import get_app_dir
+
+    directory = os.path.join(get_app_dir(), "logs", "telemetry")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, time.strftime("session_%Y%m%d_%H%M%S.cttl"))
+
+
+class _Chunk:
+    __slots__ = ("arrays", "rows")
+
+    def __init__(self, columns: list[tuple[str, str]], rows: int) -> None:
+        self.arrays = [np.zeros(rows, dtype=dtype) for _, dtype in columns]
+        self.rows = 0
+
+
+class TelemetrySink:
+    """
+    [Archetype A: The Sage - Logic/Precision]
+    Per-frame columnar recorder with a background writer thread.
+
+    `write_frame` must be called from a single thread (the logic loop, via
+    `PerformanceMonitor.record_frame`).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        probes: tuple[str, ...] = DEFAULT_PROBES,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        pool_chunks: int = DEFAULT_POOL_CHUNKS,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            path: Output file (created or truncated)
+            probes: Probe names streamed as `<name>_ms` columns
+            chunk_rows: Frames per chunk
+            pool_chunks: Pre-allocated chunks (memory bound = pool_chunks * chunk_rows rows)
+            flush_interval: Longest time (s) a recorded frame waits before being handed to the writer
+        """
+        self.path = path
+        self.probes = tuple(probes)
+        self.columns = telemetry_columns(self.probes)
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.dropped_rows = 0
+
+        self._file = open(path, "wb")
+        header = json.dumps({"columns": self.columns}).encode("utf-8")
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(header)))
+        self._file.write(header)
+        self._file.flush()
+
+        self._free: queue.SimpleQueue[_Chunk] = queue.SimpleQueue()
+        for _ in range(max(1, pool_chunks - 1)):
+            self._free.put(_Chunk(self.columns, chunk_rows))
+        self._pending: queue.SimpleQueue[_Chunk | None] = queue.SimpleQueue()
+        self._chunk = _Chunk(self.columns, chunk_rows)
+        self._chunk_rows = chunk_rows
+        self._last_handoff = time.perf_counter()
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._writer, name="TelemetryWriter", daemon=True)
+        self._thread.start()
+
+    def write_frame(
+        self,
+        t: float,
+        frame_ms: float,
+        detection_ms: float,
+        target_found: bool,
+        frame_age_ms: float,
+        probe_ms: dict[str, float],
+    ) -> None:
+        """Append one frame record (missing probes are stored as NaN)."""
+        chunk = self._chunk
+        i = chunk.rows
+        arrays = chunk.arrays
+        arrays[0][i] = t
+        arrays[1][i] = frame_ms
+        arrays[2][i] = detection_ms
+        arrays[3][i] = target_found
+        arrays[4][i] = frame_age_ms
+        get = probe_ms.get
+        nan = float("nan")
+        for column, name in enumerate(self.probes, 5):
+            arrays[column][i] = get(name, nan)
+        chunk.rows = i + 1
+
+        if chunk.rows == self._chunk_rows:
+            self._handoff()
+        elif time.perf_counter() - self._last_handoff >= self.flush_interval:
+            self._handoff()
+
+    def _handoff(self) -> None:
+        """Queue the current chunk for writing and continue in a free one."""
+        self._last_handoff = time.perf_counter()
+        chunk = self._chunk
+        if chunk.rows == 0:
+            return
+        try:
+            fresh = self._free.get_nowait()
+        except queue.Empty:
+            # Writer is behind: keep the memory bound and drop this chunk's rows instead of blocking
+            self.dropped_rows += chunk.rows
+            chunk.rows = 0
+            return
+        self._pending.put(chunk)
+        self._chunk = fresh
+
+    def _writer(self) -> None:
+        f = self._file
+        while True:
+            chunk = self._pending.get()
+            if chunk is None:
+                break
+            rows = chunk.rows
+            f.write(_ROWS.pack(rows))
+            for array in chunk.arrays:
+                f.write(array[:rows].tobytes())
+            f.flush()
+            self.rows_written += rows
+            chunk.rows = 0
+            self._free.put(chunk)
+
+    def close(self) -> None:
+        """Write everything recorded so far and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._chunk.rows:
+            self._pending.put(self._chunk)
+        self._pending.put(None)
+        self._thread.join()
+        self._file.close()
+
+
+def _open_telemetry(path: str) -> tuple[np.memmap, list[tuple[str, np.dtype]], list[tuple[int, int]]]:
+    """
+    Memory-map a telemetry file and index its chunks without reading column data.
+
+    Returns:
+        (file bytes, columns, [(data offset, rows), ...]); a truncated trailing chunk is left out.
+    """
+    size = os.path.getsize(path)
+    if size < _HEADER.size:
+        raise ValueError(f"Not a telemetry file: {path}")
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    magic, version, header_len = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"Not a telemetry file (or unsupported version): {path}")
+    offset = _HEADER.size
+    header = json.loads(data[offset : offset + header_len].tobytes())
+    columns = [(name, np.dtype(dtype)) for name, dtype in header["columns"]]
+    offset += header_len
+
+    row_bytes = sum(dtype.itemsize for _, dtype in columns)
+    chunks: list[tuple[int, int]] = []
+    while offset + _ROWS.size <= size:
+        (rows,) = _ROWS.unpack_from(data, offset)
+        offset += _ROWS.size
+        if offset + rows * row_bytes > size:
+            break
+        chunks.append((offset, rows))
+        offset += rows * row_bytes
+    return data, columns, chunks
+
+
+def _select_columns(
+    columns: list[tuple[str, np.dtype]], names: Iterable[str] | None
+) -> list[tuple[str, np.dtype, int]]:
+    """(name, dtype, byte offset within a chunk per row) of the requested columns."""
+    wanted = None if names is None else set(names)
+    if wanted is not None and not wanted <= {name for name, _ in columns}:
+        raise KeyError(f"Unknown telemetry columns: {sorted(wanted - {name for name, _ in columns})}")
+    selected = []
+    row_offset = 0
+    for name, dtype in columns:
+        if wanted is None or name in wanted:
+            selected.append((name, dtype, row_offset))
+        row_offset += dtype.itemsize
+    return selected
+
+
+def iter_telemetry(path: str, columns: Iterable[str] | None = None) -> Iterator[dict[str, NDArray]]:
+    """
+    Yield one dict of column arrays per chunk, for analyses that stream over a long session.
+    Arrays are read-only views of the memory-mapped file: only the pages touched are read.
+
+    Args:
+        columns: Column names to include (default: all)
+    """
+    data, all_columns, chunks = _open_telemetry(path)
+    selected = _select_columns(all_columns, columns)
+    for offset, rows in chunks:
+        yield {
+            name: np.frombuffer(data, dtype=dtype, count=rows, offset=offset + rows * column_offset)
+            for name, dtype, column_offset in selected
+        }
+
+
+def load_telemetry(
+    path: str, columns: Iterable[str] | None = None, start: int = 0, stop: int | None = None
+) -> dict[str, NDArray]:
+    """
+    Load a telemetry file into one NumPy array per column.
+    A truncated trailing chunk (e.g. after a crash) is skipped.
+
+    The file is memory-mapped and only the requested columns and frames are copied out,
+    so a slice of a multi-hour session costs memory for that slice only.
+
+    Args:
+        columns: Column names to load (default: all)
+        start, stop: Frame (row) range to load, as in `range(start, stop)` (default: every frame)
+    """
+    data, all_columns, chunks = _open_telemetry(path)
+    selected = _select_columns(all_columns, columns)
+    total = sum(rows for _, rows in chunks)
+    start, stop, _ = slice(start, stop).indices(total)
+    count = max(stop - start, 0)
+    result = {name: np.empty(count, dtype=dtype) for name, dtype, _ in selected}
+
+    first_row = 0
+    filled = 0
+    for offset, rows in chunks:
+        lo = max(start - first_row, 0)
+        hi = min(stop - first_row, rows)
+        first_row += rows
+        if lo >= hi:
+            if first_row >= stop:
+                break
+            continue
+        for name, dtype, column_offset in selected:
+            column = np.frombuffer(data, dtype=dtype, count=rows, offset=offset + rows * column_offset)
+            result[name][filled : filled + hi - lo] = column[lo:hi]
+        filled += hi - lo
+    return result